@@ -1,9 +1,11 @@
 # paper_search_mcp/sources/arxiv.py
 from typing import List
 from datetime import datetime
+import httpx
 import requests
 import feedparser
 from ..paper import Paper
+from ..http_client import stream_to_file
 from PyPDF2 import PdfReader
 import os
 
@@ -96,6 +98,26 @@ class ArxivSearcher(PaperSource):
         except requests.RequestException as e:
             return f"Error downloading PDF: {e}"
 
+    async def download_pdf_async(self, client: httpx.AsyncClient, paper_id: str, save_path: str) -> str:
+        """Download PDF of an arXiv paper, streaming it to disk.
+
+        Args:
+            client: httpx.AsyncClient to download with
+            paper_id: arXiv paper ID
+            save_path: Directory to save the PDF
+
+        Returns:
+            Path to downloaded PDF or error message
+        """
+        pdf_url = f"https://arxiv.org/pdf/{paper_id}.pdf"
+        try:
+            os.makedirs(save_path, exist_ok=True)
+            output_file = os.path.join(save_path, f"{paper_id}.pdf")
+            await stream_to_file(client, pdf_url, output_file)
+            return output_file
+        except httpx.HTTPError as e:
+            return f"Error downloading PDF: {e}"
+
     def read_paper(self, paper_id: str, save_path: str = "./downloads") -> str:
         """Read a paper and convert it to text format.
 
@@ -1,8 +1,10 @@
 from typing import List
+import httpx
 import requests
 import os
 from datetime import datetime, timedelta
 from ..paper import Paper
+from ..http_client import stream_to_file
 from PyPDF2 import PdfReader
 
 class PaperSource:
@@ -128,6 +130,35 @@ class BioRxivSearcher(PaperSource):
                     raise Exception(f"Failed to download PDF after {self.max_retries} attempts: {e}")
                 print(f"Attempt {tries} failed, retrying...")
     
+    async def download_pdf_async(self, client: httpx.AsyncClient, paper_id: str, save_path: str) -> str:
+        """
+        Download a PDF for a given paper ID from bioRxiv, streaming it to disk.
+
+        Args:
+            client: httpx.AsyncClient to download with.
+            paper_id: The DOI of the paper.
+            save_path: Directory to save the PDF.
+
+        Returns:
+            Path to the downloaded PDF file.
+        """
+        if not paper_id:
+            raise ValueError("Invalid paper_id: paper_id is empty")
+
+        pdf_url = f"https://www.biorxiv.org/content/{paper_id}v1.full.pdf"
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        }
+        os.makedirs(save_path, exist_ok=True)
+        output_file = f"{save_path}/{paper_id.replace('/', '_')}.pdf"
+        for tries in range(1, self.max_retries + 1):
+            try:
+                await stream_to_file(client, pdf_url, output_file, headers=headers)
+                return output_file
+            except httpx.HTTPError as e:
+                if tries == self.max_retries:
+                    raise Exception(f"Failed to download PDF after {self.max_retries} attempts: {e}")
+    
     def read_paper(self, paper_id: str, save_path: str = "./downloads") -> str:
         """
         Read a paper and convert it to text format.
@@ -1,14 +1,22 @@
 # paper_search_mcp/academic_platforms/crossref.py
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+import json
 import requests
 import time
 import random
 from ..paper import Paper
+from ..deduplication import normalize_doi
+from ..http_cache import ResponseCache, cached_content
 import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    from orjson import loads as _json_loads  # Optional: pip install paper-search-mcp[json]
+except ImportError:
+    _json_loads = json.loads
+
 class PaperSource:
     """Abstract base class for paper sources"""
     def search(self, query: str, **kwargs) -> List[Paper]:
@@ -28,12 +36,26 @@ class CrossRefSearcher(PaperSource):
     # User agent for polite API usage as per CrossRef etiquette
     USER_AGENT = "paper-search-mcp/0.1.3 (https://github.com/Dragonatorul/paper-search-mcp; mailto:paper-search@example.org)"
     
-    def __init__(self):
-        self.session = requests.Session()
+    # DOIs OR-ed into one filter per request, keeping the URL a sane length
+    MAX_DOIS_PER_FILTER = 50
+
+    # Response cache lifetime for single-DOI records, which rarely change
+    DOI_TTL = 24 * 3600
+
+    def __init__(self, session: Optional[requests.Session] = None, cache_dir: Optional[str] = None):
+        """Initialize the searcher.
+
+        Args:
+            session: Optional session to share (e.g. its connection pool); its
+                headers are updated for CrossRef. A new one is created otherwise.
+            cache_dir: Optional response cache root (default: ~/.cache/paper-search-mcp)
+        """
+        self.session = session if session is not None else requests.Session()
         self.session.headers.update({
             'User-Agent': self.USER_AGENT,
             'Accept': 'application/json'
         })
+        self.cache = ResponseCache("crossref", cache_dir)
     
     def search(self, query: str, max_results: int = 10, **kwargs) -> List[Paper]:
         """
@@ -282,19 +304,20 @@ class CrossRefSearcher(PaperSource):
         try:
             url = f"{self.BASE_URL}/works/{doi}"
             params = {'mailto': 'paper-search@example.org'}
-            
-            response = self.session.get(url, params=params, timeout=30)
-            
-            if response.status_code == 404:
-                logger.warning(f"DOI not found in CrossRef: {doi}")
-                return None
-                
-            response.raise_for_status()
-            data = response.json()
-            
+
+            # Served from the on-disk response cache for DOI_TTL after the first fetch
+            content = cached_content(self.cache, self.session.get, url, params, ttl=self.DOI_TTL)
+            data = _json_loads(content)
+
             item = data.get('message', {})
             return self._parse_crossref_item(item)
-            
+
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                logger.warning(f"DOI not found in CrossRef: {doi}")
+                return None
+            logger.error(f"Error fetching DOI {doi} from CrossRef: {e}")
+            return None
         except requests.RequestException as e:
             logger.error(f"Error fetching DOI {doi} from CrossRef: {e}")
             return None
@@ -302,6 +325,54 @@ class CrossRefSearcher(PaperSource):
             logger.error(f"Unexpected error fetching DOI {doi}: {e}")
             return None
 
+    def get_papers_by_dois(self, dois: List[str]) -> List[Paper]:
+        """
+        Get several papers by DOI using batched requests.
+
+        DOIs are OR-ed as repeated doi: filters, MAX_DOIS_PER_FILTER per
+        request, so N papers cost ceil(N / 50) round-trips instead of N.
+
+        Args:
+            dois: Digital Object Identifiers
+
+        Returns:
+            Paper objects in the order of the requested DOIs; DOIs that are
+            not found are omitted
+        """
+        keys = [normalize_doi(d) for d in dois if d]
+        # ',' separates filters, so such DOIs cannot be batched
+        batchable = [k for k in keys if k and "," not in k]
+        url = f"{self.BASE_URL}/works"
+        found = {}
+
+        for start in range(0, len(batchable), self.MAX_DOIS_PER_FILTER):
+            chunk = batchable[start:start + self.MAX_DOIS_PER_FILTER]
+            params = {
+                'filter': ",".join(f"doi:{doi}" for doi in chunk),
+                'rows': len(chunk),
+                'mailto': 'paper-search@example.org'
+            }
+            try:
+                response = self.session.get(url, params=params, timeout=30)
+                response.raise_for_status()
+                items = response.json().get('message', {}).get('items', [])
+            except Exception as e:
+                logger.error(f"Error fetching DOIs {', '.join(chunk)} from CrossRef: {e}")
+                continue
+
+            for item in items:
+                paper = self._parse_crossref_item(item)
+                if paper and paper.doi:
+                    found[normalize_doi(paper.doi)] = paper
+
+        for key in keys:
+            if key and "," in key:
+                paper = self.get_paper_by_doi(key)
+                if paper:
+                    found[key] = paper
+
+        return [found[k] for k in keys if k in found]
+
 if __name__ == "__main__":
     # Test CrossRefSearcher functionality
     # 测试CrossRefSearcher功能
@@ -31,9 +31,14 @@ class DBLPSearcher:
     SEARCH_URL = f"{BASE_URL}/search/publ/api"
     BIB_URL = f"{BASE_URL}/bib"
 
-    def __init__(self):
-        """Initialize DBLP searcher."""
-        self.session = requests.Session()
+    def __init__(self, session: Optional[requests.Session] = None):
+        """Initialize DBLP searcher.
+
+        Args:
+            session: Optional session to share (e.g. its connection pool); its
+                headers are updated for DBLP. A new one is created otherwise.
+        """
+        self.session = session if session is not None else requests.Session()
         self.session.headers.update({
             'User-Agent': 'paper-search-mcp/1.0',
             'Accept': 'application/xml, application/x-bibtex'
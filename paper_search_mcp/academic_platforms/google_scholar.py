@@ -2,13 +2,18 @@ from typing import List, Optional
 from datetime import datetime
 import requests
 from bs4 import BeautifulSoup
-import time
+import threading
 import random
 from ..paper import Paper
+from ..http_client import RateLimiter
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Scholar blocks bursts from one IP, so requests from every call are spaced
+# out process-wide (one per 2 s, the mean of the old fixed 1-3 s delay)
+_SCHOLAR_RATE_LIMITER = RateLimiter(0.5)
+
 class PaperSource:
     """Abstract base class for paper sources"""
     def search(self, query: str, **kwargs) -> List[Paper]:
@@ -33,6 +38,8 @@ class GoogleScholarSearcher(PaperSource):
 
     def __init__(self):
         self._setup_session()
+        # Concurrent tool calls share the session one request at a time
+        self._request_lock = threading.Lock()
 
     def _setup_session(self):
         """Initialize session with random user agent"""
@@ -109,9 +116,10 @@ class GoogleScholarSearcher(PaperSource):
                     'as_sdt': '0,5'  # Include articles and citations
                 }
 
-                # Make request with random delay
-                time.sleep(random.uniform(1.0, 3.0))
-                response = self.session.get(self.SCHOLAR_URL, params=params)
+                # Only requests that follow recent ones wait their turn
+                with self._request_lock:
+                    _SCHOLAR_RATE_LIMITER.wait()
+                    response = self.session.get(self.SCHOLAR_URL, params=params, timeout=30)
                 
                 if response.status_code != 200:
                     logger.error(f"Search failed with status {response.status_code}")
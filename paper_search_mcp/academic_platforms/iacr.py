@@ -1,10 +1,13 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
+import asyncio
+import httpx
 import requests
 from bs4 import BeautifulSoup
 import time
 import random
 from ..paper import Paper
+from ..http_client import stream_to_file
 import logging
 from PyPDF2 import PdfReader
 import os
@@ -30,6 +33,8 @@ class IACRSearcher(PaperSource):
 
     IACR_SEARCH_URL = "https://eprint.iacr.org/search"
     IACR_BASE_URL = "https://eprint.iacr.org"
+    # Upper bound on concurrent detail-page fetches in search_async
+    DETAIL_CONCURRENCY = 20
     BROWSERS = [
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
@@ -230,6 +235,33 @@ class IACRSearcher(PaperSource):
             logger.error(f"PDF download error: {e}")
             return f"Error downloading PDF: {e}"
 
+    async def download_pdf_async(
+        self, client: httpx.AsyncClient, paper_id: str, save_path: str
+    ) -> str:
+        """
+        Download PDF from IACR ePrint Archive, streaming it to disk
+
+        Args:
+            client: httpx.AsyncClient to download with
+            paper_id: IACR paper ID (e.g., "2025/1014")
+            save_path: Path to save the PDF
+
+        Returns:
+            str: Path to downloaded file or error message
+        """
+        try:
+            pdf_url = f"{self.IACR_BASE_URL}/{paper_id}.pdf"
+            os.makedirs(save_path, exist_ok=True)
+            filename = f"{save_path}/iacr_{paper_id.replace('/', '_')}.pdf"
+            await stream_to_file(client, pdf_url, filename, headers=dict(self.session.headers))
+            return filename
+
+        except httpx.HTTPStatusError as e:
+            return f"Failed to download PDF: HTTP {e.response.status_code}"
+        except Exception as e:
+            logger.error(f"PDF download error: {e}")
+            return f"Error downloading PDF: {e}"
+
     def read_paper(self, paper_id: str, save_path: str = "./downloads") -> str:
         """
         Download and extract text from IACR paper PDF
@@ -311,14 +343,7 @@ class IACRSearcher(PaperSource):
         """
         try:
             # Handle both paper ID and full URL
-            if paper_id.startswith("http"):
-                paper_url = paper_id
-                # Extract paper ID from URL
-                parts = paper_url.split("/")
-                if len(parts) >= 2:
-                    paper_id = f"{parts[-2]}/{parts[-1]}"
-            else:
-                paper_url = f"{self.IACR_BASE_URL}/{paper_id}"
+            paper_id, paper_url = self._resolve_paper_url(paper_id)
 
             # Make request
             response = self.session.get(paper_url)
@@ -329,8 +354,29 @@ class IACRSearcher(PaperSource):
                 )
                 return None
 
+            return self._parse_details_html(response.text, paper_id, paper_url)
+
+        except Exception as e:
+            logger.error(f"Error fetching paper details for {paper_id}: {e}")
+            return None
+
+    def _resolve_paper_url(self, paper_id: str) -> Tuple[str, str]:
+        """Return (paper_id, paper_url) for an IACR paper ID or full URL"""
+        if paper_id.startswith("http"):
+            paper_url = paper_id
+            # Extract paper ID from URL
+            parts = paper_url.split("/")
+            if len(parts) >= 2:
+                paper_id = f"{parts[-2]}/{parts[-1]}"
+        else:
+            paper_url = f"{self.IACR_BASE_URL}/{paper_id}"
+        return paper_id, paper_url
+
+    def _parse_details_html(self, html: str, paper_id: str, paper_url: str) -> Optional[Paper]:
+        """Parse an IACR paper page into a detailed Paper object"""
+        try:
             # Parse the page
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(html, "html.parser")
 
             # Extract title from h3 element
             title = ""
@@ -429,10 +475,105 @@ class IACRSearcher(PaperSource):
                 extra={"publication_info": publication_info, "history": history},
             )
 
+        except Exception as e:
+            logger.error(f"Error parsing paper details for {paper_id}: {e}")
+            return None
+
+    async def aget_paper_details(
+        self, client: httpx.AsyncClient, paper_id: str
+    ) -> Optional[Paper]:
+        """
+        Async counterpart of get_paper_details on a caller-supplied client
+
+        Args:
+            client: httpx.AsyncClient to send the request on
+            paper_id: IACR paper ID (e.g., "2009/101") or full URL
+
+        Returns:
+            Paper: Detailed paper object, or None if the fetch fails
+        """
+        try:
+            paper_id, paper_url = self._resolve_paper_url(paper_id)
+            response = await client.get(paper_url, headers=dict(self.session.headers))
+            if response.status_code != 200:
+                logger.error(
+                    f"Failed to fetch paper details: HTTP {response.status_code}"
+                )
+                return None
+            return self._parse_details_html(response.text, paper_id, paper_url)
         except Exception as e:
             logger.error(f"Error fetching paper details for {paper_id}: {e}")
             return None
 
+    async def search_async(
+        self,
+        client: httpx.AsyncClient,
+        query: str,
+        max_results: int = 10,
+        fetch_details: bool = True,
+    ) -> List[Paper]:
+        """
+        Async counterpart of search that fetches detail pages concurrently
+
+        The sync search fetches one detail page per result in turn; here
+        they are gathered on the shared client, at most DETAIL_CONCURRENCY
+        in flight at once.
+
+        Args:
+            client: httpx.AsyncClient to send requests on
+            query: Search query string
+            max_results: Maximum number of results to return
+            fetch_details: Whether to fetch detailed information for each paper
+
+        Returns:
+            List[Paper]: List of paper objects, in search result order
+        """
+        try:
+            response = await client.get(
+                self.IACR_SEARCH_URL,
+                params={"q": query},
+                headers=dict(self.session.headers),
+            )
+            if response.status_code != 200:
+                logger.error(f"IACR search failed with status {response.status_code}")
+                return []
+
+            soup = BeautifulSoup(response.text, "html.parser")
+            results = soup.find_all("div", class_="mb-4")
+            if not results:
+                logger.info("No results found for the query")
+                return []
+
+            # Compact parse first; it also tells us which entries are papers
+            entries = []
+            for item in results:
+                paper = self._parse_paper(item, fetch_details=False)
+                if paper:
+                    entries.append(paper)
+                if len(entries) >= max_results:
+                    break
+
+            if not fetch_details:
+                return entries
+
+            semaphore = asyncio.Semaphore(self.DETAIL_CONCURRENCY)
+
+            async def fetch(paper: Paper) -> Paper:
+                async with semaphore:
+                    detailed = await self.aget_paper_details(client, paper.paper_id)
+                if detailed:
+                    return detailed
+                logger.warning(
+                    f"Could not fetch details for {paper.paper_id}, falling back to search result parsing"
+                )
+                return paper
+
+            return list(await asyncio.gather(*(fetch(paper) for paper in entries)))
+
+        except Exception as e:
+            logger.error(f"IACR search error: {e}")
+            return []
+
 
 if __name__ == "__main__":
     # Test IACR searcher
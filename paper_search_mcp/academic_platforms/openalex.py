@@ -4,14 +4,44 @@ OpenAlex is a free and open catalog of the global research system.
 It indexes over 200M works, 90M authors, and provides comprehensive citation data.
 API Documentation: https://docs.openalex.org/
 """
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
+import asyncio
+import logging
 import time
+import httpx
 import requests
 from ..paper import Paper
-from PyPDF2 import PdfReader
+from ..deduplication import normalize_doi
+from ..pdf_utils import extract_pdf_text
+from ..http_client import borrow_client, run_blocking
 import os
 
+logger = logging.getLogger(__name__)
+
+
+def _reconstruct_abstract(inverted_index: Optional[Dict[str, List[int]]]) -> str:
+    """Rebuild abstract text from an OpenAlex ``abstract_inverted_index``.
+
+    Args:
+        inverted_index: Mapping of word -> list of token positions
+
+    Returns:
+        Abstract text, or empty string if the index is missing or malformed
+    """
+    if not inverted_index:
+        return ""
+    try:
+        # Scatter words straight into their slots: O(n), no dict or sort
+        size = 1 + max((max(positions) for positions in inverted_index.values() if positions), default=-1)
+        slots: List[Optional[str]] = [None] * size
+        for word, positions in inverted_index.items():
+            for pos in positions:
+                slots[pos] = word
+        return " ".join([word for word in slots if word is not None])
+    except (AttributeError, IndexError, TypeError, ValueError):
+        return ""
+
 
 class OpenAlexSearcher:
     """Searcher for OpenAlex academic database.
@@ -22,6 +52,9 @@ class OpenAlexSearcher:
 
     BASE_URL = "https://api.openalex.org"
     EMAIL_PARAM = "mailto:paper-search-mcp@example.com"  # Polite identification
+    MAX_CONCURRENT_DOWNLOADS = 8  # Cap on parallel PDF downloads
+    MAX_PDF_SIZE = 100 * 1024 * 1024  # Refuse PDFs above 100 MiB, advertised or received
+    MAX_IDS_PER_FILTER = 50  # OpenAlex limit on OR-ed values in one filter
 
     def __init__(self, email: Optional[str] = None):
         """Initialize OpenAlex searcher.
@@ -142,6 +175,189 @@ class OpenAlexSearcher:
             print(f"Error fetching paper {openalex_id}: {e}")
             return None
 
+    def get_papers_by_ids(self, openalex_ids: List[str]) -> List[Paper]:
+        """Get several papers by OpenAlex ID using batched requests.
+
+        IDs are OR-ed into a single filter, MAX_IDS_PER_FILTER per request,
+        so N papers cost ceil(N / 50) round-trips instead of N.
+
+        Args:
+            openalex_ids: OpenAlex IDs (e.g., ['W3124567890', 'https://openalex.org/W2741809807'])
+
+        Returns:
+            Paper objects in the order of the requested IDs; IDs that are not
+            found are omitted
+        """
+        ids = [i.split("/")[-1] if i.startswith("http") else i for i in openalex_ids if i]
+        url = f"{self.BASE_URL}/works"
+        found = {}
+
+        for start in range(0, len(ids), self.MAX_IDS_PER_FILTER):
+            chunk = ids[start:start + self.MAX_IDS_PER_FILTER]
+            params = {
+                "filter": "openalex:" + "|".join(chunk),
+                "per-page": len(chunk),
+                "mailto": self.EMAIL_PARAM
+            }
+            try:
+                response = self.session.get(url, params=params, timeout=30)
+                response.raise_for_status()
+                data = response.json()
+            except Exception as e:
+                logger.error(f"Error fetching papers {', '.join(chunk)}: {e}")
+                continue
+
+            for work in data.get("results", []):
+                paper = self._parse_work(work)
+                if paper:
+                    found[paper.paper_id.upper()] = paper
+
+        return [found[i.upper()] for i in ids if i.upper() in found]
+
+    def get_papers_by_dois(self, dois: List[str]) -> List[Paper]:
+        """Get several papers by DOI using batched requests.
+
+        DOIs are OR-ed into a single filter, MAX_IDS_PER_FILTER per request,
+        like get_papers_by_ids.
+
+        Args:
+            dois: DOIs, bare or as doi.org URLs (e.g., ['10.1038/nature12373'])
+
+        Returns:
+            Paper objects in the order of the requested DOIs; DOIs that are
+            not found are omitted
+        """
+        keys = [normalize_doi(d) for d in dois if d]
+        # '|' separates filter values, so such DOIs cannot be batched
+        batchable = [k for k in keys if k and "|" not in k]
+        url = f"{self.BASE_URL}/works"
+        found = {}
+
+        for start in range(0, len(batchable), self.MAX_IDS_PER_FILTER):
+            chunk = batchable[start:start + self.MAX_IDS_PER_FILTER]
+            params = {
+                "filter": "doi:" + "|".join(chunk),
+                "per-page": len(chunk),
+                "mailto": self.EMAIL_PARAM
+            }
+            try:
+                response = self.session.get(url, params=params, timeout=30)
+                response.raise_for_status()
+                data = response.json()
+            except Exception as e:
+                logger.error(f"Error fetching papers with DOIs {', '.join(chunk)}: {e}")
+                continue
+
+            for work in data.get("results", []):
+                paper = self._parse_work(work)
+                if paper and paper.doi:
+                    found[normalize_doi(paper.doi)] = paper
+
+        for key in keys:
+            if key and "|" in key:
+                paper = self.get_paper_by_doi(key)
+                if paper:
+                    found[key] = paper
+
+        return [found[k] for k in keys if k in found]
+
+    async def _afetch_filtered(
+        self,
+        client: httpx.AsyncClient,
+        field: str,
+        values: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Fetch works whose field matches any of values, all chunks in flight at once.
+
+        Chunk requests go to one host, so on the shared client they reuse
+        keep-alive connections (multiplexed on one when HTTP/2 is available).
+        """
+        headers = {'User-Agent': self.session.headers['User-Agent']}
+
+        async def fetch(chunk: List[str]) -> List[Dict[str, Any]]:
+            params = {
+                "filter": f"{field}:" + "|".join(chunk),
+                "per-page": len(chunk),
+                "mailto": self.EMAIL_PARAM
+            }
+            try:
+                response = await client.get(f"{self.BASE_URL}/works", params=params, headers=headers)
+                response.raise_for_status()
+                return response.json().get("results", [])
+            except Exception as e:
+                logger.error(f"Error fetching papers {', '.join(chunk)}: {e}")
+                return []
+
+        chunks = [values[start:start + self.MAX_IDS_PER_FILTER]
+                  for start in range(0, len(values), self.MAX_IDS_PER_FILTER)]
+        pages = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+        return [work for page in pages for work in page]
+
+    async def aget_papers_by_ids(
+        self,
+        openalex_ids: List[str],
+        client: Optional[httpx.AsyncClient] = None
+    ) -> List[Paper]:
+        """Async counterpart of get_papers_by_ids that sends all chunks concurrently.
+
+        Args:
+            openalex_ids: OpenAlex IDs (e.g., ['W3124567890', 'https://openalex.org/W2741809807'])
+            client: Optional client to reuse (one is created otherwise)
+
+        Returns:
+            Paper objects in the order of the requested IDs; IDs that are not
+            found are omitted
+        """
+        ids = [i.split("/")[-1] if i.startswith("http") else i for i in openalex_ids if i]
+        async with borrow_client(client, self._async_client) as client:
+            works = await self._afetch_filtered(client, "openalex", ids)
+
+        found = {}
+        for work in works:
+            paper = self._parse_work(work)
+            if paper:
+                found[paper.paper_id.upper()] = paper
+        return [found[i.upper()] for i in ids if i.upper() in found]
+
+    async def aget_papers_by_dois(
+        self,
+        dois: List[str],
+        client: Optional[httpx.AsyncClient] = None
+    ) -> List[Paper]:
+        """Async counterpart of get_papers_by_dois that sends all chunks concurrently.
+
+        Args:
+            dois: DOIs, bare or as doi.org URLs (e.g., ['10.1038/nature12373'])
+            client: Optional client to reuse (one is created otherwise)
+
+        Returns:
+            Paper objects in the order of the requested DOIs; DOIs that are
+            not found are omitted
+        """
+        keys = [normalize_doi(d) for d in dois if d]
+        # '|' separates filter values, so such DOIs cannot be batched
+        batchable = [k for k in keys if k and "|" not in k]
+        async with borrow_client(client, self._async_client) as client:
+            works = await self._afetch_filtered(client, "doi", batchable)
+
+        found = {}
+        for work in works:
+            paper = self._parse_work(work)
+            if paper and paper.doi:
+                found[normalize_doi(paper.doi)] = paper
+
+        for key in keys:
+            if key and "|" in key:
+                paper = await run_blocking(self.get_paper_by_doi, key)
+                if paper:
+                    found[key] = paper
+
+        return [found[k] for k in keys if k in found]
+
+    @staticmethod
+    def _async_client() -> httpx.AsyncClient:
+        return httpx.AsyncClient(timeout=30, follow_redirects=True)
+
     def get_paper_by_doi(self, doi: str) -> Optional[Paper]:
         """Get a specific paper by its DOI.
 
@@ -342,7 +558,7 @@ class OpenAlexSearcher:
             print(f"Error fetching related papers: {e}")
             return []
 
-    def _parse_work(self, work: dict) -> Optional[Paper]:
+    def _parse_work(self, work: Dict[str, Any]) -> Optional[Paper]:
         """Parse OpenAlex work data into a Paper object.
 
         Args:
@@ -353,90 +569,72 @@ class OpenAlexSearcher:
         """
         try:
             # Basic metadata
-            paper_id = work.get("id", "").split("/")[-1]
-            title = work.get("title", "")
+            work_url: str = work.get("id") or ""
+            paper_id: str = work_url.rsplit("/", 1)[-1]
+            title: str = work.get("title") or ""
 
             # Authors
-            authors = []
-            authorships = work.get("authorships", [])
-            for authorship in authorships:
-                author_name = authorship.get("author", {}).get("display_name", "")
+            authors: List[str] = []
+            for authorship in work.get("authorships") or ():
+                author_name = (authorship.get("author") or {}).get("display_name")
                 if author_name:
                     authors.append(author_name)
 
-            # Publication date
+            # Publication date (OpenAlex always uses plain YYYY-MM-DD)
+            published_date: Optional[datetime] = None
             pub_date = work.get("publication_date")
-            published_date = None
             if pub_date:
                 try:
                     published_date = datetime.fromisoformat(pub_date.replace("Z", "+00:00"))
-                except:
+                except ValueError:
                     pass
 
             # DOI and URL
-            doi = work.get("doi", "")
-            url = work.get("id", "")
+            doi: str = work.get("doi") or ""
+            url = work_url
             if url.startswith("http"):
                 url = url.replace("api.openalex.org", "openalex.org")
 
             # PDF URL - check locations
-            pdf_url = ""
-            locations = work.get("locations", [])
-            for location in locations:
-                source = location.get("source", {})
-                if source.get("type") == "repository" or source.get("type") == "journal":
-                    pdf_url = location.get("landing_page_url", "") or location.get("pdf_url", "")
+            pdf_url: str = ""
+            for location in work.get("locations") or ():
+                source_type = (location.get("source") or {}).get("type")
+                if source_type == "repository" or source_type == "journal":
+                    pdf_url = location.get("landing_page_url") or location.get("pdf_url") or ""
                     if pdf_url:
                         break
 
             # If no PDF in locations, check best location
-            if not pdf_url and work.get("best_oa_location"):
-                best_loc = work["best_oa_location"]
-                pdf_url = best_loc.get("pdf_url", "") or best_loc.get("landing_page_url", "")
+            best_loc = work.get("best_oa_location")
+            if not pdf_url and best_loc:
+                pdf_url = best_loc.get("pdf_url") or best_loc.get("landing_page_url") or ""
 
             # Abstract
-            abstract = work.get("abstract_inverted_index")
-            abstract_text = ""
-            if abstract:
-                # Reconstruct abstract from inverted index
-                try:
-                    index_to_word = {}
-                    for word, positions in abstract.items():
-                        for pos in positions:
-                            index_to_word[pos] = word
-
-                    # Sort by position and join
-                    sorted_indices = sorted(index_to_word.keys())
-                    abstract_text = " ".join([index_to_word[i] for i in sorted_indices])
-                except:
-                    abstract_text = ""
-
-            # Keywords/Concepts
-            keywords = []
-            concepts = work.get("concepts", [])
-            for concept in concepts[:10]:  # Top 10 concepts
+            abstract_text = _reconstruct_abstract(work.get("abstract_inverted_index"))
+
+            # Keywords/Concepts (top 10) and categories (top 5 with high score)
+            concepts: List[Dict[str, Any]] = (work.get("concepts") or [])[:10]
+            keywords: List[str] = []
+            categories: List[str] = []
+            for rank, concept in enumerate(concepts):
                 concept_name = concept.get("display_name", "")
                 if concept_name:
                     keywords.append(concept_name)
-
-            # Categories (from concepts with high score)
-            categories = []
-            for concept in concepts[:5]:
-                if concept.get("score", 0) > 0.5:
-                    categories.append(concept.get("display_name", ""))
+                if rank < 5 and concept.get("score", 0) > 0.5:
+                    categories.append(concept_name)
 
             # Citation count
-            citations = work.get("cited_by_count", 0)
+            citations: int = work.get("cited_by_count", 0)
 
-            # References
-            references = []
-            ref_list = work.get("referenced_works", [])
-            for ref in ref_list[:50]:  # Limit to first 50
-                if ref:
-                    references.append(ref.split("/")[-1] if "/" in ref else ref)
+            # References (limit to first 50)
+            references: List[str] = [
+                ref.rsplit("/", 1)[-1]
+                for ref in (work.get("referenced_works") or [])[:50]
+                if ref
+            ]
 
             # Type
-            work_type = work.get("type", "")
+            work_type: str = work.get("type") or ""
             source = f"openalex_{work_type}" if work_type else "openalex"
 
             return Paper(
@@ -456,7 +654,7 @@ class OpenAlexSearcher:
                 extra={
                     "openalex_id": paper_id,
                     "work_type": work_type,
-                    "concepts": concepts[:10],
+                    "concepts": concepts,
                     "has_fulltext": work.get("has_fulltext", False),
                     "open_access": work.get("open_access", {})
                 }
@@ -466,6 +664,19 @@ class OpenAlexSearcher:
             print(f"Error parsing work: {e}")
             return None
 
+    def _check_pdf_size(self, headers) -> Optional[str]:
+        """Return an error message if Content-Length exceeds MAX_PDF_SIZE."""
+        content_length = headers.get("Content-Length", "")
+        if content_length.isdigit() and int(content_length) > self.MAX_PDF_SIZE:
+            return f"Failed to download PDF: file too large ({content_length} bytes)"
+        return None
+
+    def _check_bytes_written(self, written: int) -> Optional[str]:
+        """Return an error message once a body without a usable Content-Length passes MAX_PDF_SIZE."""
+        if written > self.MAX_PDF_SIZE:
+            return f"Failed to download PDF: file too large (over {self.MAX_PDF_SIZE} bytes)"
+        return None
+
     def download_pdf(self, paper_id: str, save_path: str = "./downloads") -> str:
         """Download PDF of an OpenAlex paper.
 
@@ -492,19 +703,155 @@ class OpenAlexSearcher:
 
         try:
             os.makedirs(save_path, exist_ok=True)
-            response = self.session.get(pdf_url, timeout=30)
-            response.raise_for_status()
-
             filename = f"{paper_id.replace('/', '_')}.pdf"
             file_path = os.path.join(save_path, filename)
 
-            with open(file_path, 'wb') as f:
-                f.write(response.content)
+            # Stream to a .part file so memory use stays flat and a failed or
+            # oversized transfer never leaves a truncated PDF at file_path
+            partial_path = file_path + ".part"
+            try:
+                with self.session.get(pdf_url, stream=True, timeout=30) as response:
+                    response.raise_for_status()
+                    too_large = self._check_pdf_size(response.headers)
+                    if too_large:
+                        return too_large
+                    written = 0
+                    with open(partial_path, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=65536):
+                            written += len(chunk)
+                            too_large = self._check_bytes_written(written)
+                            if too_large:
+                                return too_large
+                            f.write(chunk)
+                os.replace(partial_path, file_path)
+            finally:
+                if os.path.exists(partial_path):
+                    os.remove(partial_path)
 
             return file_path
         except Exception as e:
             return f"Failed to download PDF: {e}"
 
+    async def download_pdf_async(
+        self,
+        client: httpx.AsyncClient,
+        paper_id: str,
+        save_path: str = "./downloads"
+    ) -> str:
+        """Download PDF of an OpenAlex paper, streaming it to disk on client.
+
+        Args:
+            client: httpx.AsyncClient to download with
+            paper_id: OpenAlex paper ID
+            save_path: Directory to save the PDF
+
+        Returns:
+            Path to downloaded PDF or error message
+        """
+        os.makedirs(save_path, exist_ok=True)
+        return await self._adownload_one(client, asyncio.Semaphore(1), paper_id, save_path)
+
+    def download_pdfs(self, paper_ids: List[str], save_path: str = "./downloads") -> List[str]:
+        """Download PDFs of several OpenAlex papers concurrently.
+
+        Synchronous wrapper around adownload_pdfs(); must not be called from
+        a running event loop (await adownload_pdfs() there instead).
+
+        Args:
+            paper_ids: OpenAlex paper IDs
+            save_path: Directory to save the PDFs
+
+        Returns:
+            One entry per paper ID, in order: path to the PDF or error message
+        """
+        return asyncio.run(self.adownload_pdfs(paper_ids, save_path))
+
+    async def adownload_pdfs(
+        self,
+        paper_ids: List[str],
+        save_path: str = "./downloads",
+        client: Optional[httpx.AsyncClient] = None
+    ) -> List[str]:
+        """Download PDFs of several OpenAlex papers concurrently.
+
+        Metadata lookups and PDF transfers run in parallel, at most
+        MAX_CONCURRENT_DOWNLOADS at a time.
+
+        Args:
+            paper_ids: OpenAlex paper IDs
+            save_path: Directory to save the PDFs
+            client: Optional client to reuse (one is created otherwise)
+
+        Returns:
+            One entry per paper ID, in order: path to the PDF or error message
+        """
+        if not paper_ids:
+            return []
+
+        os.makedirs(save_path, exist_ok=True)
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_DOWNLOADS)
+        async with borrow_client(
+            client, lambda: httpx.AsyncClient(timeout=30, follow_redirects=True)
+        ) as client:
+            return await asyncio.gather(*(
+                self._adownload_one(client, semaphore, paper_id, save_path)
+                for paper_id in paper_ids
+            ))
+
+    async def _adownload_one(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        paper_id: str,
+        save_path: str
+    ) -> str:
+        """Resolve and download a single PDF for adownload_pdfs()."""
+        # Sent per request so a shared client can be used
+        headers = {'User-Agent': self.session.headers['User-Agent']}
+        async with semaphore:
+            openalex_id = paper_id.split("/")[-1] if paper_id.startswith("http") else paper_id
+            try:
+                response = await client.get(
+                    f"{self.BASE_URL}/works/{openalex_id}",
+                    params={"mailto": self.EMAIL_PARAM},
+                    headers=headers
+                )
+                response.raise_for_status()
+                paper = self._parse_work(response.json())
+            except Exception as e:
+                logger.error(f"Error fetching paper {openalex_id}: {e}")
+                paper = None
+
+            if not paper:
+                return f"Paper {paper_id} not found"
+            if not paper.pdf_url:
+                return "No PDF URL available for this paper"
+
+            filename = f"{paper_id.replace('/', '_')}.pdf"
+            file_path = os.path.join(save_path, filename)
+            partial_path = file_path + ".part"
+            try:
+                async with client.stream("GET", paper.pdf_url, headers=headers) as response:
+                    response.raise_for_status()
+                    too_large = self._check_pdf_size(response.headers)
+                    if too_large:
+                        return too_large
+                    written = 0
+                    with open(partial_path, 'wb') as f:
+                        async for chunk in response.aiter_bytes(65536):
+                            written += len(chunk)
+                            too_large = self._check_bytes_written(written)
+                            if too_large:
+                                return too_large
+                            f.write(chunk)
+                os.replace(partial_path, file_path)
+                return file_path
+            except Exception as e:
+                return f"Failed to download PDF: {e}"
+            finally:
+                if os.path.exists(partial_path):
+                    os.remove(partial_path)
+
     def read_paper(self, paper_id: str, save_path: str = "./downloads") -> str:
         """Read and extract text from an OpenAlex paper PDF.
 
@@ -521,11 +868,7 @@ class OpenAlexSearcher:
             return ""
 
         try:
-            reader = PdfReader(pdf_path)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
+            return extract_pdf_text(pdf_path)
         except Exception as e:
             print(f"Error reading PDF: {e}")
             return ""
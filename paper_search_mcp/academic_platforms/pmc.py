@@ -4,18 +4,134 @@ PMC is a free full-text archive of biomedical and life sciences journal literatu
 at the U.S. National Institutes of Health's National Library of Medicine (NIH/NLM).
 API Documentation: https://www.ncbi.nlm.nih.gov/pmc/tools/oai/
 """
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+import calendar
+import asyncio
+import io
+import httpx
 import requests
-import xml.etree.ElementTree as ET
+from urllib3.util.request import ACCEPT_ENCODING
 from ..paper import Paper
-from PyPDF2 import PdfReader
+from ..http_cache import ResponseCache, acached_content, cached_content, cached_stream
+from ..http_client import _HTTP2_AVAILABLE, RateLimiter, borrow_client
+from ..ncbi import ET, _NCBI_ADAPTER, _XML_PARSER, _iter_elements, _parse_xml
+from ..pdf_utils import extract_pdf_text
 import os
+import json
 import logging
 import re
+import sys
 
 logger = logging.getLogger(__name__)
 
+try:
+    from orjson import loads as _json_loads  # Optional: pip install paper-search-mcp[json]
+except ImportError:
+    _json_loads = json.loads
+
+# E-utilities allows 3 requests/second per IP without an API key
+_NCBI_RATE_LIMITER = RateLimiter(3)
+
+
+def _compile_path(path: str, fallback=None):
+    """Compile an element path once; returns a callable mapping an element to matches.
+
+    Without lxml the path is evaluated with ElementPath, or by fallback for
+    XPath expressions ElementPath cannot handle.
+    """
+    if _XML_PARSER is not None:
+        return ET.XPath(path)
+    return fallback or (lambda elem: elem.findall(path))
+
+
+# Anchored under <front> so the full-text <body> (often megabytes) is never walked
+_XP_TITLE = _compile_path("front/article-meta/title-group/article-title")
+_XP_ABSTRACT = _compile_path("front/article-meta/abstract")
+_AUTHOR_CONTRIBS = "front/article-meta/contrib-group/contrib[@contrib-type='author']"
+# First <name> of each author (also inside <name-alternatives>), in one traversal
+_XP_AUTHOR_NAMES = _compile_path(
+    _AUTHOR_CONTRIBS + "/descendant::name[1]",
+    fallback=lambda elem: [
+        name for name in (contrib.find(".//name") for contrib in elem.findall(_AUTHOR_CONTRIBS))
+        if name is not None
+    ],
+)
+_XP_PUB_DATE = _compile_path("front/article-meta/pub-date")
+_XP_DOI = _compile_path("front/article-meta/article-id[@pub-id-type='doi']")
+_XP_PMCID = _compile_path("front/article-meta/article-id[@pub-id-type='pmc']")
+_XP_PMCID_ALT = _compile_path("front/article-meta/article-id[@pub-id-type='pmcid']")
+_XP_JOURNAL = _compile_path("front/journal-meta//journal-title")
+
+
+_XP_ARTICLE = _compile_path(".//article")
+_XP_BODY = _compile_path("body")
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _element_text(elem) -> str:
+    """Return an element's text content (without its tail), whitespace-collapsed.
+
+    lxml flattens the subtree in a single C pass; ElementTree's equivalent
+    would include the tail, so the fallback joins itertext() instead.
+    """
+    if _XML_PARSER is not None:
+        text = ET.tostring(elem, method="text", encoding="unicode", with_tail=False)
+    else:
+        text = "".join(elem.itertext())
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def _block_texts(elem):
+    """Yield the text of each <title>/<p> block under elem, outermost only."""
+    for child in elem:
+        if child.tag in ("title", "p"):
+            text = _element_text(child)
+            if text:
+                yield text
+        else:
+            yield from _block_texts(child)
+
+
+def _to_int_or(default: int, s: Optional[str], low: int, high: int) -> int:
+    """Return s as an int if it is all digits and within [low, high], else default."""
+    if s:
+        s = s.strip()
+        if s.isdigit() and low <= int(s) <= high:
+            return int(s)
+    return default
+
+
+@dataclass(slots=True)
+class _PMCParseCtx:
+    """Per-article fields collected while parsing; reused across a batch."""
+    title: str = ""
+    abstract: str = ""
+    authors: List[str] = field(default_factory=list)
+    published_date: Optional[datetime] = None
+    doi: str = ""
+    journal: str = ""
+
+    def reset(self):
+        """Clear fields for the next article (authors gets a fresh list, as the Paper keeps the old one)."""
+        self.title = ""
+        self.abstract = ""
+        self.authors = []
+        self.published_date = None
+        self.doi = ""
+        self.journal = ""
+
+
+def _first(xpath, elem):
+    """Return the first element matched by a compiled path, or None."""
+    matches = xpath(elem)
+    return matches[0] if matches else None
+
 
 class PMCSearcher:
     """Searcher for PubMed Central (PMC) full-text biomedical papers.
@@ -27,13 +143,28 @@ class PMCSearcher:
     BASE_URL = "https://www.ncbi.nlm.nih.gov/pmc/oai/oai.cgi"
     EUTILS_BASE = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
     PMCID_PREFIX = "PMC"
+    _PMCID_RE = re.compile(r'^\s*(?:PMC)?(\d+)\s*$', re.IGNORECASE)
+    # Response cache lifetimes: search hits change daily, article records rarely
+    ESEARCH_TTL = 48 * 3600
+    EFETCH_TTL = 7 * 24 * 3600
+    # NCBI asks for POST above ~200 IDs; larger lists are split and fetched concurrently
+    MAX_IDS_PER_EFETCH = 200
+    MAX_CONCURRENT_REQUESTS = 3
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """Initialize PMC searcher.
 
-    def __init__(self):
-        """Initialize PMC searcher."""
+        Args:
+            cache_dir: Optional response cache root (default: ~/.cache/paper-search-mcp)
+        """
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (compatible; paper-search-mcp/1.0)'
+            'User-Agent': 'Mozilla/5.0 (compatible; paper-search-mcp/1.0)',
+            # gzip/deflate, plus br/zstd when brotli/zstandard are installed
+            'Accept-Encoding': ACCEPT_ENCODING,
         })
+        self.session.mount("https://", _NCBI_ADAPTER)
+        self.cache = ResponseCache("pmc", cache_dir)
 
     def search(
         self,
@@ -59,30 +190,12 @@ class PMCSearcher:
         try:
             # Use ESearch API for better search functionality
             search_url = f"{self.EUTILS_BASE}/esearch.fcgi"
-            params = {
-                "db": "pmc",
-                "term": query,
-                "retmax": max_results,
-                "retmode": "json",
-                "tool": "paper_search_mcp",
-                "email": "paper-search-mcp@example.com"
-            }
-
-            # Add year filter if provided
-            if year:
-                if "-" in year:
-                    # Year range
-                    params["datetype"] = "pubmed"
-                    params["reldate"] = year
-                else:
-                    # Single year
-                    params["datetype"] = "pubmed"
-                    params["mindate"] = f"{year}/01/01"
-                    params["maxdate"] = f"{year}/12/31"
-
-            response = self.session.get(search_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            params = self._esearch_params(query, max_results, year)
+
+            content = cached_content(
+                self.cache, self._get, search_url, params, ttl=self.ESEARCH_TTL
+            )
+            data = _json_loads(content)
 
             pmcids = data.get("esearchresult", {}).get("idlist", [])
 
@@ -90,48 +203,310 @@ class PMCSearcher:
                 logger.info(f"No PMC papers found for query: {query}")
                 return papers
 
-            # Fetch details for each paper
-            for pmcid in pmcids[:max_results]:
-                try:
-                    paper = self.get_paper_by_pmcid(pmcid)
-                    if paper:
-                        papers.append(paper)
-                except Exception as e:
-                    logger.warning(f"Error fetching paper {pmcid}: {e}")
-                    continue
+            # Fetch details for all papers in a single EFetch request
+            papers = self.get_papers_by_pmcids(pmcids[:max_results])
 
         except Exception as e:
             logger.error(f"Error searching PMC: {e}")
 
         return papers
 
-    def get_paper_by_pmcid(self, pmcid: str) -> Optional[Paper]:
-        """Get a specific paper by its PMCID.
+    @staticmethod
+    def _esearch_params(query: str, max_results: int, year: Optional[str]) -> Dict:
+        """Build ESearch query parameters for a PMC search."""
+        params = {
+            "db": "pmc",
+            "term": query,
+            "retmax": max_results,
+            "retmode": "json",
+            "tool": "paper_search_mcp",
+            "email": "paper-search-mcp@example.com"
+        }
+
+        # Add year filter if provided
+        if year:
+            if "-" in year:
+                # Year range
+                params["datetype"] = "pubmed"
+                params["reldate"] = year
+            else:
+                # Single year
+                params["datetype"] = "pubmed"
+                params["mindate"] = f"{year}/01/01"
+                params["maxdate"] = f"{year}/12/31"
+        return params
+
+    @staticmethod
+    def _efetch_batch_params(ids: List[str]) -> Dict:
+        """Build metadata-only EFetch parameters for a batch of numeric PMCIDs."""
+        return {
+            "db": "pmc",
+            "id": ",".join(ids),
+            "retmode": "xml",
+            "rettype": "abstract",  # Front matter only; <body> is not needed here
+            "tool": "paper_search_mcp",
+            "email": "paper-search-mcp@example.com"
+        }
+
+    def _normalize_ids(self, pmcids: List[str]) -> List[str]:
+        """Normalize PMCIDs to numeric form, skipping (and logging) invalid ones."""
+        ids = []
+        for pmcid in pmcids:
+            try:
+                ids.append(self._normalize_pmcid(pmcid)[0])
+            except ValueError as e:
+                logger.warning(f"Skipping {e}")
+        return ids
+
+    def _batches(self, ids: List[str]) -> List[List[str]]:
+        """Split numeric PMCIDs into EFetch-sized batches."""
+        return [
+            ids[start:start + self.MAX_IDS_PER_EFETCH]
+            for start in range(0, len(ids), self.MAX_IDS_PER_EFETCH)
+        ]
+
+    @classmethod
+    def _normalize_pmcid(cls, pmcid: str) -> Tuple[str, str]:
+        """Split a PMCID into its numeric and prefixed forms.
 
         Args:
-            pmcid: PubMed Central ID (e.g., 'PMC1234567' or just '1234567')
+            pmcid: PubMed Central ID (e.g., 'PMC1234567', 'pmc1234567' or '1234567')
 
         Returns:
-            Paper object or None if not found
+            Tuple of (numeric ID, full PMCID), e.g. ('1234567', 'PMC1234567')
+
+        Raises:
+            ValueError: If pmcid is not a PMCID
+        """
+        match = cls._PMCID_RE.match(pmcid)
+        if not match:
+            raise ValueError(f"Invalid PMCID: {pmcid!r}")
+        number = match.group(1)
+        return number, f"{cls.PMCID_PREFIX}{number}"
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """Issue a GET on the shared session within NCBI's rate limit."""
+        _NCBI_RATE_LIMITER.wait()
+        return self.session.get(url, **kwargs)
+
+    def get_papers_by_pmcids(self, pmcids: List[str]) -> List[Paper]:
+        """Get several papers with batched EFetch requests.
+
+        Up to MAX_IDS_PER_EFETCH IDs are fetched per request; longer lists
+        are split and the batches fetched on MAX_CONCURRENT_REQUESTS threads.
+
+        Args:
+            pmcids: PubMed Central IDs (e.g., ['PMC1234567', '7654321'])
+
+        Returns:
+            Paper objects in the order of the requested IDs; IDs that are not
+            returned by PMC are omitted
         """
-        # Clean PMCID
-        pmcid = pmcid.replace("PMC", "").strip()
+        ids = self._normalize_ids(pmcids)
+        if not ids:
+            return []
 
+        batches = self._batches(ids)
+        found: Dict[str, Paper] = {}
+        if len(batches) == 1:
+            found.update(self._fetch_batch(batches[0]))
+        else:
+            with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS) as executor:
+                for batch_found in executor.map(self._fetch_batch, batches):
+                    found.update(batch_found)
+
+        return [found[pmcid] for pmcid in ids if pmcid in found]
+
+    def _fetch_batch(self, ids: List[str]) -> Dict[str, Paper]:
+        """Fetch one EFetch batch of numeric PMCIDs.
+
+        Args:
+            ids: Numeric PMCIDs, at most MAX_IDS_PER_EFETCH
+
+        Returns:
+            Mapping of numeric PMCID to Paper for the articles returned
+        """
         try:
-            # Use EFetch API to get paper details
             fetch_url = f"{self.EUTILS_BASE}/efetch.fcgi"
-            params = {
-                "db": "pmc",
-                "id": pmcid,
-                "retmode": "xml",
-                "tool": "paper_search_mcp",
-                "email": "paper-search-mcp@example.com"
-            }
+            params = self._efetch_batch_params(ids)
+            with cached_stream(
+                self.cache, self._get, fetch_url, params, ttl=self.EFETCH_TTL
+            ) as stream:
+                return self._parse_batch(stream, ids)
 
-            response = self.session.get(fetch_url, params=params, timeout=30)
-            response.raise_for_status()
+        except Exception as e:
+            logger.error(f"Error fetching papers {', '.join(ids)}: {e}")
+            return {}
 
-            return self._parse_pmc_xml(response.content, pmcid)
+    def _parse_batch(self, stream, ids: List[str]) -> Dict[str, Paper]:
+        """Parse a batched EFetch response stream article by article.
+
+        Args:
+            stream: Readable binary stream of the EFetch XML
+            ids: Numeric PMCIDs requested, used when an article lacks its ID
+
+        Returns:
+            Mapping of numeric PMCID to Paper for the articles returned
+        """
+        found = {}
+        ctx = _PMCParseCtx()
+        for position, article in enumerate(_iter_elements(stream, "article")):
+            pmcid = self._article_pmcid(article)
+            if not pmcid and position < len(ids):
+                pmcid = ids[position]
+            if not pmcid:
+                continue
+            paper = self._parse_pmc_xml_element(article, pmcid, ctx)
+            if paper:
+                found[pmcid] = paper
+        return found
+
+    def _async_client(self) -> httpx.AsyncClient:
+        """Create an async client; HTTP/2 multiplexing is used when h2 is installed."""
+        return httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            headers={"User-Agent": self.session.headers["User-Agent"]},
+            timeout=30,
+            follow_redirects=True,
+        )
+
+    async def _aget(self, client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+        """Issue an async GET within NCBI's rate limit.
+
+        The User-Agent is sent per request so a shared client can be used.
+        """
+        await _NCBI_RATE_LIMITER.await_turn()
+        return await client.get(url, headers={"User-Agent": self.session.headers["User-Agent"]}, **kwargs)
+
+    async def asearch(
+        self,
+        query: str,
+        max_results: int = 10,
+        year: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> List[Paper]:
+        """Search PubMed Central without blocking the event loop.
+
+        Async counterpart of search(); shares its response cache.
+
+        Args:
+            query: Search query string
+            max_results: Maximum number of papers to return
+            year: Optional year filter (e.g., '2020' or '2018-2022')
+            client: Optional client to reuse (one is created otherwise)
+
+        Returns:
+            List of Paper objects
+        """
+        try:
+            async with borrow_client(client, self._async_client) as client:
+                search_url = f"{self.EUTILS_BASE}/esearch.fcgi"
+                content = await acached_content(
+                    self.cache, partial(self._aget, client), search_url,
+                    self._esearch_params(query, max_results, year), ttl=self.ESEARCH_TTL
+                )
+                pmcids = _json_loads(content).get("esearchresult", {}).get("idlist", [])
+                if not pmcids:
+                    logger.info(f"No PMC papers found for query: {query}")
+                    return []
+                return await self._aget_papers(client, pmcids[:max_results])
+        except Exception as e:
+            logger.error(f"Error searching PMC: {e}")
+            return []
+
+    async def aget_papers_by_pmcids(
+        self,
+        pmcids: List[str],
+        client: Optional[httpx.AsyncClient] = None
+    ) -> List[Paper]:
+        """Async counterpart of get_papers_by_pmcids(); batches run concurrently.
+
+        Args:
+            pmcids: PubMed Central IDs (e.g., ['PMC1234567', '7654321'])
+            client: Optional client to reuse (one is created otherwise)
+
+        Returns:
+            Paper objects in the order of the requested IDs
+        """
+        async with borrow_client(client, self._async_client) as client:
+            return await self._aget_papers(client, pmcids)
+
+    async def aget_paper_by_pmcid(
+        self,
+        pmcid: str,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> Optional[Paper]:
+        """Async counterpart of get_paper_by_pmcid() (metadata only).
+
+        Args:
+            pmcid: PubMed Central ID (e.g., 'PMC1234567' or just '1234567')
+            client: Optional client to reuse (one is created otherwise)
+
+        Returns:
+            Paper object or None if not found
+        """
+        papers = await self.aget_papers_by_pmcids([pmcid], client)
+        return papers[0] if papers else None
+
+    async def _aget_papers(self, client: httpx.AsyncClient, pmcids: List[str]) -> List[Paper]:
+        """Fetch all EFetch batches for pmcids concurrently on one client."""
+        ids = self._normalize_ids(pmcids)
+        if not ids:
+            return []
+
+        async def fetch(batch: List[str]) -> Dict[str, Paper]:
+            try:
+                content = await acached_content(
+                    self.cache, partial(self._aget, client), f"{self.EUTILS_BASE}/efetch.fcgi",
+                    self._efetch_batch_params(batch), ttl=self.EFETCH_TTL
+                )
+                return self._parse_batch(io.BytesIO(content), batch)
+            except Exception as e:
+                logger.error(f"Error fetching papers {', '.join(batch)}: {e}")
+                return {}
+
+        found: Dict[str, Paper] = {}
+        for batch_found in await asyncio.gather(*(fetch(batch) for batch in self._batches(ids))):
+            found.update(batch_found)
+        return [found[pmcid] for pmcid in ids if pmcid in found]
+
+    def _fetch_article_xml(self, pmcid: str, metadata_only: bool = False) -> bytes:
+        """Fetch (or load from cache) the EFetch JATS XML for one numeric PMCID.
+
+        Args:
+            pmcid: Numeric PMCID
+            metadata_only: Request front matter only (rettype=abstract)
+                instead of the full text
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        fetch_url = f"{self.EUTILS_BASE}/efetch.fcgi"
+        params = {
+            "db": "pmc",
+            "id": pmcid,
+            "retmode": "xml",
+            "tool": "paper_search_mcp",
+            "email": "paper-search-mcp@example.com"
+        }
+        if metadata_only:
+            params["rettype"] = "abstract"
+        return cached_content(self.cache, self._get, fetch_url, params, ttl=self.EFETCH_TTL)
+
+    def get_paper_by_pmcid(self, pmcid: str, metadata_only: bool = True) -> Optional[Paper]:
+        """Get a specific paper by its PMCID.
+
+        Args:
+            pmcid: PubMed Central ID (e.g., 'PMC1234567' or just '1234567')
+            metadata_only: Fetch front matter only, skipping the full-text body
+
+        Returns:
+            Paper object or None if not found
+        """
+        try:
+            pmcid, _ = self._normalize_pmcid(pmcid)
+            content = self._fetch_article_xml(pmcid, metadata_only=metadata_only)
+            return self._parse_pmc_xml(content, pmcid)
 
         except Exception as e:
             logger.error(f"Error fetching paper {pmcid}: {e}")
@@ -148,67 +523,88 @@ class PMCSearcher:
             Paper object or None if parsing fails
         """
         try:
-            root = ET.fromstring(xml_content)
+            root = _parse_xml(xml_content)
+            article = root if root.tag == "article" else _first(_XP_ARTICLE, root)
+            return self._parse_pmc_xml_element(article if article is not None else root, pmcid)
+        except Exception as e:
+            logger.error(f"Error parsing PMC XML: {e}")
+            return None
 
-            # Namespace handling
-            namespaces = {
-                'mml': 'http://www.w3.org/1998/Math/MathML',
-                'xlink': 'http://www.w3.org/1999/xlink',
-                'xsi': 'http://www.w3.org/2001/XMLSchema-instance'
-            }
+    @staticmethod
+    def _article_pmcid(article) -> str:
+        """Return the numeric PMCID recorded in an <article> element, if any."""
+        for xpath in (_XP_PMCID, _XP_PMCID_ALT):
+            elem = _first(xpath, article)
+            if elem is not None and elem.text:
+                match = PMCSearcher._PMCID_RE.match(elem.text)
+                if match:
+                    return match.group(1)
+        return ""
+
+    def _parse_pmc_xml_element(
+        self,
+        root,
+        pmcid: str,
+        ctx: Optional[_PMCParseCtx] = None
+    ) -> Optional[Paper]:
+        """Parse a single PMC <article> element into a Paper object.
 
+        Args:
+            root: Article element from a PMC EFetch response
+            pmcid: Numeric PMCID for this paper
+            ctx: Parse context to reuse across a batch (a new one if omitted)
+
+        Returns:
+            Paper object or None if parsing fails
+        """
+        if ctx is None:
+            ctx = _PMCParseCtx()
+        else:
+            ctx.reset()
+
+        try:
             # Extract title
-            title = ""
-            title_elem = root.find(".//article-title")
+            title_elem = _first(_XP_TITLE, root)
             if title_elem is not None:
-                title = "".join(title_elem.itertext()).strip()
+                ctx.title = _element_text(title_elem)
 
             # Extract abstract
-            abstract = ""
-            abstract_elem = root.find(".//abstract")
+            abstract_elem = _first(_XP_ABSTRACT, root)
             if abstract_elem is not None:
-                abstract = "".join(abstract_elem.itertext()).strip()
+                ctx.abstract = _element_text(abstract_elem)
 
             # Extract authors
-            authors = []
-            for contrib in root.findall(".//contrib"):
-                if contrib.get("contrib-type") == "author":
-                    name_elem = contrib.find(".//name")
-                    if name_elem is not None:
-                        given = name_elem.findtext("given-names", "")
-                        surname = name_elem.findtext("surname", "")
-                        if given and surname:
-                            authors.append(f"{given} {surname}")
-                        elif surname:
-                            authors.append(surname)
+            for name_elem in _XP_AUTHOR_NAMES(root):
+                given = name_elem.findtext("given-names", "")
+                surname = name_elem.findtext("surname", "")
+                if given and surname:
+                    ctx.authors.append(f"{given} {surname}")
+                elif surname:
+                    ctx.authors.append(surname)
 
             # Extract publication date
-            published_date = None
-            pub_date_elem = root.find(".//pub-date")
+            pub_date_elem = _first(_XP_PUB_DATE, root)
             if pub_date_elem is not None:
                 year = pub_date_elem.findtext("year")
                 month = pub_date_elem.findtext("month")
                 day = pub_date_elem.findtext("day")
-                if year:
-                    try:
-                        month_int = int(month) if month and month.isdigit() else 1
-                        day_int = int(day) if day and day.isdigit() else 1
-                        published_date = datetime(int(year), month_int, day_int)
-                    except:
-                        published_date = datetime(int(year), 1, 1)
+                year_int = _to_int_or(0, year, 1, 9999)
+                if year_int:
+                    month_int = _to_int_or(1, month, 1, 12)
+                    day_int = _to_int_or(1, day, 1, calendar.monthrange(year_int, month_int)[1])
+                    ctx.published_date = datetime(year_int, month_int, day_int)
 
             # Extract DOI
-            doi = ""
-            for doi_elem in root.findall(".//article-id[@pub-id-type='doi']"):
-                if doi_elem is not None and doi_elem.text:
-                    doi = doi_elem.text.strip()
+            for doi_elem in _XP_DOI(root):
+                if doi_elem.text:
+                    ctx.doi = doi_elem.text.strip()
                     break
 
             # Extract journal/title info
-            journal = ""
-            journal_elem = root.find(".//journal-title")
+            journal_elem = _first(_XP_JOURNAL, root)
             if journal_elem is not None and journal_elem.text:
-                journal = journal_elem.text.strip()
+                # Interned: batched results share one string per journal
+                ctx.journal = sys.intern(journal_elem.text.strip())
 
             # Build URLs
             full_pmcid = f"{self.PMCID_PREFIX}{pmcid}"
@@ -217,21 +613,21 @@ class PMCSearcher:
 
             return Paper(
                 paper_id=full_pmcid,
-                title=title,
-                authors=authors,
-                abstract=abstract,
-                doi=doi,
-                published_date=published_date or datetime.min,
+                title=ctx.title,
+                authors=ctx.authors,
+                abstract=ctx.abstract,
+                doi=ctx.doi,
+                published_date=ctx.published_date or datetime.min,
                 pdf_url=pdf_url,
                 url=url,
                 source="pmc",
-                categories=[journal] if journal else [],
+                categories=[ctx.journal] if ctx.journal else [],
                 keywords=[],
                 citations=0,
                 references=[],
                 extra={
                     "pmcid": full_pmcid,
-                    "journal": journal
+                    "journal": ctx.journal
                 }
             )
 
@@ -249,22 +645,35 @@ class PMCSearcher:
         Returns:
             Path to downloaded PDF or error message
         """
-        # Clean PMCID
-        pmcid = paper_id.replace("PMC", "").strip()
-        full_pmcid = f"{self.PMCID_PREFIX}{pmcid}"
-
         try:
+            _, full_pmcid = self._normalize_pmcid(paper_id)
             os.makedirs(save_path, exist_ok=True)
-            pdf_url = f"https://www.ncbi.nlm.nih.gov/pmc/articles/{full_pmcid}/pdf/"
-
-            response = self.session.get(pdf_url, timeout=30)
-            response.raise_for_status()
-
             filename = f"{full_pmcid}.pdf"
             file_path = os.path.join(save_path, filename)
 
-            with open(file_path, 'wb') as f:
-                f.write(response.content)
+            # A PMC PDF never changes, so a previous download is kept for good
+            if self._is_pdf(file_path):
+                return file_path
+
+            pdf_url = f"https://www.ncbi.nlm.nih.gov/pmc/articles/{full_pmcid}/pdf/"
+
+            # Stream to a temporary file so a failed transfer never leaves a
+            # truncated PDF that the check above would later reuse
+            partial_path = file_path + ".part"
+            try:
+                with self.session.get(pdf_url, timeout=30, stream=True) as response:
+                    response.raise_for_status()
+                    with open(partial_path, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=65536):
+                            f.write(chunk)
+                # PMC answers some requests with an HTML interstitial and a 200;
+                # only a real PDF is kept, since it is reused from then on
+                if not self._is_pdf(partial_path):
+                    return f"Failed to download PDF: {full_pmcid} returned no PDF"
+                os.replace(partial_path, file_path)
+            finally:
+                if os.path.exists(partial_path):
+                    os.remove(partial_path)
 
             return file_path
 
@@ -272,8 +681,42 @@ class PMCSearcher:
             logger.error(f"Error downloading PDF for {paper_id}: {e}")
             return f"Failed to download PDF: {e}"
 
+    @staticmethod
+    def _is_pdf(path: str) -> bool:
+        """Return True if path is a file starting with the PDF signature."""
+        try:
+            with open(path, 'rb') as f:
+                return f.read(5) == b"%PDF-"
+        except OSError:
+            return False
+
+    @staticmethod
+    def _jats_full_text(xml_content: bytes) -> str:
+        """Return title, abstract and body text of a JATS article, or '' if it has no <body>."""
+        root = _parse_xml(xml_content)
+        article = root if root.tag == "article" else _first(_XP_ARTICLE, root)
+        if article is None:
+            return ""
+        body = _first(_XP_BODY, article)
+        if body is None:
+            return ""
+        blocks = []
+        title = _first(_XP_TITLE, article)
+        if title is not None:
+            blocks.append(_element_text(title))
+        abstract = _first(_XP_ABSTRACT, article)
+        if abstract is not None:
+            blocks.extend(_block_texts(abstract))
+        blocks.extend(_block_texts(body))
+        return "\n".join(block for block in blocks if block)
+
     def read_paper(self, paper_id: str, save_path: str = "./downloads") -> str:
-        """Read and extract text from a PMC paper PDF.
+        """Read the full text of a PMC paper.
+
+        The JATS XML full text from EFetch is used when PMC has it; the PDF
+        is downloaded and extracted only for articles without a <body>.
+        The text is saved as <PMCID>.txt in save_path and returned directly
+        on later calls, since PMC articles are immutable.
 
         Args:
             paper_id: PMC ID (e.g., 'PMC1234567' or '1234567')
@@ -282,20 +725,48 @@ class PMCSearcher:
         Returns:
             Extracted text content or empty string on failure
         """
-        pdf_path = self.download_pdf(paper_id, save_path)
-
-        if pdf_path.startswith("Failed"):
+        try:
+            pmcid, full_pmcid = self._normalize_pmcid(paper_id)
+        except ValueError as e:
+            logger.error(f"Error reading paper: {e}")
             return ""
-
+        txt_path = os.path.join(save_path, f"{full_pmcid}.txt")
+        cached_pdf_path = os.path.join(save_path, f"{full_pmcid}.pdf")
         try:
-            reader = PdfReader(pdf_path)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
+            if os.path.isfile(txt_path) and (
+                not os.path.exists(cached_pdf_path)
+                or os.path.getmtime(txt_path) >= os.path.getmtime(cached_pdf_path)
+            ):
+                with open(txt_path, 'r', encoding='utf-8') as f:
+                    return f.read()
+        except OSError as e:
+            logger.warning(f"Ignoring unreadable text cache {txt_path}: {e}")
+
+        text = ""
+        try:
+            text = self._jats_full_text(self._fetch_article_xml(pmcid))
         except Exception as e:
-            logger.error(f"Error reading PDF: {e}")
-            return ""
+            logger.warning(f"No JATS full text for {full_pmcid}, falling back to PDF: {e}")
+
+        if not text:
+            pdf_path = self.download_pdf(paper_id, save_path)
+
+            if pdf_path.startswith("Failed"):
+                return ""
+
+            try:
+                text = extract_pdf_text(pdf_path)
+            except Exception as e:
+                logger.error(f"Error reading PDF: {e}")
+                return ""
+
+        try:
+            os.makedirs(save_path, exist_ok=True)
+            with open(txt_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+        except OSError as e:
+            logger.warning(f"Could not cache extracted text to {txt_path}: {e}")
+        return text
 
     def get_full_text_xml(self, paper_id: str) -> Optional[str]:
         """Get the full text XML of a PMC paper.
@@ -306,23 +777,10 @@ class PMCSearcher:
         Returns:
             XML content as string or None if not found
         """
-        # Clean PMCID
-        pmcid = paper_id.replace("PMC", "").strip()
-
         try:
-            fetch_url = f"{self.EUTILS_BASE}/efetch.fcgi"
-            params = {
-                "db": "pmc",
-                "id": pmcid,
-                "retmode": "xml",
-                "tool": "paper_search_mcp",
-                "email": "paper-search-mcp@example.com"
-            }
-
-            response = self.session.get(fetch_url, params=params, timeout=30)
-            response.raise_for_status()
-
-            return response.text
+            pmcid, _ = self._normalize_pmcid(paper_id)
+            content = self._fetch_article_xml(pmcid)
+            return content.decode("utf-8", errors="replace")
 
         except Exception as e:
             logger.error(f"Error fetching full text XML for {paper_id}: {e}")
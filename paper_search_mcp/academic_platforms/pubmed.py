@@ -1,11 +1,17 @@
 # paper_search_mcp/sources/pubmed.py
-from typing import List
+from functools import partial
+from typing import List, Optional
 import requests
-from xml.etree import ElementTree as ET
+from urllib3.util.request import ACCEPT_ENCODING
 from datetime import datetime
 from ..paper import Paper
+from ..http_cache import ResponseCache, acached_content, cached_content, cached_stream
+from ..http_client import _HTTP2_AVAILABLE, borrow_client
+from ..ncbi import ET, _NCBI_ADAPTER, _iter_elements, _parse_xml
+import io
 import os
 import logging
+import httpx
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +32,24 @@ class PubMedSearcher(PaperSource):
     """Searcher for PubMed papers"""
     SEARCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
     FETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+    # Response cache lifetimes: search hits change daily, article records rarely
+    ESEARCH_TTL = 48 * 3600
+    EFETCH_TTL = 7 * 24 * 3600
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """Initialize PubMed searcher.
+
+        Args:
+            cache_dir: Optional response cache root (default: ~/.cache/paper-search-mcp)
+        """
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (compatible; paper-search-mcp/1.0)',
+            # gzip/deflate, plus br/zstd when brotli/zstandard are installed
+            'Accept-Encoding': ACCEPT_ENCODING,
+        })
+        self.session.mount("https://", _NCBI_ADAPTER)
+        self.cache = ResponseCache("pubmed", cache_dir)
 
     def search(self, query: str, max_results: int = 10) -> List[Paper]:
         """Search PubMed for papers.
@@ -39,38 +63,22 @@ class PubMedSearcher(PaperSource):
         """
         papers = []
         try:
-            search_params = {
-                'db': 'pubmed',
-                'term': query,
-                'retmax': max_results,
-                'retmode': 'xml'
-            }
-            search_response = requests.get(self.SEARCH_URL, params=search_params, timeout=30)
-            search_response.raise_for_status()
-            search_root = ET.fromstring(search_response.content)
-            ids = [id.text for id in search_root.findall('.//Id')]
+            search_content = cached_content(
+                self.cache, self.session.get, self.SEARCH_URL,
+                self._search_params(query, max_results), ttl=self.ESEARCH_TTL
+            )
+            ids = self._parse_ids(search_content)
 
             if not ids:
                 logger.info(f"No results found for query: {query}")
                 return papers
 
-            fetch_params = {
-                'db': 'pubmed',
-                'id': ','.join(ids),
-                'retmode': 'xml'
-            }
-            fetch_response = requests.get(self.FETCH_URL, params=fetch_params, timeout=30)
-            fetch_response.raise_for_status()
-            fetch_root = ET.fromstring(fetch_response.content)
-
-            for article in fetch_root.findall('.//PubmedArticle'):
-                try:
-                    paper = self._parse_article(article)
-                    if paper:
-                        papers.append(paper)
-                except Exception as e:
-                    logger.warning(f"Error parsing PubMed article: {e}")
-                    continue
+            # Parse articles as they arrive instead of building the whole DOM
+            with cached_stream(
+                self.cache, self.session.get, self.FETCH_URL,
+                self._fetch_params(ids), ttl=self.EFETCH_TTL
+            ) as stream:
+                papers = self._parse_articles(stream)
 
         except requests.RequestException as e:
             logger.error(f"Error fetching from PubMed: {e}")
@@ -79,6 +87,91 @@ class PubMedSearcher(PaperSource):
 
         return papers
 
+    def _async_client(self) -> httpx.AsyncClient:
+        """Create an async client; HTTP/2 multiplexing is used when h2 is installed."""
+        return httpx.AsyncClient(http2=_HTTP2_AVAILABLE, timeout=30, follow_redirects=True)
+
+    async def asearch(
+        self,
+        query: str,
+        max_results: int = 10,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> List[Paper]:
+        """Search PubMed without blocking the event loop.
+
+        Async counterpart of search(); shares its response cache.
+
+        Args:
+            query: Search query string
+            max_results: Maximum number of papers to return
+            client: Optional client to reuse (one is created otherwise)
+
+        Returns:
+            List of Paper objects
+        """
+        try:
+            async with borrow_client(client, self._async_client) as client:
+                # Sent per request so a shared client can be used
+                get = partial(client.get, headers={'User-Agent': self.session.headers['User-Agent']})
+                search_content = await acached_content(
+                    self.cache, get, self.SEARCH_URL,
+                    self._search_params(query, max_results), ttl=self.ESEARCH_TTL
+                )
+                ids = self._parse_ids(search_content)
+                if not ids:
+                    logger.info(f"No results found for query: {query}")
+                    return []
+
+                fetch_content = await acached_content(
+                    self.cache, get, self.FETCH_URL,
+                    self._fetch_params(ids), ttl=self.EFETCH_TTL
+                )
+                return self._parse_articles(io.BytesIO(fetch_content))
+
+        except httpx.HTTPError as e:
+            logger.error(f"Error fetching from PubMed: {e}")
+        except ET.ParseError as e:
+            logger.error(f"Error parsing PubMed response: {e}")
+        return []
+
+    @staticmethod
+    def _search_params(query: str, max_results: int) -> dict:
+        """Build ESearch query parameters."""
+        return {
+            'db': 'pubmed',
+            'term': query,
+            'retmax': max_results,
+            'retmode': 'xml'
+        }
+
+    @staticmethod
+    def _fetch_params(ids: List[str]) -> dict:
+        """Build EFetch query parameters for a list of PMIDs."""
+        return {
+            'db': 'pubmed',
+            'id': ','.join(ids),
+            'retmode': 'xml'
+        }
+
+    @staticmethod
+    def _parse_ids(search_content: bytes) -> List[str]:
+        """Extract PMIDs from an ESearch XML response."""
+        search_root = _parse_xml(search_content)
+        return [id.text for id in search_root.findall('.//Id')]
+
+    def _parse_articles(self, stream) -> List[Paper]:
+        """Parse an EFetch XML stream into papers, skipping malformed articles."""
+        papers = []
+        for article in _iter_elements(stream, 'PubmedArticle'):
+            try:
+                paper = self._parse_article(article)
+                if paper:
+                    papers.append(paper)
+            except Exception as e:
+                logger.warning(f"Error parsing PubMed article: {e}")
+                continue
+        return papers
+
     def _parse_article(self, article) -> Paper:
         """Parse a PubMed article element into a Paper object.
 
@@ -115,13 +208,10 @@ class PubMedSearcher(PaperSource):
             abstract = abstract_elem.text if abstract_elem is not None and abstract_elem.text else ""
 
             # Extract publication date
-            pub_date = None
             year_elem = article.find('.//PubDate/Year')
-            if year_elem is not None and year_elem.text:
-                try:
-                    pub_date = datetime.strptime(year_elem.text, '%Y')
-                except ValueError:
-                    pub_date = datetime.now()
+            year = year_elem.text.strip() if year_elem is not None and year_elem.text else ""
+            if year.isdigit() and 1 <= int(year) <= 9999:
+                pub_date = datetime(int(year), 1, 1)
             else:
                 pub_date = datetime.now()
 
@@ -13,6 +13,14 @@ import re
 logger = logging.getLogger(__name__)
 
 
+def _retry_after_seconds(response) -> Optional[float]:
+    """Return a response's Retry-After delay in seconds, if given as a number."""
+    try:
+        return max(0.0, float(response.headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return None
+
+
 class PaperSource:
     """Abstract base class for paper sources"""
 
@@ -31,6 +39,9 @@ class SemanticSearcher(PaperSource):
 
     SEMANTIC_SEARCH_URL = "https://api.semanticscholar.org/graph/v1/paper/search"
     SEMANTIC_BASE_URL = "https://api.semanticscholar.org/graph/v1"
+    MAX_BATCH_IDS = 500  # Semantic Scholar limit on IDs per paper/batch request
+    MAX_RETRY_WAIT = 30  # Longest 429 wait worth sleeping through before giving up
+    RATE_LIMIT_COOLDOWN = 60  # Seconds to stop sending after a final 429 without Retry-After
     BROWSERS = [
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7)",
@@ -39,6 +50,8 @@ class SemanticSearcher(PaperSource):
 
     def __init__(self):
         self._setup_session()
+        # Monotonic time until which requests are refused after being rate limited
+        self._rate_limited_until = 0.0
 
     def _setup_session(self):
         """Initialize session with random user agent"""
@@ -156,30 +169,47 @@ class SemanticSearcher(PaperSource):
             return None
         return api_key.strip()
     
-    def request_api(self, path: str, params: dict) -> dict:
+    def request_api(self, path: str, params: dict, json_body: Optional[dict] = None) -> dict:
         """
         Make a request to the Semantic Scholar API with optional API key.
+        Sends a POST with json_body when given, otherwise a GET.
+
+        A 429 is retried after its Retry-After delay (or exponential backoff).
+        Once retries are exhausted, further calls fail fast until the server's
+        Retry-After (or RATE_LIMIT_COOLDOWN) has passed, instead of adding to
+        the load that caused the limit.
         """
         max_retries = 3
         retry_delay = 2  # seconds
-        
+        rate_limited = {"error": "rate_limited", "status_code": 429, "message": "Too many requests. Please wait before retrying."}
+
+        if time.monotonic() < self._rate_limited_until:
+            logger.warning("Rate limited (429) recently; skipping request until the cooldown ends")
+            return rate_limited
+
         for attempt in range(max_retries):
             try:
                 api_key = self.get_api_key()
                 headers = {"x-api-key": api_key} if api_key else {}
                 url = f"{self.SEMANTIC_BASE_URL}/{path}"
-                response = self.session.get(url, params=params, headers=headers)
+                if json_body is not None:
+                    response = self.session.post(url, params=params, json=json_body, headers=headers)
+                else:
+                    response = self.session.get(url, params=params, headers=headers)
                 
                 # 检查是否是429错误（限流）
                 if response.status_code == 429:
-                    if attempt < max_retries - 1:
-                        wait_time = retry_delay * (2 ** attempt)  # 指数退避
+                    retry_after = _retry_after_seconds(response)
+                    wait_time = retry_after if retry_after is not None else retry_delay * (2 ** attempt)  # 指数退避
+                    if attempt < max_retries - 1 and wait_time <= self.MAX_RETRY_WAIT:
                         logger.warning(f"Rate limited (429). Waiting {wait_time} seconds before retry {attempt + 1}/{max_retries}")
                         time.sleep(wait_time)
                         continue
                     else:
-                        logger.error(f"Rate limited (429) after {max_retries} attempts. Please wait before making more requests.")
-                        return {"error": "rate_limited", "status_code": 429, "message": "Too many requests. Please wait before retrying."}
+                        cooldown = retry_after if retry_after is not None else self.RATE_LIMIT_COOLDOWN
+                        self._rate_limited_until = time.monotonic() + cooldown
+                        logger.error(f"Rate limited (429) after {attempt + 1} attempts. Pausing requests for {cooldown} seconds.")
+                        return rate_limited
                 
                 response.raise_for_status()
                 return response
@@ -193,7 +223,7 @@ class SemanticSearcher(PaperSource):
                         continue
                     else:
                         logger.error(f"Rate limited (429) after {max_retries} attempts. Please wait before making more requests.")
-                        return {"error": "rate_limited", "status_code": 429, "message": "Too many requests. Please wait before retrying."}
+                        return rate_limited
                 else:
                     logger.error(f"HTTP Error requesting API: {e}")
                     return {"error": "http_error", "status_code": e.response.status_code, "message": str(e)}
@@ -574,6 +604,63 @@ class SemanticSearcher(PaperSource):
 
         return papers
 
+    def get_papers_batch(self, paper_ids: List[str]) -> List[Paper]:
+        """
+        Get several Semantic Scholar papers with the batch endpoint.
+
+        IDs are POSTed to paper/batch, MAX_BATCH_IDS per request, so N
+        papers cost ceil(N / 500) round-trips instead of N.
+
+        Args:
+            paper_ids (List[str]): Paper IDs in any form the API accepts
+                (e.g., a paperId, 'DOI:10.1038/nature12373', 'ARXIV:2106.15928')
+
+        Returns:
+            List[Paper]: Papers in the order of the requested IDs; IDs that are
+            not found are omitted
+        """
+        return [paper for paper in self.get_papers_batch_aligned(paper_ids) if paper]
+
+    def get_papers_batch_aligned(self, paper_ids: List[str]) -> List[Optional[Paper]]:
+        """
+        Like get_papers_batch, but with one entry per requested ID.
+
+        Args:
+            paper_ids (List[str]): Paper IDs in any form the API accepts
+
+        Returns:
+            List[Optional[Paper]]: The paper for each ID in paper_ids, or None
+            where it was empty, not found or its chunk failed
+        """
+        papers: List[Optional[Paper]] = [None] * len(paper_ids)
+        positions = [pos for pos, paper_id in enumerate(paper_ids) if paper_id]
+        fields = ["title", "abstract", "year", "citationCount", "authors", "url",
+                  "publicationDate", "externalIds", "fieldsOfStudy", "openAccessPdf"]
+
+        for start in range(0, len(positions), self.MAX_BATCH_IDS):
+            chunk = positions[start:start + self.MAX_BATCH_IDS]
+            try:
+                response = self.request_api(
+                    "paper/batch", {"fields": ",".join(fields)},
+                    json_body={"ids": [paper_ids[pos] for pos in chunk]}
+                )
+
+                if isinstance(response, dict) and "error" in response:
+                    logger.error(f"Error fetching paper batch: {response.get('message', 'Unknown error')}")
+                    continue
+
+                if not hasattr(response, 'status_code') or response.status_code != 200:
+                    continue
+
+                # Results align with the requested IDs, with null for unknown ones
+                for pos, item in zip(chunk, response.json()):
+                    if item:
+                        papers[pos] = self._parse_paper(item)
+            except Exception as e:
+                logger.error(f"Error fetching paper batch: {e}")
+
+        return papers
+
     def search_by_author(self, author_name: str, max_results: int = 20) -> List[Paper]:
         """
         Search for papers by a specific author in Semantic Scholar.
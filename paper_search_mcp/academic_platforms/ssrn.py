@@ -3,20 +3,207 @@
 SSRN is a repository specializing in preprints from social sciences, law, business, and humanities.
 Note: SSRN doesn't have a public API, so we use web scraping with proper rate limiting.
 """
-from typing import List, Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import codecs
+import httpx
+import io
 import re
 import os
 import logging
+import threading
 import time
 
 from ..paper import Paper
+from ..http_client import _HTTP2_AVAILABLE, borrow_client
+from ..tool_cache import TTLCache
+
+try:
+    from lxml import etree
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "SSRN parsing requires lxml; html.parser is 5-10x slower and is not "
+        "used as a fallback. Install it with: pip install lxml"
+    ) from e
 
 logger = logging.getLogger(__name__)
 
 
+# charset parameter of a Content-Type header
+_CHARSET_RE = re.compile(r"""charset=["']?([\w.:-]+)""", re.IGNORECASE)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Paper-ID patterns applied to every result entry, compiled once
+_RE_ABS_ID = re.compile(r"abstract[=/](\d+)")
+_RE_HTML_ID = re.compile(r"/(\d+)\.html")
+_RE_ROW_ID = re.compile(r"(?:abstract)?[=/](\d+)")
+# Comma separator with its surrounding whitespace, for author/keyword lists
+_RE_COMMA = re.compile(r"\s*,\s*")
+
+
+def _cls(name: str) -> str:
+    """XPath predicate matching one token of an element's class attribute."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Selectors are compiled once; each call is then a single libxml2 traversal
+_XP_ENTRY_TITLE = etree.XPath(f"(.//a[{_cls('title')}])[1]")
+_XP_ENTRY_AUTHORS = etree.XPath(f"(.//span[{_cls('authors')}])[1]")
+_XP_ENTRY_DATE = etree.XPath(f"(.//span[{_cls('date')}])[1]")
+_XP_ABSTRACT = etree.XPath(f"(.//div[{_cls('abstract')}])[1]")
+_XP_TOPICS = etree.XPath(f".//a[{_cls('topic')}]")
+_XP_DOWNLOAD = etree.XPath(f"(.//a[{_cls('download')}])[1]")
+# Row title link: the first href matching abstract|rec=<n>, via EXSLT regex
+_XP_ROW_LINK = etree.XPath(
+    r"(.//a[re:test(@href, 'abstract|rec=\d+')])[1]",
+    namespaces={"re": "http://exslt.org/regular-expressions"},
+)
+_XP_CELLS = etree.XPath(".//td")
+_XP_PAGE_TITLE = etree.XPath(f"(//h1[{_cls('title')}])[1]")
+_XP_OG_TITLE = etree.XPath("string((//meta[@property='og:title'])[1]/@content)")
+_XP_DOI_META = etree.XPath("string((//meta[@name='citation_doi'])[1]/@content)")
+_XP_PAGE_AUTHORS = etree.XPath(f"(//div[{_cls('authors')}])[1]//a")
+_XP_PAGE_DATE = etree.XPath(f"(//div[{_cls('date')}])[1]")
+_XP_KEYWORDS = etree.XPath(f"(//div[{_cls('keywords')}])[1]")
+_XP_AUTHOR_NAME = etree.XPath(f"(//div[{_cls('author-name')}])[1]")
+
+
+_DATE_FORMATS = ("%B %d, %Y", "%B %Y", "%m/%d/%Y", "%Y-%m-%d")
+
+
+def _parse_date(text: str) -> Optional[datetime]:
+    """Parse an SSRN date in any of _DATE_FORMATS with a single strptime call.
+
+    The format is picked from the text's shape (leading digit or month name,
+    separator, comma) rather than by trying each format in turn.
+    """
+    text = text.strip()
+    if not text:
+        return None
+    if text[0].isdigit():
+        fmt = _DATE_FORMATS[2] if "/" in text else _DATE_FORMATS[3]
+    else:
+        fmt = _DATE_FORMATS[0] if "," in text else _DATE_FORMATS[1]
+    try:
+        return datetime.strptime(text, fmt)
+    except ValueError:
+        return None
+
+
+def _charset(content_type: str) -> Optional[str]:
+    """Return the codec named by a Content-Type charset, or None if absent/unknown."""
+    match = _CHARSET_RE.search(content_type or "")
+    if not match:
+        return None
+    try:
+        return codecs.lookup(match.group(1)).name
+    except LookupError:
+        return None
+
+
+@lru_cache(maxsize=8)
+def _html_parser(encoding: Optional[str] = None) -> "etree.HTMLParser":
+    """Return the shared libxml2 HTML parser for an encoding (None = sniff).
+
+    The tree is built in C straight from the response bytes, with no Python
+    object per node; comments/PIs are dropped so itertext() only sees
+    rendered text.
+    """
+    return etree.HTMLParser(encoding=encoding, remove_comments=True, remove_pis=True, no_network=True)
+
+
+def _parse_html(content: bytes, encoding: Optional[str] = None):
+    """Build the parse tree for an SSRN page once, with libxml2's HTML parser.
+
+    Args:
+        content: Raw response body
+        encoding: Charset from the HTTP headers; when None, libxml2 sniffs
+            the <meta> charset from the bytes
+
+    Raises:
+        ValueError: If the document has no content
+    """
+    root = etree.fromstring(content, _html_parser(encoding))
+    if root is None:
+        raise ValueError("Empty SSRN page")
+    return root
+
+
+# Result node class per tag: cards (div.paper-card) or table rows (tr.data)
+_RESULT_CLASS = {"div": "paper-card", "tr": "data"}
+_RESULT_TAGS = tuple(_RESULT_CLASS)
+
+
+def _iter_result_nodes(content: bytes, encoding: Optional[str] = None):
+    """Stream result cards (div.paper-card) and rows (tr.data) out of a listing page.
+
+    The lxml counterpart of a SoupStrainer: each node is handed over as soon
+    as it closes, then cleared together with the page chrome preceding it,
+    so only the result being parsed is held in memory.
+    """
+    context = etree.iterparse(
+        io.BytesIO(content),
+        events=("end",),
+        tag=_RESULT_TAGS,
+        html=True,
+        encoding=encoding,
+        remove_comments=True,
+        remove_pis=True,
+        no_network=True,
+    )
+    for _, elem in context:
+        if _RESULT_CLASS[elem.tag] not in (elem.get("class") or "").split():
+            continue
+        yield elem
+        elem.clear(keep_tail=True)
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+def _first(xpath, node):
+    """Return the first node selected by a compiled XPath, or None."""
+    found = xpath(node)
+    return found[0] if found else None
+
+
+def _text(elem) -> str:
+    """Return an element's text with whitespace collapsed ('' for None)."""
+    if elem is None:
+        return ""
+    return _WHITESPACE_RE.sub(" ", "".join(elem.itertext())).strip()
+
+
+def _leaf_text(elem) -> str:
+    """Return a leaf element's own text, whitespace collapsed ('' for None).
+
+    Titles, names, dates and topics are plain text nodes, so reading .text
+    skips the descendant walk _text() does; elements that do have children
+    fall back to it.
+    """
+    if elem is None:
+        return ""
+    if len(elem):
+        return _text(elem)
+    return " ".join((elem.text or "").split())
+
+
+@dataclass(slots=True)
+class _Entry:
+    """Lightweight listing entry; a full Paper is only built for kept results."""
+    paper_id: str
+    title: str
+    authors: List[str]
+    published_date: datetime
+    categories: List[str] = field(default_factory=list)
+    abstract: str = ""
+    pdf_url: str = ""
+
+
 class SSRNSearcher:
     """Searcher for SSRN preprints and early research.
 
@@ -32,24 +219,103 @@ class SSRNSearcher:
     BASE_URL = "https://papers.ssrn.com"
     SOLR_URL = "https://api.ssrn.com"
     ABSTRACT_URL = f"{BASE_URL}/abstract"
+    # Prefix of every paper page URL (<prefix><paper_id>.html)
+    _ABS_PREFIX = f"{ABSTRACT_URL}/"
     DOWNLOAD_URL = f"{BASE_URL}/cgi-bin/works"
+    # Default request headers, shared by the sync and async clients
+    _HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (compatible; paper-search-mcp/1.0)',
+        'Accept': 'text/html,application/xhtml+xml',
+        'Accept-Language': 'en-US,en;q=0.9'
+    }
+    # Content-Types that may still hold a PDF, checked by its %PDF- signature
+    _UNLABELLED_TYPES = frozenset({"", "application/octet-stream", "binary/octet-stream", "application/download"})
+    # Upper bound on in-flight requests from the async API
+    MAX_CONCURRENT_REQUESTS = 5
+    # Connection pool shared by every request of one searcher
+    POOL_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+    # Token bucket: sustained requests per second, and how many may burst at once
+    RATE_LIMIT = 5.0
+    RATE_BURST = 5
+    # Candidates fetched in full when resolving a DOI
+    DOI_CANDIDATES = 5
+    # In-memory memo of parsed paper/author pages (seconds, entries)
+    _CACHE_TTL = 600
+    _CACHE_SIZE = 256
 
     def __init__(self):
         """Initialize SSRN searcher."""
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (compatible; paper-search-mcp/1.0)',
-            'Accept': 'text/html,application/xhtml+xml',
-            'Accept-Language': 'en-US,en;q=0.9'
-        })
-        self.last_request_time = 0
-
-    def _rate_limit(self, delay: float = 1.0):
+        # Pooled keep-alive client; with h2 installed, concurrent requests are
+        # multiplexed over one HTTP/2 connection instead of one TLS session each
+        self.session = httpx.Client(
+            http2=_HTTP2_AVAILABLE,
+            headers=self._HEADERS,
+            timeout=30.0,
+            limits=self.POOL_LIMITS,
+            follow_redirects=True,
+        )
+        self._tokens = float(self.RATE_BURST)
+        self._last_refill = time.monotonic()
+        self._rate_lock = threading.Lock()
+        self._async_loop = None
+        self._async_semaphore = None
+        self._paper_cache = TTLCache(self._CACHE_SIZE, self._CACHE_TTL)
+        self._author_cache = TTLCache(self._CACHE_SIZE, self._CACHE_TTL)
+
+    def _reserve_slot(self) -> float:
+        """Take a token from the bucket and return how long to wait for it.
+
+        The bucket refills at RATE_LIMIT tokens per second up to RATE_BURST.
+        Tokens may go negative, so concurrent callers queue up one refill
+        interval apart instead of all waking at once.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.RATE_BURST), self._tokens + (now - self._last_refill) * self.RATE_LIMIT
+            )
+            self._last_refill = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.RATE_LIMIT
+
+    def _rate_limit(self):
         """Apply rate limiting to avoid being blocked."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < delay:
-            time.sleep(delay - elapsed)
-        self.last_request_time = time.time()
+        wait = self._reserve_slot()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def _arate_limit(self):
+        """Async counterpart of _rate_limit(); sleeps without blocking the loop."""
+        wait = self._reserve_slot()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _async_client(self) -> httpx.AsyncClient:
+        """Create an async client; HTTP/2 multiplexing is used when h2 is installed."""
+        return httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            headers=self.session.headers,
+            timeout=30,
+            limits=self.POOL_LIMITS,
+            follow_redirects=True,
+        )
+
+    def _concurrency_limit(self) -> asyncio.Semaphore:
+        """Return the request semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            self._async_loop = loop
+            self._async_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        return self._async_semaphore
+
+    async def _aget(self, client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+        """Issue a rate-limited async GET, bounded to MAX_CONCURRENT_REQUESTS in flight.
+
+        SSRN's headers are sent per request so a shared client can be used.
+        """
+        async with self._concurrency_limit():
+            await self._arate_limit()
+            return await client.get(url, headers=self._HEADERS, **kwargs)
 
     def search(
         self,
@@ -76,50 +342,18 @@ class SSRNSearcher:
         try:
             self._rate_limit()
 
-            # Build search URL
-            params = {
-                "query": query,
-                "pg": 1
-            }
-
-            if author_id:
-                params["authorId"] = author_id
-
-            response = self.session.get(f"{self.ABSTRACT_URL}/search.cfm", params=params, timeout=30)
+            response = self.session.get(
+                f"{self.ABSTRACT_URL}/search.cfm", params=self._search_params(query, author_id), timeout=30
+            )
 
             if response.status_code != 200:
                 logger.error(f"SSRN search failed with status {response.status_code}")
                 return papers
 
-            soup = BeautifulSoup(response.content, 'lxml')
-
             # Parse results
-            results = self._parse_search_results(soup, query)
-
-            # Apply filters
-            if year or topic:
-                filtered = []
-                for paper in results:
-                    # Year filter
-                    if year:
-                        paper_year = paper.published_date.year if paper.published_date else 0
-                        if "-" in year:
-                            parts = year.split("-")
-                            if paper_year < int(parts[0].strip()) or paper_year > int(parts[1].strip()):
-                                continue
-                        elif paper_year != int(year):
-                            continue
-
-                    # Topic filter
-                    if topic:
-                        paper_categories = [c.lower() for c in paper.categories]
-                        if topic.lower() not in paper_categories:
-                            continue
-
-                    filtered.append(paper)
-                results = filtered
-
-            papers = results[:max_results]
+            # Filter cheap entries first; Paper objects are built only for the kept ones
+            entries = self._parse_search_entries(response.content, _charset(response.headers.get("Content-Type", "")))
+            papers = [self._entry_to_paper(e) for e in self._filter_results(entries, year, topic)[:max_results]]
             logger.info(f"SSRN search: found {len(papers)} papers for '{query}'")
 
         except Exception as e:
@@ -127,6 +361,87 @@ class SSRNSearcher:
 
         return papers
 
+    async def asearch(
+        self,
+        query: str,
+        max_results: int = 10,
+        year: Optional[str] = None,
+        topic: Optional[str] = None,
+        author_id: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> List[Paper]:
+        """Search SSRN without blocking the event loop.
+
+        Async counterpart of search().
+
+        Args:
+            query: Search query string
+            max_results: Maximum number of papers (max: 100)
+            year: Optional year filter
+            topic: Topic/category filter
+            author_id: Filter by author SSRN ID
+            client: Optional client to reuse (one is created otherwise)
+
+        Returns:
+            List of Paper objects
+        """
+        try:
+            async with borrow_client(client, self._async_client) as client:
+                response = await self._aget(
+                    client, f"{self.ABSTRACT_URL}/search.cfm", params=self._search_params(query, author_id)
+                )
+            if response.status_code != 200:
+                logger.error(f"SSRN search failed with status {response.status_code}")
+                return []
+
+            entries = self._parse_search_entries(response.content, _charset(response.headers.get("Content-Type", "")))
+            papers = [self._entry_to_paper(e) for e in self._filter_results(entries, year, topic)[:max_results]]
+            logger.info(f"SSRN search: found {len(papers)} papers for '{query}'")
+            return papers
+
+        except Exception as e:
+            logger.error(f"SSRN search error: {e}")
+            return []
+
+    @staticmethod
+    def _search_params(query: str, author_id: Optional[str] = None) -> Dict:
+        """Build search.cfm query parameters."""
+        params = {
+            "query": query,
+            "pg": 1
+        }
+        if author_id:
+            params["authorId"] = author_id
+        return params
+
+    @staticmethod
+    def _filter_results(results: List[_Entry], year: Optional[str], topic: Optional[str]) -> List[_Entry]:
+        """Apply the optional year and topic filters to parsed listing entries."""
+        if not (year or topic):
+            return results
+
+        # Parse the filters once, not per entry
+        lo, hi = SSRNSearcher._year_range(year) if year else (None, None)
+        topic_key = topic.lower() if topic else None
+
+        return [
+            paper for paper in results
+            if (lo is None or lo <= paper.published_date.year <= hi)
+            and (topic_key is None or any(c.lower() == topic_key for c in paper.categories))
+        ]
+
+    @staticmethod
+    def _year_range(year: str) -> Tuple[int, int]:
+        """Parse a year filter ('2020' or '2018-2022') into inclusive bounds.
+
+        Raises:
+            ValueError: If the filter is not a year or year range
+        """
+        if "-" in year:
+            start, end = year.split("-", 1)
+            return int(start.strip()), int(end.strip())
+        return int(year), int(year)
+
     def search_by_doi(self, doi: str) -> Optional[Paper]:
         """Search for paper by DOI.
 
@@ -139,14 +454,29 @@ class SSRNSearcher:
         # SSRN doesn't directly support DOI search via API
         # Try searching by DOI string
         clean_doi = doi.replace("https://doi.org/", "").replace("doi:", "").strip()
-        results = self.search(clean_doi, max_results=1)
+        results = self.search(clean_doi, max_results=self.DOI_CANDIDATES)
 
-        for paper in results:
+        # Listing entries carry no DOI; fetch the candidates' detail pages in parallel
+        for paper in self._enrich(results):
             if clean_doi.lower() in paper.doi.lower():
                 return paper
 
         return None
 
+    def _enrich(self, papers: List[Paper]) -> List[Paper]:
+        """Replace listing entries with their full detail-page records.
+
+        Detail pages are fetched on MAX_CONCURRENT_REQUESTS threads, still
+        paced by the shared token bucket. Entries whose page cannot be
+        fetched are kept as they are.
+        """
+        if len(papers) <= 1:
+            details = [self.get_paper_by_id(paper.paper_id) for paper in papers]
+        else:
+            with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS) as executor:
+                details = list(executor.map(self.get_paper_by_id, (paper.paper_id for paper in papers)))
+        return [detail or paper for paper, detail in zip(papers, details)]
+
     def search_by_author(
         self,
         author_name: str,
@@ -165,6 +495,16 @@ class SSRNSearcher:
         """
         return self.search(f'author:"{author_name}"', max_results, year)
 
+    async def asearch_by_author(
+        self,
+        author_name: str,
+        max_results: int = 10,
+        year: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> List[Paper]:
+        """Async counterpart of search_by_author()."""
+        return await self.asearch(f'author:"{author_name}"', max_results, year, client=client)
+
     def get_paper_by_id(self, paper_id: str) -> Optional[Paper]:
         """Get a specific paper by its SSRN ID.
 
@@ -174,22 +514,77 @@ class SSRNSearcher:
         Returns:
             Paper object or None
         """
+        paper = self._paper_cache.get(paper_id)
+        if paper is not None:
+            return paper
+
         try:
             self._rate_limit()
 
-            url = f"{self.ABSTRACT_URL}/{paper_id}.html"
+            url = self._ABS_PREFIX + paper_id + ".html"
             response = self.session.get(url, timeout=30)
 
             if response.status_code == 404:
                 return None
             response.raise_for_status()
 
-            return self._parse_paper_page(response.content, paper_id)
+            paper = self._parse_paper_page(
+                response.content, paper_id, _charset(response.headers.get("Content-Type", ""))
+            )
+            if paper is not None:
+                self._paper_cache.set(paper_id, paper)
+            return paper
 
         except Exception as e:
             logger.error(f"Error fetching SSRN paper {paper_id}: {e}")
             return None
 
+    async def aget_paper_by_id(self, paper_id: str, client: Optional[httpx.AsyncClient] = None) -> Optional[Paper]:
+        """Async counterpart of get_paper_by_id().
+
+        Args:
+            paper_id: SSRN paper ID
+            client: Optional client to reuse (one is created otherwise)
+
+        Returns:
+            Paper object or None
+        """
+        paper = self._paper_cache.get(paper_id)
+        if paper is not None:
+            return paper
+
+        try:
+            async with borrow_client(client, self._async_client) as client:
+                response = await self._aget(client, self._ABS_PREFIX + paper_id + ".html")
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+
+            paper = self._parse_paper_page(
+                response.content, paper_id, _charset(response.headers.get("Content-Type", ""))
+            )
+            if paper is not None:
+                self._paper_cache.set(paper_id, paper)
+            return paper
+
+        except Exception as e:
+            logger.error(f"Error fetching SSRN paper {paper_id}: {e}")
+            return None
+
+    async def aget_papers_by_ids(self, paper_ids: List[str]) -> List[Optional[Paper]]:
+        """Fetch several SSRN papers concurrently over one client.
+
+        Args:
+            paper_ids: SSRN paper IDs
+
+        Returns:
+            Paper objects (None where not found), in the order of paper_ids
+        """
+        async with self._async_client() as client:
+            return list(await asyncio.gather(
+                *(self.aget_paper_by_id(paper_id, client) for paper_id in paper_ids)
+            ))
+
     def get_author_by_id(self, author_id: str) -> Optional[Dict]:
         """Get author information by SSRN ID.
 
@@ -199,6 +594,10 @@ class SSRNSearcher:
         Returns:
             Author info dict or None
         """
+        author_info = self._author_cache.get(author_id)
+        if author_info is not None:
+            return dict(author_info)
+
         try:
             self._rate_limit()
 
@@ -208,32 +607,54 @@ class SSRNSearcher:
             if response.status_code != 200:
                 return None
 
-            soup = BeautifulSoup(response.content, 'lxml')
+            author_info = self._parse_author_page(
+                response.content, author_id, _charset(response.headers.get("Content-Type", ""))
+            )
+            self._author_cache.set(author_id, author_info)
+            return dict(author_info)
 
-            # Parse author info
-            author_info = {"author_id": author_id}
+        except Exception as e:
+            logger.error(f"Error fetching SSRN author {author_id}: {e}")
+            return None
 
-            name_elem = soup.find("div", {"class": "author-name"})
-            if name_elem:
-                author_info["name"] = name_elem.get_text(strip=True)
+    async def aget_author_by_id(self, author_id: str) -> Optional[Dict]:
+        """Async counterpart of get_author_by_id()."""
+        author_info = self._author_cache.get(author_id)
+        if author_info is not None:
+            return dict(author_info)
 
-            return author_info
+        try:
+            async with self._async_client() as client:
+                response = await self._aget(
+                    client, f"{self.BASE_URL}/sol3/Authors.cfm",
+                    params={"action": "search", "txt_Query": author_id}
+                )
+            if response.status_code != 200:
+                return None
+            author_info = self._parse_author_page(
+                response.content, author_id, _charset(response.headers.get("Content-Type", ""))
+            )
+            self._author_cache.set(author_id, author_info)
+            return dict(author_info)
 
         except Exception as e:
             logger.error(f"Error fetching SSRN author {author_id}: {e}")
             return None
 
-    def get_author_papers(self, author_id: str, max_results: int = 50) -> List[Paper]:
+    def get_author_papers(self, author_id: str, max_results: int = 50, enrich: bool = False) -> List[Paper]:
         """Get all papers by an author.
 
         Args:
             author_id: SSRN author ID
             max_results: Maximum results
+            enrich: Fetch each paper's detail page (abstract, keywords, DOI)
+                in parallel instead of returning the listing entries
 
         Returns:
             List of Paper objects
         """
-        return self.search("", max_results, author_id=author_id)
+        papers = self.search("", max_results, author_id=author_id)
+        return self._enrich(papers) if enrich else papers
 
     def get_top_papers(
         self,
@@ -256,25 +677,51 @@ class SSRNSearcher:
 
             url = f"{self.ABSTRACT_URL}/topPapers.cfm"
 
-            params = {}
-            if topic:
-                params["topic"] = topic
-            if timeframe:
-                params["time"] = timeframe
-
-            response = self.session.get(url, params=params, timeout=30)
+            response = self.session.get(url, params=self._listing_params(topic, timeframe), timeout=30)
 
             if response.status_code != 200:
                 return []
 
-            soup = BeautifulSoup(response.content, 'lxml')
+            return self._parse_search_results(
+                response.content, "top papers", _charset(response.headers.get("Content-Type", ""))
+            )
 
-            return self._parse_search_results(soup, "top papers")
+        except Exception as e:
+            logger.error(f"Error fetching top papers: {e}")
+            return []
+
+    async def aget_top_papers(
+        self,
+        topic: Optional[str] = None,
+        timeframe: str = "month",
+        max_results: int = 10
+    ) -> List[Paper]:
+        """Async counterpart of get_top_papers()."""
+        try:
+            async with self._async_client() as client:
+                response = await self._aget(
+                    client, f"{self.ABSTRACT_URL}/topPapers.cfm", params=self._listing_params(topic, timeframe)
+                )
+            if response.status_code != 200:
+                return []
+            return self._parse_search_results(
+                response.content, "top papers", _charset(response.headers.get("Content-Type", ""))
+            )
 
         except Exception as e:
             logger.error(f"Error fetching top papers: {e}")
             return []
 
+    @staticmethod
+    def _listing_params(topic: Optional[str], timeframe: Optional[str] = None) -> Dict:
+        """Build query parameters for the top/new paper listings."""
+        params = {}
+        if topic:
+            params["topic"] = topic
+        if timeframe:
+            params["time"] = timeframe
+        return params
+
     def get_new_papers(
         self,
         topic: Optional[str] = None,
@@ -294,18 +741,35 @@ class SSRNSearcher:
 
             url = f"{self.ABSTRACT_URL}/newPapers.cfm"
 
-            params = {}
-            if topic:
-                params["topic"] = topic
-
-            response = self.session.get(url, params=params, timeout=30)
+            response = self.session.get(url, params=self._listing_params(topic), timeout=30)
 
             if response.status_code != 200:
                 return []
 
-            soup = BeautifulSoup(response.content, 'lxml')
+            return self._parse_search_results(
+                response.content, "new papers", _charset(response.headers.get("Content-Type", ""))
+            )
 
-            return self._parse_search_results(soup, "new papers")
+        except Exception as e:
+            logger.error(f"Error fetching new papers: {e}")
+            return []
+
+    async def aget_new_papers(
+        self,
+        topic: Optional[str] = None,
+        max_results: int = 10
+    ) -> List[Paper]:
+        """Async counterpart of get_new_papers()."""
+        try:
+            async with self._async_client() as client:
+                response = await self._aget(
+                    client, f"{self.ABSTRACT_URL}/newPapers.cfm", params=self._listing_params(topic)
+                )
+            if response.status_code != 200:
+                return []
+            return self._parse_search_results(
+                response.content, "new papers", _charset(response.headers.get("Content-Type", ""))
+            )
 
         except Exception as e:
             logger.error(f"Error fetching new papers: {e}")
@@ -324,9 +788,7 @@ class SSRNSearcher:
         try:
             os.makedirs(save_path, exist_ok=True)
 
-            self._rate_limit()
-
-            # Get download link
+            # Get download link (memoized if the paper was just looked up)
             paper = self.get_paper_by_id(paper_id)
             if not paper:
                 return f"Paper {paper_id} not found"
@@ -335,23 +797,41 @@ class SSRNSearcher:
             # We'll try the direct download link
             download_url = f"{self.DOWNLOAD_URL}?download=yes&paper_id={paper_id}"
 
-            response = self.session.get(download_url, timeout=60)
-
-            if response.status_code != 200:
-                return f"PDF download not available for {paper_id}"
-
-            content_type = response.headers.get("Content-Type", "")
-
-            if "pdf" in content_type.lower() or len(response.content) > 1000:
-                filename = f"ssrn_{paper_id}.pdf"
-                file_path = os.path.join(save_path, filename)
-
-                with open(file_path, 'wb') as f:
-                    f.write(response.content)
+            self._rate_limit()
 
-                return file_path
+            filename = f"ssrn_{paper_id}.pdf"
+            file_path = os.path.join(save_path, filename)
 
-            return f"PDF not available for {paper_id}"
+            # Stream to a temporary file so memory stays flat for large PDFs and
+            # a failed transfer never leaves a truncated file behind
+            partial_path = file_path + ".part"
+            try:
+                with self.session.stream("GET", download_url, timeout=60) as response:
+                    if response.status_code != 200:
+                        return f"PDF download not available for {paper_id}"
+
+                    # Decide from the headers before reading the body: login-wall
+                    # HTML is dropped untransferred, and only an unlabelled binary
+                    # body costs one chunk to check for the PDF signature
+                    content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+                    if "pdf" not in content_type and content_type not in self._UNLABELLED_TYPES:
+                        return f"PDF not available for {paper_id}"
+
+                    chunks = response.iter_bytes(chunk_size=65536)
+                    first = next(chunks, b"")
+                    if "pdf" not in content_type and not first.startswith(b"%PDF-"):
+                        return f"PDF not available for {paper_id}"
+
+                    with open(partial_path, 'wb') as f:
+                        f.write(first)
+                        for chunk in chunks:
+                            f.write(chunk)
+                os.replace(partial_path, file_path)
+            finally:
+                if os.path.exists(partial_path):
+                    os.remove(partial_path)
+
+            return file_path
 
         except Exception as e:
             logger.error(f"Error downloading SSRN PDF: {e}")
@@ -371,247 +851,233 @@ class SSRNSearcher:
             return paper.abstract
         return ""
 
-    def _parse_search_results(self, soup: BeautifulSoup, query: str) -> List[Paper]:
-        """Parse search results page into Paper objects."""
+    def _parse_search_results(self, content: bytes, query: str, encoding: Optional[str] = None) -> List[Paper]:
+        """Parse a search results page into Paper objects."""
+        return [self._entry_to_paper(entry) for entry in self._parse_search_entries(content, encoding)]
+
+    def _parse_search_entries(self, content: bytes, encoding: Optional[str] = None) -> List[_Entry]:
+        """Parse a search results page into lightweight listing entries.
+
+        Cards and rows come out of one streamed pass and are dispatched by
+        tag. Paper cards are preferred: once one parses, rows are neither
+        parsed nor kept.
+        """
         papers = []
+        row_papers = []
+        # Bound once: these are looked up for every node on the page
+        parse_entry = self._parse_paper_entry
+        parse_row = self._parse_paper_row
 
-        # Find all paper entries
-        for entry in soup.find_all("div", {"class": "paper-card"}):
+        for node in _iter_result_nodes(content, encoding):
             try:
-                paper = self._parse_paper_entry(entry)
-                if paper:
-                    papers.append(paper)
-            except Exception as e:
-                logger.warning(f"Error parsing SSRN paper entry: {e}")
-                continue
-
-        # Alternative parsing for table format
-        if not papers:
-            for row in soup.find_all("tr", {"class": "data"}):
-                try:
-                    paper = self._parse_paper_row(row)
+                if node.tag == "div":
+                    paper = parse_entry(node)
                     if paper:
                         papers.append(paper)
-                except Exception as e:
-                    logger.warning(f"Error parsing SSRN paper row: {e}")
-                    continue
+                        row_papers.clear()
+                # Alternative parsing for table format
+                elif not papers:
+                    paper = parse_row(node)
+                    if paper:
+                        row_papers.append(paper)
+            except Exception as e:
+                logger.warning(f"Error parsing SSRN paper {node.tag}: {e}")
+                continue
 
-        return papers
+        return papers or row_papers
+
+    @staticmethod
+    def _parse_author_page(content: bytes, author_id: str, encoding: Optional[str] = None) -> Dict:
+        """Parse an author search page into an author info dict."""
+        tree = _parse_html(content, encoding)
+
+        author_info = {"author_id": author_id}
+
+        name_elem = _first(_XP_AUTHOR_NAME, tree)
+        if name_elem is not None:
+            author_info["name"] = _leaf_text(name_elem)
+
+        return author_info
+
+    def _entry_to_paper(self, entry: _Entry) -> Paper:
+        """Build the full Paper record for a listing entry."""
+        return Paper(
+            paper_id=entry.paper_id,
+            title=entry.title,
+            authors=entry.authors,
+            abstract=entry.abstract[:3000],
+            doi="",  # listing pages carry no DOI
+            published_date=entry.published_date,
+            pdf_url=entry.pdf_url,
+            url=self._ABS_PREFIX + entry.paper_id + ".html",
+            source="ssrn",
+            categories=entry.categories[:5],
+            keywords=[],
+            citations=0,
+            references=[],
+            extra={
+                "ssrn_id": entry.paper_id,
+                "topics": entry.categories,
+                "download_url": entry.pdf_url
+            }
+        )
 
-    def _parse_paper_entry(self, entry) -> Optional[Paper]:
+    def _parse_paper_entry(self, entry) -> Optional[_Entry]:
         """Parse a paper card entry."""
         try:
             # Find paper ID and title link
-            link = entry.find("a", {"class": "title"})
-            if not link:
+            link = _first(_XP_ENTRY_TITLE, entry)
+            if link is None:
                 return None
 
             href = link.get("href", "")
-            match = re.search(r"abstract[=/](\d+)", href)
+            match = _RE_ABS_ID.search(href)
             if not match:
-                match = re.search(r"/(\d+)\.html", href)
+                match = _RE_HTML_ID.search(href)
 
             paper_id = match.group(1) if match else ""
 
-            title = link.get_text(strip=True)
+            title = _leaf_text(link)
             if not title:
                 return None
 
             # Authors
             authors = []
-            author_elem = entry.find("span", {"class": "authors"})
-            if author_elem:
-                author_text = author_elem.get_text(strip=True)
-                authors = [a.strip() for a in author_text.split(",") if a.strip()]
+            author_elem = _first(_XP_ENTRY_AUTHORS, entry)
+            if author_elem is not None:
+                author_text = _leaf_text(author_elem)
+                authors = [a for a in _RE_COMMA.split(author_text) if a]
 
             # Abstract
-            abstract = ""
-            abstract_elem = entry.find("div", {"class": "abstract"})
-            if abstract_elem:
-                abstract = abstract_elem.get_text(strip=True)
+            abstract = _text(_first(_XP_ABSTRACT, entry))
 
             # Date
             published_date = None
-            date_elem = entry.find("span", {"class": "date"})
-            if date_elem:
-                date_text = date_elem.get_text(strip=True)
-                try:
-                    published_date = datetime.strptime(date_text, "%B %d, %Y")
-                except:
-                    try:
-                        published_date = datetime.strptime(date_text, "%B %Y")
-                    except:
-                        pass
-
-            # URL
-            url = f"{self.ABSTRACT_URL}/{paper_id}.html"
+            date_elem = _first(_XP_ENTRY_DATE, entry)
+            if date_elem is not None:
+                published_date = _parse_date(_leaf_text(date_elem))
 
             # Categories/Topics
             categories = []
-            for topic in entry.find_all("a", {"class": "topic"}):
-                topic_text = topic.get_text(strip=True)
+            for topic in _XP_TOPICS(entry):
+                topic_text = _leaf_text(topic)
                 if topic_text:
                     categories.append(topic_text)
 
             # PDF URL (if available)
             pdf_url = ""
-            pdf_link = entry.find("a", {"class": "download"})
-            if pdf_link:
+            pdf_link = _first(_XP_DOWNLOAD, entry)
+            if pdf_link is not None:
                 pdf_href = pdf_link.get("href", "")
                 if "download" in pdf_href.lower():
                     pdf_url = pdf_href
 
-            return Paper(
+            return _Entry(
                 paper_id=paper_id,
                 title=title,
                 authors=authors,
-                abstract=abstract[:3000] if abstract else "",
-                doi="",  # SSRN doesn't use DOIs
                 published_date=published_date or datetime.min,
-                pdf_url=pdf_url,
-                url=url,
-                source="ssrn",
-                categories=categories[:5],
-                keywords=[],
-                citations=0,
-                references=[],
-                extra={
-                    "ssrn_id": paper_id,
-                    "topics": categories,
-                    "download_url": pdf_url
-                }
+                categories=categories,
+                abstract=abstract,
+                pdf_url=pdf_url
             )
 
         except Exception as e:
             logger.error(f"Error parsing SSRN entry: {e}")
             return None
 
-    def _parse_paper_row(self, row) -> Optional[Paper]:
+    def _parse_paper_row(self, row) -> Optional[_Entry]:
         """Parse a paper table row."""
         try:
             # Find title link
-            link = row.find("a", href=re.compile(r"abstract|rec=\d+"))
-            if not link:
+            link = _first(_XP_ROW_LINK, row)
+            if link is None:
                 return None
 
             href = link.get("href", "")
-            match = re.search(r"(?:abstract)?[=/](\d+)", href)
+            match = _RE_ROW_ID.search(href)
             paper_id = match.group(1) if match else ""
 
-            title = link.get_text(strip=True)
+            title = _leaf_text(link)
             if not title:
                 return None
 
             # Authors
-            cells = row.find_all("td")
+            cells = _XP_CELLS(row)
             authors = []
             if len(cells) > 1:
-                author_text = cells[1].get_text(strip=True)
-                authors = [a.strip() for a in author_text.split(",") if a.strip()]
+                author_text = _leaf_text(cells[1])
+                authors = [a for a in _RE_COMMA.split(author_text) if a]
 
             # Date
             published_date = datetime.min
             if len(cells) > 2:
-                date_text = cells[2].get_text(strip=True)
-                try:
-                    published_date = datetime.strptime(date_text, "%m/%d/%Y")
-                except:
-                    try:
-                        published_date = datetime.strptime(date_text, "%Y-%m-%d")
-                    except:
-                        pass
-
-            url = f"{self.ABSTRACT_URL}/{paper_id}.html"
+                published_date = _parse_date(_leaf_text(cells[2])) or datetime.min
 
-            return Paper(
+            return _Entry(
                 paper_id=paper_id,
                 title=title,
                 authors=authors,
-                abstract="",
-                doi="",
-                published_date=published_date,
-                pdf_url="",
-                url=url,
-                source="ssrn",
-                categories=[],
-                keywords=[],
-                citations=0,
-                references=[],
-                extra={"ssrn_id": paper_id}
+                published_date=published_date
             )
 
         except Exception as e:
             logger.error(f"Error parsing SSRN row: {e}")
             return None
 
-    def _parse_paper_page(self, content: bytes, paper_id: str) -> Optional[Paper]:
+    def _parse_paper_page(self, content: bytes, paper_id: str, encoding: Optional[str] = None) -> Optional[Paper]:
         """Parse a paper detail page."""
         try:
-            soup = BeautifulSoup(content, 'lxml')
+            tree = _parse_html(content, encoding)
 
             # Title
-            title = ""
-            title_elem = soup.find("h1", {"class": "title"})
-            if not title_elem:
-                title_elem = soup.find("meta", {"property": "og:title"})
-            if title_elem:
-                if hasattr(title_elem, 'get_text'):
-                    title = title_elem.get_text(strip=True)
-                else:
-                    title = title_elem.get("content", "")
+            title = _leaf_text(_first(_XP_PAGE_TITLE, tree))
+            if not title:
+                title = _XP_OG_TITLE(tree).strip()
 
             if not title:
                 return None
 
             # Authors
             authors = []
-            author_section = soup.find("div", {"class": "authors"})
-            if author_section:
-                for link in author_section.find_all("a"):
-                    name = link.get_text(strip=True)
-                    if name:
-                        authors.append(name)
+            for link in _XP_PAGE_AUTHORS(tree):
+                name = _leaf_text(link)
+                if name:
+                    authors.append(name)
 
             # Abstract
-            abstract = ""
-            abstract_elem = soup.find("div", {"class": "abstract"})
-            if abstract_elem:
-                abstract = abstract_elem.get_text(strip=True)
+            abstract = _text(_first(_XP_ABSTRACT, tree))
 
             # Date
             published_date = datetime.min
-            date_elem = soup.find("div", {"class": "date"})
-            if date_elem:
-                date_text = date_elem.get_text(strip=True)
-                try:
-                    published_date = datetime.strptime(date_text, "%B %d, %Y")
-                except:
-                    try:
-                        published_date = datetime.strptime(date_text, "%B %Y")
-                    except:
-                        pass
+            date_elem = _first(_XP_PAGE_DATE, tree)
+            if date_elem is not None:
+                published_date = _parse_date(_leaf_text(date_elem)) or datetime.min
 
             # Keywords
             keywords = []
-            keywords_elem = soup.find("div", {"class": "keywords"})
-            if keywords_elem:
-                keyword_text = keywords_elem.get_text(strip=True)
-                keywords = [k.strip() for k in keyword_text.split(",")]
+            keywords_elem = _first(_XP_KEYWORDS, tree)
+            if keywords_elem is not None:
+                keyword_text = _leaf_text(keywords_elem)
+                keywords = [k for k in _RE_COMMA.split(keyword_text) if k]
 
             # Categories
             categories = []
-            for topic in soup.find_all("a", {"class": "topic"}):
-                topic_text = topic.get_text(strip=True)
+            for topic in _XP_TOPICS(tree):
+                topic_text = _leaf_text(topic)
                 if topic_text:
                     categories.append(topic_text)
 
+            # DOI (SSRN mints 10.2139/ssrn.<id> DOIs)
+            doi = _XP_DOI_META(tree).strip()
+
             # URL
-            url = f"{self.ABSTRACT_URL}/{paper_id}.html"
+            url = self._ABS_PREFIX + paper_id + ".html"
 
             # PDF URL
             pdf_url = ""
-            pdf_link = soup.find("a", {"class": "download"})
-            if pdf_link:
+            pdf_link = _first(_XP_DOWNLOAD, tree)
+            if pdf_link is not None:
                 pdf_url = pdf_link.get("href", "")
 
             return Paper(
@@ -619,7 +1085,7 @@ class SSRNSearcher:
                 title=title,
                 authors=authors,
                 abstract=abstract[:3000] if abstract else "",
-                doi="",
+                doi=doi,
                 published_date=published_date or datetime.min,
                 pdf_url=pdf_url,
                 url=url,
@@ -640,6 +1106,23 @@ class SSRNSearcher:
             return None
 
 
+_DEFAULT_SEARCHER: Optional[SSRNSearcher] = None
+_DEFAULT_SEARCHER_LOCK = threading.Lock()
+
+
+def get_searcher() -> SSRNSearcher:
+    """Return the process-wide SSRNSearcher, creating it on first use.
+
+    Sharing one instance reuses its connection pool, rate limiter and
+    lookup memo across MCP tool calls.
+    """
+    global _DEFAULT_SEARCHER
+    with _DEFAULT_SEARCHER_LOCK:
+        if _DEFAULT_SEARCHER is None:
+            _DEFAULT_SEARCHER = SSRNSearcher()
+        return _DEFAULT_SEARCHER
+
+
 if __name__ == "__main__":
     # Test SSRN searcher
     searcher = SSRNSearcher()
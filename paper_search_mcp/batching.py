@@ -0,0 +1,96 @@
+# paper_search_mcp/batching.py
+"""Automatic batching of single-ID lookups.
+
+Upstream APIs answer many IDs in one request, but MCP clients often issue
+single-ID tool calls concurrently. A BatchScheduler buffers those calls
+for a few milliseconds and resolves them all from one batch request.
+"""
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Set
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class BatchScheduler:
+    """Coalesce single-key lookups into batch requests.
+
+    Submitted keys are flushed together once max_batch distinct keys are
+    pending or max_delay seconds after the first one, whichever is first.
+    """
+
+    def __init__(
+        self,
+        fetch_batch: Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]],
+        max_batch: int = 50,
+        max_delay: float = 0.02
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            fetch_batch: Coroutine function taking a list of keys and returning
+                a mapping from key to result; keys missing from it resolve to None
+            max_batch: Maximum distinct keys per batch request
+            max_delay: Seconds to wait for more keys before flushing
+        """
+        self.fetch_batch = fetch_batch
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._pending: Dict[Hashable, List[asyncio.Future]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # The loop only keeps weak references to tasks; in-flight batches live here
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, key: Hashable) -> Any:
+        """Queue a key for the next batch and return its result."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # A timer or waiters left by an earlier, possibly closed, loop never fire
+            self._loop = loop
+            self._pending = {}
+            self._timer = None
+            self._tasks = set()
+        future = loop.create_future()
+        self._pending.setdefault(key, []).append(future)
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """Send every pending key as one batch request."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, {}
+        if pending:
+            task = asyncio.ensure_future(self._resolve(pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, pending: Dict[Hashable, List[asyncio.Future]]) -> None:
+        """Fetch one batch and settle each waiting future from it."""
+        try:
+            results = await self.fetch_batch(list(pending))
+        except Exception as e:
+            logger.error(f"Batch lookup of {len(pending)} keys failed: {e}")
+            self._settle(pending.values(), exception=e)
+            return
+        for key, futures in pending.items():
+            self._settle([futures], result=results.get(key))
+
+    @staticmethod
+    def _settle(groups: Iterable[List[asyncio.Future]], result: Any = None,
+                exception: Optional[BaseException] = None) -> None:
+        for futures in groups:
+            for future in futures:
+                # A waiter may have been cancelled while the batch ran
+                if future.done():
+                    continue
+                if exception is not None:
+                    future.set_exception(exception)
+                else:
+                    future.set_result(result)
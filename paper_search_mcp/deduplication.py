@@ -6,50 +6,106 @@ This module provides utilities to identify and remove duplicates based on:
 - Title similarity (secondary method)
 - Author + year matching (tertiary method)
 """
-from typing import List, Dict, Set, Tuple
-from collections import defaultdict
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Iterator, List, Dict, Optional, Tuple
+from collections import ChainMap, defaultdict
 from difflib import SequenceMatcher
+from functools import lru_cache
 from .paper import Paper
 
+logger = logging.getLogger(__name__)
 
+try:
+    from orjson import loads as _json_loads  # Optional: pip install paper-search-mcp[json]
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    # C++ Indel ratio; same 0-100 scale as SequenceMatcher.ratio() * 100
+    from rapidfuzz.fuzz import ratio as _fuzz_ratio  # Optional: pip install paper-search-mcp[fuzzy]
+except ImportError:
+    _fuzz_ratio = None
+
+try:
+    # Element-wise scoring of many title pairs in one call; returns a numpy array
+    import numpy  # noqa: F401
+    from rapidfuzz.process import cpdist as _cpdist  # Optional: pip install paper-search-mcp[fuzzy]
+except ImportError:
+    _cpdist = None
+
+try:
+    from datasketch import MinHash, MinHashLSH  # Optional: pip install paper-search-mcp[lsh]
+except ImportError:
+    MinHash = MinHashLSH = None
+
+# DOI URL/scheme prefixes stripped before comparison
+_DOI_PREFIXES = ("https://doi.org/", "http://doi.org/", "doi:", "doi.org/")
+
+# Punctuation replaced with spaces in titles, applied in one translate pass
+_TITLE_TRANS = str.maketrans({c: " " for c in ".,!?;:-()[]{}"})
+
+
+@lru_cache(maxsize=8192)
 def normalize_doi(doi: str) -> str:
     """Normalize DOI for comparison."""
     if not doi:
         return ""
     # Remove URL prefix if present
     doi = doi.lower()
-    for prefix in ["https://doi.org/", "http://doi.org/", "doi:", "doi.org/"]:
-        if doi.startswith(prefix):
-            doi = doi[len(prefix):]
+    if doi.startswith(_DOI_PREFIXES):
+        for prefix in _DOI_PREFIXES:
+            if doi.startswith(prefix):
+                doi = doi[len(prefix):]
+                break  # at most one prefix matches
     # Remove any trailing slashes or spaces
     return doi.strip().rstrip("/")
 
 
+@lru_cache(maxsize=8192)
 def normalize_title(title: str) -> str:
     """Normalize title for comparison."""
     if not title:
         return ""
-    # Convert to lowercase
-    title = title.lower()
-    # Remove common punctuation
-    for char in [".", ",", "!", "?", ";", ":", "-", "(", ")", "[", "]", "{", "}"]:
-        title = title.replace(char, " ")
-    # Remove extra whitespace
-    title = " ".join(title.split())
-    return title
+    # Lowercase, blank out common punctuation, then collapse whitespace
+    return " ".join(title.lower().translate(_TITLE_TRANS).split())
+
+
+@lru_cache(maxsize=8192)
+def _pair_ratio(a: str, b: str) -> float:
+    if _fuzz_ratio is not None:
+        return _fuzz_ratio(a, b) / 100.0
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def _cached_ratio(a: str, b: str) -> float:
+    """Similarity of two normalized titles, memoized per unordered pair."""
+    return _pair_ratio(a, b) if a <= b else _pair_ratio(b, a)
+
+
+def _clear_caches() -> None:
+    """Drop memoized normalizations and scores after a dedup pass."""
+    normalize_doi.cache_clear()
+    normalize_title.cache_clear()
+    _pair_ratio.cache_clear()
 
 
 def title_similarity(title1: str, title2: str) -> float:
-    """Calculate similarity between two titles using SequenceMatcher.
+    """Calculate similarity between two titles.
+
+    Uses RapidFuzz when installed, otherwise difflib's SequenceMatcher.
 
     Returns:
         float: Similarity score between 0 and 1
     """
     if not title1 or not title2:
         return 0.0
-    norm1 = normalize_title(title1)
-    norm2 = normalize_title(title2)
-    return SequenceMatcher(None, norm1, norm2).ratio()
+    return _cached_ratio(normalize_title(title1), normalize_title(title2))
 
 
 def are_titles_similar(title1: str, title2: str, threshold: float = 0.9) -> bool:
@@ -63,13 +119,67 @@ def are_titles_similar(title1: str, title2: str, threshold: float = 0.9) -> bool
     Returns:
         bool: True if titles are similar enough
     """
-    return title_similarity(title1, title2) >= threshold
+    return _normalized_titles_similar(normalize_title(title1), normalize_title(title2), threshold)
+
+
+def _normalized_titles_similar(norm1: str, norm2: str, threshold: float = 0.9) -> bool:
+    """are_titles_similar() for titles already passed through normalize_title()."""
+    len1, len2 = len(norm1), len(norm2)
+    if not len1 or not len2:
+        return False
+    if norm1 == norm2:
+        return True
+    # Upper bound on either ratio: 2 * min(len) / (len1 + len2)
+    if 2 * min(len1, len2) < threshold * (len1 + len2):
+        return False
+
+    if _fuzz_ratio is not None:
+        # score_cutoff lets RapidFuzz bail out early once the threshold is unreachable
+        cutoff = threshold * 100
+        return _fuzz_ratio(norm1, norm2, score_cutoff=cutoff) >= cutoff
+
+    # Cheapest bounds first, as documented for difflib
+    matcher = SequenceMatcher(None, norm1, norm2)
+    if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+        return False
+    return _cached_ratio(norm1, norm2) >= threshold
+
+
+def _author_set(authors: List[str]) -> frozenset:
+    """Lowercased, stripped author names as a set."""
+    return frozenset(filter(None, (a.lower().strip() for a in authors or ())))
+
+
+def _at_least_k_author_matches(authors1: frozenset, authors2: frozenset, k: int = 2) -> bool:
+    """Check whether two author sets share at least k authors.
+
+    Exact matches are counted by set intersection. Only when that falls
+    short are the remaining names compared by substring ("J Smith" vs
+    "Smith"), and only between names that end in the same surname. Stops
+    as soon as k matches are found.
+    """
+    common = authors1 & authors2
+    matches = len(common)
+    if matches >= k:
+        return True
+    by_surname: Dict[str, List[str]] = defaultdict(list)
+    for a in authors1 - common:
+        by_surname[a.split()[-1]].append(a)
+    for a2 in authors2 - common:
+        for a1 in by_surname.get(a2.split()[-1], ()):
+            if a1 in a2 or a2 in a1:
+                matches += 1
+                if matches >= k:
+                    return True
+                break
+    return False
 
 
 def are_same_paper(paper1: Paper, paper2: Paper) -> bool:
     """Check if two papers are the same using multiple criteria.
 
     Priority:
+    0. Same paper_id from the same source
     1. DOI match (exact, after normalization)
     2. Title similarity (>= 0.9)
     3. Author + year match
@@ -81,38 +191,354 @@ def are_same_paper(paper1: Paper, paper2: Paper) -> bool:
     Returns:
         bool: True if papers are likely the same
     """
-    # Check DOI match (most reliable)
-    doi1 = normalize_doi(paper1.doi)
-    doi2 = normalize_doi(paper2.doi)
-    if doi1 and doi2 and doi1 == doi2:
+    # Same record re-ingested from one source
+    if paper1.paper_id and paper1.paper_id == paper2.paper_id and paper1.source == paper2.source:
         return True
 
-    # Check title similarity
-    if are_titles_similar(paper1.title, paper2.title):
-        # Additional check: at least one author in common
-        if paper1.authors and paper2.authors:
-            authors1 = [a.lower().strip() for a in paper1.authors]
-            authors2 = [a.lower().strip() for a in paper2.authors]
-            if any(a1 in a2 or a2 in a1 for a1 in authors1 for a2 in authors2):
-                return True
-
-    # Check author + year match
-    if paper1.authors and paper2.authors:
-        authors1 = [a.lower().strip() for a in paper1.authors]
-        authors2 = [a.lower().strip() for a in paper2.authors]
-        # Check if at least 2 authors match
-        matching_authors = sum(1 for a1 in authors1 for a2 in authors2 if a1 in a2 or a2 in a1)
-        if matching_authors >= 2:
-            # Check publication year
-            year1 = paper1.published_date.year if paper1.published_date else None
-            year2 = paper2.published_date.year if paper2.published_date else None
-            if year1 and year2 and year1 == year2:
-                return True
+    ndois, ntitles, nauths, years = zip(_paper_features(paper1), _paper_features(paper2))
+    return _are_same(0, 1, ndois, ntitles, nauths, years)
 
-    return False
+
+def _paper_features(paper: Paper) -> Tuple[str, str, frozenset, Optional[int]]:
+    """Normalized DOI, title, author set and year used for matching."""
+    year = paper.published_date.year if paper.published_date else None
+    return normalize_doi(paper.doi), normalize_title(paper.title), _author_set(paper.authors), year
+
+
+def _are_same(i: int, j: int, ndois, ntitles, nauths, years) -> bool:
+    """are_same_paper() over precomputed per-paper feature arrays.
+
+    Checks run cheapest first so the title similarity score is only
+    computed for pairs that already share an author or a year.
+    """
+    same = _match_without_title(i, j, ndois, nauths, years)
+    if same is None:
+        return _normalized_titles_similar(ntitles[i], ntitles[j])
+    return same
+
+
+def _match_without_title(i: int, j: int, ndois, nauths, years) -> Optional[bool]:
+    """Run every matching rule except title similarity.
+
+    Returns:
+        True or False when the DOI, author or year rules decide the pair,
+        None when the pair is the same paper exactly if the titles are similar
+    """
+    # DOIs are authoritative both ways when both papers have one
+    doi1, doi2 = ndois[i], ndois[j]
+    if doi1 and doi2:
+        return doi1 == doi2
+
+    authors1, authors2 = nauths[i], nauths[j]
+    if not authors1 or not authors2:
+        return False
+    year1 = years[i]
+    year_match = year1 is not None and year1 == years[j]
+
+    # Author + year match: at least 2 authors in common
+    if year_match and _at_least_k_author_matches(authors1, authors2, 2):
+        return True
+    if not year_match and authors1.isdisjoint(authors2):
+        return False
+
+    # Title similarity plus at least one author in common
+    if not _at_least_k_author_matches(authors1, authors2, 1):
+        return False
+    return None
+
+
+# Below this many title checks, scoring them one by one is cheaper than a batch call
+_BATCH_TITLE_MIN_PAIRS = 64
+
+
+def _titles_similar_batch(pairs: List[Tuple[int, int]], ntitles: List[str],
+                          threshold: float = 0.9) -> List[bool]:
+    """_normalized_titles_similar() for many (i, j) pairs at once.
+
+    With RapidFuzz and numpy installed, all pairs are scored in one
+    cpdist call in C across all cores; the decisions are the same as
+    scoring each pair on its own.
+    """
+    if _cpdist is None or _fuzz_ratio is None or len(pairs) < _BATCH_TITLE_MIN_PAIRS:
+        return [_normalized_titles_similar(ntitles[i], ntitles[j], threshold) for i, j in pairs]
+    cutoff = threshold * 100
+    scores = _cpdist(
+        [ntitles[i] for i, _ in pairs], [ntitles[j] for _, j in pairs],
+        scorer=_fuzz_ratio, score_cutoff=cutoff, workers=-1
+    )
+    # Two empty titles score 100 but never count as similar
+    return [
+        score >= cutoff and bool(ntitles[i]) and bool(ntitles[j])
+        for (i, j), score in zip(pairs, scores.tolist())
+    ]
+
+
+# Length of the normalized-title prefix used as a blocking key
+_TITLE_BLOCK_PREFIX = 6
+
+# Above this many papers, titles are blocked by MinHash LSH when datasketch is installed
+_LSH_MIN_PAPERS = 500
+_LSH_THRESHOLD = 0.8
+_LSH_NUM_PERM = 64
+
+# Above this many papers, blocked comparisons are spread over worker processes
+_PARALLEL_MIN_PAPERS = 1000
+
+
+class _DSU:
+    """Compact union-find over integer indices."""
+
+    __slots__ = ("parent",)
+
+    def __init__(self, size: int):
+        self.parent: List[int] = list(range(size))
+
+    def find(self, x: int) -> int:
+        """Return the representative of x's set, halving the path on the way."""
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """Merge the sets of a and b; return False if they were already joined."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        # Keep the lower index as root so groups are led by their first occurrence
+        if root_b < root_a:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        return True
+
+
+def _blocking_keys(ntitle: str, authors: frozenset, year: Optional[int],
+                   title_prefix: bool = True) -> List[Tuple]:
+    """Return the buckets a paper is compared within.
+
+    Papers can only match via a shared title prefix (title similarity) or
+    a shared author in the same year (author + year), so only papers that
+    share one of these keys are compared.
+    """
+    keys = []
+    title_key = ntitle[:_TITLE_BLOCK_PREFIX] if title_prefix else ""
+    if title_key:
+        keys.append(("title", title_key))
+    if year is not None:
+        keys.extend(("author", author, year) for author in authors)
+    return keys
+
+
+def _title_shingles(ntitle: str) -> set:
+    """Character 3-grams of a normalized title."""
+    if len(ntitle) < 3:
+        return {ntitle}
+    return {ntitle[k:k + 3] for k in range(len(ntitle) - 2)}
+
+
+def _lsh_title_pairs(ntitles: List[str]) -> Iterator[Tuple[int, int]]:
+    """Yield (i, j), i < j, for titles whose 3-gram MinHashes collide.
+
+    Unlike prefix buckets, this still pairs titles that differ at the
+    start ("A Study of X" vs "Study of X"), in roughly O(N) time.
+    """
+    lsh = MinHashLSH(threshold=_LSH_THRESHOLD, num_perm=_LSH_NUM_PERM)
+    hashes = {}
+    for i, title in enumerate(ntitles):
+        if not title:
+            continue
+        minhash = MinHash(num_perm=_LSH_NUM_PERM)
+        minhash.update_batch([s.encode("utf-8") for s in _title_shingles(title)])
+        lsh.insert(i, minhash)
+        hashes[i] = minhash
+    for i, minhash in hashes.items():
+        for j in lsh.query(minhash):
+            if j > i:
+                yield i, j
+
+
+def _candidate_buckets(ntitles: List[str], nauths: List[frozenset],
+                       years: List[Optional[int]],
+                       ndois: Optional[List[str]] = None) -> List[List[int]]:
+    """Return the index lists whose members are worth running the full match on.
+
+    Two papers that both have a DOI are decided by the DOI index alone, so
+    when ndois is given, buckets and LSH pairs made up only of papers with
+    a DOI are dropped.
+    """
+    use_lsh = MinHashLSH is not None and len(ntitles) > _LSH_MIN_PAPERS
+    dois = ndois if ndois is not None else [""] * len(ntitles)
+
+    buckets: Dict[Tuple, List[int]] = defaultdict(list)
+    for i in range(len(ntitles)):
+        for key in _blocking_keys(ntitles[i], nauths[i], years[i], title_prefix=not use_lsh):
+            buckets[key].append(i)
+    result = [
+        members for members in buckets.values()
+        if len(members) > 1 and not all(dois[i] for i in members)
+    ]
+
+    if use_lsh:
+        result.extend([i, j] for i, j in _lsh_title_pairs(ntitles) if not (dois[i] and dois[j]))
+    return result
+
+
+def _bucket_pairs(buckets: List[List[int]]) -> Iterator[Tuple[int, int]]:
+    """Yield every (i, j), i < j, pair within each bucket."""
+    for members in buckets:
+        for a in range(len(members)):
+            i = members[a]
+            for j in members[a + 1:]:
+                yield i, j
+
+
+def _candidate_pairs(ntitles: List[str], nauths: List[frozenset],
+                     years: List[Optional[int]]) -> Iterator[Tuple[int, int]]:
+    """Yield the (i, j), i < j, index pairs worth running the full match on."""
+    return _bucket_pairs(_candidate_buckets(ntitles, nauths, years))
+
+
+# Feature lists installed once per worker process by _init_worker()
+_worker_features: Tuple = ()
 
 
-def deduplicate_papers(papers: List[Paper], keep: str = "first") -> List[Paper]:
+def _init_worker(*features) -> None:
+    global _worker_features
+    _worker_features = features
+
+
+def _bucket_union(buckets: List[List[int]]) -> List[Tuple[int, int]]:
+    """Return the matching pairs within a chunk of buckets (runs in a worker)."""
+    return [(i, j) for i, j in _bucket_pairs(buckets) if _are_same(i, j, *_worker_features)]
+
+
+def _parallel_matches(buckets: List[List[int]], features: Tuple) -> List[Tuple[int, int]]:
+    """Match bucket chunks in worker processes, returning every matching pair.
+
+    Only the precomputed feature lists are sent to the workers, once each,
+    never the Paper objects. The pool is started, drained and shut down
+    within this call, so any pool failure surfaces here.
+    """
+    workers = os.cpu_count() or 1
+    size = -(-len(buckets) // (workers * 4))
+    chunks = [buckets[k:k + size] for k in range(0, len(buckets), size)]
+    # spawn: a forked child could inherit locks held by the server's I/O, log and cache threads
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=features,
+    ) as pool:
+        return [pair for pairs in pool.map(_bucket_union, chunks) for pair in pairs]
+
+
+def _group_duplicates(papers: List[Paper]) -> List[List[int]]:
+    """Group duplicate papers, returning index lists in first-occurrence order.
+
+    This is the single grouping pass behind deduplicate_papers,
+    merge_duplicate_papers and find_duplicates; pass its result to them as
+    _cached_grouping to run several of them over one list.
+    """
+    return _group_features(
+        [(p.source, p.paper_id) if p.paper_id else None for p in papers],
+        [normalize_doi(p.doi) for p in papers],
+        [normalize_title(p.title) for p in papers],
+        [_author_set(p.authors) for p in papers],
+        [p.published_date.year if p.published_date else None for p in papers],
+    )
+
+
+def _group_features(record_keys: List[Optional[Tuple[str, str]]], ndois: List[str],
+                    ntitles: List[str], nauths: List[frozenset],
+                    years: List[Optional[int]]) -> List[List[int]]:
+    """Group duplicates from per-paper feature lists, in first-occurrence order.
+
+    Each paper's (source, paper_id), normalized DOI, title, authors and year
+    are computed once by the caller. Phase 1 joins papers with the same
+    record key or DOI through hash indexes. Phase 2 compares only papers
+    that share a blocking key (or, for large inputs, a MinHash LSH band)
+    and are not both settled by their DOIs, instead of all N²/2 pairs, in
+    worker processes for large inputs. Grouping is transitive: if A matches
+    B and B matches C, all three end up in one group.
+    """
+    dsu = _DSU(len(ndois))
+
+    # Phase 1: exact (source, paper_id) and DOI matches
+    for keys in (record_keys, ndois):
+        index: Dict = {}
+        for i, key in enumerate(keys):
+            if not key:
+                continue
+            if key in index:
+                dsu.union(index[key], i)
+            else:
+                index[key] = i
+
+    # Phase 2: pairwise checks between blocked candidates
+    buckets = _candidate_buckets(ntitles, nauths, years, ndois)
+    parallel = len(ndois) > _PARALLEL_MIN_PAPERS and len(buckets) > 1
+    if parallel:
+        try:
+            matches = _parallel_matches(buckets, (ndois, ntitles, nauths, years))
+        except (OSError, BrokenProcessPool) as e:
+            logger.warning(f"Parallel duplicate matching failed, falling back to serial: {e}")
+            parallel = False
+        else:
+            for i, j in matches:
+                dsu.union(i, j)
+    if not parallel:
+        # With a batch scorer, pairs that hinge on title similarity are scored
+        # together afterwards; identical titles never need scoring
+        batch = _cpdist is not None and _fuzz_ratio is not None
+        title_checks = []
+        for i, j in _bucket_pairs(buckets):
+            if dsu.find(i) == dsu.find(j):
+                continue
+            same = _match_without_title(i, j, ndois, nauths, years)
+            if same is None:
+                if batch and ntitles[i] != ntitles[j]:
+                    title_checks.append((i, j))
+                    continue
+                same = _normalized_titles_similar(ntitles[i], ntitles[j])
+            if same:
+                dsu.union(i, j)
+        for (i, j), similar in zip(title_checks, _titles_similar_batch(title_checks, ntitles)):
+            if similar:
+                dsu.union(i, j)
+
+    groups: Dict[int, List[int]] = {}
+    for i in range(len(ndois)):
+        groups.setdefault(dsu.find(i), []).append(i)
+    # Keep long-lived servers from accumulating strings across unrelated searches
+    _clear_caches()
+    return list(groups.values())
+
+
+# Field weights for keep="best": the paper with the most complete metadata wins
+_COMPLETENESS_WEIGHTS = (
+    ("title", 1), ("abstract", 2), ("doi", 2), ("authors", 1), ("pdf_url", 2), ("categories", 1)
+)
+
+
+def _kept_indices(groups: List[List[int]], keep: str,
+                  scores: Optional[List[int]] = None) -> List[int]:
+    """Index of the member kept from each group under a keep policy.
+
+    For keep='best', scores holds each item's precomputed completeness
+    score, so the metadata is scanned once per item rather than per group
+    comparison.
+    """
+    if keep == "last":
+        return [group[-1] for group in groups]
+    if keep == "best":
+        return [max(group, key=scores.__getitem__) for group in groups]
+    # 'first' and unknown values keep the first occurrence
+    return [group[0] for group in groups]
+
+
+def deduplicate_papers(papers: List[Paper], keep: str = "first",
+                       _cached_grouping: Optional[List[List[int]]] = None) -> List[Paper]:
     """Remove duplicate papers from a list.
 
     Args:
@@ -121,6 +547,8 @@ def deduplicate_papers(papers: List[Paper], keep: str = "first") -> List[Paper]:
             - 'first': Keep the first occurrence (default)
             - 'last': Keep the last occurrence
             - 'best': Keep the one with most complete metadata
+        _cached_grouping: Index groups from an earlier _group_duplicates(papers)
+            call on the same list, to skip regrouping
 
     Returns:
         List[Paper]: Deduplicated list of papers
@@ -128,59 +556,35 @@ def deduplicate_papers(papers: List[Paper], keep: str = "first") -> List[Paper]:
     if not papers:
         return []
 
-    # Build groups of duplicates
-    groups: List[List[Paper]] = []
-    seen_indices: Set[int] = set()
+    groups = _cached_grouping if _cached_grouping is not None else _group_duplicates(papers)
+    scores = None
+    if keep == "best":
+        scores = [sum(w for f, w in _COMPLETENESS_WEIGHTS if getattr(p, f)) for p in papers]
+    return [papers[i] for i in _kept_indices(groups, keep, scores)]
 
-    for i, paper in enumerate(papers):
-        if i in seen_indices:
-            continue
 
-        # Start a new group with this paper
-        group = [paper]
-        seen_indices.add(i)
+def _dict_features(d: Dict) -> Tuple:
+    """The _group_features() inputs read straight from a paper dict.
 
-        # Look for duplicates
-        for j in range(i + 1, len(papers)):
-            if j in seen_indices:
-                continue
-            if are_same_paper(paper, papers[j]):
-                group.append(papers[j])
-                seen_indices.add(j)
-
-        groups.append(group)
-
-    # Select which paper to keep from each group
-    result = []
-    for group in groups:
-        if keep == "first":
-            result.append(group[0])
-        elif keep == "last":
-            result.append(group[-1])
-        elif keep == "best":
-            # Select paper with most complete metadata
-            def completeness_score(p: Paper) -> int:
-                score = 0
-                if p.title: score += 1
-                if p.abstract: score += 2
-                if p.doi: score += 2
-                if p.authors: score += 1
-                if p.pdf_url: score += 2
-                if p.categories: score += 1
-                return score
-
-            result.append(max(group, key=completeness_score))
-        else:
-            result.append(group[0])
-
-    return result
+    Raises on exactly the dicts dict_to_paper() rejects, and dates them
+    the same way, so every dict tool groups a list like merge_papers does.
+    """
+    int(d.get("citations", 0))
+    lists = {field: _parse_list(d.get(field)) for field in _LIST_FIELDS}
+    return (
+        (d.get("source", ""), d["paper_id"]) if d.get("paper_id") else None,
+        normalize_doi(d.get("doi")),
+        normalize_title(d.get("title")),
+        _author_set(lists["authors"]),
+        _dict_published_date(d).year,
+    )
 
 
 def deduplicate_paper_dicts(paper_dicts: List[Dict], keep: str = "first") -> List[Dict]:
     """Remove duplicate papers from a list of paper dictionaries.
 
-    This is a convenience function that converts dicts to Paper objects,
-    deduplicates, and converts back to dicts.
+    Matching features are read from the dicts directly, so no Paper objects
+    are built and the surviving input dicts are returned as-is.
 
     Args:
         paper_dicts: List of paper dictionaries to deduplicate
@@ -192,23 +596,26 @@ def deduplicate_paper_dicts(paper_dicts: List[Dict], keep: str = "first") -> Lis
     if not paper_dicts:
         return []
 
-    # Convert dicts to Paper objects
-    papers = []
+    dicts, features = [], []
     for d in paper_dicts:
         try:
-            papers.append(dict_to_paper(d))
+            features.append(_dict_features(d))
         except Exception:
-            # If conversion fails, skip this entry
+            # If a field can't be parsed, skip this entry
             continue
+        dicts.append(d)
+    if not dicts:
+        return []
 
-    # Deduplicate
-    deduped = deduplicate_papers(papers, keep)
-
-    # Convert back to dicts
-    return [p.to_dict() for p in deduped]
+    groups = _group_features(*map(list, zip(*features)))
+    scores = None
+    if keep == "best":
+        scores = [sum(w for f, w in _COMPLETENESS_WEIGHTS if d.get(f)) for d in dicts]
+    return [dicts[i] for i in _kept_indices(groups, keep, scores)]
 
 
-def merge_duplicate_papers(papers: List[Paper]) -> List[Paper]:
+def merge_duplicate_papers(papers: List[Paper],
+                           _cached_grouping: Optional[List[List[int]]] = None) -> List[Paper]:
     """Merge duplicate papers by combining their metadata.
 
     When duplicates are found, create a merged paper with the best metadata
@@ -216,6 +623,8 @@ def merge_duplicate_papers(papers: List[Paper]) -> List[Paper]:
 
     Args:
         papers: List of papers to deduplicate and merge
+        _cached_grouping: Index groups from an earlier _group_duplicates(papers)
+            call on the same list, to skip regrouping
 
     Returns:
         List[Paper]: List with duplicates merged
@@ -223,35 +632,11 @@ def merge_duplicate_papers(papers: List[Paper]) -> List[Paper]:
     if not papers:
         return []
 
-    # Build groups of duplicates
-    groups: List[List[Paper]] = []
-    seen_indices: Set[int] = set()
-
-    for i, paper in enumerate(papers):
-        if i in seen_indices:
-            continue
-
-        group = [paper]
-        seen_indices.add(i)
-
-        for j in range(i + 1, len(papers)):
-            if j in seen_indices:
-                continue
-            if are_same_paper(paper, papers[j]):
-                group.append(papers[j])
-                seen_indices.add(j)
-
-        groups.append(group)
-
-    # Merge each group
-    result = []
-    for group in groups:
-        if len(group) == 1:
-            result.append(group[0])
-        else:
-            result.append(merge_paper_group(group))
-
-    return result
+    groups = _cached_grouping if _cached_grouping is not None else _group_duplicates(papers)
+    return [
+        papers[group[0]] if len(group) == 1 else merge_paper_group([papers[i] for i in group])
+        for group in groups
+    ]
 
 
 def merge_paper_group(group: List[Paper]) -> Paper:
@@ -275,16 +660,9 @@ def merge_paper_group(group: List[Paper]) -> Paper:
         return getattr(base, field_name, None)
 
     def choose_list(field_name: str):
-        # Combine all non-empty lists, avoiding duplicates
-        seen = set()
-        result = []
-        for paper in group:
-            value = getattr(paper, field_name, None)
-            if value:
-                for item in value:
-                    if item and item not in seen:
-                        seen.add(item)
-                        result.append(item)
+        # Combine all non-empty lists, avoiding duplicates (dicts keep insertion order)
+        chained = (x for p in group for x in (getattr(p, field_name, None) or ()) if x)
+        result = list(dict.fromkeys(chained))
         return result if result else getattr(base, field_name, None)
 
     # Choose best fields
@@ -295,10 +673,10 @@ def merge_paper_group(group: List[Paper]) -> Paper:
     url = choose_field("url")
 
     # Use earliest published date
-    published_date = base.published_date
-    for paper in group[1:]:
-        if paper.published_date and paper.published_date < published_date:
-            published_date = paper.published_date
+    published_date = min(
+        (p.published_date for p in group if p.published_date),
+        default=base.published_date,
+    )
 
     # Combine authors and categories
     authors = choose_list("authors")
@@ -306,11 +684,9 @@ def merge_paper_group(group: List[Paper]) -> Paper:
     keywords = choose_list("keywords")
     references = choose_list("references")
 
-    # Combine extra data
-    extra = {}
-    for paper in group:
-        if paper.extra:
-            extra.update(paper.extra)
+    # Combine extra data, later papers winning on key conflicts
+    extras = [p.extra for p in group if p.extra]
+    extra = dict(ChainMap(*reversed(extras))) if extras else {}
 
     # Use max citation count
     citations = max((p.citations for p in group), default=0)
@@ -338,6 +714,34 @@ def merge_paper_group(group: List[Paper]) -> Paper:
     )
 
 
+# Paper fields stored as lists, or as "; "-joined strings by Paper.to_dict()
+_LIST_FIELDS = ("authors", "categories", "keywords", "references")
+
+
+def _parse_list(val) -> List[str]:
+    """Parse a list field that may be a list or a semicolon-separated string."""
+    if isinstance(val, list):
+        return val
+    if val:
+        return [s.strip() for s in val.split(";") if s.strip()]
+    return []
+
+
+def _parse_date(val) -> Optional[datetime]:
+    """Parse an ISO date string, returning None if missing or invalid."""
+    if not val:
+        return None
+    try:
+        return datetime.fromisoformat(val)
+    except (TypeError, ValueError):
+        return None
+
+
+def _dict_published_date(d: Dict) -> datetime:
+    """Parse a dict's published_date; undated papers get datetime.min."""
+    return _parse_date(d.get("published_date")) or datetime.min
+
+
 def dict_to_paper(d: Dict) -> Paper:
     """Convert a dictionary back to a Paper object.
 
@@ -347,67 +751,40 @@ def dict_to_paper(d: Dict) -> Paper:
     Returns:
         Paper object
     """
-    from datetime import datetime
-
-    # Parse dates
-    published_date = None
-    if d.get("published_date"):
-        try:
-            published_date = datetime.fromisoformat(d["published_date"])
-        except:
-            pass
-
-    updated_date = None
-    if d.get("updated_date"):
-        try:
-            updated_date = datetime.fromisoformat(d["updated_date"])
-        except:
-            pass
-
-    # Parse lists
-    def parse_list(field: str) -> List[str]:
-        val = d.get(field, "")
-        if isinstance(val, list):
-            return val
-        if val:
-            return [s.strip() for s in val.split(";") if s.strip()]
-        return []
-
     # Parse extra
     extra = d.get("extra")
     if isinstance(extra, str):
         try:
-            import json
-            extra = json.loads(extra)
-        except:
+            extra = _json_loads(extra)
+        except ValueError:
             extra = {}
 
     return Paper(
         paper_id=d.get("paper_id", ""),
         title=d.get("title", ""),
-        authors=parse_list("authors"),
         abstract=d.get("abstract", ""),
         doi=d.get("doi", ""),
-        published_date=published_date or datetime.min,
+        published_date=_dict_published_date(d),
         pdf_url=d.get("pdf_url", ""),
         url=d.get("url", ""),
         source=d.get("source", ""),
-        updated_date=updated_date,
-        categories=parse_list("categories"),
-        keywords=parse_list("keywords"),
+        updated_date=_parse_date(d.get("updated_date")),
         citations=int(d.get("citations", 0)),
-        references=parse_list("references"),
-        extra=extra
+        extra=extra,
+        **{field: _parse_list(d.get(field)) for field in _LIST_FIELDS},
     )
 
 
-def find_duplicates(papers: List[Paper]) -> List[Tuple[Paper, List[Paper]]]:
+def find_duplicates(papers: List[Paper],
+                    _cached_grouping: Optional[List[List[int]]] = None) -> List[Tuple[Paper, List[Paper]]]:
     """Find groups of duplicate papers without removing them.
 
     Useful for analyzing what duplicates exist before deciding how to handle them.
 
     Args:
         papers: List of papers to analyze
+        _cached_grouping: Index groups from an earlier _group_duplicates(papers)
+            call on the same list, to skip regrouping
 
     Returns:
         List of tuples (canonical_paper, duplicate_papers)
@@ -415,24 +792,41 @@ def find_duplicates(papers: List[Paper]) -> List[Tuple[Paper, List[Paper]]]:
     if not papers:
         return []
 
-    groups: List[Tuple[Paper, List[Paper]]] = []
-    seen_indices: Set[int] = set()
+    groups = _cached_grouping if _cached_grouping is not None else _group_duplicates(papers)
+    return [
+        (papers[group[0]], [papers[i] for i in group[1:]])
+        for group in groups
+        if len(group) > 1
+    ]
 
-    for i, paper in enumerate(papers):
-        if i in seen_indices:
-            continue
 
-        duplicates = []
-        seen_indices.add(i)
+def find_duplicate_dicts(paper_dicts: List[Dict]) -> List[Tuple[Dict, List[Dict]]]:
+    """Find groups of duplicate paper dictionaries without removing them.
 
-        for j in range(i + 1, len(papers)):
-            if j in seen_indices:
-                continue
-            if are_same_paper(paper, papers[j]):
-                duplicates.append(papers[j])
-                seen_indices.add(j)
+    Like deduplicate_paper_dicts, matching features are read from the dicts
+    directly and the input dicts are returned as-is, so nothing is converted
+    to a Paper and back.
 
-        if duplicates:
-            groups.append((paper, duplicates))
+    Args:
+        paper_dicts: List of paper dictionaries to analyze
+
+    Returns:
+        List of tuples (canonical_dict, duplicate_dicts)
+    """
+    dicts, features = [], []
+    for d in paper_dicts or []:
+        try:
+            features.append(_dict_features(d))
+        except Exception:
+            # If a field can't be parsed, skip this entry
+            continue
+        dicts.append(d)
+    if not dicts:
+        return []
 
-    return groups
+    groups = _group_features(*map(list, zip(*features)))
+    return [
+        (dicts[group[0]], [dicts[i] for i in group[1:]])
+        for group in groups
+        if len(group) > 1
+    ]
@@ -0,0 +1,166 @@
+# paper_search_mcp/disk_cache.py
+"""Persistent store for memoized tool results, shared across sessions.
+
+Paper metadata looked up by DOI or ID rarely changes, so a lookup answered
+in one MCP session can serve the next without a network round trip.
+Results live in one SQLite database under the cache directory, keyed by a
+BLAKE2b digest of the tool call and stored as zlib-compressed JSON.
+
+Reads run on the caller's thread (a single indexed SELECT). Writes are
+queued to one background thread, so callers never wait on disk I/O, and
+the database uses WAL mode so reads are not blocked by that writer.
+
+Environment variables:
+    PAPER_SEARCH_MCP_CACHE_DIR: Cache root (default: ~/.cache/paper-search-mcp)
+    PAPER_SEARCH_MCP_CACHE: Set to "0" to disable caching entirely
+"""
+from typing import Any, Hashable, Optional
+import atexit
+import hashlib
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+import zlib
+
+from .http_cache import DEFAULT_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads  # Optional: pip install paper-search-mcp[json]
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(value: Any) -> bytes:
+        return json.dumps(value).encode("utf-8")
+
+
+class DiskCache:
+    """SQLite-backed key/value store whose entries expire after ttl seconds.
+
+    Database errors are logged and treated as misses, so a broken or
+    read-only cache directory never breaks a tool call.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: float = 86400):
+        """Initialize the store. The database is opened on first use.
+
+        Args:
+            path: Database file; defaults to tool-results.sqlite3 under
+                $PAPER_SEARCH_MCP_CACHE_DIR or ~/.cache/paper-search-mcp
+            ttl: Entry lifetime in seconds (default: one day)
+        """
+        self._path = path
+        self.ttl = ttl
+        self.enabled = os.environ.get("PAPER_SEARCH_MCP_CACHE", "1") != "0"
+        self._reader: Optional[sqlite3.Connection] = None
+        self._reader_lock = threading.Lock()
+        self._writes: "queue.Queue" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        if self._path is None:
+            root = os.environ.get("PAPER_SEARCH_MCP_CACHE_DIR") or DEFAULT_CACHE_DIR
+            self._path = os.path.join(root, "tool-results.sqlite3")
+        return self._path
+
+    @staticmethod
+    def digest(key: Hashable) -> bytes:
+        """Return the database key for a cache key (nested tuples of plain values)."""
+        encoded = json.dumps(key, default=str, separators=(",", ":")).encode("utf-8")
+        return hashlib.blake2b(encoded, digest_size=16).digest()
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # In WAL mode commits are durable at checkpoints; losing the last few
+        # cache writes to a power cut is fine
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS results (k BLOB PRIMARY KEY, v BLOB NOT NULL, ts REAL NOT NULL)")
+        return conn
+
+    def get(self, key: Hashable) -> Any:
+        """Return the stored value for key, or None if missing or expired."""
+        if not self.enabled:
+            return None
+        try:
+            with self._reader_lock:
+                if self._reader is None:
+                    self._reader = self._connect()
+                row = self._reader.execute(
+                    "SELECT v, ts FROM results WHERE k = ?", (self.digest(key),)
+                ).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"Tool result cache unavailable: {e}")
+            return None
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+        try:
+            return _json_loads(zlib.decompress(row[0]))
+        except (zlib.error, ValueError) as e:
+            logger.debug(f"Discarding unreadable tool result cache entry: {e}")
+            return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Queue value to be stored under key by the writer thread."""
+        if not self.enabled:
+            return
+        self._ensure_writer()
+        self._writes.put((self.digest(key), value, time.time()))
+
+    def flush(self) -> None:
+        """Block until every queued write has been stored."""
+        if self._writer is not None:
+            self._writes.join()
+
+    def close(self) -> None:
+        """Store queued writes, then stop the writer and close the database."""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._writes.put(None)
+            writer.join()
+            atexit.unregister(self.flush)
+        with self._reader_lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+
+    def _ensure_writer(self) -> None:
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="tool-cache-writer", daemon=True)
+                self._writer.start()
+                # The writer is a daemon thread, so drain its queue before exit
+                atexit.register(self.flush)
+
+    def _write_loop(self) -> None:
+        conn = None
+        try:
+            while True:
+                item = self._writes.get()
+                try:
+                    if item is None:
+                        return
+                    if conn is None:
+                        conn = self._connect()
+                        conn.execute("DELETE FROM results WHERE ts < ?", (time.time() - self.ttl,))
+                    digest, value, ts = item
+                    conn.execute(
+                        "INSERT OR REPLACE INTO results (k, v, ts) VALUES (?, ?, ?)",
+                        (digest, zlib.compress(_json_dumps(value)), ts)
+                    )
+                except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+                    logger.debug(f"Could not write tool result cache entry: {e}")
+                finally:
+                    self._writes.task_done()
+        finally:
+            if conn is not None:
+                conn.close()
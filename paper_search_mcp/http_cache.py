@@ -0,0 +1,217 @@
+# paper_search_mcp/http_cache.py
+"""On-disk HTTP response cache shared by the platform searchers.
+
+Responses are stored under ``<cache dir>/<namespace>/<sha256>.bin`` with a
+``<sha256>.meta.json`` sidecar recording when and how they were fetched.
+The key is the SHA-256 of the URL plus its sorted query parameters.
+
+Environment variables:
+    PAPER_SEARCH_MCP_CACHE_DIR: Cache root (default: ~/.cache/paper-search-mcp)
+    PAPER_SEARCH_MCP_CACHE: Set to "0" to disable caching entirely
+"""
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional
+from urllib.parse import urlencode
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "paper-search-mcp")
+
+
+class ResponseCache:
+    """File-based response cache with per-lookup TTL.
+
+    Cache I/O errors are logged and treated as misses, so a broken or
+    read-only cache directory never breaks a request.
+    """
+
+    def __init__(self, namespace: str, cache_dir: Optional[str] = None):
+        """Initialize the cache.
+
+        Args:
+            namespace: Subdirectory for this searcher (e.g., 'pmc')
+            cache_dir: Cache root; defaults to $PAPER_SEARCH_MCP_CACHE_DIR or
+                ~/.cache/paper-search-mcp
+        """
+        root = cache_dir or os.environ.get("PAPER_SEARCH_MCP_CACHE_DIR") or DEFAULT_CACHE_DIR
+        self.directory = os.path.join(root, namespace)
+        self.enabled = os.environ.get("PAPER_SEARCH_MCP_CACHE", "1") != "0"
+
+    @staticmethod
+    def key(url: str, params: Optional[Dict] = None) -> str:
+        """Return the cache key for a URL and its query parameters."""
+        query = urlencode(sorted((params or {}).items()))
+        return hashlib.sha256((url + "?" + query).encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str):
+        base = os.path.join(self.directory, key)
+        return base + ".bin", base + ".meta.json"
+
+    def get(self, url: str, params: Optional[Dict] = None, ttl: Optional[float] = None) -> Optional[bytes]:
+        """Return a cached body, or None if missing or older than ttl seconds.
+
+        A ttl of None means entries never expire.
+        """
+        if not self.enabled:
+            return None
+        body_path, meta_path = self._paths(self.key(url, params))
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if ttl is not None and time.time() - meta["fetched_at"] > ttl:
+                return None
+            with open(body_path, "rb") as f:
+                return f.read()
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, url: str, params: Optional[Dict], content: bytes, content_type: str = "", status: int = 200):
+        """Store a response body."""
+        if not self.enabled:
+            return
+        with self._writer(url, params, content_type, status) as f:
+            if f is not None:
+                f.write(content)
+
+    @contextmanager
+    def _writer(self, url: str, params: Optional[Dict], content_type: str, status: int):
+        """Yield a binary file to fill with a body; committed atomically on clean exit."""
+        body_path, meta_path = self._paths(self.key(url, params))
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError as e:
+            logger.debug(f"Response cache unavailable: {e}")
+            yield None
+            return
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                yield f
+            # Errors raised by the caller propagate above; only commit failures are swallowed
+            try:
+                os.replace(tmp_path, body_path)
+                meta = {"url": url, "fetched_at": time.time(), "content_type": content_type, "status": status}
+                with open(meta_path, "w", encoding="utf-8") as f:
+                    json.dump(meta, f)
+            except OSError as e:
+                logger.debug(f"Could not write response cache entry: {e}")
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+class _TeeReader:
+    """Readable stream that copies everything it reads into a sink file."""
+
+    def __init__(self, source, sink):
+        self._source = source
+        self._sink = sink
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._source.read(size)
+        if data and self._sink is not None:
+            self._sink.write(data)
+        return data
+
+
+def cached_content(
+    cache: ResponseCache,
+    get: Callable,
+    url: str,
+    params: Optional[Dict] = None,
+    ttl: Optional[float] = None,
+    timeout: float = 30
+) -> bytes:
+    """Return a response body from the cache, fetching and storing it on a miss.
+
+    Args:
+        cache: Cache to consult
+        get: HTTP GET callable (e.g., session.get)
+        url: Request URL
+        params: Query parameters
+        ttl: Maximum entry age in seconds (None = never expires)
+        timeout: Request timeout in seconds
+
+    Raises:
+        requests.HTTPError: For non-2xx responses (which are never cached)
+    """
+    content = cache.get(url, params, ttl)
+    if content is not None:
+        return content
+    response = get(url, params=params, timeout=timeout)
+    response.raise_for_status()
+    cache.put(url, params, response.content, response.headers.get("Content-Type", ""), response.status_code)
+    return response.content
+
+
+@contextmanager
+def cached_stream(
+    cache: ResponseCache,
+    get: Callable,
+    url: str,
+    params: Optional[Dict] = None,
+    ttl: Optional[float] = None,
+    timeout: float = 30
+) -> Iterator:
+    """Yield a readable binary stream of a response body.
+
+    Cache hits are served from memory; misses stream from the network and
+    are copied into the cache as they are read, so callers can parse
+    incrementally without buffering the whole body.
+    """
+    content = cache.get(url, params, ttl)
+    if content is not None:
+        yield io.BytesIO(content)
+        return
+
+    with get(url, params=params, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        if not cache.enabled:
+            yield response.raw
+            return
+        content_type = response.headers.get("Content-Type", "")
+        with cache._writer(url, params, content_type, response.status_code) as sink:
+            stream = _TeeReader(response.raw, sink)
+            yield stream
+            # Drain anything the caller left unread so the cached copy is complete
+            while stream.read(65536):
+                pass
+
+
+async def acached_content(
+    cache: ResponseCache,
+    get: Callable,
+    url: str,
+    params: Optional[Dict] = None,
+    ttl: Optional[float] = None,
+    timeout: float = 30
+) -> bytes:
+    """Async counterpart of cached_content for httpx.AsyncClient-style callables.
+
+    Args:
+        cache: Cache to consult
+        get: Awaitable HTTP GET callable (e.g., client.get)
+        url: Request URL
+        params: Query parameters
+        ttl: Maximum entry age in seconds (None = never expires)
+        timeout: Request timeout in seconds
+
+    Raises:
+        httpx.HTTPStatusError: For non-2xx responses (which are never cached)
+    """
+    content = cache.get(url, params, ttl)
+    if content is not None:
+        return content
+    response = await get(url, params=params, timeout=timeout)
+    response.raise_for_status()
+    cache.put(url, params, response.content, response.headers.get("Content-Type", ""), response.status_code)
+    return response.content
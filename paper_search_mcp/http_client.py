@@ -0,0 +1,165 @@
+# paper_search_mcp/http_client.py
+"""Shared async HTTP client for the MCP tools.
+
+Opening an ``httpx.AsyncClient`` per tool call pays a TCP connect, TLS
+handshake and pool teardown every time. Tools instead borrow one pooled
+client per event loop, so consecutive calls reuse keep-alive connections.
+Searchers send their own headers per request, so one client serves all.
+
+Searchers that are still synchronous run on a dedicated I/O thread pool
+via run_blocking, sized for socket-bound work rather than CPU count.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+import asyncio
+import contextvars
+import functools
+import importlib.util
+import os
+import threading
+import time
+import weakref
+
+import httpx
+
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0)
+TIMEOUT = httpx.Timeout(30.0)
+
+# Sync searcher calls wait on sockets, not the CPU, so the pool is larger
+# than the default executor's min(32, cpu_count + 4)
+IO_WORKERS = 64
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# Connections belong to the loop they were opened on, so clients are per loop
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the shared client for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            limits=LIMITS,
+            timeout=TIMEOUT,
+            follow_redirects=True,
+        )
+        _clients[loop] = client
+    return client
+
+
+async def aclose_async_client() -> None:
+    """Close the running loop's shared client, if one was created."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+class RateLimiter:
+    """Thread-safe limiter spacing calls at least 1/rate seconds apart."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def _reserve(self) -> float:
+        """Claim the next free slot and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        return delay
+
+    def wait(self):
+        """Block until the caller may issue its request."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def await_turn(self):
+        """Asynchronously wait until the caller may issue its request."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the I/O thread pool, creating it on first use or after shutdown."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="searcher-io")
+        return _executor
+
+
+async def run_blocking(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking call on the I/O thread pool and await its result.
+
+    Like asyncio.to_thread, the caller's context variables are visible
+    inside fn.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, fn, *args, **kwargs)
+    return await loop.run_in_executor(_get_executor(), call)
+
+
+def shutdown_executor(wait: bool = True) -> None:
+    """Shut down the I/O thread pool; the next run_blocking starts a new one."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+@asynccontextmanager
+async def borrow_client(
+    client: Optional[httpx.AsyncClient],
+    factory: Callable[[], httpx.AsyncClient]
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield client if given (leaving it open), else a fresh one from factory that is closed after."""
+    if client is not None:
+        yield client
+        return
+    async with factory() as own_client:
+        yield own_client
+
+
+async def stream_to_file(
+    client: httpx.AsyncClient,
+    url: str,
+    file_path: str,
+    headers: Optional[Dict[str, str]] = None,
+    chunk_size: int = 65536
+) -> None:
+    """Stream a response body to file_path, chunk by chunk.
+
+    Memory stays at one chunk whatever the file size, and the event loop
+    serves other tools between chunks. Chunks go to a .part file that is
+    renamed into place once complete, so a failed transfer never leaves
+    a truncated file at file_path.
+
+    Raises:
+        httpx.HTTPStatusError: For non-2xx responses
+        httpx.HTTPError: For transport failures
+    """
+    part_path = file_path + ".part"
+    try:
+        async with client.stream("GET", url, headers=headers) as response:
+            response.raise_for_status()
+            # Local writes of one chunk are short; no file I/O thread needed
+            with open(part_path, "wb") as f:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    f.write(chunk)
+        os.replace(part_path, file_path)
+    finally:
+        if os.path.exists(part_path):
+            os.remove(part_path)
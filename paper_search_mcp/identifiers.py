@@ -0,0 +1,57 @@
+# paper_search_mcp/identifiers.py
+"""Classification of paper identifiers.
+
+Tools that take a structured ID classify it before calling upstream, so a
+malformed ID is rejected without a network round trip. Every form is an
+alternative of one anchored, pre-compiled pattern, so classifying an ID
+is a single pass over it.
+"""
+from typing import Optional
+import re
+
+_ID_RE = re.compile(
+    r"""
+    ^(?:
+        (?P<arxiv>\d{4}\.\d{4,5}(?:v\d+)?                   # 2106.15928, 2106.15928v1
+            | [a-z][a-z\-]*(?:\.[A-Z]{2})?/\d{7}(?:v\d+)?)  # hep-th/9901001, math.AG/0101001
+      | (?P<doi>10\.\d{4,9}/\S+)
+      | (?P<openalex>[Ww]\d+)
+      | (?P<semantic>[0-9a-fA-F]{40})
+      | (?P<prefixed>(?i:doi|arxiv|mag|acl|pmid|pmcid|corpusid|url):\S+)
+      | (?P<url>https?://\S+)
+    )$
+    """,
+    re.VERBOSE,
+)
+
+# Semantic Scholar prefixes for the bare forms it cannot resolve on its own
+_SEMANTIC_PREFIXES = {"doi": "DOI:", "arxiv": "ARXIV:", "url": "URL:"}
+
+
+def classify_id(identifier: str) -> str:
+    """Return the kind of a paper identifier.
+
+    Args:
+        identifier: Paper ID as given by the caller
+
+    Returns:
+        One of 'arxiv', 'doi', 'openalex', 'semantic' (a 40-hex paperId),
+        'prefixed' (e.g. 'PMID:19872477'), 'url', or '' if unrecognized
+    """
+    match = _ID_RE.match(identifier.strip())
+    return match.lastgroup if match else ""
+
+
+def semantic_paper_id(identifier: str) -> Optional[str]:
+    """Return identifier in a form the Semantic Scholar API accepts, or None.
+
+    Bare DOIs, arXiv IDs and URLs get their API prefix, e.g.
+    '2106.15928' becomes 'ARXIV:2106.15928'.
+    """
+    identifier = identifier.strip()
+    kind = classify_id(identifier)
+    if kind in ("semantic", "prefixed"):
+        return identifier
+    if kind in _SEMANTIC_PREFIXES:
+        return _SEMANTIC_PREFIXES[kind] + identifier
+    return None
@@ -0,0 +1,79 @@
+# paper_search_mcp/ncbi.py
+"""Shared plumbing for the NCBI searchers (PubMed and PMC).
+
+Both query E-utilities on the same host, so they share one retrying
+connection pool and one hardened XML parser configuration.
+"""
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# One pooled, retrying adapter mounted by every PubMed and PMC session;
+# E-utilities answers 429 when the 3 req/s limit is exceeded, so back off and retry.
+_NCBI_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    ),
+)
+
+try:
+    from lxml import etree as ET
+    # libxml2 parser; comments/PIs are dropped so itertext() matches ElementTree.
+    # No DTD loading, entity expansion or network access: malformed or hostile
+    # responses can neither stall on external fetches nor blow up memory.
+    _XML_PARSER = ET.XMLParser(
+        huge_tree=True,
+        recover=True,
+        resolve_entities=False,
+        no_network=True,
+        load_dtd=False,
+        remove_comments=True,
+        remove_pis=True,
+    )
+except ImportError:  # lxml is a dependency, but stay importable without it
+    import xml.etree.ElementTree as ET
+    _XML_PARSER = None
+
+
+def _parse_xml(content: bytes):
+    """Parse an XML document, raising ET.ParseError if there is no root element."""
+    root = ET.fromstring(content, parser=_XML_PARSER)
+    if root is None:  # lxml's recover mode yields None for non-XML input
+        raise ET.ParseError("Document has no root element", 0, 0, 0)
+    return root
+
+
+def _iter_elements(stream, tag: str):
+    """Incrementally parse an XML stream, yielding each completed <tag> element.
+
+    Elements are cleared (and detached from the root) once the caller has
+    consumed them, so memory stays O(one element) rather than O(document).
+    """
+    if _XML_PARSER is None:
+        for _, elem in ET.iterparse(stream, events=('end',)):
+            if elem.tag == tag:
+                yield elem
+                elem.clear()
+        return
+
+    context = ET.iterparse(
+        stream,
+        events=('end',),
+        tag=tag,
+        huge_tree=True,
+        recover=True,
+        resolve_entities=False,
+        no_network=True,
+        load_dtd=False,
+        remove_comments=True,
+        remove_pis=True,
+    )
+    for _, elem in context:
+        yield elem
+        elem.clear(keep_tail=True)
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Dict, Optional
 
-@dataclass
+@dataclass(slots=True)
 class Paper:
     """Standardized paper format with core fields for academic sources"""
     # 核心字段（必填，但允许空值或默认值）
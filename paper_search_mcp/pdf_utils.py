@@ -0,0 +1,113 @@
+# paper_search_mcp/pdf_utils.py
+"""PDF text extraction shared by the platform searchers.
+
+Uses pypdfium2 (Google's PDFium, C++) when it is installed, which is
+several times faster than PyPDF2's pure-Python content-stream interpreter.
+PyPDF2 remains the fallback so the package works without the extra.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+import mmap
+import multiprocessing
+import os
+from PyPDF2 import PdfReader
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # Optional fast backend: pip install paper-search-mcp[pdf]
+    pdfium = None
+
+# Documents with at least this many pages are split across worker processes;
+# below it, process start-up costs more than the extraction itself.
+PARALLEL_PAGE_THRESHOLD = 64
+
+
+def _extract_page_range_pdfium(pdf_path: str, start: int, stop: int) -> List[str]:
+    """Extract text of pages [start, stop) with pypdfium2.
+
+    Module-level so worker processes can unpickle it; each worker opens
+    its own handle because PDFium documents cannot be shared.
+    """
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        pages = []
+        for index in range(start, min(stop, len(pdf))):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            pages.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
+        return pages
+    finally:
+        pdf.close()
+
+
+def _extract_pages_pdfium(pdf_path: str) -> List[str]:
+    """Extract per-page text with pypdfium2, in parallel for long documents."""
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        n_pages = len(pdf)
+    finally:
+        pdf.close()
+
+    workers = os.cpu_count() or 1
+    if n_pages < PARALLEL_PAGE_THRESHOLD or workers < 2:
+        return _extract_page_range_pdfium(pdf_path, 0, n_pages)
+
+    chunk = max(1, n_pages // (4 * workers))
+    ranges: List[Tuple[int, int]] = [(start, start + chunk) for start in range(0, n_pages, chunk)]
+    # spawn, not fork: the server process runs an event loop and HTTP threads
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(ranges)),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        results = executor.map(
+            _extract_page_range_pdfium,
+            [pdf_path] * len(ranges),
+            [start for start, _ in ranges],
+            [stop for _, stop in ranges],
+        )
+        return [text for texts in results for text in texts]
+
+
+def _pypdf2_page_texts(stream) -> List[str]:
+    """Extract per-page text from an open PDF stream with a lenient PyPDF2 reader."""
+    reader = PdfReader(stream, strict=False)
+    if len(reader.pages) == 0:
+        return []
+    return [page.extract_text() or "" for page in reader.pages]
+
+
+def _extract_pages_pypdf2(pdf_path: str) -> List[str]:
+    """Extract per-page text with PyPDF2.
+
+    Given a path, PyPDF2 reads the whole file into a BytesIO; handing it a
+    read-only mmap instead lets the OS page content in on demand.
+    """
+    with open(pdf_path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty files cannot be mapped
+            return _pypdf2_page_texts(f)
+        with mm:
+            return _pypdf2_page_texts(mm)
+
+
+def extract_pdf_text(pdf_path: str) -> str:
+    """Extract the text of every page of a PDF file.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        Page texts joined by newlines, stripped of surrounding whitespace
+
+    Raises:
+        Exception: If neither backend can read the file
+    """
+    if pdfium is not None:
+        try:
+            return "\n".join(_extract_pages_pdfium(pdf_path)).strip()
+        except Exception:
+            pass  # Let PyPDF2 have a go at files PDFium rejects
+    return "\n".join(_extract_pages_pypdf2(pdf_path)).strip()
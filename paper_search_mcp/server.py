@@ -1,43 +1,164 @@
 # paper_search_mcp/server.py
-from typing import List, Dict, Optional
-import httpx
+from contextlib import asynccontextmanager
+import asyncio
+import atexit
+import functools
+import importlib
+import importlib.util
+import logging
+import logging.handlers
+import os
+import queue
+import re
+import sys
+from typing import Callable, List, Dict, Optional
 from mcp.server.fastmcp import FastMCP
-from .academic_platforms.arxiv import ArxivSearcher
-from .academic_platforms.pubmed import PubMedSearcher
-from .academic_platforms.biorxiv import BioRxivSearcher
-from .academic_platforms.medrxiv import MedRxivSearcher
-from .academic_platforms.google_scholar import GoogleScholarSearcher
-from .academic_platforms.iacr import IACRSearcher
-from .academic_platforms.semantic import SemanticSearcher
-from .academic_platforms.crossref import CrossRefSearcher
-from .academic_platforms.openalex import OpenAlexSearcher
-from .academic_platforms.pmc import PMCSearcher
-from .academic_platforms.sci_hub import SciHubFetcher
-from .academic_platforms.hal import HALSearcher
-from .academic_platforms.ssrn import SSRNSearcher
-from .academic_platforms.dblp import DBLPSearcher
-from .deduplication import deduplicate_paper_dicts, merge_duplicate_papers, dict_to_paper, find_duplicates
+import anyio
+from mcp.types import CallToolResult, TextContent
+import pydantic_core
+from .deduplication import deduplicate_paper_dicts, merge_duplicate_papers, dict_to_paper, find_duplicate_dicts, normalize_doi
+from .batching import BatchScheduler
+from .disk_cache import DiskCache
+from .identifiers import classify_id, semantic_paper_id
+from .http_client import aclose_async_client, get_async_client, run_blocking, shutdown_executor
+from .tool_cache import TTLCache, memoize_tool, prime, singleflight
 
 from .paper import Paper
 
+logger = logging.getLogger(__name__)
+
+# Optional: pip install paper-search-mcp[uvloop] (not available on Windows)
+_UVLOOP_AVAILABLE = importlib.util.find_spec("uvloop") is not None
+
+try:
+    from orjson import OPT_INDENT_2, dumps as _orjson_dumps  # Optional: pip install paper-search-mcp[json]
+except ImportError:
+    _orjson_dumps = None
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Close the shared HTTP client and the sync searchers' thread pool on shutdown."""
+    try:
+        yield {}
+    finally:
+        await aclose_async_client()
+        shutdown_executor(wait=False)
+
+
 # Initialize MCP server
-mcp = FastMCP("paper_search_server")
-
-# Instances of searchers
-arxiv_searcher = ArxivSearcher()
-pubmed_searcher = PubMedSearcher()
-biorxiv_searcher = BioRxivSearcher()
-medrxiv_searcher = MedRxivSearcher()
-google_scholar_searcher = GoogleScholarSearcher()
-iacr_searcher = IACRSearcher()
-semantic_searcher = SemanticSearcher()
-crossref_searcher = CrossRefSearcher()
-openalex_searcher = OpenAlexSearcher()
-pmc_searcher = PMCSearcher()
-scihub_fetcher = SciHubFetcher()
-hal_searcher = HALSearcher()
-ssrn_searcher = SSRNSearcher()
-dblp_searcher = DBLPSearcher()
+mcp = FastMCP("paper_search_server", lifespan=lifespan)
+
+# Memoized tool results: DOI/ID lookups change rarely, search rankings more often.
+# Lookups also persist on disk for a day, so later sessions reuse them.
+_DOI_CACHE = TTLCache(maxsize=4096, ttl=3600, store=DiskCache(ttl=86400))
+_SEARCH_CACHE = TTLCache(maxsize=1024, ttl=600)
+# Lookups that came back empty are remembered briefly, so a caller retrying
+# an unknown ID does not re-query (or rate-limit us against) the upstream API
+_MISS_TTL = 60
+
+# Searchers are imported and constructed on first use, so a session that
+# only calls one platform never loads the others
+_SEARCHERS = {
+    "arxiv": "ArxivSearcher",
+    "pubmed": "PubMedSearcher",
+    "biorxiv": "BioRxivSearcher",
+    "medrxiv": "MedRxivSearcher",
+    "google_scholar": "GoogleScholarSearcher",
+    "iacr": "IACRSearcher",
+    "semantic": "SemanticSearcher",
+    "crossref": "CrossRefSearcher",
+    "openalex": "OpenAlexSearcher",
+    "pmc": "PMCSearcher",
+    "sci_hub": "SciHubFetcher",
+    "hal": "HALSearcher",
+    "ssrn": "get_searcher",
+    "dblp": "DBLPSearcher",
+}
+
+# Module attributes that used to hold eagerly created searchers
+_LEGACY_NAMES = {f"{name}_searcher": name for name in _SEARCHERS}
+_LEGACY_NAMES["scihub_fetcher"] = "sci_hub"
+
+
+@functools.cache
+def _get(name: str):
+    """Return the shared searcher for a platform, importing its module on first use."""
+    module = importlib.import_module(f".academic_platforms.{name}", __package__)
+    return getattr(module, _SEARCHERS[name])()
+
+
+def __getattr__(attr: str):
+    # Keep server.arxiv_searcher etc. working for existing callers
+    if attr in _LEGACY_NAMES:
+        return _get(_LEGACY_NAMES[attr])
+    raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+
+
+def preload_searchers(names: Optional[str] = None) -> None:
+    """Import and construct searchers ahead of the first tool call.
+
+    Args:
+        names: Comma-separated platform names, or 'all'; defaults to
+            $PAPER_SEARCH_MCP_PRELOAD
+    """
+    names = names if names is not None else os.environ.get("PAPER_SEARCH_MCP_PRELOAD", "")
+    if names.strip().lower() == "all":
+        selected = list(_SEARCHERS)
+    else:
+        selected = [n.strip() for n in names.split(",") if n.strip()]
+    for name in selected:
+        if name in _SEARCHERS:
+            _get(name)
+        else:
+            logger.warning(f"Unknown platform in PAPER_SEARCH_MCP_PRELOAD: {name}")
+
+
+async def _fetch_openalex_ids(ids: List[str]) -> Dict[str, Paper]:
+    papers = await _get("openalex").aget_papers_by_ids(ids, client=get_async_client())
+    return {paper.paper_id.upper(): paper for paper in papers}
+
+
+async def _fetch_openalex_dois(dois: List[str]) -> Dict[str, Paper]:
+    papers = await _get("openalex").aget_papers_by_dois(dois, client=get_async_client())
+    return {normalize_doi(paper.doi): paper for paper in papers}
+
+
+async def _fetch_crossref_dois(dois: List[str]) -> Dict[str, Paper]:
+    papers = await run_blocking(_get("crossref").get_papers_by_dois, dois)
+    return {normalize_doi(paper.doi): paper for paper in papers}
+
+
+async def _fetch_semantic_ids(ids: List[str]) -> Dict[str, Paper]:
+    # Batch results come back under the API's own paperId, so map by position
+    papers = await run_blocking(_get("semantic").get_papers_batch_aligned, ids)
+    return {paper_id: paper for paper_id, paper in zip(ids, papers) if paper}
+
+
+# Concurrent single-ID lookups are answered from one batch request
+_semantic_id_batcher = BatchScheduler(_fetch_semantic_ids)
+_openalex_id_batcher = BatchScheduler(_fetch_openalex_ids)
+_openalex_doi_batcher = BatchScheduler(_fetch_openalex_dois)
+_crossref_doi_batcher = BatchScheduler(_fetch_crossref_dois)
+
+_OPENALEX_WORK_ID = re.compile(r"^W\d+$", re.IGNORECASE)
+
+
+# Serialized fields whose values repeat across results (platform, subject
+# categories, keyword lists, dates); equal values share one interned str
+_SHARED_FIELDS = ("source", "categories", "keywords", "published_date", "updated_date")
+
+
+def _share_strings(rows: List[Dict]) -> List[Dict]:
+    """Intern repeating field values so equal strings across results, and
+    across cached result lists, are stored once."""
+    intern = sys.intern
+    for row in rows:
+        for field in _SHARED_FIELDS:
+            value = row.get(field)
+            if value and isinstance(value, str):
+                row[field] = intern(value)
+    return rows
 
 
 # Synchronous helper to adapt synchronous searchers
@@ -47,11 +168,113 @@ def sync_search(searcher, query: str, max_results: int, **kwargs) -> List[Dict]:
         papers = searcher.search(query, year=kwargs['year'], max_results=max_results)
     else:
         papers = searcher.search(query, max_results=max_results)
-    return [paper.to_dict() for paper in papers]
+    return _share_strings([paper.to_dict() for paper in papers])
+
+
+async def async_search(searcher, query: str, max_results: int, **kwargs) -> List[Dict]:
+    """Run sync_search on the I/O thread pool so the event loop keeps serving other tools."""
+    return await run_blocking(sync_search, searcher, query, max_results, **kwargs)
+
+
+# Lookup arguments keyed in normalized form, so 'https://doi.org/10.x/y'
+# and '10.x/y' share one cache entry, whether primed or fetched
+_LOOKUP_KEYS = {"doi": normalize_doi}
+
+# Per-paper lookups a platform's search hits can answer, as (tool name,
+# argument, result field). Search and lookup share one parser on these
+# platforms, so a hit is exactly what the lookup would return.
+_PREFETCH_LOOKUPS = {
+    "openalex": (("get_openalex_paper", "paper_id", "paper_id"), ("get_openalex_paper_by_doi", "doi", "doi")),
+    "crossref": (("get_crossref_paper_by_doi", "doi", "doi"),),
+}
+
+
+def _prefetch_lookups(platform: str, rows: List[Dict]) -> None:
+    """Seed the lookup cache with search hits so follow-up get_* calls are free."""
+    for name, argument, field in _PREFETCH_LOOKUPS.get(platform, ()):
+        for row in rows:
+            if row.get(field):
+                value = _LOOKUP_KEYS[argument](row[field]) if argument in _LOOKUP_KEYS else row[field]
+                prime(_DOI_CACHE, name, row, **{argument: value})
+
+
+def _encode_row(row: Dict) -> str:
+    """Encode one result row exactly as FastMCP would, with orjson when installed."""
+    if _orjson_dumps is not None:
+        return _orjson_dumps(row, default=str, option=OPT_INDENT_2).decode()
+    return pydantic_core.to_json(row, fallback=str, indent=2).decode()
+
+
+def _encoded_tool(fn: Callable) -> Callable:
+    """Register a List[Dict] tool whose result is encoded once, here.
+
+    For a plain list FastMCP dumps the validated result back to dicts and
+    then encodes each row separately. A CallToolResult skips both passes
+    and is still validated against the tool's List[Dict] output schema,
+    so clients see the same content. fn itself is returned unchanged for
+    Python callers.
+    """
+    @functools.wraps(fn)
+    async def tool(*args, **kwargs) -> CallToolResult:
+        rows = await fn(*args, **kwargs)
+        return CallToolResult(
+            content=[TextContent(type="text", text=_encode_row(row)) for row in rows],
+            structuredContent={"result": rows},
+        )
+
+    mcp.tool()(tool)
+    return fn
+
+
+# Tools that differ only by platform share one dispatcher each. The
+# decorated stub supplies the tool's name, signature and docstring; the
+# platform is bound once, here, at registration.
+def _search_tool(platform: str) -> Callable:
+    """Register a search_* tool backed by the platform's search(query, max_results)."""
+    def decorator(stub: Callable) -> Callable:
+        @functools.wraps(stub)
+        async def tool(query: str, max_results: int = 10) -> List[Dict]:
+            return await async_search(_get(platform), query, max_results)
+        return mcp.tool()(memoize_tool(_SEARCH_CACHE)(tool))
+    return decorator
+
+
+def _download_tool(platform: str) -> Callable:
+    """Register a download_* tool that streams the PDF on the shared client."""
+    def decorator(stub: Callable) -> Callable:
+        @functools.wraps(stub)
+        async def tool(paper_id: str, save_path: str = "./downloads") -> str:
+            return await _get(platform).download_pdf_async(get_async_client(), paper_id, save_path)
+        return mcp.tool()(tool)
+    return decorator
+
+
+def _read_tool(platform: str, normalize_id: Optional[Callable[[str], Optional[str]]] = None) -> Callable:
+    """Register a read_* tool that extracts text in a worker thread, logging failures.
+
+    normalize_id, if given, maps the ID to the platform's form; IDs it
+    rejects (None) fail without contacting the platform.
+    """
+    def decorator(stub: Callable) -> Callable:
+        @functools.wraps(stub)
+        async def tool(paper_id: str, save_path: str = "./downloads") -> str:
+            if normalize_id is not None:
+                normalized = normalize_id(paper_id)
+                if normalized is None:
+                    logger.warning(f"Unrecognized {platform} paper ID: {paper_id}")
+                    return ""
+                paper_id = normalized
+            try:
+                return await run_blocking(_get(platform).read_paper, paper_id, save_path)
+            except Exception as e:
+                logger.exception(f"Error reading paper {paper_id}: {e}")
+                return ""
+        return mcp.tool()(tool)
+    return decorator
 
 
 # Tool definitions
-@mcp.tool()
+@_search_tool("arxiv")
 async def search_arxiv(query: str, max_results: int = 10) -> List[Dict]:
     """Search academic papers from arXiv.
 
@@ -61,11 +284,10 @@ async def search_arxiv(query: str, max_results: int = 10) -> List[Dict]:
     Returns:
         List of paper metadata in dictionary format.
     """
-    papers = sync_search(arxiv_searcher, query, max_results)
-    return papers if papers else []
 
 
 @mcp.tool()
+@memoize_tool(_SEARCH_CACHE)
 async def search_pubmed(query: str, max_results: int = 10) -> List[Dict]:
     """Search academic papers from PubMed.
 
@@ -75,11 +297,11 @@ async def search_pubmed(query: str, max_results: int = 10) -> List[Dict]:
     Returns:
         List of paper metadata in dictionary format.
     """
-    papers = sync_search(pubmed_searcher, query, max_results)
-    return papers if papers else []
+    papers = await _get("pubmed").asearch(query, max_results=max_results, client=get_async_client())
+    return [paper.to_dict() for paper in papers]
 
 
-@mcp.tool()
+@_search_tool("biorxiv")
 async def search_biorxiv(query: str, max_results: int = 10) -> List[Dict]:
     """Search academic papers from bioRxiv.
 
@@ -89,11 +311,9 @@ async def search_biorxiv(query: str, max_results: int = 10) -> List[Dict]:
     Returns:
         List of paper metadata in dictionary format.
     """
-    papers = sync_search(biorxiv_searcher, query, max_results)
-    return papers if papers else []
 
 
-@mcp.tool()
+@_search_tool("medrxiv")
 async def search_medrxiv(query: str, max_results: int = 10) -> List[Dict]:
     """Search academic papers from medRxiv.
 
@@ -103,11 +323,9 @@ async def search_medrxiv(query: str, max_results: int = 10) -> List[Dict]:
     Returns:
         List of paper metadata in dictionary format.
     """
-    papers = sync_search(medrxiv_searcher, query, max_results)
-    return papers if papers else []
 
 
-@mcp.tool()
+@_search_tool("google_scholar")
 async def search_google_scholar(query: str, max_results: int = 10) -> List[Dict]:
     """Search academic papers from Google Scholar.
 
@@ -117,11 +335,10 @@ async def search_google_scholar(query: str, max_results: int = 10) -> List[Dict]
     Returns:
         List of paper metadata in dictionary format.
     """
-    papers = sync_search(google_scholar_searcher, query, max_results)
-    return papers if papers else []
 
 
 @mcp.tool()
+@memoize_tool(_SEARCH_CACHE)
 async def search_iacr(
     query: str, max_results: int = 10, fetch_details: bool = True
 ) -> List[Dict]:
@@ -134,11 +351,13 @@ async def search_iacr(
     Returns:
         List of paper metadata in dictionary format.
     """
-    papers = iacr_searcher.search(query, max_results, fetch_details)
+    papers = await _get("iacr").search_async(
+        get_async_client(), query, max_results, fetch_details
+    )
     return [paper.to_dict() for paper in papers] if papers else []
 
 
-@mcp.tool()
+@_download_tool("arxiv")
 async def download_arxiv(paper_id: str, save_path: str = "./downloads") -> str:
     """Download PDF of an arXiv paper.
 
@@ -148,7 +367,6 @@ async def download_arxiv(paper_id: str, save_path: str = "./downloads") -> str:
     Returns:
         Path to the downloaded PDF file.
     """
-    return arxiv_searcher.download_pdf(paper_id, save_path)
 
 
 @mcp.tool()
@@ -162,12 +380,12 @@ async def download_pubmed(paper_id: str, save_path: str = "./downloads") -> str:
         str: Message indicating that direct PDF download is not supported.
     """
     try:
-        return pubmed_searcher.download_pdf(paper_id, save_path)
+        return await run_blocking(_get("pubmed").download_pdf, paper_id, save_path)
     except NotImplementedError as e:
         return str(e)
 
 
-@mcp.tool()
+@_download_tool("biorxiv")
 async def download_biorxiv(paper_id: str, save_path: str = "./downloads") -> str:
     """Download PDF of a bioRxiv paper.
 
@@ -177,10 +395,9 @@ async def download_biorxiv(paper_id: str, save_path: str = "./downloads") -> str
     Returns:
         Path to the downloaded PDF file.
     """
-    return biorxiv_searcher.download_pdf(paper_id, save_path)
 
 
-@mcp.tool()
+@_download_tool("medrxiv")
 async def download_medrxiv(paper_id: str, save_path: str = "./downloads") -> str:
     """Download PDF of a medRxiv paper.
 
@@ -190,10 +407,9 @@ async def download_medrxiv(paper_id: str, save_path: str = "./downloads") -> str
     Returns:
         Path to the downloaded PDF file.
     """
-    return medrxiv_searcher.download_pdf(paper_id, save_path)
 
 
-@mcp.tool()
+@_download_tool("iacr")
 async def download_iacr(paper_id: str, save_path: str = "./downloads") -> str:
     """Download PDF of an IACR ePrint paper.
 
@@ -203,10 +419,9 @@ async def download_iacr(paper_id: str, save_path: str = "./downloads") -> str:
     Returns:
         Path to the downloaded PDF file.
     """
-    return iacr_searcher.download_pdf(paper_id, save_path)
 
 
-@mcp.tool()
+@_read_tool("arxiv")
 async def read_arxiv_paper(paper_id: str, save_path: str = "./downloads") -> str:
     """Read and extract text content from an arXiv paper PDF.
 
@@ -216,11 +431,6 @@ async def read_arxiv_paper(paper_id: str, save_path: str = "./downloads") -> str
     Returns:
         str: The extracted text content of the paper.
     """
-    try:
-        return arxiv_searcher.read_paper(paper_id, save_path)
-    except Exception as e:
-        print(f"Error reading paper {paper_id}: {e}")
-        return ""
 
 
 @mcp.tool()
@@ -233,10 +443,10 @@ async def read_pubmed_paper(paper_id: str, save_path: str = "./downloads") -> st
     Returns:
         str: Message indicating that direct paper reading is not supported.
     """
-    return pubmed_searcher.read_paper(paper_id, save_path)
+    return await run_blocking(_get("pubmed").read_paper, paper_id, save_path)
 
 
-@mcp.tool()
+@_read_tool("biorxiv")
 async def read_biorxiv_paper(paper_id: str, save_path: str = "./downloads") -> str:
     """Read and extract text content from a bioRxiv paper PDF.
 
@@ -246,14 +456,9 @@ async def read_biorxiv_paper(paper_id: str, save_path: str = "./downloads") -> s
     Returns:
         str: The extracted text content of the paper.
     """
-    try:
-        return biorxiv_searcher.read_paper(paper_id, save_path)
-    except Exception as e:
-        print(f"Error reading paper {paper_id}: {e}")
-        return ""
 
 
-@mcp.tool()
+@_read_tool("medrxiv")
 async def read_medrxiv_paper(paper_id: str, save_path: str = "./downloads") -> str:
     """Read and extract text content from a medRxiv paper PDF.
 
@@ -263,14 +468,9 @@ async def read_medrxiv_paper(paper_id: str, save_path: str = "./downloads") -> s
     Returns:
         str: The extracted text content of the paper.
     """
-    try:
-        return medrxiv_searcher.read_paper(paper_id, save_path)
-    except Exception as e:
-        print(f"Error reading paper {paper_id}: {e}")
-        return ""
 
 
-@mcp.tool()
+@_read_tool("iacr")
 async def read_iacr_paper(paper_id: str, save_path: str = "./downloads") -> str:
     """Read and extract text content from an IACR ePrint paper PDF.
 
@@ -280,14 +480,10 @@ async def read_iacr_paper(paper_id: str, save_path: str = "./downloads") -> str:
     Returns:
         str: The extracted text content of the paper.
     """
-    try:
-        return iacr_searcher.read_paper(paper_id, save_path)
-    except Exception as e:
-        print(f"Error reading paper {paper_id}: {e}")
-        return ""
 
 
 @mcp.tool()
+@memoize_tool(_SEARCH_CACHE)
 async def search_semantic(query: str, year: Optional[str] = None, max_results: int = 10) -> List[Dict]:
     """Search academic papers from Semantic Scholar.
 
@@ -301,7 +497,7 @@ async def search_semantic(query: str, year: Optional[str] = None, max_results: i
     kwargs = {}
     if year is not None:
         kwargs['year'] = year
-    papers = sync_search(semantic_searcher, query, max_results, **kwargs)
+    papers = await async_search(_get("semantic"), query, max_results, **kwargs)
     return papers if papers else []
 
 
@@ -323,10 +519,13 @@ async def download_semantic(paper_id: str, save_path: str = "./downloads") -> st
     Returns:
         Path to the downloaded PDF file.
     """ 
-    return semantic_searcher.download_pdf(paper_id, save_path)
+    normalized = semantic_paper_id(paper_id)
+    if normalized is None:
+        return f"Error: Unrecognized Semantic Scholar paper ID: {paper_id}"
+    return await run_blocking(_get("semantic").download_pdf, normalized, save_path)
 
 
-@mcp.tool()
+@_read_tool("semantic", normalize_id=semantic_paper_id)
 async def read_semantic_paper(paper_id: str, save_path: str = "./downloads") -> str:
     """Read and extract text content from a Semantic Scholar paper.
 
@@ -344,14 +543,10 @@ async def read_semantic_paper(paper_id: str, save_path: str = "./downloads") ->
     Returns:
         str: The extracted text content of the paper.
     """
-    try:
-        return semantic_searcher.read_paper(paper_id, save_path)
-    except Exception as e:
-        print(f"Error reading paper {paper_id}: {e}")
-        return ""
 
 
 @mcp.tool()
+@singleflight
 async def get_semantic_citations(paper_id: str, max_results: int = 20) -> List[Dict]:
     """Get papers that cite this Semantic Scholar paper (forward citations).
 
@@ -365,11 +560,15 @@ async def get_semantic_citations(paper_id: str, max_results: int = 20) -> List[D
     Example:
         await get_semantic_citations("5bbfdf2e62f0508c65ba6de9c72fe2066fd98138", 10)
     """
-    papers = semantic_searcher.get_citations(paper_id, max_results)
+    normalized = semantic_paper_id(paper_id)
+    if normalized is None:
+        return []
+    papers = await run_blocking(_get("semantic").get_citations, normalized, max_results)
     return [paper.to_dict() for paper in papers] if papers else []
 
 
 @mcp.tool()
+@singleflight
 async def get_semantic_references(paper_id: str, max_results: int = 20) -> List[Dict]:
     """Get papers referenced by this Semantic Scholar paper (backward citations).
 
@@ -383,11 +582,15 @@ async def get_semantic_references(paper_id: str, max_results: int = 20) -> List[
     Example:
         await get_semantic_references("5bbfdf2e62f0508c65ba6de9c72fe2066fd98138", 10)
     """
-    papers = semantic_searcher.get_references(paper_id, max_results)
+    normalized = semantic_paper_id(paper_id)
+    if normalized is None:
+        return []
+    papers = await run_blocking(_get("semantic").get_references, normalized, max_results)
     return [paper.to_dict() for paper in papers] if papers else []
 
 
 @mcp.tool()
+@singleflight
 async def get_semantic_related(paper_id: str, max_results: int = 20) -> List[Dict]:
     """Get papers related to this Semantic Scholar paper based on citations and concepts.
 
@@ -401,11 +604,58 @@ async def get_semantic_related(paper_id: str, max_results: int = 20) -> List[Dic
     Example:
         await get_semantic_related("5bbfdf2e62f0508c65ba6de9c72fe2066fd98138", 10)
     """
-    papers = semantic_searcher.get_related_papers(paper_id, max_results)
+    normalized = semantic_paper_id(paper_id)
+    if normalized is None:
+        return []
+    papers = await run_blocking(_get("semantic").get_related_papers, normalized, max_results)
+    return [paper.to_dict() for paper in papers] if papers else []
+
+
+@mcp.tool()
+@memoize_tool(_DOI_CACHE, miss_ttl=_MISS_TTL)
+async def get_semantic_paper(paper_id: str) -> Dict:
+    """Get a specific paper from Semantic Scholar.
+
+    Concurrent calls are combined into one batch request.
+
+    Args:
+        paper_id: Paper ID in any form Semantic Scholar accepts
+            (e.g., '649def34f8be52c8b66281af98ae884c09aef38b', 'DOI:10.1038/nature12373', 'ARXIV:2106.15928')
+
+    Returns:
+        Paper metadata in dictionary format, or empty dict if not found.
+
+    Example:
+        await get_semantic_paper("ARXIV:2106.15928")
+    """
+    normalized = semantic_paper_id(paper_id)
+    paper = await _semantic_id_batcher.submit(normalized) if normalized else None
+    return paper.to_dict() if paper else {}
+
+
+@mcp.tool()
+@singleflight
+async def get_semantic_papers_batch(paper_ids: List[str]) -> List[Dict]:
+    """Get several Semantic Scholar papers in batched requests.
+
+    Args:
+        paper_ids: List of paper IDs in any form Semantic Scholar accepts
+            (e.g., ['649def34f8be52c8b66281af98ae884c09aef38b', 'DOI:10.1038/nature12373', 'ARXIV:2106.15928'])
+
+    Returns:
+        List of paper metadata in dictionary format, in request order. IDs
+        that are not found are omitted.
+
+    Example:
+        await get_semantic_papers_batch(["DOI:10.1038/nature12373", "ARXIV:2106.15928"])
+    """
+    ids = [normalized for normalized in map(semantic_paper_id, paper_ids) if normalized]
+    papers = await run_blocking(_get("semantic").get_papers_batch, ids) if ids else []
     return [paper.to_dict() for paper in papers] if papers else []
 
 
 @mcp.tool()
+@memoize_tool(_SEARCH_CACHE)
 async def search_semantic_by_author(
     author_name: str,
     max_results: int = 20
@@ -422,11 +672,12 @@ async def search_semantic_by_author(
     Example:
         await search_semantic_by_author("Yann LeCun", 15)
     """
-    papers = semantic_searcher.search_by_author(author_name, max_results)
+    papers = await run_blocking(_get("semantic").search_by_author, author_name, max_results)
     return [paper.to_dict() for paper in papers] if papers else []
 
 
-@mcp.tool()
+@_encoded_tool
+@memoize_tool(_SEARCH_CACHE)
 async def search_crossref(query: str, max_results: int = 10, **kwargs) -> List[Dict]:
     """Search academic papers from CrossRef database.
     
@@ -455,11 +706,13 @@ async def search_crossref(query: str, max_results: int = 10, **kwargs) -> List[D
         # Search sorted by publication date
         search_crossref("neural networks", 15, sort="published", order="desc")
     """
-    papers = sync_search(crossref_searcher, query, max_results, **kwargs)
+    papers = await async_search(_get("crossref"), query, max_results, **kwargs)
+    _prefetch_lookups("crossref", papers)
     return papers if papers else []
 
 
 @mcp.tool()
+@memoize_tool(_DOI_CACHE, miss_ttl=_MISS_TTL, normalize=_LOOKUP_KEYS)
 async def get_crossref_paper_by_doi(doi: str) -> Dict:
     """Get a specific paper from CrossRef by its DOI.
 
@@ -471,10 +724,31 @@ async def get_crossref_paper_by_doi(doi: str) -> Dict:
     Example:
         get_crossref_paper_by_doi("10.1038/nature12373")
     """
-    paper = crossref_searcher.get_paper_by_doi(doi)
+    key = normalize_doi(doi)
+    paper = await _crossref_doi_batcher.submit(key) if classify_id(key) == "doi" else None
     return paper.to_dict() if paper else {}
 
 
+@mcp.tool()
+@singleflight
+async def get_crossref_papers_by_dois(dois: List[str]) -> List[Dict]:
+    """Get several papers from CrossRef by DOI in batched requests.
+
+    Args:
+        dois: List of DOIs (e.g., ['10.1038/nature12373', '10.1126/science.1157784'])
+
+    Returns:
+        List of paper metadata in dictionary format, in request order. DOIs
+        that are not found are omitted.
+
+    Example:
+        get_crossref_papers_by_dois(["10.1038/nature12373", "10.1126/science.1157784"])
+    """
+    dois = [doi for doi in dois if classify_id(normalize_doi(doi)) == "doi"]
+    papers = await run_blocking(_get("crossref").get_papers_by_dois, dois) if dois else []
+    return [paper.to_dict() for paper in papers] if papers else []
+
+
 @mcp.tool()
 async def download_crossref(paper_id: str, save_path: str = "./downloads") -> str:
     """Attempt to download PDF of a CrossRef paper.
@@ -490,7 +764,7 @@ async def download_crossref(paper_id: str, save_path: str = "./downloads") -> st
         Use the DOI to access the paper through the publisher's website.
     """
     try:
-        return crossref_searcher.download_pdf(paper_id, save_path)
+        return await run_blocking(_get("crossref").download_pdf, paper_id, save_path)
     except NotImplementedError as e:
         return str(e)
 
@@ -509,14 +783,15 @@ async def read_crossref_paper(paper_id: str, save_path: str = "./downloads") ->
         CrossRef is a citation database and doesn't provide direct paper content.
         Use the DOI to access the paper through the publisher's website.
     """
-    return crossref_searcher.read_paper(paper_id, save_path)
+    return await run_blocking(_get("crossref").read_paper, paper_id, save_path)
 
 
 # ============================================================================
 # OpenAlex Tools
 # ============================================================================
 
-@mcp.tool()
+@_encoded_tool
+@memoize_tool(_SEARCH_CACHE)
 async def search_openalex(
     query: str,
     max_results: int = 10,
@@ -558,11 +833,13 @@ async def search_openalex(
     if 'sort' in kwargs:
         search_kwargs['sort'] = kwargs['sort']
 
-    papers = sync_search(openalex_searcher, query, max_results, **search_kwargs)
+    papers = await async_search(_get("openalex"), query, max_results, **search_kwargs)
+    _prefetch_lookups("openalex", papers)
     return papers if papers else []
 
 
 @mcp.tool()
+@memoize_tool(_DOI_CACHE, miss_ttl=_MISS_TTL)
 async def get_openalex_paper(paper_id: str) -> Dict:
     """Get a specific paper from OpenAlex by its ID.
 
@@ -575,11 +852,37 @@ async def get_openalex_paper(paper_id: str) -> Dict:
     Example:
         await get_openalex_paper("W3108360596")
     """
-    paper = openalex_searcher.get_paper_by_id(paper_id)
+    if classify_id(paper_id) not in ("openalex", "doi", "prefixed", "url"):
+        return {}
+    key = paper_id.strip().rsplit("/", 1)[-1]
+    if _OPENALEX_WORK_ID.match(key):
+        paper = await _openalex_id_batcher.submit(key.upper())
+    else:
+        # Other ID forms (DOIs, PMIDs, ...) are only resolved by the single-work endpoint
+        paper = await run_blocking(_get("openalex").get_paper_by_id, paper_id)
     return paper.to_dict() if paper else {}
 
 
 @mcp.tool()
+async def get_openalex_papers(paper_ids: List[str]) -> List[Dict]:
+    """Get several papers from OpenAlex by ID in batched requests.
+
+    Args:
+        paper_ids: List of OpenAlex IDs (e.g., ['W3124567890', 'W2741809807'])
+
+    Returns:
+        List of paper metadata in dictionary format, in request order. IDs that
+        are not found are omitted.
+
+    Example:
+        await get_openalex_papers(["W3108360596", "W2741809807"])
+    """
+    papers = await _get("openalex").aget_papers_by_ids(paper_ids, client=get_async_client())
+    return [paper.to_dict() for paper in papers] if papers else []
+
+
+@mcp.tool()
+@memoize_tool(_DOI_CACHE, miss_ttl=_MISS_TTL, normalize=_LOOKUP_KEYS)
 async def get_openalex_paper_by_doi(doi: str) -> Dict:
     """Get a specific paper from OpenAlex by its DOI.
 
@@ -592,11 +895,33 @@ async def get_openalex_paper_by_doi(doi: str) -> Dict:
     Example:
         await get_openalex_paper_by_doi("10.1038/nature12373")
     """
-    paper = openalex_searcher.get_paper_by_doi(doi)
+    key = normalize_doi(doi)
+    paper = await _openalex_doi_batcher.submit(key) if classify_id(key) == "doi" else None
     return paper.to_dict() if paper else {}
 
 
 @mcp.tool()
+@singleflight
+async def get_openalex_papers_by_doi(dois: List[str]) -> List[Dict]:
+    """Get several papers from OpenAlex by DOI in batched requests.
+
+    Args:
+        dois: List of DOIs (e.g., ['10.1038/nature12373', '10.1126/science.1157784'])
+
+    Returns:
+        List of paper metadata in dictionary format, in request order. DOIs
+        that are not found are omitted.
+
+    Example:
+        await get_openalex_papers_by_doi(["10.1038/nature12373", "10.1126/science.1157784"])
+    """
+    dois = [doi for doi in dois if classify_id(normalize_doi(doi)) == "doi"]
+    papers = await _get("openalex").aget_papers_by_dois(dois, client=get_async_client()) if dois else []
+    return [paper.to_dict() for paper in papers] if papers else []
+
+
+@_encoded_tool
+@singleflight
 async def get_openalex_citations(paper_id: str, max_results: int = 20) -> List[Dict]:
     """Get papers that cite this OpenAlex work (forward citations).
 
@@ -610,11 +935,12 @@ async def get_openalex_citations(paper_id: str, max_results: int = 20) -> List[D
     Example:
         await get_openalex_citations("W3108360596", 10)
     """
-    papers = openalex_searcher.get_citations(paper_id, max_results)
+    papers = await run_blocking(_get("openalex").get_citations, paper_id, max_results)
     return [paper.to_dict() for paper in papers] if papers else []
 
 
-@mcp.tool()
+@_encoded_tool
+@singleflight
 async def get_openalex_references(paper_id: str, max_results: int = 20) -> List[Dict]:
     """Get papers referenced by this OpenAlex work (backward citations).
 
@@ -628,11 +954,12 @@ async def get_openalex_references(paper_id: str, max_results: int = 20) -> List[
     Example:
         await get_openalex_references("W3108360596", 10)
     """
-    papers = openalex_searcher.get_references(paper_id, max_results)
+    papers = await run_blocking(_get("openalex").get_references, paper_id, max_results)
     return [paper.to_dict() for paper in papers] if papers else []
 
 
 @mcp.tool()
+@memoize_tool(_SEARCH_CACHE)
 async def search_openalex_by_author(
     author_name: str,
     max_results: int = 20,
@@ -651,11 +978,12 @@ async def search_openalex_by_author(
     Example:
         await search_openalex_by_author("Yann LeCun", 15)
     """
-    papers = openalex_searcher.search_by_author(author_name, max_results, **kwargs)
+    papers = await run_blocking(_get("openalex").search_by_author, author_name, max_results, **kwargs)
     return [paper.to_dict() for paper in papers] if papers else []
 
 
 @mcp.tool()
+@singleflight
 async def get_openalex_related(paper_id: str, max_results: int = 20) -> List[Dict]:
     """Get papers related to this OpenAlex work based on concepts and references.
 
@@ -669,11 +997,11 @@ async def get_openalex_related(paper_id: str, max_results: int = 20) -> List[Dic
     Example:
         await get_openalex_related("W3108360596", 10)
     """
-    papers = openalex_searcher.get_related_papers(paper_id, max_results)
+    papers = await run_blocking(_get("openalex").get_related_papers, paper_id, max_results)
     return [paper.to_dict() for paper in papers] if papers else []
 
 
-@mcp.tool()
+@_download_tool("openalex")
 async def download_openalex(paper_id: str, save_path: str = "./downloads") -> str:
     """Download PDF of an OpenAlex paper.
 
@@ -688,10 +1016,26 @@ async def download_openalex(paper_id: str, save_path: str = "./downloads") -> st
         OpenAlex doesn't directly host PDFs. This attempts to find and download
         from available open access sources.
     """
-    return openalex_searcher.download_pdf(paper_id, save_path)
 
 
 @mcp.tool()
+async def download_openalex_papers(paper_ids: List[str], save_path: str = "./downloads") -> List[str]:
+    """Download PDFs of several OpenAlex papers in parallel.
+
+    Args:
+        paper_ids: List of OpenAlex paper IDs (e.g., ['W3124567890', 'W2741809807'])
+        save_path: Directory to save the PDFs (default: './downloads')
+
+    Returns:
+        One entry per paper ID, in order: path to downloaded PDF or error message.
+
+    Example:
+        await download_openalex_papers(["W3108360596", "W2741809807"])
+    """
+    return await _get("openalex").adownload_pdfs(paper_ids, save_path, client=get_async_client())
+
+
+@_read_tool("openalex")
 async def read_openalex_paper(paper_id: str, save_path: str = "./downloads") -> str:
     """Read and extract text content from an OpenAlex paper PDF.
 
@@ -702,11 +1046,6 @@ async def read_openalex_paper(paper_id: str, save_path: str = "./downloads") ->
     Returns:
         The extracted text content of the paper.
     """
-    try:
-        return openalex_searcher.read_paper(paper_id, save_path)
-    except Exception as e:
-        print(f"Error reading paper {paper_id}: {e}")
-        return ""
 
 
 # ============================================================================
@@ -744,7 +1083,7 @@ async def download_scihub(
         Sci-Hub operates in a legal gray area. Only use for legitimate research
         purposes and ensure compliance with your local laws and institution policies.
     """
-    result = scihub_fetcher.download_pdf(identifier)
+    result = await run_blocking(_get("sci_hub").download_pdf, identifier)
     if result:
         return result
     else:
@@ -785,7 +1124,7 @@ async def deduplicate_papers(
         all_papers = arxiv_results + semantic_results
         unique_papers = await deduplicate_papers(all_papers, keep="best")
     """
-    return deduplicate_paper_dicts(papers, keep)
+    return await run_blocking(deduplicate_paper_dicts, papers, keep)
 
 
 @mcp.tool()
@@ -818,7 +1157,7 @@ async def merge_papers(papers: List[Dict]) -> List[Dict]:
             continue
 
     # Merge and convert back
-    merged = merge_duplicate_papers(paper_objs)
+    merged = await run_blocking(merge_duplicate_papers, paper_objs)
     return [p.to_dict() for p in merged]
 
 
@@ -845,24 +1184,16 @@ async def find_duplicate_groups(papers: List[Dict]) -> Dict[str, List[Dict]]:
         dup_info = await find_duplicate_groups(results)
         print(f"Found {dup_info['count']} duplicate groups")
     """
-    # Convert dicts to Paper objects
-    paper_objs = []
-    for d in papers:
-        try:
-            paper_objs.append(dict_to_paper(d))
-        except Exception:
-            continue
-
-    # Find duplicates
-    groups = find_duplicates(paper_objs)
+    # Group the input dicts directly; no Paper round-trip
+    groups = await run_blocking(find_duplicate_dicts, papers)
 
     # Convert to report format
     group_dicts = []
     for canonical, dups in groups:
         group_dict = {
-            "canonical": canonical.to_dict(),
-            "duplicates": [d.to_dict() for d in dups],
-            "sources": [d.source for d in [canonical] + dups]
+            "canonical": canonical,
+            "duplicates": dups,
+            "sources": [d.get("source", "") for d in [canonical] + dups]
         }
         group_dicts.append(group_dict)
 
@@ -880,6 +1211,7 @@ async def find_duplicate_groups(papers: List[Dict]) -> Dict[str, List[Dict]]:
 # ============================================================================
 
 @mcp.tool()
+@memoize_tool(_SEARCH_CACHE)
 async def search_pmc(
     query: str,
     max_results: int = 10,
@@ -905,11 +1237,12 @@ async def search_pmc(
         # Search with year filter
         await search_pmc("immunotherapy", 15, year="2020-2023")
     """
-    papers = sync_search(pmc_searcher, query, max_results, year=year)
-    return papers if papers else []
+    papers = await _get("pmc").asearch(query, max_results=max_results, year=year, client=get_async_client())
+    return [paper.to_dict() for paper in papers]
 
 
 @mcp.tool()
+@memoize_tool(_DOI_CACHE, miss_ttl=_MISS_TTL)
 async def get_pmc_paper(paper_id: str) -> Dict:
     """Get a specific paper from PubMed Central by its PMCID.
 
@@ -922,7 +1255,7 @@ async def get_pmc_paper(paper_id: str) -> Dict:
     Example:
         await get_pmc_paper("PMC1234567")
     """
-    paper = pmc_searcher.get_paper_by_pmcid(paper_id)
+    paper = await _get("pmc").aget_paper_by_pmcid(paper_id, client=get_async_client())
     return paper.to_dict() if paper else {}
 
 
@@ -940,16 +1273,18 @@ async def download_pmc(paper_id: str, save_path: str = "./downloads") -> str:
     Example:
         await download_pmc("PMC1234567")
     """
-    return pmc_searcher.download_pdf(paper_id, save_path)
+    return await run_blocking(_get("pmc").download_pdf, paper_id, save_path)
 
 
-@mcp.tool()
+@_read_tool("pmc")
 async def read_pmc_paper(paper_id: str, save_path: str = "./downloads") -> str:
-    """Read and extract text content from a PubMed Central paper PDF.
+    """Read the full text of a PubMed Central paper.
+
+    Uses PMC's JATS XML full text when available, falling back to the PDF.
 
     Args:
         paper_id: PMC ID (e.g., 'PMC1234567' or '1234567')
-        save_path: Directory where the PDF is/will be saved (default: './downloads')
+        save_path: Directory where the PDF/text is/will be saved (default: './downloads')
 
     Returns:
         The extracted text content of the paper.
@@ -957,11 +1292,6 @@ async def read_pmc_paper(paper_id: str, save_path: str = "./downloads") -> str:
     Example:
         content = await read_pmc_paper("PMC1234567")
     """
-    try:
-        return pmc_searcher.read_paper(paper_id, save_path)
-    except Exception as e:
-        print(f"Error reading paper {paper_id}: {e}")
-        return ""
 
 
 # ============================================================================
@@ -969,6 +1299,7 @@ async def read_pmc_paper(paper_id: str, save_path: str = "./downloads") -> str:
 # ============================================================================
 
 @mcp.tool()
+@memoize_tool(_SEARCH_CACHE)
 async def search_hal(
     query: str,
     max_results: int = 10,
@@ -1011,11 +1342,12 @@ async def search_hal(
     if language:
         search_kwargs["language"] = language
 
-    papers = hal_searcher.search(query, max_results, **search_kwargs)
+    papers = await run_blocking(_get("hal").search, query, max_results, **search_kwargs)
     return [paper.to_dict() for paper in papers] if papers else []
 
 
 @mcp.tool()
+@memoize_tool(_SEARCH_CACHE)
 async def search_hal_by_author(
     author_name: str,
     max_results: int = 10,
@@ -1034,11 +1366,12 @@ async def search_hal_by_author(
     Example:
         await search_hal_by_author("Jean-Pierre Nadal", 15)
     """
-    papers = hal_searcher.search_by_author_name(author_name, max_results, year)
+    papers = await run_blocking(_get("hal").search_by_author_name, author_name, max_results, year)
     return [paper.to_dict() for paper in papers] if papers else []
 
 
 @mcp.tool()
+@memoize_tool(_DOI_CACHE, miss_ttl=_MISS_TTL)
 async def get_hal_document(doc_id: str) -> Dict:
     """Get a specific document from HAL by its ID.
 
@@ -1051,7 +1384,7 @@ async def get_hal_document(doc_id: str) -> Dict:
     Example:
         await get_hal_document("hal-01234567")
     """
-    paper = hal_searcher.get_document_by_id(doc_id)
+    paper = await run_blocking(_get("hal").get_document_by_id, doc_id)
     return paper.to_dict() if paper else {}
 
 
@@ -1069,7 +1402,7 @@ async def download_hal(doc_id: str, save_path: str = "./downloads") -> str:
     Example:
         await download_hal("hal-01234567")
     """
-    return hal_searcher.download_file(doc_id, save_path)
+    return await run_blocking(_get("hal").download_file, doc_id, save_path)
 
 
 @mcp.tool()
@@ -1086,7 +1419,7 @@ async def read_hal_paper(doc_id: str, save_path: str = "./downloads") -> str:
     Example:
         content = await read_hal_paper("hal-01234567")
     """
-    return hal_searcher.read_paper(doc_id, save_path)
+    return await run_blocking(_get("hal").read_paper, doc_id, save_path)
 
 
 # ============================================================================
@@ -1094,6 +1427,7 @@ async def read_hal_paper(doc_id: str, save_path: str = "./downloads") -> str:
 # ============================================================================
 
 @mcp.tool()
+@memoize_tool(_SEARCH_CACHE)
 async def search_ssrn(
     query: str,
     max_results: int = 10,
@@ -1128,11 +1462,12 @@ async def search_ssrn(
     if topic:
         search_kwargs["topic"] = topic
 
-    papers = ssrn_searcher.search(query, max_results, **search_kwargs)
+    papers = await _get("ssrn").asearch(query, max_results, client=get_async_client(), **search_kwargs)
     return [paper.to_dict() for paper in papers] if papers else []
 
 
 @mcp.tool()
+@memoize_tool(_SEARCH_CACHE)
 async def search_ssrn_by_author(
     author_name: str,
     max_results: int = 10,
@@ -1151,11 +1486,12 @@ async def search_ssrn_by_author(
     Example:
         await search_ssrn_by_author("Andrei Shleifer", 15)
     """
-    papers = ssrn_searcher.search_by_author(author_name, max_results, year)
+    papers = await _get("ssrn").asearch_by_author(author_name, max_results, year, client=get_async_client())
     return [paper.to_dict() for paper in papers] if papers else []
 
 
 @mcp.tool()
+@memoize_tool(_DOI_CACHE, miss_ttl=_MISS_TTL)
 async def get_ssrn_paper(paper_id: str) -> Dict:
     """Get a specific paper from SSRN by its ID.
 
@@ -1168,7 +1504,7 @@ async def get_ssrn_paper(paper_id: str) -> Dict:
     Example:
         await get_ssrn_paper("1234567")
     """
-    paper = ssrn_searcher.get_paper_by_id(paper_id)
+    paper = await _get("ssrn").aget_paper_by_id(paper_id, client=get_async_client())
     return paper.to_dict() if paper else {}
 
 
@@ -1190,7 +1526,7 @@ async def download_ssrn(paper_id: str, save_path: str = "./downloads") -> str:
     Example:
         await download_ssrn("1234567")
     """
-    return ssrn_searcher.download_pdf(paper_id, save_path)
+    return await run_blocking(_get("ssrn").download_pdf, paper_id, save_path)
 
 
 @mcp.tool()
@@ -1207,7 +1543,7 @@ async def read_ssrn_paper(paper_id: str, save_path: str = "./downloads") -> str:
     Example:
         content = await read_ssrn_paper("1234567")
     """
-    return ssrn_searcher.read_paper(paper_id, save_path)
+    return await run_blocking(_get("ssrn").read_paper, paper_id, save_path)
 
 
 # ============================================================================
@@ -1215,6 +1551,7 @@ async def read_ssrn_paper(paper_id: str, save_path: str = "./downloads") -> str:
 # ============================================================================
 
 @mcp.tool()
+@memoize_tool(_SEARCH_CACHE)
 async def search_dblp(
     query: str,
     max_results: int = 10,
@@ -1253,11 +1590,12 @@ async def search_dblp(
     if venue:
         search_kwargs["venue"] = venue
 
-    papers = dblp_searcher.search(query, max_results, **search_kwargs)
+    papers = await run_blocking(_get("dblp").search, query, max_results, **search_kwargs)
     return [paper.to_dict() for paper in papers] if papers else []
 
 
 @mcp.tool()
+@memoize_tool(_SEARCH_CACHE)
 async def search_dblp_by_author(
     author_name: str,
     max_results: int = 10,
@@ -1276,11 +1614,12 @@ async def search_dblp_by_author(
     Example:
         await search_dblp_by_author("Yann LeCun", 15)
     """
-    papers = dblp_searcher.search_by_author(author_name, max_results, year)
+    papers = await run_blocking(_get("dblp").search_by_author, author_name, max_results, year)
     return [paper.to_dict() for paper in papers] if papers else []
 
 
 @mcp.tool()
+@memoize_tool(_SEARCH_CACHE)
 async def search_dblp_venue(venue_name: str, max_results: int = 50) -> List[Dict]:
     """Search publications from a specific DBLP venue.
 
@@ -1294,11 +1633,12 @@ async def search_dblp_venue(venue_name: str, max_results: int = 50) -> List[Dict
     Example:
         await search_dblp_venue("NeurIPS", 100)
     """
-    papers = dblp_searcher.search_venue(venue_name, max_results)
+    papers = await run_blocking(_get("dblp").search_venue, venue_name, max_results)
     return [paper.to_dict() for paper in papers] if papers else []
 
 
 @mcp.tool()
+@memoize_tool(_DOI_CACHE, miss_ttl=_MISS_TTL)
 async def get_dblp_paper(key: str) -> Dict:
     """Get a specific paper from DBLP by its key.
 
@@ -1311,7 +1651,7 @@ async def get_dblp_paper(key: str) -> Dict:
     Example:
         await get_dblp_paper("conf/nips/VaswaniSPU17")
     """
-    paper = dblp_searcher.get_paper_by_key(key)
+    paper = await run_blocking(_get("dblp").get_paper_by_key, key)
     return paper.to_dict() if paper else {}
 
 
@@ -1325,7 +1665,7 @@ async def get_dblp_top_conferences() -> List[Dict]:
     Example:
         conferences = await get_dblp_top_conferences()
     """
-    return dblp_searcher.get_top_conferences()
+    return await run_blocking(_get("dblp").get_top_conferences)
 
 
 @mcp.tool()
@@ -1338,12 +1678,33 @@ async def get_dblp_top_journals() -> List[Dict]:
     Example:
         journals = await get_dblp_top_journals()
     """
-    return dblp_searcher.get_top_journals()
+    return await run_blocking(_get("dblp").get_top_journals)
+
+
+def _queue_log_handlers() -> logging.handlers.QueueListener:
+    """Move the root logger's handlers onto a background thread.
+
+    Records are queued by the logging thread and written to stderr by a
+    listener thread, so an error burst never blocks the event loop on I/O.
+    Nothing is logged to stdout, which carries the stdio MCP transport.
+    """
+    root = logging.getLogger()
+    handlers = root.handlers[:] or [logging.StreamHandler(sys.stderr)]
+    log_queue = queue.SimpleQueue()
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
 
 
 def main():
     """Entry point for uvx and CLI execution."""
-    mcp.run(transport="stdio")
+    _queue_log_handlers()
+    preload_searchers()
+    # Same as mcp.run(transport="stdio"), but on uvloop's libuv event loop
+    # when installed (POSIX only), which cuts the cost of each await
+    anyio.run(mcp.run_stdio_async, backend_options={"use_uvloop": _UVLOOP_AVAILABLE})
 
 
 if __name__ == "__main__":
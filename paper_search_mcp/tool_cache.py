@@ -0,0 +1,242 @@
+# paper_search_mcp/tool_cache.py
+"""In-memory TTL + LRU memoization for MCP tool results.
+
+Search and lookup tools are pure functions of their arguments from the
+client's point of view, and agents often re-issue identical calls within
+a session. Memoized tools answer repeats from memory with the already
+serialized result. Concurrent identical calls, cached or not, share a
+single upstream request ("single-flight").
+
+Empty results are not stored by default, since searchers return [] or {}
+on errors. Lookups can opt into caching them briefly (miss_ttl), so a
+caller retrying an unknown ID does not re-ask upstream every time.
+Set PAPER_SEARCH_MCP_CACHE=0 to disable caching, as for the disk cache.
+"""
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+import asyncio
+import functools
+import inspect
+import os
+import threading
+import time
+
+if TYPE_CHECKING:
+    from .disk_cache import DiskCache
+
+_MISSING = object()
+
+# Futures of tool calls currently running, keyed like cache entries
+_INFLIGHT: Dict[Hashable, asyncio.Future] = {}
+
+
+class TTLCache:
+    """Bounded mapping whose entries expire ttl seconds after being stored.
+
+    When full, the least recently used entry is evicted. An optional
+    persistent store (see disk_cache.DiskCache) acts as a second tier:
+    entries are written through to it and memory misses are read from it.
+    Safe to share between threads, as searchers running under run_blocking do.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+        store: Optional["DiskCache"] = None
+    ):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries
+            ttl: Entry lifetime in seconds
+            timer: Clock used for expiry (monotonic by default)
+            store: Optional persistent second tier
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.store = store
+        self._timer = timer
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if self._timer() < expires_at:
+                    self._data.move_to_end(key)
+                    return value
+                del self._data[key]
+        if self.store is not None:
+            value = self.store.get(key)
+            if value is not None:
+                self._remember(key, value, self.ttl)
+                return value
+        return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key, evicting the least recently used entry if full.
+
+        ttl overrides the cache's entry lifetime for this entry; such
+        short-lived entries are kept in memory only.
+        """
+        self._remember(key, value, self.ttl if ttl is None else ttl)
+        if self.store is not None and ttl is None:
+            self.store.set(key, value)
+
+    def _remember(self, key: Hashable, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (self._timer() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Turn list and dict arguments into hashable equivalents for cache keys."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _call_key(fn: Callable, signature: inspect.Signature, args: tuple, kwargs: dict,
+              normalize: Optional[Dict[str, Callable[[Any], Any]]] = None) -> Hashable:
+    """Return the key for a tool call: its name plus bound arguments with defaults applied."""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments = bound.arguments
+    if normalize:
+        arguments = {name: normalize[name](value) if name in normalize else value
+                     for name, value in arguments.items()}
+    return (fn.__name__, _freeze(arguments))
+
+
+async def _coalesce(key: Hashable, call: Callable[[], Awaitable]) -> Any:
+    """Await call(), or the result of an identical call already in flight.
+
+    The first caller for a key runs the request; later callers await its
+    future and get the same result or exception. If the leader is
+    cancelled, its followers are not: they retry, and one becomes the new
+    leader.
+    """
+    while (future := _INFLIGHT.get(key)) is not None:
+        try:
+            # Shield so a cancelled follower does not cancel the leader's future
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                # This follower was cancelled itself
+                raise
+
+    future = asyncio.get_running_loop().create_future()
+    _INFLIGHT[key] = future
+    try:
+        result = await call()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except BaseException as e:
+        future.set_exception(e)
+        # Mark retrieved so an unawaited future does not log a spurious traceback
+        future.exception()
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        _INFLIGHT.pop(key, None)
+
+
+def singleflight(fn: Callable[..., Awaitable]) -> Callable[..., Awaitable]:
+    """Decorate an async tool so concurrent identical calls share one request.
+
+    The wrapper keeps the tool's signature, so FastMCP derives the same schema.
+    """
+    signature = inspect.signature(fn)
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        key = _call_key(fn, signature, args, kwargs)
+        return await _coalesce(key, lambda: fn(*args, **kwargs))
+
+    return wrapper
+
+
+def memoize_tool(
+    cache: TTLCache,
+    miss_ttl: Optional[float] = None,
+    normalize: Optional[Dict[str, Callable[[Any], Any]]] = None
+) -> Callable[[Callable[..., Awaitable]], Callable[..., Awaitable]]:
+    """Decorate an async tool so non-empty results are served from cache.
+
+    Keys are the tool name plus its bound arguments with defaults applied,
+    so search_x("q") and search_x("q", 10) share an entry. Cache hits
+    return before the single-flight check; concurrent misses share one
+    call. The wrapper keeps the tool's signature, so FastMCP derives the
+    same schema.
+
+    Args:
+        cache: Cache holding this tool's results
+        miss_ttl: If given, empty results are cached too, for this many
+            seconds; keep it short, as an upstream error also looks empty
+        normalize: Optional functions, by argument name, applied to those
+            arguments in the key only, so equivalent spellings (e.g. a DOI
+            with or without its https://doi.org/ prefix) share an entry
+    """
+    def decorator(fn: Callable[..., Awaitable]) -> Callable[..., Awaitable]:
+        signature = inspect.signature(fn)
+
+        async def fetch(key: Hashable, args: tuple, kwargs: dict) -> Any:
+            value = await fn(*args, **kwargs)
+            if value:
+                cache.set(key, value)
+            elif miss_ttl is not None:
+                cache.set(key, value, ttl=miss_ttl)
+            return value
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            key = _call_key(fn, signature, args, kwargs, normalize)
+            if os.environ.get("PAPER_SEARCH_MCP_CACHE", "1") == "0":
+                return await _coalesce(key, lambda: fn(*args, **kwargs))
+
+            value = cache.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            return await _coalesce(key, lambda: fetch(key, args, kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+def prime(cache: TTLCache, name: str, value: Any, **arguments: Any) -> None:
+    """Store value as the cached result of tool name called with arguments.
+
+    Lets one tool warm another's entries, e.g. a search seeding per-paper
+    lookups. arguments must be the tool's full bound arguments, defaults
+    included, for a later call to hit. Empty values are skipped, as in
+    memoize_tool.
+
+    Args:
+        cache: Cache the target tool is memoized in
+        name: Target tool's function name
+        value: Result to store
+        **arguments: Target tool's arguments
+    """
+    if value and os.environ.get("PAPER_SEARCH_MCP_CACHE", "1") != "0":
+        cache.set((name, _freeze(arguments)), value)
@@ -0,0 +1,51 @@
+"""pytest hooks for the test suite."""
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Test modules whose skipUnless decorators probe a live API when imported
+_NETWORK_TEST_MODULES = (
+    "test_biorxiv",
+    "test_crossref",
+    "test_dblp",
+    "test_google_scholar",
+    "test_hal",
+    "test_iacr",
+    "test_medrxiv",
+    "test_openalex",
+    "test_pmc",
+    "test_sci_hub",
+    "test_semantic",
+    "test_ssrn",
+)
+
+
+def _selected(path: Path, args) -> bool:
+    """Whether a test file is among, or under, the paths pytest was given."""
+    for arg in args:
+        target = Path(arg.split("::", 1)[0]).resolve()
+        if path == target or target in path.parents:
+            return True
+    return False
+
+
+def _import(name: str) -> None:
+    try:
+        importlib.import_module(f"{__package__}.{name}")
+    except Exception:
+        # Collection imports the module again and reports the error properly
+        pass
+
+
+def pytest_sessionstart(session):
+    """Import the selected network test modules concurrently before collection.
+
+    Importing a module runs its cached reachability probe, so unreachable
+    APIs time out together instead of one after another.
+    """
+    here = Path(__file__).resolve().parent
+    args = session.config.args or [str(session.config.rootpath)]
+    names = [name for name in _NETWORK_TEST_MODULES if _selected(here / f"{name}.py", args)]
+    if len(names) > 1:
+        with ThreadPoolExecutor(max_workers=len(names)) as pool:
+            list(pool.map(_import, names))
@@ -0,0 +1,28 @@
+"""Shared test data builders."""
+import dataclasses
+from datetime import datetime
+
+from paper_search_mcp.paper import Paper
+
+# Prototype with the fields tests do not look at
+TEMPLATE_PAPER = Paper(
+    paper_id="",
+    title="",
+    authors=[],
+    abstract="",
+    doi="",
+    published_date=datetime(2023, 1, 1),
+    pdf_url="",
+    url="",
+    source="test",
+)
+
+
+def make_paper(**fields) -> Paper:
+    """Copy TEMPLATE_PAPER with the fields under test.
+
+    List and dict fields are replaced with fresh ones so no two papers
+    share a mutable value with the template.
+    """
+    fresh = {"authors": [], "categories": [], "keywords": [], "references": [], "extra": {}}
+    return dataclasses.replace(TEMPLATE_PAPER, **{**fresh, **fields})
@@ -0,0 +1,95 @@
+"""Unit tests for automatic batching of single-ID lookups (no network)."""
+import asyncio
+import gc
+import unittest
+
+from paper_search_mcp.batching import BatchScheduler
+
+
+class TestBatchScheduler(unittest.TestCase):
+    """Tests for BatchScheduler flushing and result routing."""
+
+    def setUp(self):
+        self.batches = []
+
+    async def fetch(self, keys):
+        self.batches.append(list(keys))
+        await asyncio.sleep(0)
+        return {k: k.upper() for k in keys if k != "missing"}
+
+    def test_concurrent_submits_share_one_batch(self):
+        """Test keys submitted together resolve from one request, duplicates included."""
+        scheduler = BatchScheduler(self.fetch, max_delay=0.01)
+
+        async def run():
+            return await asyncio.gather(*(scheduler.submit(k) for k in ["a", "b", "a", "missing"]))
+
+        self.assertEqual(asyncio.run(run()), ["A", "B", "A", None])
+        self.assertEqual(self.batches, [["a", "b", "missing"]])
+
+    def test_full_batch_flushes_immediately(self):
+        """Test reaching max_batch distinct keys flushes without waiting for the timer."""
+        scheduler = BatchScheduler(self.fetch, max_batch=2, max_delay=60)
+
+        async def run():
+            return await asyncio.wait_for(
+                asyncio.gather(*(scheduler.submit(k) for k in "abcd")), timeout=1
+            )
+
+        self.assertEqual(asyncio.run(run()), ["A", "B", "C", "D"])
+        self.assertEqual(self.batches, [["a", "b"], ["c", "d"]])
+
+    def test_batch_failure_reaches_every_waiter(self):
+        """Test an exception from the batch request is raised for each submitter."""
+        async def failing(keys):
+            raise RuntimeError("upstream down")
+
+        scheduler = BatchScheduler(failing, max_delay=0.01)
+
+        async def run():
+            return await asyncio.gather(scheduler.submit("a"), scheduler.submit("b"), return_exceptions=True)
+
+        results = asyncio.run(run())
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+
+    def test_in_flight_batch_survives_garbage_collection(self):
+        """Test a running batch is referenced by the scheduler, not only the loop."""
+        release = asyncio.Event()
+
+        async def slow(keys):
+            await release.wait()
+            return {k: k.upper() for k in keys}
+
+        scheduler = BatchScheduler(slow, max_batch=1)
+
+        async def run():
+            waiter = asyncio.ensure_future(scheduler.submit("a"))
+            await asyncio.sleep(0)
+            self.assertEqual(len(scheduler._tasks), 1)
+            gc.collect()
+            release.set()
+            return await asyncio.wait_for(waiter, timeout=1)
+
+        self.assertEqual(asyncio.run(run()), "A")
+        self.assertEqual(scheduler._tasks, set())
+
+    def test_timer_from_closed_loop_is_discarded(self):
+        """Test a loop that closes before its flush does not stall the next loop."""
+        scheduler = BatchScheduler(self.fetch, max_delay=0.01)
+
+        async def abandon():
+            asyncio.ensure_future(scheduler.submit("a"))
+            await asyncio.sleep(0)
+
+        asyncio.run(abandon())
+        self.assertIsNotNone(scheduler._timer)
+
+        async def run():
+            return await asyncio.wait_for(scheduler.submit("b"), timeout=1)
+
+        self.assertEqual(asyncio.run(run()), "B")
+        self.assertEqual(self.batches, [["b"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
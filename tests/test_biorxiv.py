@@ -1,11 +1,19 @@
+import functools
 import unittest
+import asyncio
 import os
 import shutil
+import tempfile
+import httpx
 import requests
 from paper_search_mcp.academic_platforms.biorxiv import BioRxivSearcher
 
+# Probed once per process: every skipUnless below and setUpClass share the result
+@functools.lru_cache(maxsize=1)
 def check_api_accessible():
     """检查 bioRxiv API 是否可访问"""
+    if os.environ.get("PYTEST_DISABLE_NETWORK") == "1":
+        return False
     try:
         response = requests.get("https://api.biorxiv.org/details/biorxiv/0/1", timeout=5)
         return response.status_code == 200
@@ -18,9 +26,11 @@ class TestBioRxivSearcher(unittest.TestCase):
         cls.api_accessible = check_api_accessible()
         if not cls.api_accessible:
             print("\nWarning: bioRxiv API is not accessible, some tests will be skipped")
+        cls.searcher = BioRxivSearcher()
 
-    def setUp(self):
-        self.searcher = BioRxivSearcher()
+    @classmethod
+    def tearDownClass(cls):
+        cls.searcher.session.close()
 
     def test_search(self):
         if not self.api_accessible:
@@ -63,5 +73,32 @@ class TestBioRxivSearcher(unittest.TestCase):
             if os.path.exists(save_path):
                 shutil.rmtree(save_path, ignore_errors=True)
 
+
+class TestBioRxivSearcherUnit(unittest.TestCase):
+    """Unit tests that don't require network access."""
+
+    def test_download_pdf_async_retries_then_streams(self):
+        """Test a failed attempt is retried and the PDF is streamed to disk."""
+        attempts = []
+
+        def handler(request):
+            attempts.append(request.url.path)
+            if len(attempts) == 1:
+                return httpx.Response(503)
+            return httpx.Response(200, content=b"%PDF")
+
+        save_path = tempfile.mkdtemp()
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await BioRxivSearcher().download_pdf_async(client, "10.1101/2024.01.01.123", save_path)
+
+        path = asyncio.run(run())
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(attempts[0], "/content/10.1101/2024.01.01.123v1.full.pdf")
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"%PDF")
+
+
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -1,18 +1,59 @@
-"""Tests for CrossRef searcher."""
+"""Tests for CrossRef searcher.
+
+Network tests are skipped when the API is unreachable, or without probing
+it at all when PYTEST_DISABLE_NETWORK=1 is set.
+"""
+import os
+import asyncio
+import functools
+import json
+import tempfile
 import unittest
+from unittest import mock
 import requests
+from requests.adapters import HTTPAdapter
 from paper_search_mcp.academic_platforms.crossref import CrossRefSearcher
 
 
+# One pooled session for the probe and the network tests, so they reuse
+# a kept-alive TLS connection instead of handshaking per request. It is
+# built on first use, so offline and unit-only runs never create it, and
+# each pytest-xdist worker process builds its own
+@functools.lru_cache(maxsize=1)
+def _session():
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+    return session
+
+
+# Probed once per process: every skipUnless below and setUpClass share the result
+@functools.lru_cache(maxsize=1)
 def check_crossref_accessible():
     """Check if CrossRef API is accessible."""
+    if os.environ.get("PYTEST_DISABLE_NETWORK") == "1":
+        return False
     try:
-        response = requests.get("https://api.crossref.org/works", timeout=5)
+        response = _session().get("https://api.crossref.org/works", timeout=5)
         return response.status_code == 200
     except:
         return False
 
 
+# Network tests only wait on I/O, so their requests are issued together
+_CONCURRENCY = 10
+
+
+async def _gather(*calls):
+    """Run blocking searcher calls concurrently, at most _CONCURRENCY at a time."""
+    semaphore = asyncio.Semaphore(_CONCURRENCY)
+
+    async def run(call):
+        async with semaphore:
+            return await asyncio.to_thread(call)
+
+    return await asyncio.gather(*(run(call) for call in calls))
+
+
 class TestCrossRefSearcher(unittest.TestCase):
     """Tests for CrossRefSearcher class."""
 
@@ -23,56 +64,9 @@ class TestCrossRefSearcher(unittest.TestCase):
             print(
                 "\nWarning: CrossRef API is not accessible, some tests will be skipped"
             )
-
-    def setUp(self):
-        self.searcher = CrossRefSearcher()
-
-    @unittest.skipUnless(check_crossref_accessible(), "CrossRef not accessible")
-    def test_search_basic(self):
-        """Test basic search functionality."""
-        results = self.searcher.search("machine learning", max_results=3)
-
-        self.assertIsInstance(results, list)
-        self.assertLessEqual(len(results), 3)
-
-        if results:
-            paper = results[0]
-            self.assertTrue(hasattr(paper, "title"))
-            self.assertTrue(hasattr(paper, "authors"))
-            self.assertEqual(paper.source, "crossref")
-
-    @unittest.skipUnless(check_crossref_accessible(), "CrossRef not accessible")
-    def test_search_empty_query(self):
-        """Test search with empty query."""
-        results = self.searcher.search("", max_results=3)
-        self.assertIsInstance(results, list)
-
-    @unittest.skipUnless(check_crossref_accessible(), "CrossRef not accessible")
-    def test_search_max_results(self):
-        """Test max_results parameter."""
-        results = self.searcher.search("cryptography", max_results=2)
-        self.assertLessEqual(len(results), 2)
-
-    @unittest.skipUnless(check_crossref_accessible(), "CrossRef not accessible")
-    def test_get_paper_by_doi(self):
-        """Test getting paper by DOI."""
-        # Use a known DOI
-        test_doi = "10.1038/nature12373"
-
-        paper = self.searcher.get_paper_by_doi(test_doi)
-
-        if paper:
-            self.assertEqual(paper.doi, test_doi)
-            self.assertTrue(paper.title)
-            self.assertIsInstance(paper.authors, list)
-        else:
-            print(f"Could not fetch paper with DOI: {test_doi}")
-
-    @unittest.skipUnless(check_crossref_accessible(), "CrossRef not accessible")
-    def test_get_paper_by_invalid_doi(self):
-        """Test getting paper by invalid DOI."""
-        paper = self.searcher.get_paper_by_doi("10.9999/invalid.doi.that.does.not.exist")
-        self.assertIsNone(paper)
+            return
+        # One searcher for the whole class; its tests only read from it
+        cls.searcher = CrossRefSearcher(session=_session())
 
     @unittest.skipUnless(check_crossref_accessible(), "CrossRef not accessible")
     def test_download_pdf_raises_error(self):
@@ -88,11 +82,91 @@ class TestCrossRefSearcher(unittest.TestCase):
         self.assertIn("cannot", result.lower())
 
 
+class TestCrossRefSearcherConcurrent(unittest.IsolatedAsyncioTestCase):
+    """Network tests for CrossRefSearcher, issued concurrently."""
+
+    @classmethod
+    def setUpClass(cls):
+        if check_crossref_accessible():
+            cls.searcher = CrossRefSearcher(session=_session())
+
+    @unittest.skipUnless(check_crossref_accessible(), "CrossRef not accessible")
+    async def test_searches_and_doi_lookups(self):
+        """Test search and DOI lookups against the live API."""
+        test_doi = "10.1038/nature12373"
+        basic, empty, limited, paper, invalid = await _gather(
+            functools.partial(self.searcher.search, "machine learning", max_results=3),
+            functools.partial(self.searcher.search, "", max_results=3),
+            functools.partial(self.searcher.search, "cryptography", max_results=2),
+            functools.partial(self.searcher.get_paper_by_doi, test_doi),
+            functools.partial(self.searcher.get_paper_by_doi, "10.9999/invalid.doi.that.does.not.exist"),
+        )
+
+        with self.subTest("basic search"):
+            self.assertIsInstance(basic, list)
+            self.assertLessEqual(len(basic), 3)
+            if basic:
+                self.assertTrue(hasattr(basic[0], "title"))
+                self.assertTrue(hasattr(basic[0], "authors"))
+                self.assertEqual(basic[0].source, "crossref")
+
+        with self.subTest("empty query"):
+            self.assertIsInstance(empty, list)
+
+        with self.subTest("max_results"):
+            self.assertLessEqual(len(limited), 2)
+
+        with self.subTest("paper by DOI"):
+            if paper:
+                self.assertEqual(paper.doi, test_doi)
+                self.assertTrue(paper.title)
+                self.assertIsInstance(paper.authors, list)
+            else:
+                print(f"Could not fetch paper with DOI: {test_doi}")
+
+        with self.subTest("invalid DOI"):
+            self.assertIsNone(invalid)
+
+
 class TestCrossRefSearcherUnit(unittest.TestCase):
     """Unit tests for CrossRefSearcher without network."""
 
-    def setUp(self):
-        self.searcher = CrossRefSearcher()
+    @classmethod
+    def setUpClass(cls):
+        cls.searcher = CrossRefSearcher()
+
+    def test_shared_session_is_used(self):
+        """Test a passed-in session is reused and given CrossRef's polite-pool headers."""
+        session = requests.Session()
+        searcher = CrossRefSearcher(session=session)
+        self.assertIs(searcher.session, session)
+        self.assertEqual(session.headers["User-Agent"], CrossRefSearcher.USER_AGENT)
+
+    def test_get_paper_by_doi_cache_hit(self):
+        """Test a repeated DOI lookup is served from the response cache."""
+        body = json.dumps({"message": {"DOI": "10.1038/nature12373", "title": ["Cached"]}}).encode()
+        response = mock.Mock(status_code=200, content=body, headers={"Content-Type": "application/json"})
+        with tempfile.TemporaryDirectory() as cache_dir:
+            searcher = CrossRefSearcher(cache_dir=cache_dir)
+            with mock.patch.object(searcher.session, "get", return_value=response) as get:
+                first = searcher.get_paper_by_doi("10.1038/nature12373")
+                second = searcher.get_paper_by_doi("10.1038/nature12373")
+
+        self.assertEqual(get.call_count, 1)
+        self.assertEqual(first.title, "Cached")
+        self.assertEqual(second.title, "Cached")
+
+    def test_get_paper_by_doi_not_found_is_not_cached(self):
+        """Test a 404 returns None and is fetched again next time."""
+        response = mock.Mock(status_code=404)
+        response.raise_for_status.side_effect = requests.HTTPError(response=response)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            searcher = CrossRefSearcher(cache_dir=cache_dir)
+            with mock.patch.object(searcher.session, "get", return_value=response) as get:
+                self.assertIsNone(searcher.get_paper_by_doi("10.9999/missing"))
+                self.assertIsNone(searcher.get_paper_by_doi("10.9999/missing"))
+
+        self.assertEqual(get.call_count, 2)
 
     def test_extract_title_with_list(self):
         """Test title extraction from CrossRef item."""
@@ -150,5 +224,26 @@ class TestCrossRefSearcherUnit(unittest.TestCase):
         self.assertEqual(container, "Nature")
 
 
+    def test_get_papers_by_dois_batches(self):
+        """Test DOIs become one OR-ed filter request; comma DOIs are fetched singly."""
+        def fake_get(url, params=None, timeout=None):
+            dois = [f[len("doi:"):] for f in params["filter"].split(",")]
+            response = mock.Mock()
+            response.json.return_value = {
+                "message": {"items": [{"DOI": d.upper(), "title": [d]} for d in reversed(dois) if d != "10.1/missing"]}
+            }
+            return response
+
+        single = mock.Mock(doi="10.1/x,y", title="comma")
+        with mock.patch.object(self.searcher.session, "get", side_effect=fake_get) as get, \
+                mock.patch.object(self.searcher, "get_paper_by_doi", return_value=single) as get_one:
+            papers = self.searcher.get_papers_by_dois(["10.1/a", "10.1/x,y", "10.1/missing", "doi:10.1/B"])
+
+        self.assertEqual(get.call_count, 1)
+        self.assertEqual(get.call_args.kwargs["params"]["filter"], "doi:10.1/a,doi:10.1/missing,doi:10.1/b")
+        get_one.assert_called_once_with("10.1/x,y")
+        self.assertEqual([p.title for p in papers], ["10.1/a", "comma", "10.1/b"])
+
+
 if __name__ == "__main__":
     unittest.main()
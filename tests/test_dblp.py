@@ -1,13 +1,36 @@
-"""Tests for DBLP searcher."""
+"""Tests for DBLP searcher.
+
+Network tests are skipped when DBLP is unreachable, or without probing it
+at all when PYTEST_DISABLE_NETWORK=1 is set.
+"""
+import os
+import functools
 import unittest
+from unittest import mock
 import requests
+from requests.adapters import HTTPAdapter
 from paper_search_mcp.academic_platforms.dblp import DBLPSearcher
 
 
+# One pooled session for the probe and the network tests, so they reuse
+# a kept-alive TLS connection instead of handshaking per request. It is
+# built on first use, so offline and unit-only runs never create it, and
+# each pytest-xdist worker process builds its own
+@functools.lru_cache(maxsize=1)
+def _session():
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+    return session
+
+
+# Probed once per process: every skipUnless below and setUpClass share the result
+@functools.lru_cache(maxsize=1)
 def check_dblp_accessible():
     """Check if DBLP API is accessible."""
+    if os.environ.get("PYTEST_DISABLE_NETWORK") == "1":
+        return False
     try:
-        response = requests.get("https://dblp.org/search/publ/api?q=machine+learning&h=1&format=xml", timeout=5)
+        response = _session().get("https://dblp.org/search/publ/api?q=machine+learning&h=1&format=xml", timeout=5)
         return response.status_code == 200
     except:
         return False
@@ -23,35 +46,34 @@ class TestDBLPSearcher(unittest.TestCase):
             print(
                 "\nWarning: DBLP API is not accessible, some tests will be skipped"
             )
-
-    def setUp(self):
-        self.searcher = DBLPSearcher()
+            return
+        # One searcher for the whole class; its tests only read from it
+        cls.searcher = DBLPSearcher(session=_session())
 
     @unittest.skipUnless(check_dblp_accessible(), "DBLP not accessible")
-    def test_search_basic(self):
-        """Test basic search functionality."""
-        results = self.searcher.search("machine learning", max_results=3)
-
-        self.assertIsInstance(results, list)
-        self.assertLessEqual(len(results), 3)
-
-        if results:
-            paper = results[0]
-            self.assertTrue(hasattr(paper, "title"))
-            self.assertTrue(hasattr(paper, "authors"))
-            self.assertEqual(paper.source, "dblp")
-
-    @unittest.skipUnless(check_dblp_accessible(), "DBLP not accessible")
-    def test_search_with_year_filter(self):
-        """Test search with year filter."""
-        results = self.searcher.search("neural networks", max_results=3, year="2022")
-        self.assertIsInstance(results, list)
-
-    @unittest.skipUnless(check_dblp_accessible(), "DBLP not accessible")
-    def test_search_with_author_filter(self):
-        """Test search with author filter."""
-        results = self.searcher.search("", max_results=3, author="Geoffrey Hinton")
-        self.assertIsInstance(results, list)
+    def test_search_combined(self):
+        """Test one live search, with year and author subsets taken in memory."""
+        papers = self.searcher.search("machine learning neural networks", max_results=10)
+
+        with self.subTest("basic search"):
+            self.assertIsInstance(papers, list)
+            self.assertLessEqual(len(papers), 10)
+            if papers:
+                self.assertTrue(hasattr(papers[0], "title"))
+                self.assertTrue(hasattr(papers[0], "authors"))
+                self.assertEqual(papers[0].source, "dblp")
+
+        with self.subTest("year subset"):
+            years = {p.published_date.year for p in papers if p.published_date}
+            if years:
+                year = min(years)
+                by_year = [p for p in papers if p.published_date and p.published_date.year == year]
+                self.assertTrue(by_year)
+
+        with self.subTest("author subset"):
+            if papers and papers[0].authors:
+                author = papers[0].authors[0]
+                self.assertIn(papers[0], [p for p in papers if author in p.authors])
 
     @unittest.skipUnless(check_dblp_accessible(), "DBLP not accessible")
     def test_get_top_conferences(self):
@@ -73,18 +95,22 @@ class TestDBLPSearcher(unittest.TestCase):
 class TestDBLPSearcherUnit(unittest.TestCase):
     """Unit tests for DBLPSearcher without network."""
 
-    def setUp(self):
-        self.searcher = DBLPSearcher()
-
-    def test_session_created(self):
-        """Test that session is created on initialization."""
-        self.assertTrue(hasattr(self.searcher, 'session'))
-        self.assertIsNotNone(self.searcher.session)
-
-    def test_base_urls(self):
-        """Test that base URLs are set correctly."""
-        self.assertIn("dblp.org", self.searcher.BASE_URL)
-        self.assertIn("dblp.org", self.searcher.SEARCH_URL)
+    @classmethod
+    def setUpClass(cls):
+        cls.searcher = DBLPSearcher()
+
+    def test_year_and_author_filters_become_query_params(self):
+        """Test year ranges, single years and authors are sent as DBLP parameters."""
+        response = mock.Mock(status_code=204)
+        with mock.patch.object(self.searcher.session, "get", return_value=response) as get:
+            self.assertEqual(self.searcher.search("neural networks", max_results=3, year="2022"), [])
+            self.searcher.search("", max_results=3, year="2019 - 2021", author="Geoffrey Hinton")
+
+        first, second = (c.kwargs["params"] for c in get.call_args_list)
+        self.assertEqual(first, {"q": "neural networks", "h": 3, "format": "xml",
+                                 "yearMin": "2022", "yearMax": "2022"})
+        self.assertEqual(second["author"], "Geoffrey Hinton")
+        self.assertEqual((second["yearMin"], second["yearMax"]), ("2019", "2021"))
 
 
 if __name__ == "__main__":
@@ -1,7 +1,15 @@
 """Tests for deduplication module."""
+import functools
+import hashlib
+import os
 import unittest
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from paper_search_mcp.paper import Paper
+from difflib import SequenceMatcher
+from types import SimpleNamespace
+from unittest import mock
+from paper_search_mcp import deduplication
+from tests.factories import make_paper
 from paper_search_mcp.deduplication import (
     normalize_doi,
     normalize_title,
@@ -11,9 +19,42 @@ from paper_search_mcp.deduplication import (
     deduplicate_papers,
     deduplicate_paper_dicts,
     find_duplicates,
+    find_duplicate_dicts,
+    merge_paper_group,
     dict_to_paper
 )
 
+try:
+    from hypothesis import given, settings, strategies as st  # Optional: pip install hypothesis
+except ImportError:
+    given = None
+
+# PAPER_SEARCH_MCP_SKIP_SLOW=1 skips the 10k-paper scale tests in quick local loops
+_SKIP_SLOW = os.environ.get("PAPER_SEARCH_MCP_SKIP_SLOW") == "1"
+
+
+@functools.lru_cache(maxsize=None)
+def _scale_corpus(size: int) -> tuple:
+    """size unrelated papers plus 50 planted DOI copies, built once per process.
+
+    Titles and authors are unrelated, so only the copies can match; the
+    copy of paper "p{i}" is "copy{i}". Tests must not mutate the papers.
+    """
+    fields = [
+        {
+            "paper_id": f"p{i}",
+            "title": hashlib.md5(str(i).encode()).hexdigest(),
+            "authors": [f"Author {i}"],
+            "doi": f"10.x/{i}",
+        }
+        for i in range(size)
+    ]
+    copies = [
+        {**fields[i], "paper_id": f"copy{i}", "source": "other"}
+        for i in range(0, size, size // 50)
+    ]
+    return tuple(make_paper(**f) for f in fields + copies)
+
 
 class TestNormalizeDOI(unittest.TestCase):
     """Tests for DOI normalization."""
@@ -55,6 +96,32 @@ class TestNormalizeTitle(unittest.TestCase):
         self.assertIn("new approach", normalized)
 
 
+if given is not None:
+    # HYPOTHESIS_PROFILE=thorough runs 5000 examples per property instead of 100
+    settings.register_profile("thorough", max_examples=5000)
+    settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "default"))
+
+    class TestNormalizationProperties(unittest.TestCase):
+        """Property-based tests for DOI and title normalization."""
+
+        @given(st.text())
+        def test_normalize_title_idempotent(self, title):
+            """Test normalizing a normalized title changes nothing."""
+            normalized = normalize_title(title)
+            self.assertEqual(normalize_title(normalized), normalized)
+
+        @given(
+            st.from_regex(r"10\.[0-9]{4,9}/\S+", fullmatch=True),
+            st.sampled_from(("", "https://doi.org/", "http://doi.org/", "doi:", "doi.org/")),
+            st.booleans(),
+        )
+        def test_normalize_doi_prefix_stripping(self, doi, prefix, upper):
+            """Test a URL or scheme prefix in any case does not change the normalized DOI."""
+            prefix = prefix.upper() if upper else prefix
+            self.assertEqual(normalize_doi(prefix + doi), normalize_doi(doi))
+            self.assertTrue(normalize_doi(prefix + doi).startswith("10."))
+
+
 class TestTitleSimilarity(unittest.TestCase):
     """Tests for title similarity."""
 
@@ -93,108 +160,64 @@ class TestAreSamePaper(unittest.TestCase):
 
     def test_same_doi(self):
         """Test papers with same DOI are detected as same."""
-        paper1 = Paper(
+        paper1 = make_paper(
             paper_id="test1",
             title="Test Paper",
             authors=["Author A"],
             abstract="Abstract",
             doi="10.1234/test",
-            published_date=datetime(2023, 1, 1),
-            pdf_url="",
-            url="https://example.com/test1",
-            source="test",
-            categories=[],
-            keywords=[],
-            citations=0,
-            references=[]
+            published_date=datetime(2023, 1, 1)
         )
 
-        paper2 = Paper(
+        paper2 = make_paper(
             paper_id="test2",
             title="Different Title",
             authors=["Author B"],
             abstract="Different abstract",
             doi="10.1234/test",
-            published_date=datetime(2023, 1, 2),
-            pdf_url="",
-            url="https://example.com/test2",
-            source="test",
-            categories=[],
-            keywords=[],
-            citations=0,
-            references=[]
+            published_date=datetime(2023, 1, 2)
         )
 
         self.assertTrue(are_same_paper(paper1, paper2))
 
     def test_similar_title_authors_year(self):
         """Test papers with similar title, authors, and year."""
-        paper1 = Paper(
+        paper1 = make_paper(
             paper_id="test1",
             title="Machine Learning and Neural Networks",
             authors=["Author A", "Author B"],
             abstract="Abstract 1",
-            doi="",
-            published_date=datetime(2023, 1, 1),
-            pdf_url="",
-            url="https://example.com/test1",
-            source="test",
-            categories=[],
-            keywords=[],
-            citations=0,
-            references=[]
+            published_date=datetime(2023, 1, 1)
         )
 
-        paper2 = Paper(
+        paper2 = make_paper(
             paper_id="test2",
             title="Machine Learning with Neural Networks",
             authors=["Author A", "Author B"],
             abstract="Abstract 2",
-            doi="",
-            published_date=datetime(2023, 5, 1),
-            pdf_url="",
-            url="https://example.com/test2",
-            source="test",
-            categories=[],
-            keywords=[],
-            citations=0,
-            references=[]
+            published_date=datetime(2023, 5, 1)
         )
 
         self.assertTrue(are_same_paper(paper1, paper2))
 
     def test_different_papers(self):
         """Test that different papers are not detected as same."""
-        paper1 = Paper(
+        paper1 = make_paper(
             paper_id="test1",
             title="Machine Learning",
             authors=["Author A"],
             abstract="Abstract 1",
             doi="10.1234/test1",
-            published_date=datetime(2023, 1, 1),
-            pdf_url="",
-            url="https://example.com/test1",
-            source="test",
-            categories=[],
-            keywords=[],
-            citations=0,
-            references=[]
+            published_date=datetime(2023, 1, 1)
         )
 
-        paper2 = Paper(
+        paper2 = make_paper(
             paper_id="test2",
             title="Quantum Computing",
             authors=["Author B"],
             abstract="Abstract 2",
             doi="10.5678/test2",
-            published_date=datetime(2023, 1, 2),
-            pdf_url="",
-            url="https://example.com/test2",
-            source="test",
-            categories=[],
-            keywords=[],
-            citations=0,
-            references=[]
+            published_date=datetime(2023, 1, 2)
         )
 
         self.assertFalse(are_same_paper(paper1, paper2))
@@ -206,50 +229,29 @@ class TestDeduplicatePapers(unittest.TestCase):
     def test_remove_duplicates_by_doi(self):
         """Test removing duplicate papers by DOI."""
         papers = [
-            Paper(
+            make_paper(
                 paper_id="test1",
                 title="Test Paper",
                 authors=["Author A"],
                 abstract="Abstract 1",
                 doi="10.1234/test",
-                published_date=datetime(2023, 1, 1),
-                pdf_url="",
-                url="https://example.com/test1",
-                source="test",
-                categories=[],
-                keywords=[],
-                citations=0,
-                references=[]
+                published_date=datetime(2023, 1, 1)
             ),
-            Paper(
+            make_paper(
                 paper_id="test2",
                 title="Different Title",
                 authors=["Author B"],
                 abstract="Abstract 2",
                 doi="10.1234/test",
-                published_date=datetime(2023, 1, 2),
-                pdf_url="",
-                url="https://example.com/test2",
-                source="test",
-                categories=[],
-                keywords=[],
-                citations=0,
-                references=[]
+                published_date=datetime(2023, 1, 2)
             ),
-            Paper(
+            make_paper(
                 paper_id="test3",
                 title="Unique Paper",
                 authors=["Author C"],
                 abstract="Abstract 3",
                 doi="10.5678/test",
-                published_date=datetime(2023, 1, 3),
-                pdf_url="",
-                url="https://example.com/test3",
-                source="test",
-                categories=[],
-                keywords=[],
-                citations=0,
-                references=[]
+                published_date=datetime(2023, 1, 3)
             ),
         ]
 
@@ -257,56 +259,36 @@ class TestDeduplicatePapers(unittest.TestCase):
 
         self.assertEqual(len(unique), 2)
         dois = [p.doi for p in unique]
-        self.assertIn("10.1234/test", dois)
-        self.assertIn("10.5678/test", dois)
+        for doi in ("10.1234/test", "10.5678/test"):
+            with self.subTest(doi=doi):
+                self.assertIn(doi, dois)
 
     def test_remove_duplicates_by_title(self):
         """Test removing duplicate papers by title."""
         papers = [
-            Paper(
+            make_paper(
                 paper_id="test1",
                 title="Test Paper Title",
                 authors=["Author A"],
                 abstract="Abstract 1",
                 doi="",  # No DOI - will rely on title + author + year
-                published_date=datetime(2023, 1, 1),
-                pdf_url="",
-                url="https://example.com/test1",
-                source="test",
-                categories=[],
-                keywords=[],
-                citations=0,
-                references=[]
+                published_date=datetime(2023, 1, 1)
             ),
-            Paper(
+            make_paper(
                 paper_id="test2",
                 title="Test Paper Title",
                 authors=["Author A"],  # Same author to trigger title+author+year match
                 abstract="Abstract 2",
                 doi="",  # No DOI
                 published_date=datetime(2023, 5, 1),  # Same year
-                pdf_url="",
-                url="https://example.com/test2",
-                source="test",
-                categories=[],
-                keywords=[],
-                citations=0,
-                references=[]
             ),
-            Paper(
+            make_paper(
                 paper_id="test3",
                 title="Different Paper",
                 authors=["Author C"],
                 abstract="Abstract 3",
                 doi="10.9999/test3",
-                published_date=datetime(2023, 1, 3),
-                pdf_url="",
-                url="https://example.com/test3",
-                source="test",
-                categories=[],
-                keywords=[],
-                citations=0,
-                references=[]
+                published_date=datetime(2023, 1, 3)
             ),
         ]
 
@@ -314,8 +296,9 @@ class TestDeduplicatePapers(unittest.TestCase):
 
         self.assertEqual(len(unique), 2)
         titles = [p.title for p in unique]
-        self.assertIn("Test Paper Title", titles)
-        self.assertIn("Different Paper", titles)
+        for title in ("Test Paper Title", "Different Paper"):
+            with self.subTest(title=title):
+                self.assertIn(title, titles)
 
     def test_remove_duplicates_empty_list(self):
         """Test removing duplicates from empty list."""
@@ -325,35 +308,21 @@ class TestDeduplicatePapers(unittest.TestCase):
     def test_keep_first(self):
         """Test keep='first' option."""
         papers = [
-            Paper(
+            make_paper(
                 paper_id="test1",
                 title="Same Title",
                 authors=["Author A"],
                 abstract="First",
-                doi="",
                 published_date=datetime(2023, 1, 1),
-                pdf_url="",
-                url="https://example.com/test1",
-                source="source1",
-                categories=[],
-                keywords=[],
-                citations=0,
-                references=[]
+                source="source1"
             ),
-            Paper(
+            make_paper(
                 paper_id="test2",
                 title="Same Title",
                 authors=["Author A"],
                 abstract="Second",
-                doi="",
                 published_date=datetime(2023, 1, 2),
-                pdf_url="",
-                url="https://example.com/test2",
-                source="source2",
-                categories=[],
-                keywords=[],
-                citations=0,
-                references=[]
+                source="source2"
             ),
         ]
 
@@ -364,35 +333,21 @@ class TestDeduplicatePapers(unittest.TestCase):
     def test_keep_last(self):
         """Test keep='last' option."""
         papers = [
-            Paper(
+            make_paper(
                 paper_id="test1",
                 title="Same Title",
                 authors=["Author A"],
                 abstract="First",
-                doi="",
                 published_date=datetime(2023, 1, 1),
-                pdf_url="",
-                url="https://example.com/test1",
-                source="source1",
-                categories=[],
-                keywords=[],
-                citations=0,
-                references=[]
+                source="source1"
             ),
-            Paper(
+            make_paper(
                 paper_id="test2",
                 title="Same Title",
                 authors=["Author A"],
                 abstract="Second",
-                doi="",
                 published_date=datetime(2023, 1, 2),
-                pdf_url="",
-                url="https://example.com/test2",
-                source="source2",
-                categories=[],
-                keywords=[],
-                citations=0,
-                references=[]
+                source="source2"
             ),
         ]
 
@@ -400,6 +355,66 @@ class TestDeduplicatePapers(unittest.TestCase):
         self.assertEqual(len(unique), 1)
         self.assertEqual(unique[0].paper_id, "test2")
 
+    def test_missing_dates(self):
+        """Test papers without a date never match on author + year but still match on title."""
+        shared = dict(authors=["Ann Lee", "Bob Roe"], published_date=None)
+        papers = [
+            make_paper(paper_id="a", title="Graph Attention Networks", **shared),
+            make_paper(paper_id="b", title="Quantum Error Correction", **shared),
+            make_paper(paper_id="c", title="Graph Attention Networks.", **shared),
+        ]
+        self.assertFalse(are_same_paper(papers[0], papers[1]))
+
+        unique = deduplicate_papers(papers)
+        self.assertEqual([p.paper_id for p in unique], ["a", "b"])
+
+    def test_doi_bucket_skips_title_check(self):
+        """Test papers with DOIs are grouped by DOI without title or pair checks."""
+        papers = [
+            make_paper(paper_id="a", title="Same Title", authors=["Ann Lee"], doi="10.1/a"),
+            make_paper(paper_id="b", title="Same Title", authors=["Ann Lee"], doi="https://doi.org/10.1/A"),
+            make_paper(paper_id="c", title="Same Title", authors=["Ann Lee"], doi="10.1/c"),
+        ]
+        with mock.patch.object(deduplication, "title_similarity", side_effect=AssertionError), \
+                mock.patch.object(deduplication, "_normalized_titles_similar", side_effect=AssertionError), \
+                mock.patch.object(deduplication, "_match_without_title", side_effect=AssertionError):
+            unique = deduplicate_papers(papers)
+
+        self.assertEqual([p.paper_id for p in unique], ["a", "c"])
+
+    @unittest.skipIf(_SKIP_SLOW, "PAPER_SEARCH_MCP_SKIP_SLOW=1")
+    def test_scale(self):
+        """Test large inputs are grouped without a pairwise scan."""
+        for size in (1_000, 10_000):
+            with self.subTest(size=size):
+                papers = list(_scale_corpus(size))
+                with mock.patch.object(deduplication, "_PARALLEL_MIN_PAPERS", len(papers)), \
+                        mock.patch.object(deduplication, "_match_without_title", wraps=deduplication._match_without_title) as same:
+                    unique = deduplicate_papers(papers)
+
+                self.assertEqual(len(unique), size)
+                # Copies share a title block with their originals but are already
+                # joined by DOI, so no pair needs the fuzzy match
+                self.assertEqual(same.call_count, 0)
+
+    @unittest.skipIf(_SKIP_SLOW, "PAPER_SEARCH_MCP_SKIP_SLOW=1")
+    def test_remove_duplicates_by_title_scales(self):
+        """Test repeated titles are joined by equality, not by scoring every pair."""
+        papers = [
+            make_paper(
+                paper_id=f"id{i}",
+                title=hashlib.md5(str(i % 500).encode()).hexdigest(),
+                authors=[f"Author {i % 500}"],
+            )
+            for i in range(10_000)
+        ]
+        with mock.patch.object(deduplication, "SequenceMatcher", side_effect=AssertionError), \
+                mock.patch.object(deduplication, "_fuzz_ratio", None):
+            unique = deduplicate_papers(papers)
+
+        self.assertEqual(len(unique), 500)
+        self.assertEqual([p.paper_id for p in unique[:3]], ["id0", "id1", "id2"])
+
 
 class TestDeduplicatePaperDicts(unittest.TestCase):
     """Tests for deduplicate_paper_dicts function."""
@@ -444,61 +459,84 @@ class TestDeduplicatePaperDicts(unittest.TestCase):
         unique = deduplicate_paper_dicts(dicts)
         self.assertEqual(len(unique), 1)
 
+    def test_returns_input_dicts_without_building_papers(self):
+        """Test survivors are the original dicts and no Paper round-trip happens."""
+        dicts = [
+            {"paper_id": "1", "title": "Graph Networks", "authors": "Ann Lee; Bob Roe",
+             "doi": "", "published_date": "2021-05-01T00:00:00", "source": "a"},
+            {"paper_id": "2", "title": "Graph networks.", "authors": ["ann lee"],
+             "doi": "", "published_date": "2021-06-01", "source": "b", "abstract": "Text"},
+            {"paper_id": "3", "title": "Other", "authors": "Cat Poe", "source": "a"},
+        ]
+        with mock.patch.object(deduplication, "dict_to_paper") as to_paper:
+            unique = deduplicate_paper_dicts(dicts, keep="best")
+
+        to_paper.assert_not_called()
+        self.assertIs(unique[0], dicts[1])
+        self.assertIs(unique[1], dicts[2])
+
+    def test_dict_tools_agree_on_undated_and_unparsable_dicts(self):
+        """Test the dict tools and the dict_to_paper round-trip group alike."""
+        dicts = [
+            {"paper_id": "1", "title": "Graph neural networks", "authors": "John Smith; Jane Doe"},
+            {"paper_id": "2", "title": "Protein folding at scale", "authors": "John Smith; Jane Doe"},
+            {"paper_id": "3", "title": "Unrelated", "authors": "Ann Lee", "citations": "many"},
+        ]
+
+        deduped = deduplicate_paper_dicts(dicts)
+        groups = find_duplicate_dicts(dicts)
+        papers = []
+        for d in dicts:
+            try:
+                papers.append(dict_to_paper(d))
+            except ValueError:
+                continue
+        merged = deduplication.merge_duplicate_papers(papers)
+
+        # Undated papers share datetime.min's year, so two shared authors match
+        self.assertEqual([d["paper_id"] for d in deduped], ["1"])
+        self.assertEqual(groups, [(dicts[0], [dicts[1]])])
+        self.assertEqual(len(merged), len(deduped))
+
 
 class TestFindDuplicates(unittest.TestCase):
     """Tests for find_duplicates function."""
 
-    def test_find_duplicate_groups(self):
-        """Test finding duplicate groups."""
-        papers = [
-            Paper(
+    @classmethod
+    def setUpClass(cls):
+        cls.papers = (
+            make_paper(
                 paper_id="test1",
                 title="Same Title",
                 authors=["Author A"],
                 abstract="Abstract 1",
                 doi="10.1234/test",
                 published_date=datetime(2023, 1, 1),
-                pdf_url="",
-                url="https://example.com/test1",
-                source="source1",
-                categories=[],
-                keywords=[],
-                citations=0,
-                references=[]
+                source="source1"
             ),
-            Paper(
+            make_paper(
                 paper_id="test2",
                 title="Same Title",
                 authors=["Author A"],
                 abstract="Abstract 2",
                 doi="10.1234/test",
                 published_date=datetime(2023, 1, 2),
-                pdf_url="",
-                url="https://example.com/test2",
-                source="source2",
-                categories=[],
-                keywords=[],
-                citations=0,
-                references=[]
+                source="source2"
             ),
-            Paper(
+            make_paper(
                 paper_id="test3",
                 title="Unique Paper",
                 authors=["Author B"],
                 abstract="Abstract 3",
                 doi="10.5678/test",
                 published_date=datetime(2023, 1, 3),
-                pdf_url="",
-                url="https://example.com/test3",
-                source="source3",
-                categories=[],
-                keywords=[],
-                citations=0,
-                references=[]
+                source="source3"
             ),
-        ]
+        )
 
-        groups = find_duplicates(papers)
+    def test_find_duplicate_groups(self):
+        """Test finding duplicate groups."""
+        groups = find_duplicates(list(self.papers))
 
         # Should have 1 duplicate group
         self.assertEqual(len(groups), 1)
@@ -509,6 +547,333 @@ class TestFindDuplicates(unittest.TestCase):
         self.assertEqual(len(duplicates), 1)
         self.assertEqual(duplicates[0].paper_id, "test2")
 
+    @unittest.skipIf(_SKIP_SLOW, "PAPER_SEARCH_MCP_SKIP_SLOW=1")
+    def test_find_duplicate_groups_at_scale(self):
+        """Test every planted copy in the shared scale corpus is reported with its original."""
+        groups = find_duplicates(list(_scale_corpus(10_000)))
+
+        self.assertEqual(len(groups), 50)
+        for canonical, duplicates in groups:
+            self.assertEqual([d.paper_id for d in duplicates], ["copy" + canonical.paper_id[1:]])
+
+    def test_find_duplicate_dicts_returns_inputs(self):
+        """Test dict grouping matches find_duplicates and returns the input dicts."""
+        papers = [
+            make_paper(paper_id="a", title="Same Title", authors=["Author A"], doi="10.1/x", source="s1"),
+            make_paper(paper_id="b", title="Other Title", authors=["Author B"], source="s2"),
+            make_paper(paper_id="c", title="Same Title", authors=["Author A"], doi="10.1/X", source="s3"),
+        ]
+        dicts = [p.to_dict() for p in papers] + [{"title": None}]
+
+        with mock.patch.object(deduplication, "dict_to_paper") as to_paper:
+            groups = find_duplicate_dicts(dicts)
+
+        to_paper.assert_not_called()
+        self.assertEqual(len(groups), 1)
+        canonical, duplicates = groups[0]
+        self.assertIs(canonical, dicts[0])
+        self.assertEqual(len(duplicates), 1)
+        self.assertIs(duplicates[0], dicts[2])
+        self.assertEqual(find_duplicate_dicts([]), [])
+
+
+class TestMergePaperGroup(unittest.TestCase):
+    """Tests for merging a group of duplicates."""
+
+    def test_extra_merged_with_later_papers_winning(self):
+        """Test extras combine, later values override, and sources are recorded."""
+        first = make_paper(paper_id="1", title="T", source="a")
+        first.extra = {"venue": "X", "pages": "1-2"}
+        second = make_paper(paper_id="2", title="T", source="b")
+        second.extra = {"venue": "Y"}
+
+        merged = merge_paper_group([first, second, make_paper(paper_id="3", title="T", source="c")])
+
+        self.assertEqual(merged.extra, {"venue": "Y", "pages": "1-2", "merged_from": ["a", "b", "c"]})
+        self.assertEqual(first.extra, {"venue": "X", "pages": "1-2"})
+
+
+class TestDictToPaper(unittest.TestCase):
+    """Tests for converting paper dicts back to Paper objects."""
+
+    def test_round_trip_of_to_dict(self):
+        """Test joined list fields, ISO dates and JSON extra are parsed back."""
+        paper = make_paper(paper_id="1", title="Title", authors=["Ann Lee", "Bob Roe"], doi="10.1/a")
+        restored = dict_to_paper(dict(paper.to_dict(), extra='{"venue": "X"}'))
+
+        self.assertEqual(restored.authors, ["Ann Lee", "Bob Roe"])
+        self.assertEqual(restored.published_date, paper.published_date)
+        self.assertEqual(restored.extra, {"venue": "X"})
+
+    def test_invalid_values_fall_back(self):
+        """Test bad dates and extra JSON don't raise."""
+        paper = dict_to_paper({"title": "T", "published_date": "not a date", "extra": "{bad"})
+
+        self.assertEqual(paper.published_date, datetime.min)
+        self.assertEqual(paper.extra, {})
+
+
+class TestFuzzyBackend(unittest.TestCase):
+    """Tests for the optional RapidFuzz similarity backend."""
+
+    def test_rapidfuzz_used_with_score_cutoff(self):
+        """Test are_titles_similar passes the threshold to RapidFuzz as a cutoff."""
+        fake_ratio = mock.Mock(return_value=95.0)
+        with mock.patch.object(deduplication, "_fuzz_ratio", fake_ratio):
+            self.assertTrue(are_titles_similar("Deep Learning!", "deep learnings", threshold=0.9))
+            self.assertAlmostEqual(title_similarity("A", "B"), 0.95)
+
+        fake_ratio.assert_any_call("deep learning", "deep learnings", score_cutoff=90.0)
+
+    def test_identical_titles_are_not_scored(self):
+        """Test titles equal after normalization match without calling a scorer."""
+        with mock.patch.object(deduplication, "_fuzz_ratio", side_effect=AssertionError), \
+                mock.patch.object(deduplication, "SequenceMatcher", side_effect=AssertionError):
+            self.assertTrue(are_titles_similar("Deep Learning!", "deep learning"))
+
+    def test_difflib_fallback(self):
+        """Test SequenceMatcher is used when RapidFuzz is not installed."""
+        with mock.patch.object(deduplication, "_fuzz_ratio", None):
+            self.assertEqual(title_similarity("Same Title", "same title"), 1.0)
+            self.assertFalse(are_titles_similar("Attention", "Quantum lattice"))
+
+    def test_length_bound_skips_matcher(self):
+        """Test titles of very different lengths are rejected without scoring."""
+        with mock.patch.object(deduplication, "SequenceMatcher") as matcher, \
+                mock.patch.object(deduplication, "_fuzz_ratio", None):
+            self.assertFalse(are_titles_similar("Attention", "Attention is all you need for everything"))
+        matcher.assert_not_called()
+
+    def test_batched_title_checks_match_scalar_decisions(self):
+        """Test scoring pairs in one cpdist call decides every pair as scoring it alone."""
+        def ratio(a, b, score_cutoff=0):
+            score = SequenceMatcher(None, a, b).ratio() * 100
+            return score if score >= score_cutoff else 0
+
+        def cpdist(queries, choices, scorer, score_cutoff, workers):
+            return SimpleNamespace(tolist=lambda: [
+                scorer(a, b, score_cutoff=score_cutoff) for a, b in zip(queries, choices)
+            ])
+
+        words = ["deep", "learning", "for", "graph", "neural", "networks", "a", "survey", ""]
+        titles = [normalize_title(" ".join(words[k] for k in range(i % 7, 9, 1 + i % 3))) for i in range(100)]
+        pairs = [(i, j) for i in range(100) for j in range(i + 1, 100)]
+
+        with mock.patch.object(deduplication, "_fuzz_ratio", ratio):
+            scalar = [deduplication._normalized_titles_similar(titles[i], titles[j]) for i, j in pairs]
+            with mock.patch.object(deduplication, "_cpdist", cpdist):
+                batched = deduplication._titles_similar_batch(pairs, titles)
+
+        self.assertEqual(batched, scalar)
+        self.assertTrue(any(batched))
+        self.assertFalse(all(batched))
+
+
+class TestSimilarityCache(unittest.TestCase):
+    """Tests for memoized normalization and similarity scores."""
+
+    def test_ratio_cached_per_unordered_pair(self):
+        """Test (a, b) and (b, a) share one cache entry."""
+        deduplication._clear_caches()
+        title_similarity("Graph neural networks", "Graph neural network")
+        title_similarity("Graph neural network", "Graph neural networks")
+
+        info = deduplication._pair_ratio.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 1))
+
+    def test_normalize_cache_hit(self):
+        """Test repeated titles and DOIs are normalized once."""
+        deduplication._clear_caches()
+        for _ in range(3):
+            are_titles_similar("Machine Learning and Neural Networks", "Machine Learning with Neural Networks")
+            normalize_doi("https://doi.org/10.1234/Test")
+
+        self.assertEqual(normalize_title.cache_info().misses, 2)
+        self.assertEqual(normalize_title.cache_info().hits, 4)
+        self.assertEqual((normalize_doi.cache_info().misses, normalize_doi.cache_info().hits), (1, 2))
+
+    def test_caches_cleared_after_deduplication(self):
+        """Test a dedup pass leaves no memoized entries behind."""
+        deduplicate_papers([
+            make_paper(paper_id="1", title="Some Title", doi="10.1/a"),
+            make_paper(paper_id="2", title="Some Title"),
+        ])
+
+        self.assertEqual(deduplication.normalize_title.cache_info().currsize, 0)
+        self.assertEqual(deduplication.normalize_doi.cache_info().currsize, 0)
+        self.assertEqual(deduplication._pair_ratio.cache_info().currsize, 0)
+
+
+class TestAuthorOverlap(unittest.TestCase):
+    """Tests for the set-based author overlap check."""
+
+    def test_exact_and_surname_substring_matches(self):
+        """Test exact names match directly and abbreviated names by surname."""
+        at_least = deduplication._at_least_k_author_matches
+        self.assertTrue(at_least(frozenset({"jane doe"}), frozenset({"jane doe", "x y"}), 1))
+        self.assertTrue(at_least(frozenset({"j smith"}), frozenset({"smith"}), 1))
+        self.assertFalse(at_least(frozenset({"li"}), frozenset({"alice brown"}), 1))
+
+    def test_k_counts_exact_and_substring_matches(self):
+        """Test k is reached by combining exact and abbreviated matches."""
+        at_least = deduplication._at_least_k_author_matches
+        self.assertTrue(at_least(frozenset({"ann lee", "b roe"}), frozenset({"ann lee", "roe"})))
+        self.assertFalse(at_least(frozenset({"ann lee", "bob roe"}), frozenset({"ann lee", "cat poe"})))
+
+
+class TestDSU(unittest.TestCase):
+    """Tests for the union-find used to group duplicates."""
+
+    def test_union_keeps_lowest_index_as_root(self):
+        """Test chained unions collapse onto the first occurrence."""
+        dsu = deduplication._DSU(4)
+        self.assertTrue(dsu.union(3, 2))
+        self.assertTrue(dsu.union(2, 1))
+        self.assertFalse(dsu.union(1, 3))
+
+        self.assertEqual([dsu.find(i) for i in range(4)], [0, 1, 1, 1])
+
+
+class TestBuildGroups(unittest.TestCase):
+    """Tests for blocked duplicate grouping."""
+
+    def test_only_papers_sharing_a_block_are_compared(self):
+        """Test unrelated papers are never compared."""
+        papers = [
+            make_paper(paper_id=f"p{i}", title=f"{i:03d} distinct topic", authors=[f"Author {i}"])
+            for i in range(50)
+        ]
+        with mock.patch.object(deduplication, "_match_without_title", wraps=deduplication._match_without_title) as same:
+            groups = deduplication._group_duplicates(papers)
+
+        self.assertEqual(len(groups), 50)
+        self.assertEqual(same.call_count, 0)
+
+    def test_doi_matches_are_joined_without_comparison(self):
+        """Test papers sharing a normalized DOI are grouped by the DOI index."""
+        papers = [
+            make_paper(paper_id="a", title="Alpha", doi="https://doi.org/10.1/X"),
+            make_paper(paper_id="b", title="Beta", doi="10.1/x"),
+        ]
+        with mock.patch.object(deduplication, "_match_without_title", return_value=False):
+            self.assertEqual(deduplication._group_duplicates(papers), [[0, 1]])
+
+    def test_groups_are_transitive_and_ordered(self):
+        """Test A~B and B~C put A, B and C in one group led by the first occurrence."""
+        papers = [
+            make_paper(paper_id="a", title="Deep Learning for Graphs", authors=["Ann Lee"]),
+            make_paper(paper_id="x", title="Unrelated Work", authors=["Bob Roe"]),
+            make_paper(paper_id="b", title="Deep Learning for Graphs", authors=["Ann Lee"], doi="10.1/b"),
+            make_paper(paper_id="c", title="Totally Different", authors=["Cat Poe"], doi="10.1/b"),
+        ]
+        self.assertEqual(deduplication._group_duplicates(papers), [[0, 2, 3], [1]])
+
+    def test_same_source_record_joined_by_id(self):
+        """Test re-ingested records share a group without any comparison."""
+        papers = [
+            make_paper(paper_id="2301.1", title="Alpha", source="arxiv"),
+            make_paper(paper_id="2301.1", title="Alpha v2", source="arxiv"),
+            make_paper(paper_id="2301.1", title="Alpha", source="other"),
+        ]
+        with mock.patch.object(deduplication, "_match_without_title", return_value=False):
+            self.assertEqual(deduplication._group_duplicates(papers), [[0, 1], [2]])
+        self.assertTrue(are_same_paper(papers[0], papers[1]))
+
+    def test_conflicting_dois_never_match(self):
+        """Test two different DOIs win over matching titles and authors."""
+        papers = [
+            make_paper(paper_id="a", title="Deep Learning for Graphs", authors=["Ann Lee"], doi="10.1/a"),
+            make_paper(paper_id="b", title="Deep Learning for Graphs", authors=["Ann Lee"], doi="10.1/b"),
+        ]
+        self.assertEqual(deduplication._group_duplicates(papers), [[0], [1]])
+
+    def test_title_not_scored_without_shared_author_or_year(self):
+        """Test the title comparison is skipped for pairs with nothing else in common."""
+        papers = [
+            make_paper(paper_id="a", title="Deep Learning for Graphs", authors=["Ann Lee"],
+                        published_date=datetime(2020, 1, 1)),
+            make_paper(paper_id="b", title="Deep Learning for Graphs", authors=["Bob Roe"],
+                        published_date=datetime(2021, 1, 1)),
+        ]
+        with mock.patch.object(deduplication, "_normalized_titles_similar") as similar:
+            self.assertFalse(are_same_paper(*papers))
+        similar.assert_not_called()
+
+    def test_cached_grouping_shared_across_entry_points(self):
+        """Test one grouping pass can feed dedup, merge and find_duplicates."""
+        papers = [
+            make_paper(paper_id="a", title="Alpha", doi="10.1/x", source="s1"),
+            make_paper(paper_id="b", title="Beta", source="s2"),
+            make_paper(paper_id="c", title="Alpha", doi="10.1/X", source="s3"),
+        ]
+        groups = deduplication._group_duplicates(papers)
+        with mock.patch.object(deduplication, "_group_duplicates") as regroup:
+            kept = deduplicate_papers(papers, _cached_grouping=groups)
+            merged = deduplication.merge_duplicate_papers(papers, _cached_grouping=groups)
+            found = find_duplicates(papers, _cached_grouping=groups)
+
+        regroup.assert_not_called()
+        self.assertEqual([p.paper_id for p in kept], ["a", "b"])
+        self.assertEqual(merged[0].extra["merged_from"], ["s1", "s3"])
+        self.assertEqual(found, [(papers[0], [papers[2]])])
+
+    def test_parallel_matching_groups_like_serial(self):
+        """Test the worker-process path yields the same groups as the serial one."""
+        papers = [make_paper(paper_id=f"p{i}", title=f"Title number {i % 7}", authors=[f"Author {i % 7}"])
+                  for i in range(30)]
+        serial = deduplication._group_duplicates(papers)
+        with mock.patch.object(deduplication, "_PARALLEL_MIN_PAPERS", 0), \
+                self.assertNoLogs(deduplication.logger, "WARNING"):
+            parallel = deduplication._group_duplicates(papers)
+
+        self.assertEqual(parallel, serial)
+        self.assertEqual(len(serial), 7)
+
+    def test_parallel_matching_uses_spawn(self):
+        """Test worker processes are spawned rather than forked from the server."""
+        buckets = [[0, 1], [2, 3]]
+        with mock.patch.object(deduplication, "ProcessPoolExecutor") as pool_cls:
+            pool_cls.return_value.__enter__.return_value.map.return_value = [[(0, 1)], []]
+            pairs = deduplication._parallel_matches(buckets, ((), (), (), ()))
+
+        self.assertEqual(pairs, [(0, 1)])
+        self.assertEqual(pool_cls.call_args.kwargs["mp_context"].get_start_method(), "spawn")
+
+    def test_broken_pool_falls_back_to_serial(self):
+        """Test a pool that breaks while matching leaves the serial pass to group."""
+        papers = [make_paper(paper_id=f"p{i}", title=f"Title number {i % 3}", authors=[f"Author {i % 3}"])
+                  for i in range(9)]
+        with mock.patch.object(deduplication, "_PARALLEL_MIN_PAPERS", 0), \
+                mock.patch.object(deduplication, "_parallel_matches", side_effect=BrokenProcessPool("died")), \
+                self.assertLogs(deduplication.logger, "WARNING"):
+            groups = deduplication._group_duplicates(papers)
+
+        self.assertEqual(len(groups), 3)
+
+    def test_prefix_blocking_without_datasketch(self):
+        """Test large inputs fall back to prefix buckets when datasketch is missing."""
+        ntitles = ["same prefix one", "same prefix two", "other"] * 200
+        with mock.patch.object(deduplication, "MinHashLSH", None):
+            pairs = set(deduplication._candidate_pairs(ntitles, [frozenset()] * 600, [None] * 600))
+
+        self.assertIn((0, 1), pairs)
+        self.assertNotIn((0, 2), pairs)
+
+    def test_title_shingles(self):
+        """Test titles are shingled into character 3-grams."""
+        self.assertEqual(deduplication._title_shingles("abcd"), {"abc", "bcd"})
+        self.assertEqual(deduplication._title_shingles("ab"), {"ab"})
+
+    def test_author_year_rule_still_applies(self):
+        """Test two shared authors in the same year still match across titles."""
+        papers = [
+            make_paper(paper_id="a", title="First title", authors=["Ann Lee", "Bob Roe"],
+                        published_date=datetime(2020, 1, 1)),
+            make_paper(paper_id="b", title="Another name", authors=["ann lee", "bob roe"],
+                        published_date=datetime(2020, 1, 1)),
+        ]
+        self.assertEqual(len(deduplicate_papers(papers)), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,81 @@
+# tests/test_disk_cache.py
+"""Unit tests for the persistent tool result store (no network)."""
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+from paper_search_mcp.disk_cache import DiskCache
+
+
+class TestDiskCache(unittest.TestCase):
+    """Tests for DiskCache storage, expiry and error handling."""
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.cache_dir.name, "results.sqlite3")
+        self.cache = DiskCache(self.path, ttl=60)
+
+    def tearDown(self):
+        self.cache.close()
+        self.cache_dir.cleanup()
+
+    def test_round_trip_across_instances(self):
+        """Test a stored value is readable by a new instance, as in a later session."""
+        key = ("get_openalex_paper", (("paper_id", "W1"),))
+        value = {"paper_id": "W1", "title": "Café", "citations": 3}
+        self.cache.set(key, value)
+        self.cache.close()
+
+        reopened = DiskCache(self.path, ttl=60)
+        try:
+            self.assertEqual(reopened.get(key), value)
+            self.assertIsNone(reopened.get(("get_openalex_paper", (("paper_id", "W2"),))))
+        finally:
+            reopened.close()
+
+    def test_entries_expire_after_ttl(self):
+        """Test entries older than ttl are misses and are pruned on the next open."""
+        with mock.patch("paper_search_mcp.disk_cache.time.time", return_value=1000.0):
+            self.cache.set("old", [1])
+            self.cache.flush()
+        with mock.patch("paper_search_mcp.disk_cache.time.time", return_value=1061.0):
+            self.assertIsNone(self.cache.get("old"))
+            self.cache.close()
+            reopened = DiskCache(self.path, ttl=60)
+            reopened.set("new", [2])
+            reopened.close()
+
+        rows = sqlite3.connect(self.path).execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        self.assertEqual(rows, 1)
+
+    def test_writes_happen_off_the_calling_thread(self):
+        """Test set() only queues the write until the writer thread stores it."""
+        with mock.patch.object(DiskCache, "_write_loop") as write_loop:
+            self.cache.set("k", [1])
+        write_loop.assert_called_once()
+        self.assertEqual(self.cache._writes.qsize(), 1)
+        self.cache._writer = None
+
+    def test_unusable_directory_is_a_miss(self):
+        """Test a cache path that cannot be created degrades to misses."""
+        blocker = os.path.join(self.cache_dir.name, "file")
+        open(blocker, "w").close()
+        cache = DiskCache(os.path.join(blocker, "results.sqlite3"))
+        cache.set("k", [1])
+        cache.flush()
+        self.assertIsNone(cache.get("k"))
+        cache.close()
+
+    def test_disabled_by_environment(self):
+        """Test PAPER_SEARCH_MCP_CACHE=0 stores and serves nothing."""
+        with mock.patch.dict(os.environ, {"PAPER_SEARCH_MCP_CACHE": "0"}):
+            cache = DiskCache(self.path)
+        cache.set("k", [1])
+        self.assertIsNone(cache.get("k"))
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,18 @@
+import functools
 import unittest
 import os
 import requests
+from unittest import mock
+from paper_search_mcp import http_client
+from paper_search_mcp.academic_platforms import google_scholar
 from paper_search_mcp.academic_platforms.google_scholar import GoogleScholarSearcher
 
+# Probed once per process: every skipUnless below and setUpClass share the result
+@functools.lru_cache(maxsize=1)
 def check_scholar_accessible():
     """检查 Google Scholar 是否可访问"""
+    if os.environ.get("PYTEST_DISABLE_NETWORK") == "1":
+        return False
     try:
         response = requests.get("https://scholar.google.com", timeout=5)
         return response.status_code == 200
@@ -17,9 +25,11 @@ class TestGoogleScholarSearcher(unittest.TestCase):
         cls.scholar_accessible = check_scholar_accessible()
         if not cls.scholar_accessible:
             print("\nWarning: Google Scholar is not accessible, some tests will be skipped")
+        cls.searcher = GoogleScholarSearcher()
 
-    def setUp(self):
-        self.searcher = GoogleScholarSearcher()
+    @classmethod
+    def tearDownClass(cls):
+        cls.searcher.session.close()
 
     def test_search(self):
         if not self.scholar_accessible:
@@ -42,5 +52,31 @@ class TestGoogleScholarSearcher(unittest.TestCase):
         message = self.searcher.read_paper("some_id")
         self.assertIn("Google Scholar doesn't support direct paper reading", message)
 
+
+class TestGoogleScholarSearcherUnit(unittest.TestCase):
+    """Unit tests that don't require network access."""
+
+    PAGE = (
+        '<div class="gs_ri"><h3 class="gs_rt"><a href="https://example.org/{n}">Paper {n}</a></h3>'
+        '<div class="gs_a">A Author - Journal, 2020</div></div>'
+    )
+
+    def test_only_follow_up_requests_wait(self):
+        """Test the first page is fetched at once and later pages are spaced by the limiter."""
+        searcher = GoogleScholarSearcher()
+        pages = [mock.Mock(status_code=200, text="".join(self.PAGE.format(n=f"{p}-{i}") for i in range(10)))
+                 for p in range(2)]
+
+        with mock.patch.object(google_scholar, "_SCHOLAR_RATE_LIMITER", http_client.RateLimiter(0.5)), \
+                mock.patch.object(http_client.time, "monotonic", return_value=100.0), \
+                mock.patch.object(http_client.time, "sleep") as sleep, \
+                mock.patch.object(searcher.session, "get", side_effect=pages) as get:
+            papers = searcher.search("q", max_results=20)
+
+        self.assertEqual(len(papers), 20)
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [2.0])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,11 +1,18 @@
 """Tests for HAL searcher."""
+import functools
+import os
 import unittest
+from unittest import mock
 import requests
 from paper_search_mcp.academic_platforms.hal import HALSearcher
 
 
+# Probed once per process: every skipUnless below and setUpClass share the result
+@functools.lru_cache(maxsize=1)
 def check_hal_accessible():
     """Check if HAL API is accessible."""
+    if os.environ.get("PYTEST_DISABLE_NETWORK") == "1":
+        return False
     try:
         response = requests.get("https://hal.science/search/search?rows=1", timeout=5)
         return response.status_code == 200
@@ -23,9 +30,11 @@ class TestHALSearcher(unittest.TestCase):
             print(
                 "\nWarning: HAL API is not accessible, some tests will be skipped"
             )
+        cls.searcher = HALSearcher()
 
-    def setUp(self):
-        self.searcher = HALSearcher()
+    @classmethod
+    def tearDownClass(cls):
+        cls.searcher.session.close()
 
     @unittest.skipUnless(check_hal_accessible(), "HAL not accessible")
     def test_search_basic(self):
@@ -57,17 +66,41 @@ class TestHALSearcher(unittest.TestCase):
 class TestHALSearcherUnit(unittest.TestCase):
     """Unit tests for HALSearcher without network."""
 
-    def setUp(self):
-        self.searcher = HALSearcher()
-
-    def test_session_created(self):
-        """Test that session is created on initialization."""
-        self.assertTrue(hasattr(self.searcher, 'session'))
-        self.assertIsNotNone(self.searcher.session)
+    @classmethod
+    def setUpClass(cls):
+        cls.searcher = HALSearcher()
 
-    def test_base_url(self):
-        """Test that base URL is set correctly."""
-        self.assertIn("archives-ouvertes.fr", self.searcher.BASE_URL)
+    @classmethod
+    def tearDownClass(cls):
+        cls.searcher.session.close()
+
+    def test_search_parses_canned_response(self):
+        """Test a search sends HAL filter queries and parses the returned docs."""
+        response = mock.Mock(status_code=200)
+        response.json.return_value = {"response": {"docs": [
+            {
+                "halId_s": "hal-01234567",
+                "title_s": ["Apprentissage profond", "A study of deep learning"],
+                "authorName_s": ["Marie Curie", "Pierre Curie"],
+                "abstract_s": ["We study deep networks."],
+                "doiId_s": "10.1234/hal.5678",
+                "producedDate_s": "2022-03-15",
+                "docType_s": "ART",
+            },
+            {"halId_s": "hal-untitled"},
+        ]}}
+        with mock.patch.object(self.searcher.session, "get", return_value=response) as get:
+            results = self.searcher.search("deep learning", max_results=3, year="2020-2022", doc_type="article")
+
+        params = get.call_args.kwargs["params"]
+        self.assertEqual(params["fq"], "producedDate_s:[2020 TO 2022] AND docType_s:ART")
+        self.assertEqual(len(results), 1)
+        paper = results[0]
+        self.assertEqual(paper.title, "A study of deep learning")
+        self.assertEqual(paper.authors, ["Marie Curie", "Pierre Curie"])
+        self.assertEqual(paper.doi, "10.1234/hal.5678")
+        self.assertEqual(paper.published_date.year, 2022)
+        self.assertEqual(paper.source, "hal")
 
 
 if __name__ == "__main__":
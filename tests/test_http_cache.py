@@ -0,0 +1,100 @@
+# tests/test_http_cache.py
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+import requests
+from paper_search_mcp.http_cache import ResponseCache, cached_content, cached_stream
+
+
+class TestResponseCache(unittest.TestCase):
+    """Tests for the on-disk response cache (no network)."""
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        self.cache = ResponseCache("test", self.cache_dir.name)
+
+    def test_key_ignores_param_order(self):
+        """Test the key depends on parameter values, not insertion order."""
+        a = ResponseCache.key("https://x/efetch", {"db": "pmc", "id": "1"})
+        b = ResponseCache.key("https://x/efetch", {"id": "1", "db": "pmc"})
+        c = ResponseCache.key("https://x/efetch", {"id": "2", "db": "pmc"})
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, c)
+        self.assertEqual(len(a), 64)
+
+    def test_put_get_roundtrip(self):
+        """Test stored bodies are returned with a sidecar metadata file."""
+        self.cache.put("https://x", {"q": "a"}, b"body", "text/xml")
+        self.assertEqual(self.cache.get("https://x", {"q": "a"}), b"body")
+
+        key = ResponseCache.key("https://x", {"q": "a"})
+        with open(os.path.join(self.cache.directory, key + ".meta.json")) as f:
+            self.assertEqual(json.load(f)["content_type"], "text/xml")
+
+    def test_ttl_expiry(self):
+        """Test entries older than the TTL are treated as misses."""
+        self.cache.put("https://x", None, b"body")
+        with mock.patch("paper_search_mcp.http_cache.time.time", return_value=10 ** 12):
+            self.assertIsNone(self.cache.get("https://x", None, ttl=60))
+            self.assertEqual(self.cache.get("https://x", None, ttl=None), b"body")
+
+    def test_disabled_by_env(self):
+        """Test PAPER_SEARCH_MCP_CACHE=0 turns the cache off."""
+        with mock.patch.dict(os.environ, {"PAPER_SEARCH_MCP_CACHE": "0"}):
+            cache = ResponseCache("test", self.cache_dir.name)
+        cache.put("https://x", None, b"body")
+        self.assertIsNone(cache.get("https://x", None))
+
+    def test_cached_content_fetches_once(self):
+        """Test a miss is fetched and stored, and a hit skips the network."""
+        response = mock.Mock(content=b"data", headers={}, status_code=200)
+        get = mock.Mock(return_value=response)
+
+        self.assertEqual(cached_content(self.cache, get, "https://x", {"a": 1}), b"data")
+        self.assertEqual(cached_content(self.cache, get, "https://x", {"a": 1}), b"data")
+        self.assertEqual(get.call_count, 1)
+
+    def test_errors_are_not_cached(self):
+        """Test HTTP errors propagate and leave no cache entry behind."""
+        response = mock.Mock(headers={}, status_code=500)
+        response.raise_for_status.side_effect = requests.HTTPError("500")
+        get = mock.Mock(return_value=response)
+
+        with self.assertRaises(requests.HTTPError):
+            cached_content(self.cache, get, "https://x")
+        self.assertIsNone(self.cache.get("https://x"))
+
+    def test_cached_stream_tees_into_cache(self):
+        """Test a streamed body is cached even if the reader stops early."""
+        response = mock.MagicMock(raw=io.BytesIO(b"0123456789"), headers={}, status_code=200)
+        response.__enter__.return_value = response
+        get = mock.Mock(return_value=response)
+
+        with cached_stream(self.cache, get, "https://x") as stream:
+            self.assertEqual(stream.read(4), b"0123")
+
+        self.assertEqual(self.cache.get("https://x"), b"0123456789")
+        with cached_stream(self.cache, get, "https://x") as stream:
+            self.assertEqual(stream.read(), b"0123456789")
+        self.assertEqual(get.call_count, 1)
+
+    def test_cached_stream_error_discards_partial(self):
+        """Test an exception while reading leaves no partial entry."""
+        response = mock.MagicMock(raw=io.BytesIO(b"0123456789"), headers={}, status_code=200)
+        response.__enter__.return_value = response
+
+        with self.assertRaises(ValueError):
+            with cached_stream(self.cache, mock.Mock(return_value=response), "https://x") as stream:
+                stream.read(4)
+                raise ValueError("parse failed")
+
+        self.assertIsNone(self.cache.get("https://x"))
+        self.assertEqual([f for f in os.listdir(self.cache.directory) if f.endswith(".tmp")], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+"""Unit tests for the shared async HTTP client (no network)."""
+import asyncio
+import contextvars
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import httpx
+
+from paper_search_mcp import http_client
+
+
+class TestSharedAsyncClient(unittest.TestCase):
+    """Tests for get_async_client and borrow_client."""
+
+    def test_one_client_per_loop(self):
+        """Test calls on one loop share a client and a new loop gets its own."""
+        async def twice():
+            first, second = http_client.get_async_client(), http_client.get_async_client()
+            await http_client.aclose_async_client()
+            return first, second
+
+        first, second = asyncio.run(twice())
+        other, _ = asyncio.run(twice())
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertTrue(first.is_closed)
+
+    def test_closed_client_is_replaced(self):
+        """Test a client closed elsewhere is not handed out again."""
+        async def run():
+            client = http_client.get_async_client()
+            await client.aclose()
+            replacement = http_client.get_async_client()
+            await http_client.aclose_async_client()
+            return client, replacement
+
+        client, replacement = asyncio.run(run())
+        self.assertIsNot(client, replacement)
+
+    def test_borrow_client_leaves_given_client_open(self):
+        """Test a borrowed client stays open while a factory-made one is closed."""
+        async def run():
+            async with httpx.AsyncClient() as given:
+                async with http_client.borrow_client(given, httpx.AsyncClient) as client:
+                    self.assertIs(client, given)
+                self.assertFalse(given.is_closed)
+            async with http_client.borrow_client(None, httpx.AsyncClient) as own:
+                pass
+            return own
+
+        self.assertTrue(asyncio.run(run()).is_closed)
+
+
+
+class TestStreamToFile(unittest.TestCase):
+    """Tests for chunked streaming downloads."""
+
+    def download(self, handler, name="paper.pdf"):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, name)
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                await http_client.stream_to_file(client, "https://example.org/p.pdf", path, chunk_size=4)
+
+        return asyncio.run(run()), path, directory
+
+    def test_body_written_in_full(self):
+        """Test the body lands at the target path with no leftover part file."""
+        _, path, directory = self.download(lambda request: httpx.Response(200, content=b"%PDF-1.7 body"))
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"%PDF-1.7 body")
+        self.assertEqual(os.listdir(directory), ["paper.pdf"])
+
+    def test_error_status_leaves_no_file(self):
+        """Test an HTTP error raises and writes nothing."""
+        with self.assertRaises(httpx.HTTPStatusError):
+            self.download(lambda request: httpx.Response(404))
+
+    def test_failed_transfer_leaves_no_partial_file(self):
+        """Test a transfer that breaks mid-stream cleans up its part file."""
+        directory = tempfile.mkdtemp()
+
+        class BrokenStream(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                yield b"%PDF"
+                raise httpx.ReadError("connection lost")
+
+        async def run():
+            transport = httpx.MockTransport(lambda request: httpx.Response(200, stream=BrokenStream()))
+            async with httpx.AsyncClient(transport=transport) as client:
+                await http_client.stream_to_file(client, "https://example.org/p.pdf",
+                                                 os.path.join(directory, "p.pdf"))
+
+        with self.assertRaises(httpx.ReadError):
+            asyncio.run(run())
+        self.assertEqual(os.listdir(directory), [])
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Tests for the shared request rate limiter."""
+
+    def test_rate_limiter_spaces_calls(self):
+        """Test the limiter delays back-to-back calls by 1/rate seconds."""
+        limiter = http_client.RateLimiter(4)
+        with mock.patch.object(http_client.time, "monotonic", return_value=100.0), \
+                mock.patch.object(http_client.time, "sleep") as sleep:
+            limiter.wait()
+            limiter.wait()
+            limiter.wait()
+
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [0.25, 0.5])
+
+
+class TestRunBlocking(unittest.TestCase):
+    """Tests for the sync searcher I/O thread pool."""
+
+    def tearDown(self):
+        http_client.shutdown_executor()
+
+    def test_runs_on_io_pool_with_caller_context(self):
+        """Test calls run on named pool threads and see the caller's context variables."""
+        var = contextvars.ContextVar("var", default="unset")
+
+        def probe(suffix, sep="-"):
+            return threading.current_thread().name, var.get() + sep + suffix
+
+        async def run():
+            var.set("caller")
+            return await http_client.run_blocking(probe, "x", sep=":")
+
+        name, value = asyncio.run(run())
+        self.assertTrue(name.startswith("searcher-io"))
+        self.assertEqual(value, "caller:x")
+
+    def test_pool_is_recreated_after_shutdown(self):
+        """Test run_blocking works again once the pool has been shut down."""
+        first = http_client._get_executor()
+        http_client.shutdown_executor()
+        self.assertEqual(asyncio.run(http_client.run_blocking(sum, [1, 2])), 3)
+        self.assertIsNot(http_client._get_executor(), first)
+        self.assertEqual(first._max_workers, http_client.IO_WORKERS)
+
+
+if __name__ == "__main__":
+    unittest.main()
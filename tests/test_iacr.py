@@ -1,11 +1,19 @@
+import functools
 import unittest
+import unittest.mock
+import asyncio
 import os
+import httpx
 import requests
 from paper_search_mcp.academic_platforms.iacr import IACRSearcher
 
 
+# Probed once per process: every skipUnless below and setUpClass share the result
+@functools.lru_cache(maxsize=1)
 def check_iacr_accessible():
     """Check if IACR ePrint Archive is accessible"""
+    if os.environ.get("PYTEST_DISABLE_NETWORK") == "1":
+        return False
     try:
         response = requests.get("https://eprint.iacr.org", timeout=5)
         return response.status_code == 200
@@ -21,9 +29,11 @@ class TestIACRSearcher(unittest.TestCase):
             print(
                 "\nWarning: IACR ePrint Archive is not accessible, some tests will be skipped"
             )
+        cls.searcher = IACRSearcher()
 
-    def setUp(self):
-        self.searcher = IACRSearcher()
+    @classmethod
+    def tearDownClass(cls):
+        cls.searcher.session.close()
 
     @unittest.skipUnless(check_iacr_accessible(), "IACR not accessible")
     def test_search_basic(self):
@@ -303,5 +313,79 @@ class TestIACRSearcher(unittest.TestCase):
             )
 
 
+SEARCH_HTML = """
+<div class="mb-4">
+  <div class="d-flex">
+    <a class="paperlink" href="/{pid}">{pid}</a>
+    <a href="/{pid}.pdf">(PDF)</a>
+    <small class="ms-auto">Last updated: 2024-01-02</small>
+  </div>
+  <div class="ms-md-4"><strong>Compact {pid}</strong>
+    <span class="fst-italic">Alice, Bob</span></div>
+</div>
+"""
+
+DETAIL_HTML = """
+<h3 class="mb-3">Detailed {pid}</h3>
+<p class="fst-italic">Alice and Bob</p>
+<p style="white-space: pre-wrap;">Abstract of {pid}</p>
+"""
+
+
+class TestIACRSearchAsyncUnit(unittest.TestCase):
+    """Offline tests for search_async using a mock transport."""
+
+    def run_search(self, ids, failing=(), **kwargs):
+        in_flight, peak = 0, 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            if request.url.path == "/search":
+                body = "".join(SEARCH_HTML.format(pid=pid) for pid in ids)
+                return httpx.Response(200, text=body)
+            pid = request.url.path.lstrip("/")
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if pid in failing:
+                return httpx.Response(500)
+            return httpx.Response(200, text=DETAIL_HTML.format(pid=pid))
+
+        async def run():
+            transport = httpx.MockTransport(handler)
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await IACRSearcher().search_async(client, "q", **kwargs)
+
+        return asyncio.run(run()), peak
+
+    def test_details_fetched_concurrently_in_order(self):
+        """Test detail pages are gathered concurrently and keep result order."""
+        ids = [f"2024/{n}" for n in range(5)]
+        papers, peak = self.run_search(ids, max_results=5)
+        self.assertEqual([p.title for p in papers], [f"Detailed {pid}" for pid in ids])
+        self.assertEqual(papers[0].authors, ["Alice", "Bob"])
+        self.assertGreater(peak, 1)
+
+    def test_concurrency_is_bounded(self):
+        """Test no more than DETAIL_CONCURRENCY detail fetches run at once."""
+        ids = [f"2024/{n}" for n in range(8)]
+        with unittest.mock.patch.object(IACRSearcher, "DETAIL_CONCURRENCY", 3):
+            papers, peak = self.run_search(ids, max_results=8)
+        self.assertEqual(len(papers), 8)
+        self.assertLessEqual(peak, 3)
+
+    def test_failed_detail_falls_back_to_compact(self):
+        """Test a failed detail fetch keeps the search result entry."""
+        papers, _ = self.run_search(["2024/1", "2024/2"], failing={"2024/2"})
+        self.assertEqual([p.title for p in papers], ["Detailed 2024/1", "Compact 2024/2"])
+
+    def test_without_details_makes_one_request(self):
+        """Test fetch_details=False parses only the search page."""
+        papers, peak = self.run_search(["2024/1", "2024/2", "2024/3"], max_results=2, fetch_details=False)
+        self.assertEqual([p.title for p in papers], ["Compact 2024/1", "Compact 2024/2"])
+        self.assertEqual(peak, 0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,49 @@
+# tests/test_identifiers.py
+"""Unit tests for paper identifier classification (no network)."""
+import unittest
+
+from paper_search_mcp.identifiers import classify_id, semantic_paper_id
+
+
+class TestClassifyId(unittest.TestCase):
+    """Tests for classify_id."""
+
+    def test_known_forms(self):
+        """Test each supported identifier form is classified."""
+        cases = {
+            "2106.15928": "arxiv",
+            "2106.15928v2": "arxiv",
+            "hep-th/9901001": "arxiv",
+            "10.1038/nature12373": "doi",
+            "W3124567890": "openalex",
+            "649def34f8be52c8b66281af98ae884c09aef38b": "semantic",
+            "DOI:10.18653/v1/N18-3011": "prefixed",
+            "pmid:19872477": "prefixed",
+            "https://openalex.org/W3124567890": "url",
+            " 10.1038/nature12373 ": "doi",
+        }
+        for identifier, kind in cases.items():
+            with self.subTest(identifier=identifier):
+                self.assertEqual(classify_id(identifier), kind)
+
+    def test_malformed_ids_are_unrecognized(self):
+        """Test free text and truncated IDs are rejected."""
+        for identifier in ("", "machine learning", "10.1038", "W12x", "DOI:", "649def34"):
+            with self.subTest(identifier=identifier):
+                self.assertEqual(classify_id(identifier), "")
+
+
+class TestSemanticPaperId(unittest.TestCase):
+    """Tests for semantic_paper_id."""
+
+    def test_bare_forms_get_api_prefix(self):
+        """Test bare DOIs and arXiv IDs are prefixed; native forms pass through."""
+        self.assertEqual(semantic_paper_id("2106.15928"), "ARXIV:2106.15928")
+        self.assertEqual(semantic_paper_id("10.1038/nature12373"), "DOI:10.1038/nature12373")
+        self.assertEqual(semantic_paper_id("CorpusId:215416146"), "CorpusId:215416146")
+        self.assertIsNone(semantic_paper_id("W3124567890"))
+        self.assertIsNone(semantic_paper_id("not an id"))
+
+
+if __name__ == "__main__":
+    unittest.main()
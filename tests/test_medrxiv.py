@@ -1,11 +1,16 @@
+import functools
 import unittest
 import os
 import shutil
 import requests
 from paper_search_mcp.academic_platforms.medrxiv import MedRxivSearcher
 
+# Probed once per process: every skipUnless below and setUpClass share the result
+@functools.lru_cache(maxsize=1)
 def check_api_accessible():
     """检查 medRxiv API 是否可访问"""
+    if os.environ.get("PYTEST_DISABLE_NETWORK") == "1":
+        return False
     try:
         response = requests.get("https://api.medRxiv.org/details/medrxiv/0/1", timeout=5)
         return response.status_code == 200
@@ -18,9 +23,11 @@ class TestMedRxivSearcher(unittest.TestCase):
         cls.api_accessible = check_api_accessible()
         if not cls.api_accessible:
             print("\nWarning: medRxiv API is not accessible, some tests will be skipped")
+        cls.searcher = MedRxivSearcher()
 
-    def setUp(self):
-        self.searcher = MedRxivSearcher()
+    @classmethod
+    def tearDownClass(cls):
+        cls.searcher.session.close()
 
     def test_search(self):
         if not self.api_accessible:
@@ -1,11 +1,21 @@
 """Tests for OpenAlex searcher."""
+import functools
+import os
+import tempfile
 import unittest
+import asyncio
+from unittest import mock
+import httpx
 import requests
 from paper_search_mcp.academic_platforms.openalex import OpenAlexSearcher
 
 
+# Probed once per process: every skipUnless below and setUpClass share the result
+@functools.lru_cache(maxsize=1)
 def check_openalex_accessible():
     """Check if OpenAlex API is accessible."""
+    if os.environ.get("PYTEST_DISABLE_NETWORK") == "1":
+        return False
     try:
         response = requests.get("https://api.openalex.org/works?per_page=1", timeout=5)
         return response.status_code == 200
@@ -23,9 +33,11 @@ class TestOpenAlexSearcher(unittest.TestCase):
             print(
                 "\nWarning: OpenAlex API is not accessible, some tests will be skipped"
             )
+        cls.searcher = OpenAlexSearcher()
 
-    def setUp(self):
-        self.searcher = OpenAlexSearcher()
+    @classmethod
+    def tearDownClass(cls):
+        cls.searcher.session.close()
 
     @unittest.skipUnless(check_openalex_accessible(), "OpenAlex not accessible")
     def test_search_basic(self):
@@ -86,17 +98,220 @@ class TestOpenAlexSearcher(unittest.TestCase):
         self.assertIsInstance(results, list)
         self.assertLessEqual(len(results), 3)
 
+    @unittest.skipUnless(check_openalex_accessible(), "OpenAlex not accessible")
+    def test_download_pdfs(self):
+        """Test concurrent download returns one result per ID, in order."""
+        results = self.searcher.download_pdfs(["W2741809807", "W0"], save_path="./downloads")
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[1], "Paper W0 not found")
+
 
 class TestOpenAlexSearcherUnit(unittest.TestCase):
     """Unit tests for OpenAlexSearcher without network."""
 
-    def setUp(self):
-        self.searcher = OpenAlexSearcher()
+    @classmethod
+    def setUpClass(cls):
+        cls.searcher = OpenAlexSearcher()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.searcher.session.close()
+
+    def test_parse_work(self):
+        """Test parsing of an OpenAlex work record."""
+        work = {
+            "id": "https://openalex.org/W123",
+            "title": "Attention Is All You Need",
+            "doi": "https://doi.org/10.5555/3295222",
+            "publication_date": "2017-06-12",
+            "authorships": [
+                {"author": {"display_name": "Ashish Vaswani"}},
+                {"author": {"display_name": "Noam Shazeer"}},
+                {"author": None},
+            ],
+            "abstract_inverted_index": {"The": [0], "dominant": [1], "models": [2, 4], "and": [3]},
+            "locations": [{"source": None}, {"source": {"type": "repository"}, "pdf_url": "https://x/y.pdf"}],
+            "concepts": [
+                {"display_name": "Transformer", "score": 0.9},
+                {"display_name": "Attention", "score": 0.4},
+            ],
+            "cited_by_count": 42,
+            "referenced_works": ["https://openalex.org/W1", "https://openalex.org/W2"],
+            "type": "article",
+        }
+
+        paper = self.searcher._parse_work(work)
+
+        self.assertEqual(paper.paper_id, "W123")
+        self.assertEqual(paper.authors, ["Ashish Vaswani", "Noam Shazeer"])
+        self.assertEqual(paper.abstract, "The dominant models and models")
+        self.assertEqual(paper.published_date.year, 2017)
+        self.assertEqual(paper.pdf_url, "https://x/y.pdf")
+        self.assertEqual(paper.keywords, ["Transformer", "Attention"])
+        self.assertEqual(paper.categories, ["Transformer"])
+        self.assertEqual(paper.references, ["W1", "W2"])
+        self.assertEqual(paper.citations, 42)
+        self.assertEqual(paper.source, "openalex_article")
+
+    def test_search_parses_canned_response(self):
+        """Test a search sends the year filter and parses every returned work."""
+        response = mock.Mock(status_code=200)
+        response.json.return_value = {"results": [
+            {"id": "https://openalex.org/W1", "title": "First", "publication_date": "2021-01-02"},
+            {"id": "https://openalex.org/W2", "title": "Second", "publication_date": "2021-05-06"},
+        ]}
+        with mock.patch.object(self.searcher.session, "get", return_value=response) as get:
+            results = self.searcher.search("graph neural networks", max_results=2, year="2021")
+
+        self.assertEqual(get.call_args.kwargs["params"]["filter"], "publication_year:2021")
+        self.assertEqual([p.paper_id for p in results], ["W1", "W2"])
+        self.assertEqual(results[0].title, "First")
+
+    def test_get_papers_by_ids_batches(self):
+        """Test IDs are OR-ed into batched filters and results keep request order."""
+        def fake_get(url, params=None, timeout=None):
+            ids = params["filter"][len("openalex:"):].split("|")
+            response = mock.Mock()
+            response.json.return_value = {
+                "results": [{"id": f"https://openalex.org/{i}", "title": i} for i in reversed(ids)]
+            }
+            return response
+
+        ids = [f"W{i}" for i in range(60)] + ["https://openalex.org/W99"]
+        with mock.patch.object(self.searcher.session, "get", side_effect=fake_get) as get:
+            papers = self.searcher.get_papers_by_ids(ids)
+
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual([p.paper_id for p in papers], [f"W{i}" for i in range(60)] + ["W99"])
+
+    def test_get_papers_by_dois_batches(self):
+        """Test DOIs are OR-ed into one filter and matched back after normalization."""
+        def fake_get(url, params=None, timeout=None):
+            dois = params["filter"][len("doi:"):].split("|")
+            response = mock.Mock()
+            response.json.return_value = {
+                "results": [{"id": f"https://openalex.org/W{n}", "title": d, "doi": f"https://doi.org/{d.upper()}"}
+                            for n, d in enumerate(reversed(dois))]
+            }
+            return response
+
+        dois = ["10.1/b", "https://doi.org/10.1/A", "", "10.1/c"]
+        with mock.patch.object(self.searcher.session, "get", side_effect=fake_get) as get:
+            papers = self.searcher.get_papers_by_dois(dois)
+
+        self.assertEqual(get.call_count, 1)
+        self.assertEqual(get.call_args.kwargs["params"]["filter"], "doi:10.1/b|10.1/a|10.1/c")
+        self.assertEqual([p.title for p in papers], ["10.1/b", "10.1/a", "10.1/c"])
+
+    def test_aget_papers_by_ids_sends_chunks_concurrently(self):
+        """Test chunk requests are all in flight together and results keep request order."""
+        in_flight, peak = 0, 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            ids = request.url.params["filter"][len("openalex:"):].split("|")
+            return httpx.Response(200, json={
+                "results": [{"id": f"https://openalex.org/{i}", "title": i} for i in reversed(ids)]
+            })
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await self.searcher.aget_papers_by_ids(ids, client=client)
+
+        ids = [f"W{i}" for i in range(120)]
+        papers = asyncio.run(run())
+
+        self.assertEqual(peak, 3)
+        self.assertEqual([p.paper_id for p in papers], ids)
+
+    def test_reconstruct_abstract(self):
+        """Test abstract rebuilding from an inverted index."""
+        from paper_search_mcp.academic_platforms.openalex import _reconstruct_abstract
+
+        self.assertEqual(_reconstruct_abstract(None), "")
+        self.assertEqual(_reconstruct_abstract({}), "")
+        self.assertEqual(_reconstruct_abstract({"a": [0, 2], "b": [1]}), "a b a")
+        # Gaps in the position sequence are skipped
+        self.assertEqual(_reconstruct_abstract({"x": [5], "y": [1]}), "y x")
+        self.assertEqual(_reconstruct_abstract({"x": "bad"}), "")
+
+    def test_check_pdf_size(self):
+        """Test oversized downloads are rejected from Content-Length."""
+        limit = self.searcher.MAX_PDF_SIZE
+        self.assertIsNone(self.searcher._check_pdf_size({}))
+        self.assertIsNone(self.searcher._check_pdf_size({"Content-Length": str(limit)}))
+        self.assertIn("too large", self.searcher._check_pdf_size({"Content-Length": str(limit + 1)}))
+
+    def _download_with_body(self, stream):
+        """Run adownload_pdfs for one paper whose PDF body is stream; return (result, files)."""
+        directory = tempfile.mkdtemp()
+        work = {
+            "id": "https://openalex.org/W1",
+            "title": "T",
+            "locations": [{"source": {"type": "repository"}, "pdf_url": "https://example.org/p.pdf"}],
+        }
+
+        def handler(request):
+            if request.url.path.endswith(".pdf"):
+                return httpx.Response(200, stream=stream)
+            return httpx.Response(200, json=work)
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await self.searcher.adownload_pdfs(["W1"], directory, client=client)
+
+        return asyncio.run(run())[0], os.listdir(directory)
+
+    def test_failed_transfer_leaves_no_file(self):
+        """Test a PDF transfer that breaks mid-stream leaves neither PDF nor part file."""
+        class BrokenStream(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                yield b"%PDF"
+                raise httpx.ReadError("connection lost")
+
+        result, files = self._download_with_body(BrokenStream())
+        self.assertTrue(result.startswith("Failed to download PDF"))
+        self.assertEqual(files, [])
+
+    def test_size_cap_applies_without_content_length(self):
+        """Test a chunked body is cut off once it passes MAX_PDF_SIZE."""
+        class ChunkedStream(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                for _ in range(4):
+                    yield b"%PDF-1.4"
+
+        with mock.patch.object(self.searcher, "MAX_PDF_SIZE", 16):
+            result, files = self._download_with_body(ChunkedStream())
+        self.assertIn("too large", result)
+        self.assertEqual(files, [])
+
+    def test_download_pdf_failure_leaves_no_file(self):
+        """Test the synchronous download also writes through a part file."""
+        directory = tempfile.mkdtemp()
+        paper = mock.Mock(pdf_url="https://example.org/p.pdf")
+        response = mock.MagicMock(headers={})
+        response.__enter__.return_value = response
+
+        def chunks(chunk_size):
+            yield b"%PDF"
+            raise requests.ConnectionError("lost")
+
+        response.iter_content.side_effect = chunks
+        with mock.patch.object(self.searcher, "get_paper_by_id", return_value=paper), \
+                mock.patch.object(self.searcher.session, "get", return_value=response):
+            result = self.searcher.download_pdf("W1", directory)
+
+        self.assertTrue(result.startswith("Failed to download PDF"))
+        self.assertEqual(os.listdir(directory), [])
 
-    def test_session_created(self):
-        """Test that session is created on initialization."""
-        self.assertTrue(hasattr(self.searcher, 'session'))
-        self.assertIsNotNone(self.searcher.session)
+    def test_download_pdfs_empty(self):
+        """Test concurrent download with no IDs makes no requests."""
+        self.assertEqual(self.searcher.download_pdfs([]), [])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,96 @@
+"""Tests for PDF text extraction helpers."""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from paper_search_mcp import pdf_utils
+
+
+def make_pdf(page_texts):
+    """Build a minimal PDF with one line of Helvetica text per page."""
+    count = len(page_texts)
+    kids = " ".join(f"{3 + 2 * i} 0 R" for i in range(count))
+    font_num = 3 + 2 * count
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {count} >>".encode(),
+    ]
+    for i, text in enumerate(page_texts):
+        content = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {4 + 2 * i} 0 R "
+            f"/Resources << /Font << /F1 {font_num} 0 R >> >> >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for num, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % num + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return out
+
+
+class TestExtractPdfText(unittest.TestCase):
+    """Tests for extract_pdf_text."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.pdf_path = os.path.join(self.tmpdir.name, "paper.pdf")
+        with open(self.pdf_path, "wb") as f:
+            f.write(make_pdf(["Hello page one", "Second page"]))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_extract_text(self):
+        """Test pages are extracted in order with the default backend."""
+        self.assertEqual(pdf_utils.extract_pdf_text(self.pdf_path), "Hello page one\nSecond page")
+
+    @unittest.skipUnless(pdf_utils.pdfium, "pypdfium2 not installed")
+    def test_extract_text_parallel(self):
+        """Test the multi-process path keeps pages in order."""
+        with open(self.pdf_path, "wb") as f:
+            f.write(make_pdf([f"Page {i}" for i in range(6)]))
+        with mock.patch.object(pdf_utils, "PARALLEL_PAGE_THRESHOLD", 2), \
+                mock.patch.object(pdf_utils.os, "cpu_count", return_value=2):
+            text = pdf_utils.extract_pdf_text(self.pdf_path)
+        self.assertEqual(text, "\n".join(f"Page {i}" for i in range(6)))
+
+    def test_extract_text_pypdf2_fallback(self):
+        """Test extraction without the optional pypdfium2 backend."""
+        with mock.patch.object(pdf_utils, "pdfium", None):
+            self.assertEqual(pdf_utils.extract_pdf_text(self.pdf_path), "Hello page one\nSecond page")
+
+    def test_zero_page_pdf_pypdf2(self):
+        """Test a valid PDF without pages yields empty text via PyPDF2."""
+        with open(self.pdf_path, "wb") as f:
+            f.write(make_pdf([]))
+        with mock.patch.object(pdf_utils, "pdfium", None):
+            self.assertEqual(pdf_utils.extract_pdf_text(self.pdf_path), "")
+
+    def test_empty_file_raises_without_pdfium(self):
+        """Test empty files (which cannot be memory-mapped) still raise cleanly."""
+        empty_path = os.path.join(self.tmpdir.name, "empty.pdf")
+        open(empty_path, "wb").close()
+        with mock.patch.object(pdf_utils, "pdfium", None):
+            with self.assertRaises(Exception):
+                pdf_utils.extract_pdf_text(empty_path)
+
+    def test_invalid_file_raises(self):
+        """Test unreadable files raise rather than return garbage."""
+        bad_path = os.path.join(self.tmpdir.name, "bad.pdf")
+        with open(bad_path, "wb") as f:
+            f.write(b"not a pdf")
+        with self.assertRaises(Exception):
+            pdf_utils.extract_pdf_text(bad_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
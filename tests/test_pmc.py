@@ -1,11 +1,49 @@
 """Tests for PubMed Central searcher."""
+import functools
+import io
+import json
+import os
+import tempfile
 import unittest
+from unittest import mock
+import asyncio
+import httpx
 import requests
+from paper_search_mcp.academic_platforms import pmc
 from paper_search_mcp.academic_platforms.pmc import PMCSearcher
+from tests.test_pdf_utils import make_pdf
 
 
+SAMPLE_PMC_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<pmc-articleset>
+<article>
+  <front>
+    <journal-meta><journal-title-group><journal-title>Nature Medicine</journal-title></journal-title-group></journal-meta>
+    <article-meta>
+      <article-id pub-id-type="pmcid">PMC1234567</article-id>
+      <article-id pub-id-type="doi">10.1038/nm.1234</article-id>
+      <title-group><article-title>Tumour <italic>immune</italic> escape<!-- note --></article-title></title-group>
+      <contrib-group>
+        <contrib contrib-type="author"><name><surname>Smith</surname><given-names>Jane</given-names></name></contrib>
+        <contrib contrib-type="author"><name><surname>Doe</surname></name></contrib>
+        <contrib contrib-type="editor"><name><surname>Editor</surname><given-names>Ed</given-names></name></contrib>
+      </contrib-group>
+      <pub-date pub-type="epub"><day>15</day><month>03</month><year>2021</year></pub-date>
+      <abstract><p>T cells <bold>fail</bold> to respond.</p></abstract>
+    </article-meta>
+  </front>
+  <body><sec><p>Full text.</p></sec></body>
+</article>
+</pmc-articleset>
+"""
+
+
+# Probed once per process: every skipUnless below and setUpClass share the result
+@functools.lru_cache(maxsize=1)
 def check_pmc_accessible():
     """Check if PMC API is accessible."""
+    if os.environ.get("PYTEST_DISABLE_NETWORK") == "1":
+        return False
     try:
         response = requests.get("https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi?db=pmc&term=cancer&retmax=1", timeout=5)
         return response.status_code == 200
@@ -23,9 +61,11 @@ class TestPMCSearcher(unittest.TestCase):
             print(
                 "\nWarning: PMC API is not accessible, some tests will be skipped"
             )
+        cls.searcher = PMCSearcher()
 
-    def setUp(self):
-        self.searcher = PMCSearcher()
+    @classmethod
+    def tearDownClass(cls):
+        cls.searcher.session.close()
 
     @unittest.skipUnless(check_pmc_accessible(), "PMC not accessible")
     def test_search_basic(self):
@@ -65,12 +105,305 @@ class TestPMCSearcherUnit(unittest.TestCase):
     """Unit tests for PMCSearcher without network."""
 
     def setUp(self):
-        self.searcher = PMCSearcher()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        self.searcher = PMCSearcher(cache_dir=self.cache_dir.name)
+
+    def test_normalize_pmcid(self):
+        """Test PMCIDs are accepted with or without prefix and junk is rejected."""
+        for raw in ("PMC1234567", "pmc1234567", " 1234567 "):
+            self.assertEqual(PMCSearcher._normalize_pmcid(raw), ("1234567", "PMC1234567"))
+        for bad in ("PMCX", "", "PMC12a", "PM1234"):
+            with self.assertRaises(ValueError):
+                PMCSearcher._normalize_pmcid(bad)
+
+    def test_invalid_pmcid_makes_no_request(self):
+        """Test malformed IDs are reported without hitting the network."""
+        with mock.patch.object(self.searcher.session, "get") as get:
+            self.assertIsNone(self.searcher.get_paper_by_pmcid("PMCX"))
+            self.assertTrue(self.searcher.download_pdf("PMCX", self.cache_dir.name).startswith("Failed"))
+            self.assertEqual(self.searcher.get_papers_by_pmcids(["PMCX"]), [])
+        get.assert_not_called()
+
+    def test_get_paper_metadata_only(self):
+        """Test single lookups request front matter unless full text is asked for."""
+        with mock.patch.object(self.searcher, "_fetch_article_xml", return_value=SAMPLE_PMC_XML) as fetch:
+            paper = self.searcher.get_paper_by_pmcid("PMC1234567")
+            self.searcher.get_paper_by_pmcid("PMC1234567", metadata_only=False)
+
+        self.assertEqual(paper.title, "Tumour immune escape")
+        self.assertEqual(
+            [c.kwargs["metadata_only"] for c in fetch.call_args_list], [True, False]
+        )
+
+    def test_parse_pmc_xml(self):
+        """Test parsing an EFetch article into a Paper."""
+        paper = self.searcher._parse_pmc_xml(SAMPLE_PMC_XML, "1234567")
+
+        self.assertEqual(paper.paper_id, "PMC1234567")
+        self.assertEqual(paper.title, "Tumour immune escape")
+        self.assertEqual(paper.abstract, "T cells fail to respond.")
+        self.assertEqual(paper.authors, ["Jane Smith", "Doe"])
+        self.assertEqual(paper.doi, "10.1038/nm.1234")
+        self.assertEqual(paper.published_date.isoformat(), "2021-03-15T00:00:00")
+        self.assertEqual(paper.extra["journal"], "Nature Medicine")
+        self.assertEqual(paper.categories, ["Nature Medicine"])
+
+    def test_parse_collapses_whitespace(self):
+        """Test title/abstract markup and line breaks flatten to single spaces."""
+        xml = SAMPLE_PMC_XML.replace(
+            b"<abstract><p>T cells <bold>fail</bold> to respond.</p></abstract>",
+            b"<abstract>\n  <p>T cells\n  <bold>fail</bold>  to respond.</p>\n  <p>Second <sup>2</sup>.</p>\n</abstract>"
+        )
+        paper = self.searcher._parse_pmc_xml(xml, "1234567")
+
+        self.assertEqual(paper.title, "Tumour immune escape")
+        self.assertEqual(paper.abstract, "T cells fail to respond. Second 2.")
+
+    def test_parse_ignores_body_and_references(self):
+        """Test metadata is read from <front>, not from cited works in <back>."""
+        xml = SAMPLE_PMC_XML.replace(
+            b"</body>",
+            b"</body><back><ref-list><ref><element-citation>"
+            b"<article-title>Cited work</article-title>"
+            b"<pub-id pub-id-type='doi'>10.1/cited</pub-id>"
+            b"</element-citation></ref></ref-list></back>"
+        ).replace(b"<title-group><article-title>Tumour <italic>immune</italic> escape<!-- note --></article-title></title-group>", b"")
+        paper = self.searcher._parse_pmc_xml(xml, "1234567")
+
+        self.assertEqual(paper.title, "")
+        self.assertEqual(paper.doi, "10.1038/nm.1234")
+
+    def test_parse_author_name_alternatives(self):
+        """Test only the first <name> of a <name-alternatives> author is used."""
+        xml = SAMPLE_PMC_XML.replace(
+            b'<contrib contrib-type="author"><name><surname>Doe</surname></name></contrib>',
+            b'<contrib contrib-type="author"><name-alternatives>'
+            b'<name><surname>Wang</surname><given-names>Li</given-names></name>'
+            b'<name><surname>\xe7\x8e\x8b</surname></name>'
+            b'</name-alternatives></contrib>'
+        )
+        paper = self.searcher._parse_pmc_xml(xml, "1234567")
+
+        self.assertEqual(paper.authors, ["Jane Smith", "Li Wang"])
+
+    def test_parse_invalid_pub_date_parts(self):
+        """Test out-of-range or textual month/day fall back to 1 without failing."""
+        for date_xml, expected in (
+            (b"<day>31</day><month>02</month><year>2021</year>", "2021-02-01"),
+            (b"<month>Mar</month><year>2020</year>", "2020-01-01"),
+            (b"<month>13</month><year> 2019 </year>", "2019-01-01"),
+        ):
+            xml = SAMPLE_PMC_XML.replace(b"<day>15</day><month>03</month><year>2021</year>", date_xml)
+            paper = self.searcher._parse_pmc_xml(xml, "1234567")
+            self.assertEqual(paper.published_date.date().isoformat(), expected)
+
+        xml = SAMPLE_PMC_XML.replace(b"<year>2021</year>", b"<year>n.d.</year>")
+        self.assertEqual(self.searcher._parse_pmc_xml(xml, "1234567").published_date, pmc.datetime.min)
+
+    def test_search_batches_efetch(self):
+        """Test search fetches all PMCIDs in one EFetch call, keeping ESearch order."""
+        second = SAMPLE_PMC_XML.replace(b"PMC1234567", b"PMC7654321").replace(b"Tumour", b"Second")
+        articles = second.split(b"<pmc-articleset>")[1].split(b"</pmc-articleset>")[0]
+        batch_xml = SAMPLE_PMC_XML.replace(b"</pmc-articleset>", articles + b"</pmc-articleset>")
+
+        search_response = mock.Mock(
+            content=json.dumps({"esearchresult": {"idlist": ["7654321", "1234567"]}}).encode(),
+            headers={}, status_code=200
+        )
+        fetch_response = mock.MagicMock(raw=io.BytesIO(batch_xml), headers={}, status_code=200)
+        fetch_response.__enter__.return_value = fetch_response
+
+        with mock.patch.object(self.searcher.session, "get", side_effect=[search_response, fetch_response]) as get:
+            papers = self.searcher.search("tumour", max_results=2)
+
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual(get.call_args.kwargs["params"]["id"], "7654321,1234567")
+        self.assertEqual(get.call_args.kwargs["params"]["rettype"], "abstract")
+        self.assertEqual([p.paper_id for p in papers], ["PMC7654321", "PMC1234567"])
+        self.assertTrue(papers[0].title.startswith("Second"))
+
+    def test_parse_context_reuse_does_not_leak(self):
+        """Test a reused parse context starts each article from empty fields."""
+        ctx = pmc._PMCParseCtx()
+        first_article = pmc._parse_xml(SAMPLE_PMC_XML).find(".//article")
+        bare_article = pmc._parse_xml(b"<article><front><article-meta/></front></article>")
+
+        first = self.searcher._parse_pmc_xml_element(first_article, "1", ctx)
+        second = self.searcher._parse_pmc_xml_element(bare_article, "2", ctx)
+
+        self.assertEqual(first.authors, ["Jane Smith", "Doe"])
+        self.assertEqual((second.title, second.authors, second.doi), ("", [], ""))
+        self.assertEqual(second.published_date, pmc.datetime.min)
+
+    def test_journal_names_are_shared(self):
+        """Test papers from the same journal share one journal string object."""
+        first = self.searcher._parse_pmc_xml(SAMPLE_PMC_XML, "1234567")
+        second = self.searcher._parse_pmc_xml(SAMPLE_PMC_XML, "7654321")
+
+        self.assertIs(first.extra["journal"], second.extra["journal"])
+        self.assertIs(first.categories[0], second.extra["journal"])
+
+    def test_search_served_from_cache(self):
+        """Test a repeated search is answered from the on-disk cache."""
+        search_response = mock.Mock(
+            content=json.dumps({"esearchresult": {"idlist": ["1234567"]}}).encode(),
+            headers={}, status_code=200
+        )
+        fetch_response = mock.MagicMock(raw=io.BytesIO(SAMPLE_PMC_XML), headers={}, status_code=200)
+        fetch_response.__enter__.return_value = fetch_response
+
+        with mock.patch.object(self.searcher.session, "get", side_effect=[search_response, fetch_response]) as get:
+            first = self.searcher.search("tumour", max_results=1)
+            second = self.searcher.search("tumour", max_results=1)
+
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual([p.paper_id for p in first], ["PMC1234567"])
+        self.assertEqual([p.paper_id for p in second], ["PMC1234567"])
+
+    def test_search_without_orjson(self):
+        """Test ESearch decoding falls back to the stdlib json module."""
+        search_response = mock.Mock(
+            content=json.dumps({"esearchresult": {"idlist": []}}).encode(),
+            headers={}, status_code=200
+        )
+        with mock.patch.object(pmc, "_json_loads", json.loads), \
+                mock.patch.object(self.searcher.session, "get", return_value=search_response) as get:
+            self.assertEqual(self.searcher.search("nothing"), [])
+        self.assertEqual(get.call_count, 1)
+
+    def test_get_papers_splits_large_batches(self):
+        """Test long ID lists are split into several EFetch calls, keeping order."""
+        def fake_get(url, params=None, **kwargs):
+            pmcid = params["id"]
+            body = SAMPLE_PMC_XML.replace(b"PMC1234567", b"PMC" + pmcid.encode())
+            response = mock.MagicMock(raw=io.BytesIO(body), headers={}, status_code=200)
+            response.__enter__.return_value = response
+            return response
+
+        self.searcher.MAX_IDS_PER_EFETCH = 1
+        with mock.patch.object(pmc._NCBI_RATE_LIMITER, "wait"), \
+                mock.patch.object(self.searcher.session, "get", side_effect=fake_get) as get:
+            papers = self.searcher.get_papers_by_pmcids(["PMC3", "2", "1"])
+
+        self.assertEqual(get.call_count, 3)
+        self.assertEqual([p.paper_id for p in papers], ["PMC3", "PMC2", "PMC1"])
+
+    def test_download_pdf_streams_to_disk(self):
+        """Test PDFs are written chunk by chunk and reused on the next call."""
+        response = mock.MagicMock()
+        response.__enter__.return_value = response
+        response.iter_content.return_value = [b"%PDF-", b"1.4"]
+
+        with tempfile.TemporaryDirectory() as save_path:
+            with mock.patch.object(self.searcher.session, "get", return_value=response) as get:
+                path = self.searcher.download_pdf("PMC1234567", save_path)
+                again = self.searcher.download_pdf("1234567", save_path)
+
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), b"%PDF-1.4")
+            self.assertEqual(again, path)
+            self.assertEqual(get.call_count, 1)
+            self.assertTrue(get.call_args.kwargs["stream"])
+
+    def test_download_pdf_rejects_non_pdf_body(self):
+        """Test an HTML page served with a 200 is neither kept nor reused."""
+        html = mock.MagicMock()
+        html.__enter__.return_value = html
+        html.iter_content.return_value = [b"<html>Preparing to download...</html>"]
+
+        with tempfile.TemporaryDirectory() as save_path:
+            # A non-PDF left by an older version is fetched again
+            with open(os.path.join(save_path, "PMC1234567.pdf"), "wb") as f:
+                f.write(b"<html>error</html>")
+            with mock.patch.object(self.searcher.session, "get", return_value=html) as get:
+                first = self.searcher.download_pdf("PMC1234567", save_path)
+                second = self.searcher.download_pdf("PMC1234567", save_path)
+
+            self.assertEqual(first, "Failed to download PDF: PMC1234567 returned no PDF")
+            self.assertEqual(second, first)
+            self.assertEqual(get.call_count, 2)
+            self.assertEqual(os.listdir(save_path), ["PMC1234567.pdf"])
+
+    def test_download_pdf_failure_leaves_no_file(self):
+        """Test an interrupted download does not leave a partial PDF behind."""
+        response = mock.MagicMock()
+        response.__enter__.return_value = response
+        response.iter_content.side_effect = requests.ConnectionError("reset")
+
+        with tempfile.TemporaryDirectory() as save_path:
+            with mock.patch.object(self.searcher.session, "get", return_value=response):
+                result = self.searcher.download_pdf("PMC1234567", save_path)
+
+            self.assertTrue(result.startswith("Failed"))
+            self.assertEqual(os.listdir(save_path), [])
+
+    def test_read_paper_prefers_jats_body(self):
+        """Test read_paper uses the XML full text and skips the PDF."""
+        with tempfile.TemporaryDirectory() as save_path:
+            with mock.patch.object(self.searcher, "_fetch_article_xml", return_value=SAMPLE_PMC_XML), \
+                    mock.patch.object(self.searcher, "download_pdf") as download:
+                text = self.searcher.read_paper("PMC1234567", save_path)
+
+        download.assert_not_called()
+        self.assertEqual(text, "Tumour immune escape\nT cells fail to respond.\nFull text.")
+
+    def test_read_paper_extracts_pdf_text(self):
+        """Test read_paper falls back to the PDF when the XML has no <body>."""
+        front_only = SAMPLE_PMC_XML.replace(b"<body><sec><p>Full text.</p></sec></body>", b"")
+        with tempfile.TemporaryDirectory() as save_path:
+            pdf_path = os.path.join(save_path, "PMC1234567.pdf")
+            with open(pdf_path, "wb") as f:
+                f.write(make_pdf(["First page", "Second page"]))
+
+            with mock.patch.object(self.searcher, "_fetch_article_xml", return_value=front_only), \
+                    mock.patch.object(self.searcher, "download_pdf", return_value=pdf_path):
+                text = self.searcher.read_paper("PMC1234567", save_path)
+
+        self.assertIn("First page", text)
+        self.assertIn("Second page", text)
+
+    def test_read_paper_reuses_extracted_text(self):
+        """Test the .txt written on first read short-circuits later reads."""
+        with tempfile.TemporaryDirectory() as save_path:
+            pdf_path = os.path.join(save_path, "PMC1234567.pdf")
+            with open(pdf_path, "wb") as f:
+                f.write(make_pdf(["Cached page"]))
+
+            with mock.patch.object(self.searcher, "_fetch_article_xml", side_effect=requests.HTTPError("404")), \
+                    mock.patch.object(self.searcher, "download_pdf", return_value=pdf_path) as download:
+                first = self.searcher.read_paper("PMC1234567", save_path)
+                with mock.patch.object(pmc, "extract_pdf_text") as extract:
+                    second = self.searcher.read_paper("1234567", save_path)
+
+            self.assertTrue(os.path.exists(os.path.join(save_path, "PMC1234567.txt")))
+            self.assertEqual(first, second)
+            self.assertEqual(download.call_count, 1)
+            extract.assert_not_called()
+
+    def test_asearch_gathers_batches(self):
+        """Test the async search fetches EFetch batches concurrently on one client."""
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request.url.path)
+            if request.url.path.endswith("esearch.fcgi"):
+                return httpx.Response(200, json={"esearchresult": {"idlist": ["1", "2"]}})
+            pmcid = request.url.params["id"]
+            return httpx.Response(200, content=SAMPLE_PMC_XML.replace(b"PMC1234567", b"PMC" + pmcid.encode()))
+
+        self.searcher.MAX_IDS_PER_EFETCH = 1
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with mock.patch.object(self.searcher, "_async_client", return_value=client), \
+                mock.patch.object(pmc._NCBI_RATE_LIMITER, "await_turn", mock.AsyncMock()):
+            papers = asyncio.run(self.searcher.asearch("tumour", max_results=2))
+
+        self.assertEqual([p.paper_id for p in papers], ["PMC1", "PMC2"])
+        self.assertEqual(len(requests_seen), 3)
 
-    def test_session_created(self):
-        """Test that session is created on initialization."""
-        self.assertTrue(hasattr(self.searcher, 'session'))
-        self.assertIsNotNone(self.searcher.session)
+    def test_parse_pmc_xml_invalid(self):
+        """Test non-XML input yields None instead of raising."""
+        self.assertIsNone(self.searcher._parse_pmc_xml(b"not xml", "1"))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,142 @@
+"""Unit tests for PubMed searcher parsing (no network)."""
+import io
+import os
+import tempfile
+import unittest
+import asyncio
+import httpx
+from unittest import mock
+from paper_search_mcp.academic_platforms import pubmed
+from paper_search_mcp.academic_platforms.pubmed import PubMedSearcher, _parse_xml
+
+
+SAMPLE_PUBMED_XML = b"""<?xml version="1.0"?>
+<PubmedArticleSet>
+<PubmedArticle>
+  <MedlineCitation>
+    <PMID Version="1">31415926</PMID>
+    <Article>
+      <ArticleTitle>Deep learning for radiology.</ArticleTitle>
+      <Abstract><AbstractText>We review methods.</AbstractText></Abstract>
+      <AuthorList>
+        <Author><LastName>Smith</LastName><Initials>J</Initials></Author>
+        <Author><LastName>Doe</LastName></Author>
+        <Author><CollectiveName>Consortium</CollectiveName></Author>
+      </AuthorList>
+      <Journal><JournalIssue><PubDate><Year>2019</Year></PubDate></JournalIssue></Journal>
+      <ELocationID EIdType="doi">10.1000/xyz</ELocationID>
+    </Article>
+  </MedlineCitation>
+</PubmedArticle>
+</PubmedArticleSet>
+"""
+
+
+class TestPubMedSearcherUnit(unittest.TestCase):
+    """Unit tests for PubMedSearcher without network."""
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        self.searcher = PubMedSearcher(cache_dir=self.cache_dir.name)
+
+    def test_parse_article(self):
+        """Test parsing a PubmedArticle element into a Paper."""
+        article = _parse_xml(SAMPLE_PUBMED_XML).find('.//PubmedArticle')
+        paper = self.searcher._parse_article(article)
+
+        self.assertEqual(paper.paper_id, "31415926")
+        self.assertEqual(paper.title, "Deep learning for radiology.")
+        self.assertEqual(paper.authors, ["Smith J", "Doe"])
+        self.assertEqual(paper.abstract, "We review methods.")
+        self.assertEqual(paper.published_date.year, 2019)
+        self.assertEqual(paper.doi, "10.1000/xyz")
+
+    def test_iter_elements_streams_articles(self):
+        """Test incremental parsing yields each article exactly once."""
+        xml = SAMPLE_PUBMED_XML.replace(b"</PubmedArticleSet>", b"") + (
+            b"<PubmedArticle><MedlineCitation><PMID>2</PMID></MedlineCitation></PubmedArticle>"
+            b"</PubmedArticleSet>"
+        )
+        pmids = [a.findtext('.//PMID') for a in pubmed._iter_elements(io.BytesIO(xml), 'PubmedArticle')]
+        self.assertEqual(pmids, ["31415926", "2"])
+
+    def test_search_parses_streamed_fetch(self):
+        """Test search feeds the EFetch body through the streaming parser."""
+        search_response = mock.Mock(
+            content=b"<eSearchResult><IdList><Id>31415926</Id></IdList></eSearchResult>",
+            headers={}, status_code=200
+        )
+        fetch_response = mock.MagicMock(raw=io.BytesIO(SAMPLE_PUBMED_XML), headers={}, status_code=200)
+        fetch_response.__enter__.return_value = fetch_response
+
+        with mock.patch.object(self.searcher.session, "get", side_effect=[search_response, fetch_response]) as get:
+            papers = self.searcher.search("radiology", max_results=1)
+
+        self.assertTrue(get.call_args.kwargs["stream"])
+        self.assertEqual([p.paper_id for p in papers], ["31415926"])
+
+    def test_asearch(self):
+        """Test the async search parses ESearch and EFetch responses."""
+        def handler(request):
+            if request.url.path.endswith("esearch.fcgi"):
+                return httpx.Response(200, content=b"<eSearchResult><IdList><Id>31415926</Id></IdList></eSearchResult>")
+            self.assertEqual(request.url.params["id"], "31415926")
+            return httpx.Response(200, content=SAMPLE_PUBMED_XML)
+
+        real_client = httpx.AsyncClient
+        transport = httpx.MockTransport(handler)
+        with mock.patch.object(pubmed.httpx, "AsyncClient", lambda **kwargs: real_client(transport=transport)):
+            papers = asyncio.run(self.searcher.asearch("radiology", max_results=1))
+
+        self.assertEqual([p.paper_id for p in papers], ["31415926"])
+
+    def test_session_reuses_pooled_adapter(self):
+        """Test searchers share one keep-alive adapter with retry on 429."""
+        other = PubMedSearcher(cache_dir=self.cache_dir.name)
+        adapter = self.searcher.session.get_adapter(PubMedSearcher.SEARCH_URL)
+
+        self.assertIs(adapter, other.session.get_adapter(PubMedSearcher.FETCH_URL))
+        self.assertIn(429, adapter.max_retries.status_forcelist)
+
+    def test_entities_are_not_expanded(self):
+        """Test external and nested entities are neither fetched nor expanded."""
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as secret:
+            secret.write("SECRET")
+        self.addCleanup(os.remove, secret.name)
+        xml = (
+            '<?xml version="1.0"?>'
+            '<!DOCTYPE PubmedArticleSet ['
+            f'<!ENTITY xxe SYSTEM "file://{secret.name}">'
+            '<!ENTITY lol "lol">'
+            '<!ENTITY lol2 "&lol;&lol;&lol;&lol;&lol;&lol;&lol;&lol;">'
+            ']>'
+            '<PubmedArticleSet><PubmedArticle><MedlineCitation><PMID>1</PMID>'
+            '<Article><ArticleTitle>A &xxe; B &lol2;</ArticleTitle></Article>'
+            '</MedlineCitation></PubmedArticle></PubmedArticleSet>'
+        ).encode()
+
+        titles = ["".join(_parse_xml(xml).find('.//ArticleTitle').itertext())]
+        titles += [
+            "".join(a.find('.//ArticleTitle').itertext())
+            for a in pubmed._iter_elements(io.BytesIO(xml), 'PubmedArticle')
+        ]
+        for title in titles:
+            self.assertNotIn("SECRET", title)
+            self.assertNotIn("lollol", title)
+
+    def test_session_negotiates_compression(self):
+        """Test the session advertises every encoding urllib3 can decode."""
+        accept = self.searcher.session.headers["Accept-Encoding"]
+        self.assertIn("gzip", accept)
+        self.assertEqual(accept, pubmed.ACCEPT_ENCODING)
+
+    def test_parse_xml_rejects_non_xml(self):
+        """Test non-XML input raises a ParseError rather than returning None."""
+        from paper_search_mcp.academic_platforms.pubmed import ET
+        with self.assertRaises(ET.ParseError):
+            _parse_xml(b"not xml")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 # tests/test_sci_hub.py
+import functools
 import unittest
 import tempfile
 import shutil
@@ -7,8 +8,12 @@ import requests
 from paper_search_mcp.academic_platforms.sci_hub import SciHubFetcher
 
 
+# Probed once per process: every skipUnless below and setUpClass share the result
+@functools.lru_cache(maxsize=1)
 def check_sci_hub_accessible():
     """Check if Sci-Hub is accessible"""
+    if os.environ.get("PYTEST_DISABLE_NETWORK") == "1":
+        return False
     try:
         # Test with a simple request to see if sci-hub responds
         response = requests.get("https://sci-hub.se", timeout=10)
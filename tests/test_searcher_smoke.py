@@ -0,0 +1,47 @@
+"""Construction smoke tests shared by the HTTP searchers (no network)."""
+import unittest
+
+from paper_search_mcp.academic_platforms.dblp import DBLPSearcher
+from paper_search_mcp.academic_platforms.hal import HALSearcher
+from paper_search_mcp.academic_platforms.openalex import OpenAlexSearcher
+from paper_search_mcp.academic_platforms.pmc import PMCSearcher
+from paper_search_mcp.academic_platforms.ssrn import SSRNSearcher
+
+# Searcher class and the host its BASE_URL must point at
+_SEARCHERS = (
+    (DBLPSearcher, "dblp.org"),
+    (HALSearcher, "archives-ouvertes.fr"),
+    (OpenAlexSearcher, "openalex.org"),
+    (PMCSearcher, "ncbi.nlm.nih.gov"),
+    (SSRNSearcher, "ssrn.com"),
+)
+
+
+class TestSearcherSmoke(unittest.TestCase):
+    """Tests every searcher builds a session and points at its API."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.searchers = [(cls_(), host) for cls_, host in _SEARCHERS]
+
+    @classmethod
+    def tearDownClass(cls):
+        for searcher, _ in cls.searchers:
+            searcher.session.close()
+
+    def test_session_created(self):
+        """Test that session is created on initialization."""
+        for searcher, _ in self.searchers:
+            with self.subTest(searcher=type(searcher).__name__):
+                self.assertIsNotNone(getattr(searcher, "session", None))
+
+    def test_base_url(self):
+        """Test that base URLs are set correctly."""
+        for searcher, host in self.searchers:
+            with self.subTest(searcher=type(searcher).__name__):
+                self.assertIn(host, searcher.BASE_URL)
+                self.assertIn(host, getattr(searcher, "SEARCH_URL", searcher.BASE_URL))
+
+
+if __name__ == "__main__":
+    unittest.main()
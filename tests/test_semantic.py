@@ -1,11 +1,17 @@
+import functools
 import unittest
+from unittest import mock
 import os
 import requests
 from paper_search_mcp.academic_platforms.semantic import SemanticSearcher
 
 
+# Probed once per process: every skipUnless below and setUpClass share the result
+@functools.lru_cache(maxsize=1)
 def check_semantic_accessible():
     """Check if Semantic Scholar is accessible"""
+    if os.environ.get("PYTEST_DISABLE_NETWORK") == "1":
+        return False
     try:
         response = requests.get("https://api.semanticscholar.org/graph/v1/paper/5bbfdf2e62f0508c65ba6de9c72fe2066fd98138", timeout=5)
         return response.status_code == 200
@@ -271,5 +277,65 @@ class TestSemanticSearcher(unittest.TestCase):
 
 
 
+class TestSemanticSearcherUnit(unittest.TestCase):
+    """Unit tests that don't require network access."""
+
+    def setUp(self):
+        self.searcher = SemanticSearcher()
+
+    def test_get_papers_batch_posts_chunks(self):
+        """Test IDs are POSTed to paper/batch in chunks and unknown IDs are skipped."""
+        def fake_post(url, params=None, json=None, headers=None):
+            response = mock.Mock(status_code=200)
+            response.json.return_value = [
+                None if i.endswith("missing") else {"paperId": i, "title": i, "authors": []}
+                for i in json["ids"]
+            ]
+            return response
+
+        ids = [f"P{i}" for i in range(3)] + ["P-missing"]
+        with mock.patch.object(SemanticSearcher, "MAX_BATCH_IDS", 2), \
+                mock.patch.object(self.searcher.session, "post", side_effect=fake_post) as post:
+            papers = self.searcher.get_papers_batch(ids)
+
+        self.assertEqual(post.call_count, 2)
+        self.assertTrue(post.call_args.args[0].endswith("/paper/batch"))
+        self.assertEqual([p.paper_id for p in papers], ["P0", "P1", "P2"])
+
+    def test_get_papers_batch_aligned_keeps_positions(self):
+        """Test aligned results have one entry per requested ID, None where missing."""
+        response = mock.Mock(status_code=200)
+        response.json.return_value = [{"paperId": "P0", "title": "P0", "authors": []}, None]
+        with mock.patch.object(self.searcher.session, "post", return_value=response) as post:
+            papers = self.searcher.get_papers_batch_aligned(["DOI:10.1/a", "", "DOI:10.1/missing"])
+
+        self.assertEqual(post.call_args.kwargs["json"], {"ids": ["DOI:10.1/a", "DOI:10.1/missing"]})
+        self.assertEqual([p.paper_id if p else None for p in papers], ["P0", None, None])
+
+    def test_retry_after_is_honoured(self):
+        """Test a 429 waits for its Retry-After before retrying."""
+        limited = mock.Mock(status_code=429, headers={"Retry-After": "5"})
+        ok = mock.Mock(status_code=200, headers={})
+        with mock.patch.object(self.searcher.session, "get", side_effect=[limited, ok]), \
+                mock.patch("paper_search_mcp.academic_platforms.semantic.time.sleep") as sleep:
+            response = self.searcher.request_api("paper/X", {})
+
+        self.assertIs(response, ok)
+        sleep.assert_called_once_with(5.0)
+
+    def test_long_retry_after_pauses_requests(self):
+        """Test a Retry-After beyond MAX_RETRY_WAIT fails fast and blocks later calls."""
+        limited = mock.Mock(status_code=429, headers={"Retry-After": "120"})
+        with mock.patch.object(self.searcher.session, "get", return_value=limited) as get, \
+                mock.patch("paper_search_mcp.academic_platforms.semantic.time.sleep") as sleep:
+            first = self.searcher.request_api("paper/X", {})
+            second = self.searcher.request_api("paper/Y", {})
+
+        self.assertEqual(first["error"], "rate_limited")
+        self.assertEqual(second["error"], "rate_limited")
+        self.assertEqual(get.call_count, 1)
+        sleep.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,37 @@
 # tests/test_server.py
 import unittest
 import asyncio
+import atexit
+import io
+import logging
+import logging.handlers
 import os
+import subprocess
+import sys
+import tempfile
+import threading
+from unittest import mock
+import pydantic_core
 from paper_search_mcp import server
+from paper_search_mcp.disk_cache import DiskCache
+from tests.factories import make_paper
+
+_cache_dir = None
+_real_store = None
+
+
+def setUpModule():
+    # Keep persisted lookups out of the user's cache and out of later runs
+    global _cache_dir, _real_store
+    _cache_dir = tempfile.TemporaryDirectory()
+    _real_store = server._DOI_CACHE.store
+    server._DOI_CACHE.store = DiskCache(os.path.join(_cache_dir.name, "tool-results.sqlite3"))
+
+
+def tearDownModule():
+    server._DOI_CACHE.store.close()
+    server._DOI_CACHE.store = _real_store
+    _cache_dir.cleanup()
 
 class TestPaperSearchServer(unittest.TestCase):
     def test_search_arxiv(self):
@@ -32,5 +61,232 @@ class TestPaperSearchServer(unittest.TestCase):
             self.assertTrue(result.endswith(".pdf"), f"Result for {paper_id} should be a PDF file path")
             self.assertTrue(os.path.exists(result), f"PDF file for {paper_id} should exist on disk")
 
+
+class TestServerUnit(unittest.TestCase):
+    """Unit tests for tool wiring without network."""
+
+    def test_async_tools_share_one_client(self):
+        """Test async tools pass the loop's shared client to the searchers."""
+        async def run():
+            with mock.patch.object(server.pubmed_searcher, "asearch", mock.AsyncMock(return_value=[])) as pubmed, \
+                    mock.patch.object(server.pmc_searcher, "asearch", mock.AsyncMock(return_value=[])) as pmc:
+                await server.search_pubmed("q")
+                await server.search_pmc("q")
+                shared = server.get_async_client()
+            await server.aclose_async_client()
+            return pubmed.call_args.kwargs["client"], pmc.call_args.kwargs["client"], shared
+
+        pubmed_client, pmc_client, shared = asyncio.run(run())
+        self.assertIs(pubmed_client, shared)
+        self.assertIs(pmc_client, shared)
+
+
+    def test_sync_searchers_run_off_the_event_loop(self):
+        """Test blocking searcher calls run in worker threads, not the loop thread."""
+        threads = []
+
+        def fake_search(query, max_results=10):
+            threads.append(threading.current_thread())
+            return []
+
+        def fake_read(paper_id, save_path):
+            threads.append(threading.current_thread())
+            return "text"
+
+        with mock.patch.object(server.arxiv_searcher, "search", side_effect=fake_search), \
+                mock.patch.object(server.arxiv_searcher, "read_paper", side_effect=fake_read):
+            self.assertEqual(asyncio.run(server.search_arxiv("q")), [])
+            self.assertEqual(asyncio.run(server.read_arxiv_paper("1", "dir")), "text")
+
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(threading.current_thread(), threads)
+        self.assertTrue(all(t.name.startswith("searcher-io") for t in threads))
+
+    def test_search_results_share_repeated_strings(self):
+        """Test equal categories/dates across results are one str object."""
+        def paper(i):
+            return make_paper(paper_id=str(i), title="t", authors=["A"], source="arxiv",
+                               categories=["cs.LG", "stat.ML"])
+
+        searcher = mock.Mock()
+        searcher.search.return_value = [paper(1), paper(2)]
+        first, second = server.sync_search(searcher, "q", 2)
+
+        self.assertEqual(first["categories"], "cs.LG; stat.ML")
+        self.assertIs(first["categories"], second["categories"])
+        self.assertIs(first["published_date"], second["published_date"])
+
+    def test_read_errors_are_logged_not_printed(self):
+        """Test read_* failures go to the logger, keeping stdout free for the transport."""
+        with mock.patch.object(server._get("arxiv"), "read_paper", side_effect=RuntimeError("boom")), \
+                mock.patch("sys.stdout", new_callable=io.StringIO) as stdout, \
+                self.assertLogs(server.logger, level="ERROR") as logs:
+            self.assertEqual(asyncio.run(server.read_arxiv_paper("1")), "")
+
+        self.assertEqual(stdout.getvalue(), "")
+        self.assertIn("Error reading paper 1: boom", logs.output[0])
+
+    def test_log_records_are_written_by_listener_thread(self):
+        """Test root handlers are moved behind a queue drained by a background thread."""
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+        writers = []
+
+        class RecordingHandler(logging.Handler):
+            def emit(self, record):
+                writers.append((threading.get_ident(), record.getMessage()))
+
+        root.handlers = [RecordingHandler()]
+        root.setLevel(logging.INFO)
+        try:
+            listener = server._queue_log_handlers()
+            self.assertIsInstance(root.handlers[0], logging.handlers.QueueHandler)
+            logging.getLogger("paper_search_mcp.test").info("queued")
+            listener.stop()
+            atexit.unregister(listener.stop)
+        finally:
+            root.handlers, root.level = saved_handlers, saved_level
+
+        self.assertEqual([m for _, m in writers], ["queued"])
+        self.assertNotEqual(writers[0][0], threading.get_ident())
+
+    def test_platform_modules_load_on_first_use(self):
+        """Test importing the server loads no platform module until a searcher is used."""
+        code = (
+            "import sys\n"
+            "from paper_search_mcp import server\n"
+            "loaded = lambda: sorted(m for m in sys.modules if '.academic_platforms.' in m)\n"
+            "print(loaded())\n"
+            "server._get('dblp')\n"
+            "print(loaded())\n"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.splitlines(), ["[]", "['paper_search_mcp.academic_platforms.dblp']"])
+
+    def test_legacy_searcher_attributes(self):
+        """Test server.<name>_searcher resolves to the shared lazily created searcher."""
+        self.assertIs(server.crossref_searcher, server._get("crossref"))
+        self.assertIs(server.scihub_fetcher, server._get("sci_hub"))
+        with self.assertRaises(AttributeError):
+            server.nonexistent_searcher
+
+    def test_preload_searchers(self):
+        """Test PAPER_SEARCH_MCP_PRELOAD names are constructed up front."""
+        with mock.patch.object(server, "_get") as get:
+            server.preload_searchers("arxiv, dblp")
+            self.assertEqual([c.args[0] for c in get.call_args_list], ["arxiv", "dblp"])
+            get.reset_mock()
+            with mock.patch.dict(os.environ, {"PAPER_SEARCH_MCP_PRELOAD": "all"}):
+                server.preload_searchers()
+            self.assertEqual(get.call_count, len(server._SEARCHERS))
+
+    def test_concurrent_doi_lookups_share_one_batch(self):
+        """Test simultaneous single-DOI tool calls are answered by one batch request."""
+        dois = ["10.1000/batch-a", "https://doi.org/10.1000/BATCH-B", "10.1000/batch-missing"]
+        found = [make_paper(paper_id=d, title=d, doi=d, source="crossref")
+                 for d in ("10.1000/batch-a", "10.1000/batch-b")]
+
+        async def run():
+            return await asyncio.gather(*(server.get_crossref_paper_by_doi(d) for d in dois))
+
+        with mock.patch.object(server.crossref_searcher, "get_papers_by_dois", return_value=found) as batch:
+            results = asyncio.run(run())
+
+        batch.assert_called_once()
+        self.assertEqual(sorted(batch.call_args.args[0]), ["10.1000/batch-a", "10.1000/batch-b", "10.1000/batch-missing"])
+        self.assertEqual([r.get("doi") for r in results], ["10.1000/batch-a", "10.1000/batch-b", None])
+
+    def test_concurrent_semantic_lookups_share_one_batch(self):
+        """Test simultaneous get_semantic_paper calls resolve by position from one batch."""
+        ids = ["DOI:10.1000/sem-a", "ARXIV:2106.00001", "DOI:10.1000/sem-missing"]
+        found = [make_paper(paper_id=f"S{i}", title=f"S{i}", source="semantic") for i in range(2)]
+
+        async def run():
+            return await asyncio.gather(*(server.get_semantic_paper(i) for i in ids))
+
+        with mock.patch.object(server.semantic_searcher, "get_papers_batch_aligned",
+                               return_value=found + [None]) as batch:
+            results = asyncio.run(run())
+
+        batch.assert_called_once_with(ids)
+        self.assertEqual([r.get("paper_id") for r in results], ["S0", "S1", None])
+
+    def test_malformed_ids_are_rejected_without_upstream_calls(self):
+        """Test lookups with unrecognizable IDs return empty results without a request."""
+        async def run():
+            return (await server.get_openalex_paper("not an id"),
+                    await server.get_crossref_paper_by_doi("nature12373"),
+                    await server.get_semantic_citations("free text"),
+                    await server.download_semantic("free text"),
+                    await server.read_semantic_paper("free text"))
+
+        with mock.patch.object(server.openalex_searcher, "get_paper_by_id") as by_id, \
+                mock.patch.object(server._crossref_doi_batcher, "submit") as by_doi, \
+                mock.patch.object(server.semantic_searcher, "request_api") as semantic:
+            paper, crossref, citations, download, text = asyncio.run(run())
+
+        self.assertEqual((paper, crossref, citations, text), ({}, {}, [], ""))
+        self.assertTrue(download.startswith("Error"))
+        by_id.assert_not_called()
+        by_doi.assert_not_called()
+        semantic.assert_not_called()
+
+    def test_main_runs_stdio_on_uvloop_when_available(self):
+        """Test main() serves stdio and asks anyio for uvloop only if it is installed."""
+        for available in (True, False):
+            with self.subTest(uvloop=available), \
+                    mock.patch.object(server, "_UVLOOP_AVAILABLE", available), \
+                    mock.patch.object(server, "_queue_log_handlers"), \
+                    mock.patch.object(server, "preload_searchers"), \
+                    mock.patch.object(server.anyio, "run") as run:
+                server.main()
+            run.assert_called_once_with(server.mcp.run_stdio_async, backend_options={"use_uvloop": available})
+
+    def test_search_hits_prefetch_paper_lookups(self):
+        """Test get_* lookups for an OpenAlex search hit are served from cache."""
+        # OpenAlex returns DOIs as URLs; callers usually pass the bare form
+        hit = server.openalex_searcher._parse_work({
+            "id": "https://openalex.org/W42",
+            "title": "Hit",
+            "doi": "https://doi.org/10.1000/Prefetch",
+            "publication_date": "2021-03-04",
+            "authorships": [{"author": {"display_name": "Ada Lovelace"}}],
+            "type": "article",
+        })
+
+        async def run():
+            await server.search_openalex("prefetch query")
+            return (await server.get_openalex_paper("W42"),
+                    await server.get_openalex_paper_by_doi("10.1000/prefetch"),
+                    await server.get_openalex_paper_by_doi("doi:10.1000/PREFETCH"))
+
+        with mock.patch.object(server.openalex_searcher, "search", return_value=[hit]), \
+                mock.patch.object(server._openalex_id_batcher, "submit") as by_id, \
+                mock.patch.object(server._openalex_doi_batcher, "submit") as by_doi:
+            by_id_result, by_doi_result, prefixed_result = asyncio.run(run())
+
+        by_id.assert_not_called()
+        by_doi.assert_not_called()
+        self.assertEqual(by_id_result["title"], "Hit")
+        self.assertIs(by_doi_result, by_id_result)
+        self.assertIs(prefixed_result, by_id_result)
+
+    def test_hot_tools_return_pre_encoded_results(self):
+        """Test pre-encoded tools send the same content FastMCP would build, once."""
+        hit = make_paper(paper_id="W7", title="Caf\u00e9", authors=["A"], source="openalex")
+
+        async def run():
+            return (await server.mcp.call_tool("get_openalex_citations", {"paper_id": "W1"}),
+                    await server.get_openalex_citations("W1"))
+
+        with mock.patch.object(server.openalex_searcher, "get_citations", return_value=[hit]):
+            result, rows = asyncio.run(run())
+
+        self.assertEqual(rows, [hit.to_dict()])
+        self.assertEqual(result.structuredContent, {"result": rows})
+        self.assertEqual([c.text for c in result.content],
+                         [pydantic_core.to_json(rows[0], indent=2).decode()])
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
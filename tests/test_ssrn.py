@@ -1,11 +1,56 @@
 """Tests for SSRN searcher."""
+import functools
+import asyncio
+import os
+import tempfile
 import unittest
+from unittest import mock
+import httpx
 import requests
+from paper_search_mcp.academic_platforms import ssrn
 from paper_search_mcp.academic_platforms.ssrn import SSRNSearcher
+from paper_search_mcp.tool_cache import TTLCache
 
 
+SAMPLE_SEARCH_HTML = b"""<html><head><title>SSRN</title></head><body>
+<nav><a href="/">Home</a></nav>
+<div class="paper-card">
+  <a class="title" href="https://papers.ssrn.com/abstract=1234567">Corporate Governance and Firm Value</a>
+  <span class="authors">Jane Smith, John Doe</span>
+  <div class="abstract">We study boards.</div>
+  <span class="date">March 15, 2021</span>
+  <a class="topic" href="#">Finance</a><a class="topic" href="#">Law</a>
+  <a class="download" href="/Delivery.cfm?abstractid=1234567&amp;download=yes">PDF</a>
+</div>
+<div class="paper-card">
+  <a class="title" href="/abstract/7654321.html">Second Paper</a>
+  <span class="date">June 2019</span>
+</div>
+<footer>Footer</footer>
+</body></html>"""
+
+SAMPLE_TABLE_HTML = b"""<html><body><table>
+<tr class="data"><td><a href="/abstract=1111111">Table Paper</a></td><td>A. Author, B. Author</td><td>01/02/2020</td></tr>
+</table></body></html>"""
+
+SAMPLE_PAPER_HTML = b"""<html><head><meta property="og:title" content="Meta Title"/>
+<meta name="citation_doi" content="10.2139/ssrn.1234567"/></head><body>
+<h1 class="title">Corporate Governance and Firm Value</h1>
+<div class="authors"><a href="#">Jane Smith</a><a href="#">John Doe</a></div>
+<div class="abstract">We study boards.</div>
+<div class="date">March 15, 2021</div>
+<div class="keywords">governance, boards</div>
+<a class="topic" href="#">Finance</a>
+<a class="download" href="/Delivery.cfm?abstractid=1234567">Download</a>
+</body></html>"""
+
+
+# Probed once per process: every skipUnless below and setUpClass share the result
+@functools.lru_cache(maxsize=1)
 def check_ssrn_accessible():
     """Check if SSRN API is accessible."""
+    if os.environ.get("PYTEST_DISABLE_NETWORK") == "1":
+        return False
     try:
         response = requests.get("https://papers.ssrn.com/sol13/search.cgi?", timeout=5, params={"q": "test", "ma": "1"})
         return response.status_code == 200
@@ -23,9 +68,11 @@ class TestSSRNSearcher(unittest.TestCase):
             print(
                 "\nWarning: SSRN is not accessible, some tests will be skipped"
             )
+        cls.searcher = SSRNSearcher()
 
-    def setUp(self):
-        self.searcher = SSRNSearcher()
+    @classmethod
+    def tearDownClass(cls):
+        cls.searcher.session.close()
 
     @unittest.skipUnless(check_ssrn_accessible(), "SSRN not accessible")
     def test_search_basic(self):
@@ -60,10 +107,320 @@ class TestSSRNSearcherUnit(unittest.TestCase):
     def setUp(self):
         self.searcher = SSRNSearcher()
 
-    def test_session_created(self):
-        """Test that session is created on initialization."""
-        self.assertTrue(hasattr(self.searcher, 'session'))
-        self.assertIsNotNone(self.searcher.session)
+    def test_session_is_pooled_httpx_client(self):
+        """Test the session is one pooled httpx client that follows redirects."""
+        self.assertIsInstance(self.searcher.session, httpx.Client)
+        self.assertTrue(self.searcher.session.follow_redirects)
+        self.assertEqual(self.searcher.session.headers["Accept-Language"], "en-US,en;q=0.9")
+
+    def test_get_searcher_is_shared(self):
+        """Test the module-level accessor returns one shared searcher."""
+        self.assertIs(ssrn.get_searcher(), ssrn.get_searcher())
+        self.assertEqual(self.searcher.session.headers["User-Agent"], SSRNSearcher._HEADERS["User-Agent"])
+
+    def test_sync_client_fetches_detail_page(self):
+        """Test a detail page round-trips through the sync httpx client."""
+        def handler(request):
+            self.assertEqual(request.url.path, "/abstract/1234567.html")
+            return httpx.Response(200, content=SAMPLE_PAPER_HTML)
+
+        self.searcher.session = httpx.Client(transport=httpx.MockTransport(handler))
+        with mock.patch.object(self.searcher, "_rate_limit"):
+            paper = self.searcher.get_paper_by_id("1234567")
+
+        self.assertEqual(paper.title, "Corporate Governance and Firm Value")
+
+    def test_parse_html_builds_lxml_tree(self):
+        """Test detail pages are parsed into an lxml document tree."""
+        tree = ssrn._parse_html(SAMPLE_PAPER_HTML)
+        self.assertEqual(tree.tag, "html")
+        self.assertEqual(ssrn._XP_OG_TITLE(tree), "Meta Title")
+
+    def test_charset_from_content_type(self):
+        """Test the header charset is normalized and unknown charsets are ignored."""
+        self.assertEqual(ssrn._charset("text/html; charset=ISO-8859-1"), "iso8859-1")
+        self.assertEqual(ssrn._charset('text/html; charset="utf-8"'), "utf-8")
+        self.assertIsNone(ssrn._charset("text/html"))
+        self.assertIsNone(ssrn._charset("text/html; charset=bogus"))
+
+    def test_parse_paper_page_uses_header_charset(self):
+        """Test the detail page decodes with the HTTP charset when given."""
+        html = '<h1 class="title">Caf\u00e9 Economics</h1>'.encode("latin-1")
+        paper = self.searcher._parse_paper_page(html, "1", "iso8859-1")
+        self.assertEqual(paper.title, "Caf\u00e9 Economics")
+
+    def test_iter_result_nodes_strains_listing(self):
+        """Test only whole-token result cards and rows are streamed out."""
+        html = (
+            b'<nav><div class="menu">Menu</div></nav>'
+            b'<div class="x paper-card y"><div class="abstract">A</div></div>'
+            b'<div class="paper-cards"></div>'
+            b'<table><tr class="data"><td>R</td></tr><tr><td>S</td></tr></table>'
+        )
+        nodes = [(n.tag, ssrn._text(n)) for n in ssrn._iter_result_nodes(html)]
+        self.assertEqual(nodes, [("div", "A"), ("tr", "R")])
+
+    def test_search_builds_papers_only_for_kept_entries(self):
+        """Test filtered-out listing entries never become Paper objects."""
+        response = mock.Mock(status_code=200, headers={}, content=SAMPLE_SEARCH_HTML)
+        with mock.patch.object(self.searcher.session, "get", return_value=response), \
+                mock.patch.object(self.searcher, "_rate_limit"), \
+                mock.patch.object(self.searcher, "_entry_to_paper", wraps=self.searcher._entry_to_paper) as build:
+            papers = self.searcher.search("governance", max_results=5, topic="finance")
+
+        self.assertEqual([p.paper_id for p in papers], ["1234567"])
+        self.assertEqual(build.call_count, 1)
+
+    def test_filter_results_year_range_and_topic(self):
+        """Test year bounds are inclusive and topic matching ignores case."""
+        entries = self.searcher._parse_search_entries(SAMPLE_SEARCH_HTML)
+
+        kept = self.searcher._filter_results(entries, "2019-2020", None)
+        self.assertEqual([e.paper_id for e in kept], ["7654321"])
+        kept = self.searcher._filter_results(entries, "2021", "LAW")
+        self.assertEqual([e.paper_id for e in kept], ["1234567"])
+        with self.assertRaises(ValueError):
+            self.searcher._filter_results(entries, "recent", None)
+
+    def test_get_author_by_id(self):
+        """Test the author name is read from the author page."""
+        response = mock.Mock(status_code=200, headers={}, content=b'<div class="author-name"> Jane  Smith </div>')
+        with mock.patch.object(self.searcher.session, "get", return_value=response), \
+                mock.patch.object(self.searcher, "_rate_limit"):
+            info = self.searcher.get_author_by_id("42")
+
+        self.assertEqual(info, {"author_id": "42", "name": "Jane Smith"})
+
+    def test_parse_search_results_cards(self):
+        """Test paper cards are parsed into Paper objects."""
+        papers = self.searcher._parse_search_results(SAMPLE_SEARCH_HTML, "q")
+
+        self.assertEqual([p.paper_id for p in papers], ["1234567", "7654321"])
+        first = papers[0]
+        self.assertEqual(first.title, "Corporate Governance and Firm Value")
+        self.assertEqual(first.authors, ["Jane Smith", "John Doe"])
+        self.assertEqual(first.abstract, "We study boards.")
+        self.assertEqual(first.published_date.isoformat(), "2021-03-15T00:00:00")
+        self.assertEqual(first.categories, ["Finance", "Law"])
+        self.assertIn("download=yes", first.pdf_url)
+        self.assertEqual(papers[1].published_date.isoformat(), "2019-06-01T00:00:00")
+
+    def test_parse_search_results_rows(self):
+        """Test the table layout is used when there are no paper cards."""
+        papers = self.searcher._parse_search_results(SAMPLE_TABLE_HTML, "q")
+
+        self.assertEqual(len(papers), 1)
+        self.assertEqual(papers[0].paper_id, "1111111")
+        self.assertEqual(papers[0].authors, ["A. Author", "B. Author"])
+        self.assertEqual(papers[0].published_date.isoformat(), "2020-01-02T00:00:00")
+
+    def test_parse_paper_row_skips_non_paper_links(self):
+        """Test the row title is the first link pointing at an abstract."""
+        html = (
+            b'<table><tr class="data"><td><a href="/help">?</a>'
+            b'<a href="/abstract=2222222">Row Paper</a></td></tr></table>'
+        )
+        papers = self.searcher._parse_search_results(html, "q")
+        self.assertEqual([(p.paper_id, p.title) for p in papers], [("2222222", "Row Paper")])
+
+    def test_parse_search_results_prefers_cards_in_one_pass(self):
+        """Test rows seen before the first card are dropped and later rows skipped."""
+        html = (
+            b'<table><tr class="data"><td><a href="/abstract=1">Row 1</a></td></tr></table>'
+            b'<div class="paper-card"><a class="title" href="/abstract=2">Card</a></div>'
+            b'<table><tr class="data"><td><a href="/abstract=3">Row 3</a></td></tr></table>'
+        )
+        with mock.patch.object(self.searcher, "_parse_paper_row", wraps=self.searcher._parse_paper_row) as rows:
+            papers = self.searcher._parse_search_results(html, "q")
+
+        self.assertEqual([p.paper_id for p in papers], ["2"])
+        self.assertEqual(rows.call_count, 1)
+
+    def test_comma_lists_drop_empty_items(self):
+        """Test author and keyword lists are split and stripped in one pass."""
+        html = (
+            b'<h1 class="title">T</h1><div class="keywords">governance ,boards,, </div>'
+        )
+        paper = self.searcher._parse_paper_page(html, "1")
+        self.assertEqual(paper.keywords, ["governance", "boards"])
+
+    def test_leaf_text(self):
+        """Test leaf text reads .text directly and falls back for nested markup."""
+        tree = ssrn._parse_html(b'<p id="a"> Jane \n Smith </p><p id="b">A <i>nested</i> title</p>')
+        self.assertEqual(ssrn._leaf_text(tree.find(".//p[@id='a']")), "Jane Smith")
+        self.assertEqual(ssrn._leaf_text(tree.find(".//p[@id='b']")), "A nested title")
+        self.assertEqual(ssrn._leaf_text(None), "")
+
+    def test_parse_paper_page(self):
+        """Test a paper detail page is parsed into a Paper."""
+        paper = self.searcher._parse_paper_page(SAMPLE_PAPER_HTML, "1234567")
+
+        self.assertEqual(paper.title, "Corporate Governance and Firm Value")
+        self.assertEqual(paper.authors, ["Jane Smith", "John Doe"])
+        self.assertEqual(paper.keywords, ["governance", "boards"])
+        self.assertEqual(paper.categories, ["Finance"])
+        self.assertEqual(paper.url, "https://papers.ssrn.com/abstract/1234567.html")
+        self.assertEqual(paper.doi, "10.2139/ssrn.1234567")
+
+    def test_search_parses_response(self):
+        """Test search parses the response and applies filters."""
+        response = mock.Mock(status_code=200, headers={}, content=SAMPLE_SEARCH_HTML)
+        with mock.patch.object(self.searcher.session, "get", return_value=response), \
+                mock.patch.object(self.searcher, "_rate_limit"):
+            papers = self.searcher.search("governance", max_results=5, year="2021")
+
+        self.assertEqual([p.paper_id for p in papers], ["1234567"])
+
+    def _mock_async_client(self, handler):
+        """Patch httpx.AsyncClient in the ssrn module to use a mock transport."""
+        real_client = httpx.AsyncClient
+        transport = httpx.MockTransport(handler)
+        return mock.patch.object(
+            ssrn.httpx, "AsyncClient", lambda **kwargs: real_client(transport=transport, **kwargs)
+        )
+
+    def test_asearch(self):
+        """Test the async search parses results and applies filters."""
+        def handler(request):
+            self.assertEqual(request.url.params["query"], "governance")
+            return httpx.Response(200, content=SAMPLE_SEARCH_HTML)
+
+        with self._mock_async_client(handler), mock.patch.object(self.searcher, "_arate_limit"):
+            papers = asyncio.run(self.searcher.asearch("governance", max_results=5, year="2021"))
+
+        self.assertEqual([p.paper_id for p in papers], ["1234567"])
+
+    def test_aget_papers_by_ids(self):
+        """Test detail pages are fetched concurrently and returned in order."""
+        def handler(request):
+            if request.url.path.endswith("404.html"):
+                return httpx.Response(404)
+            return httpx.Response(200, content=SAMPLE_PAPER_HTML)
+
+        with self._mock_async_client(handler), mock.patch.object(self.searcher, "_arate_limit"):
+            papers = asyncio.run(self.searcher.aget_papers_by_ids(["1", "404", "2"]))
+
+        self.assertEqual([p and p.paper_id for p in papers], ["1", None, "2"])
+
+    def test_rate_limit_allows_burst_then_spaces_requests(self):
+        """Test the token bucket passes a burst, then queues callers 1/rate apart."""
+        burst = SSRNSearcher.RATE_BURST
+        interval = 1.0 / SSRNSearcher.RATE_LIMIT
+        with mock.patch.object(ssrn.time, "monotonic", return_value=100.0):
+            self.searcher._last_refill = 100.0
+            waits = [self.searcher._reserve_slot() for _ in range(burst + 2)]
+
+        self.assertEqual(waits[:burst], [0.0] * burst)
+        self.assertAlmostEqual(waits[burst], interval)
+        self.assertAlmostEqual(waits[burst + 1], 2 * interval)
+
+    def test_rate_limit_refills_over_time(self):
+        """Test tokens refill at RATE_LIMIT per second, capped at the burst size."""
+        with mock.patch.object(ssrn.time, "monotonic", return_value=100.0):
+            self.searcher._last_refill = 100.0
+            for _ in range(SSRNSearcher.RATE_BURST):
+                self.searcher._reserve_slot()
+        with mock.patch.object(ssrn.time, "monotonic", return_value=200.0):
+            self.assertEqual(self.searcher._reserve_slot(), 0.0)
+        self.assertEqual(self.searcher._tokens, SSRNSearcher.RATE_BURST - 1)
+    def test_get_paper_by_id_is_memoized(self):
+        """Test a repeated lookup within the TTL is served without refetching."""
+        response = mock.Mock(status_code=200, headers={}, content=SAMPLE_PAPER_HTML)
+        with mock.patch.object(self.searcher.session, "get", return_value=response) as get, \
+                mock.patch.object(self.searcher, "_rate_limit"):
+            first = self.searcher.get_paper_by_id("1234567")
+            second = self.searcher.get_paper_by_id("1234567")
+
+        self.assertIs(first, second)
+        self.assertEqual(get.call_count, 1)
+
+    def test_memo_caches_use_shared_ttl_cache(self):
+        """Test paper and author memos are the tool cache's TTL LRU, sized for SSRN."""
+        for cache in (self.searcher._paper_cache, self.searcher._author_cache):
+            self.assertIsInstance(cache, TTLCache)
+            self.assertEqual((cache.maxsize, cache.ttl), (SSRNSearcher._CACHE_SIZE, SSRNSearcher._CACHE_TTL))
+
+    def test_parse_date_formats(self):
+        """Test each supported SSRN date layout parses with one strptime call."""
+        cases = {
+            "March 15, 2021": "2021-03-15",
+            "June 2019": "2019-06-01",
+            "01/02/2020": "2020-01-02",
+            "2020-01-02": "2020-01-02",
+        }
+        for text, expected in cases.items():
+            self.assertEqual(ssrn._parse_date(text).date().isoformat(), expected)
+        self.assertIsNone(ssrn._parse_date(""))
+        self.assertIsNone(ssrn._parse_date("Forthcoming"))
+
+    def test_search_by_doi_enriches_candidates(self):
+        """Test DOI lookup matches against detail pages fetched for each candidate."""
+        listing = self.searcher._parse_search_results(SAMPLE_SEARCH_HTML, "q")
+        detail = self.searcher._parse_paper_page(SAMPLE_PAPER_HTML, "1234567")
+        with mock.patch.object(self.searcher, "search", return_value=listing), \
+                mock.patch.object(self.searcher, "get_paper_by_id",
+                                  side_effect=lambda pid: detail if pid == "1234567" else None) as get:
+            paper = self.searcher.search_by_doi("https://doi.org/10.2139/SSRN.1234567")
+
+        self.assertIs(paper, detail)
+        self.assertEqual(sorted(c.args[0] for c in get.call_args_list), ["1234567", "7654321"])
+
+    def test_get_author_papers_enrich_keeps_unfetched_entries(self):
+        """Test enrichment falls back to the listing entry when a page fails."""
+        listing = self.searcher._parse_search_results(SAMPLE_SEARCH_HTML, "q")
+        with mock.patch.object(self.searcher, "search", return_value=listing), \
+                mock.patch.object(self.searcher, "get_paper_by_id", return_value=None):
+            papers = self.searcher.get_author_papers("42", enrich=True)
+
+        self.assertEqual(papers, listing)
+
+    def _download(self, content_type, chunks):
+        """Run download_pdf against a streamed response yielding chunks."""
+        response = mock.MagicMock(status_code=200, headers={"Content-Type": content_type})
+        response.__enter__.return_value = response
+        response.iter_bytes.return_value = iter(chunks)
+        save_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(save_dir.cleanup)
+        paper = mock.Mock()
+        with mock.patch.object(self.searcher, "get_paper_by_id", return_value=paper), \
+                mock.patch.object(self.searcher.session, "stream", return_value=response) as stream, \
+                mock.patch.object(self.searcher, "_rate_limit"):
+            result = self.searcher.download_pdf("1234567", save_dir.name)
+        self.assertEqual(stream.call_args.args[0], "GET")
+        return result, save_dir.name
+
+    def test_download_pdf_streams_to_disk(self):
+        """Test PDF bodies are written chunk by chunk to the final path."""
+        result, save_dir = self._download("application/octet-stream", [b"%PDF-1.4 ", b"body"])
+
+        self.assertEqual(result, os.path.join(save_dir, "ssrn_1234567.pdf"))
+        with open(result, "rb") as f:
+            self.assertEqual(f.read(), b"%PDF-1.4 body")
+        self.assertEqual(os.listdir(save_dir), ["ssrn_1234567.pdf"])
+
+    def test_download_pdf_rejects_html_without_reading_body(self):
+        """Test a login-wall HTML page is abandoned on its headers alone."""
+        chunks = iter([b"<html>Sign in</html>"])
+        result, save_dir = self._download("text/html; charset=utf-8", chunks)
+
+        self.assertEqual(result, "PDF not available for 1234567")
+        self.assertEqual(os.listdir(save_dir), [])
+        self.assertEqual(next(chunks), b"<html>Sign in</html>")
+
+    def test_download_pdf_sniffs_unlabelled_body(self):
+        """Test an unlabelled non-PDF body is dropped after its first chunk."""
+        rest = iter([b"more"])
+        result, save_dir = self._download("", _chain_iter(iter([b"<html>"]), rest))
+
+        self.assertEqual(result, "PDF not available for 1234567")
+        self.assertEqual(os.listdir(save_dir), [])
+        self.assertEqual(next(rest), b"more")
+
+
+def _chain_iter(*iterators):
+    """Lazily chain iterators so tests can check what was left unread."""
+    for iterator in iterators:
+        yield from iterator
 
 
 if __name__ == "__main__":
@@ -0,0 +1,287 @@
+"""Unit tests for in-memory tool result memoization (no network)."""
+import asyncio
+import os
+import threading
+import unittest
+from unittest import mock
+
+from paper_search_mcp import tool_cache
+from paper_search_mcp.tool_cache import TTLCache, memoize_tool, prime, singleflight
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache(unittest.TestCase):
+    """Tests for TTLCache expiry and eviction."""
+
+    def test_entries_expire_after_ttl(self):
+        """Test an entry is served until its ttl elapses."""
+        clock = FakeClock()
+        cache = TTLCache(maxsize=10, ttl=5, timer=clock)
+        cache.set("k", [1])
+        clock.now = 4.9
+        self.assertEqual(cache.get("k"), [1])
+        clock.now = 5.0
+        self.assertIsNone(cache.get("k"))
+        self.assertEqual(len(cache), 0)
+
+    def test_least_recently_used_is_evicted(self):
+        """Test a read refreshes recency so the other entry is evicted."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_store_is_a_write_through_second_tier(self):
+        """Test entries are written to the store and memory misses are read from it."""
+        store = {}
+        backing = mock.Mock(get=store.get, set=store.__setitem__)
+        cache = TTLCache(maxsize=1, ttl=60, store=backing)
+        cache.set("a", 1)
+        cache.set("miss", {}, ttl=5)
+        self.assertEqual(store, {"a": 1})
+
+        # "a" was evicted from memory by "miss" but is still in the store
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+
+    def test_concurrent_threads_share_one_cache(self):
+        """Test readers and writers on several threads keep the cache consistent."""
+        cache = TTLCache(maxsize=50, ttl=60)
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(2000):
+                    cache.set((offset + i) % 200, i)
+                    cache.get((offset * 7 + i) % 200)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(cache), 50)
+
+
+class TestMemoizeTool(unittest.TestCase):
+    """Tests for the memoize_tool decorator."""
+
+    def setUp(self):
+        self.calls = 0
+        self.cache = TTLCache(maxsize=10, ttl=60)
+
+        @memoize_tool(self.cache)
+        async def search(query: str, max_results: int = 10):
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            return [{"query": query, "max_results": max_results}] if query else []
+
+        self.search = search
+
+    def test_repeat_call_is_served_from_cache(self):
+        """Test defaults are applied so equivalent calls share one entry."""
+        async def run():
+            first = await self.search("q")
+            second = await self.search("q", max_results=10)
+            third = await self.search("q", 5)
+            return first, second, third
+
+        first, second, third = asyncio.run(run())
+        self.assertIs(first, second)
+        self.assertEqual(third[0]["max_results"], 5)
+        self.assertEqual(self.calls, 2)
+
+    def test_concurrent_misses_share_one_call(self):
+        """Test simultaneous identical calls issue a single upstream request."""
+        async def run():
+            return await asyncio.gather(*(self.search("q") for _ in range(5)))
+
+        results = asyncio.run(run())
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(r is results[0] for r in results))
+
+    def test_empty_results_are_not_cached(self):
+        """Test error-shaped empty results are fetched again next time."""
+        async def run():
+            await self.search("")
+            await self.search("")
+
+        asyncio.run(run())
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_misses_cached_for_miss_ttl(self):
+        """Test empty results are reused until miss_ttl elapses when opted in."""
+        clock = FakeClock()
+        cache = TTLCache(maxsize=10, ttl=3600, timer=clock)
+
+        @memoize_tool(cache, miss_ttl=60)
+        async def lookup(doi: str):
+            self.calls += 1
+            return {}
+
+        asyncio.run(lookup("10.1/missing"))
+        clock.now = 59
+        self.assertEqual(asyncio.run(lookup("10.1/missing")), {})
+        self.assertEqual(self.calls, 1)
+        clock.now = 60
+        asyncio.run(lookup("10.1/missing"))
+        self.assertEqual(self.calls, 2)
+
+    def test_normalized_arguments_share_an_entry(self):
+        """Test arguments are keyed after normalize so equivalent spellings hit."""
+        @memoize_tool(self.cache, normalize={"doi": str.lower})
+        async def lookup(doi: str):
+            self.calls += 1
+            return {"doi": doi}
+
+        async def run():
+            return await lookup("10.1/ABC"), await lookup("10.1/abc")
+
+        first, second = asyncio.run(run())
+        self.assertIs(first, second)
+        self.assertEqual(self.calls, 1)
+
+    def test_disabled_by_environment(self):
+        """Test PAPER_SEARCH_MCP_CACHE=0 bypasses the cache."""
+        async def run():
+            await self.search("q")
+            await self.search("q")
+
+        with mock.patch.dict(os.environ, {"PAPER_SEARCH_MCP_CACHE": "0"}):
+            asyncio.run(run())
+        self.assertEqual(self.calls, 2)
+
+    def test_primed_entry_is_served(self):
+        """Test prime() stores a result under the key a later call computes."""
+        prime(self.cache, "search", [{"primed": True}], query="q", max_results=10)
+        prime(self.cache, "search", [], query="empty", max_results=10)
+
+        result = asyncio.run(self.search("q"))
+        self.assertEqual(result, [{"primed": True}])
+        self.assertEqual(self.calls, 0)
+        self.assertEqual(len(self.cache), 1)
+
+
+class TestSingleflight(unittest.TestCase):
+    """Tests for coalescing concurrent identical tool calls."""
+
+    def setUp(self):
+        self.calls = 0
+
+    def make_tool(self, result=None, error=None):
+        @singleflight
+        async def get_citations(paper_id: str, max_results: int = 20):
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            if error:
+                raise error
+            return result if result is not None else [{"id": paper_id}]
+        return get_citations
+
+    def test_followers_await_the_leader(self):
+        """Test identical concurrent calls share one call while distinct ones do not."""
+        tool = self.make_tool()
+
+        async def run():
+            return await asyncio.gather(tool("a"), tool("a", 20), tool("b"))
+
+        first, second, other = asyncio.run(run())
+        self.assertIs(first, second)
+        self.assertEqual(other, [{"id": "b"}])
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(tool_cache._INFLIGHT, {})
+
+    def test_sequential_calls_are_not_cached(self):
+        """Test a finished call is not reused by the next one."""
+        tool = self.make_tool()
+
+        async def run():
+            await tool("a")
+            await tool("a")
+
+        asyncio.run(run())
+        self.assertEqual(self.calls, 2)
+
+    def test_leader_exception_reaches_followers(self):
+        """Test followers see the leader's exception."""
+        tool = self.make_tool(error=ValueError("boom"))
+
+        async def run():
+            return await asyncio.gather(tool("a"), tool("a"), return_exceptions=True)
+
+        results = asyncio.run(run())
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+        self.assertEqual(self.calls, 1)
+
+    def test_cancelled_leader_does_not_cancel_followers(self):
+        """Test a follower of a cancelled leader retries and gets a result."""
+        tool = self.make_tool()
+
+        async def run():
+            leader = asyncio.ensure_future(tool("a"))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(tool("a"))
+            await asyncio.sleep(0)
+            leader.cancel()
+            result = await follower
+            with self.assertRaises(asyncio.CancelledError):
+                await leader
+            return result
+
+        self.assertEqual(asyncio.run(run()), [{"id": "a"}])
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(tool_cache._INFLIGHT, {})
+
+    def test_cancelled_follower_leaves_leader_running(self):
+        """Test cancelling a follower neither cancels nor re-runs the leader."""
+        tool = self.make_tool()
+
+        async def run():
+            leader = asyncio.ensure_future(tool("a"))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(tool("a"))
+            await asyncio.sleep(0)
+            follower.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await follower
+            return await leader
+
+        self.assertEqual(asyncio.run(run()), [{"id": "a"}])
+        self.assertEqual(self.calls, 1)
+
+    def test_empty_memoized_result_shared_by_waiters(self):
+        """Test waiters on an uncached empty result do not refetch it."""
+        cache = TTLCache(maxsize=10, ttl=60)
+
+        @memoize_tool(cache)
+        async def search(query: str):
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            return []
+
+        async def run():
+            return await asyncio.gather(*(search("q") for _ in range(3)))
+
+        asyncio.run(run())
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()